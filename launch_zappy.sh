@@ -98,11 +98,10 @@ PIDS+=($SERVER_PID)
 sleep 1
 
 # 4. Lancement des clients IA (en mode silencieux)
+# Un seul processus par équipe héberge tous ses agents.
 for team in "${TEAMS[@]}"; do
-    for ((i=1; i<=$AI_PER_TEAM; i++)); do
-        ./zappy_ai -p $PORT -n "$team" -h $HOST > /dev/null 2>&1 &
-        PIDS+=($!)
-    done
+    ./zappy_ai -p $PORT -n "$team" -h $HOST --agents $AI_PER_TEAM > /dev/null 2>&1 &
+    PIDS+=($!)
 done
 
 # 5. Lancement des clients GUI (en mode silencieux)
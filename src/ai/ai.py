@@ -1,12 +1,15 @@
 import logging
-import time
 import random
 from typing import Optional, Tuple, List
 from core.protocol import ZappyProtocol
+from core.clock import ServerClock
 from managers.movement_manager import MovementManager
 from managers.vision_manager import VisionManager
 from models.player import Player
 from models.map import Map
+from models import vision_cone
+from models.coverage import CoveragePlanner
+from models.route_optimizer import RouteOptimizer
 from managers.elevation_manager import ElevationManager
 from managers.inventory_manager import InventoryManager
 from models.playerCommunicator import PlayerCommunicator
@@ -32,24 +35,38 @@ class AI:
         self.target_resource = None
         self.target_position = None
         
+        self.clock = ServerClock.of(protocol)
         self.update_cooldown = 1
+        self.elevation_timeout = 2 * ServerClock.COSTS['Incantation']
         
         self.FOOD_CRITICAL_LEVEL = 3
         self.FOOD_SAFE_LEVEL = 5
+        # Trajets vers la nourriture, poursuivis même en urgence
+        self.FOOD_PURPOSES = ("survival", "known_food", "food_search")
+        # Unités de temps du serveur : ~14 commandes de 7 entre deux appels au
+        # rituel, ~24 rations de nourriture avant d'oublier un coéquipier
+        self.RITUAL_CALL_TICKS = 100
+        self.TEAM_ACTIVITY_TICKS = 3000
         
         self.vision_manager = VisionManager(protocol, player, map, logger)
-        self.inventory_manager = InventoryManager(protocol, player, logger)
+        self.inventory_manager = InventoryManager(protocol, player, logger, map=map)
         self.movement_manager = MovementManager(protocol, player, map, self.vision_manager, logger)
         self.elevation_manager = ElevationManager(protocol, self.vision_manager, self.inventory_manager, logger)
         self.communicator = PlayerCommunicator(protocol, player, logger)
         self.reproduction_manager = ReproductionManager(protocol, logger)
+        self.coverage_planner = CoveragePlanner(map.width, map.height, player.level)
+        self.route_optimizer = RouteOptimizer(map)
+        self.gathering_route = []
+        self.gathering_deficit = {}
         
         self.last_update = 0
+        self.last_mapped_vision = None
 
         self.elevation_in_progress = False
         self.elevation_start_time = 0
 
         self.team_status = {}
+        self.last_ritual_call = None
         self.team_leader_id = None
         self.current_ritual_target = None
         self.ritual_participants_needed = 0
@@ -58,21 +75,21 @@ class AI:
         # Variables pour rejoindre les rituels
         self.ritual_target = None
 
-    def update(self) -> bool:
+    async def update(self) -> bool:
         """Met à jour l'IA et exécute une action.
         
         Returns:
             bool: True si l'IA continue de fonctionner
         """
         try:
-            current_time = time.time()
+            current_time = self.clock.now()
             
             if self.state == "EMERGENCY_FOOD_SEARCH":
                 cooldown = 0.1
             else:
                 cooldown = self.update_cooldown
             
-            if current_time - self.last_update < cooldown:
+            if self.clock.elapsed_ticks(self.last_update) < cooldown:
                 return True
             
             self.last_update = current_time
@@ -82,17 +99,19 @@ class AI:
                 return False
             
             if self.elevation_in_progress:
-                elevation_timeout = 60
-                if current_time - self.elevation_start_time > elevation_timeout:
-                    self.logger.warning(f"⏰ Timeout de l'élévation ({elevation_timeout}s), reprise des opérations normales")
+                if self.clock.elapsed_ticks(self.elevation_start_time) > self.elevation_timeout:
+                    self.logger.warning(f"⏰ Timeout de l'élévation ({self.elevation_timeout} ticks), reprise des opérations normales")
                     self.elevation_in_progress = False
                     self.state = "NORMAL_OPERATIONS"
             
-            if not self.vision_manager.update_vision():
+            self._sync_vision()
+            self.vision_manager.scheduler.state = self.state
+            if not await self.vision_manager.update_vision():
                 self.logger.warning("Échec de la mise à jour de la vision")
                 return True
+            self._sync_vision()
             
-            if not self.inventory_manager.update_inventory():
+            if not await self.inventory_manager.update_inventory():
                 self.logger.warning("Échec de la mise à jour de l'inventaire")
                 return True
             
@@ -100,9 +119,16 @@ class AI:
                 self.logger.critical("🚨🚨 NOURRITURE CRITIQUE (0) - Le serveur va probablement nous tuer ! 🚨🚨")
                 self.state = "EMERGENCY_FOOD_SEARCH"
             
+            executor = self.movement_manager.executor
+            if executor.active:
+                if self.state == "EMERGENCY_FOOD_SEARCH" and executor.purpose not in self.FOOD_PURPOSES:
+                    executor.cancel("nourriture critique")
+                else:
+                    return await self._advance_movement()
+            
             self._update_state()
             
-            return self._execute_action()
+            return await self._execute_action()
             
         except ConnectionError as e:
             self.logger.error(f"🔌 Erreur de connexion dans l'IA: {e}")
@@ -111,6 +137,94 @@ class AI:
             self.logger.error(f"Erreur lors de la mise à jour de l'IA: {str(e)}")
             return True
 
+    def handle_server_message(self, message: str) -> bool:
+        """Traite un message asynchrone envoyé par le serveur.
+
+        Args:
+            message (str): Ligne reçue hors réponse de commande
+
+        Returns:
+            bool: False si le serveur a annoncé la mort du joueur
+        """
+        if message == "dead":
+            self.logger.critical("💀💀💀 LE SERVEUR A ANNONCÉ NOTRE MORT ! ARRÊT IMMÉDIAT ! 💀💀💀")
+            return False
+
+        if message.startswith("Current level:"):
+            new_level = int(message.split(": ")[1])
+            self.player.set_level(new_level)
+
+            if hasattr(self, 'vision_manager') and hasattr(self.vision_manager, 'set_level'):
+                self.vision_manager.set_level(new_level)
+            else:
+                self.logger.warning(f"⚠️ Impossible de mettre à jour le niveau du vision_manager: {type(self.vision_manager)}")
+
+            self._consume_ritual_stones(new_level - 1)
+            self.elevation_in_progress = False
+            self.elevation_manager.finish_ritual(new_level)
+            self.state = "NORMAL_OPERATIONS"
+            self.logger.info(f"🎉🎉🎉 ÉLÉVATION RÉUSSIE ! NOUVEAU NIVEAU : {new_level} 🎉🎉🎉")
+        elif message == "ko" and (self.elevation_in_progress or self.elevation_manager.ritual_in_progress):
+            self.logger.warning("❌ Le rituel d'élévation a échoué.")
+            self.elevation_manager.finish_ritual(None)
+            self.elevation_in_progress = False
+            self.state = "NORMAL_OPERATIONS"
+        elif message.startswith("eject:"):
+            self.movement_manager.pose.eject(self.protocol.parse_eject_response(message))
+        elif message.startswith("message"):
+            self.logger.info(f"📢 Broadcast reçu: {message}")
+            parsed_message = self.communicator.parse_message(message)
+            if parsed_message and parsed_message.get("team") == self.player.team:
+                self.logger.info(f"🤝 Message d'équipe reçu: {parsed_message}")
+                executor = self.movement_manager.executor
+                if self._handle_team_message(parsed_message) and executor.active:
+                    executor.cancel("message d'équipe")
+        else:
+            self.logger.debug(f"📨 Message asynchrone non traité: {message}")
+        return True
+
+    def _consume_ritual_stones(self, level: int) -> None:
+        """Retire de la case du joueur les pierres consommées par un rituel réussi.
+
+        Args:
+            level (int): Niveau de départ du rituel
+        """
+        requirements = self.elevation_manager.ELEVATION_REQUIREMENTS.get(level, {})
+        x, y = self.player.get_position()
+        tile = self.map.get_tile(x, y)
+        for resource, count in requirements.items():
+            if resource != 'players' and count:
+                tile.resources[resource] = max(0, tile.resources[resource] - count)
+
+    def _handle_ritual_broadcast(self, parsed_message: dict) -> None:
+        """Réagit aux appels de rituel envoyés par l'équipe.
+
+        Args:
+            parsed_message (dict): Message d'équipe parsé
+        """
+        action = parsed_message.get("action")
+        if action == "RITUAL_CALL":
+            data = parsed_message.get("data", "")
+            try:
+                parts = data.split(":")
+                if len(parts) >= 3:
+                    target_level = int(parts[0])
+                    coords_str = parts[2]
+                    target_x, target_y = map(int, coords_str.split(","))
+
+                    # Vérifier si on peut participer au rituel
+                    if self.player.level == target_level - 1:
+                        self.logger.info(f"🤝 Je suis niveau {self.player.level}, je peux participer au rituel niveau {target_level} !")
+                        self.logger.info(f"🎯 Je me dirige vers ({target_x}, {target_y}) pour rejoindre le rituel")
+
+                        # Définir la cible de mouvement pour rejoindre le rituel
+                        self.ritual_target = (target_x, target_y)
+                        self.state = "JOINING_RITUAL"
+                    else:
+                        self.logger.info(f"⚠️ Je suis niveau {self.player.level}, je ne peux pas participer au rituel niveau {target_level}")
+            except Exception as e:
+                self.logger.error(f"Erreur lors du parsing du message de rituel: {e}")
+
     def _update_state(self) -> None:
         """Met à jour l'état de l'IA."""
         try:
@@ -141,17 +255,6 @@ class AI:
             self.logger.debug("NORMAL_OPERATIONS")
             self.state = "NORMAL_OPERATIONS"
             self.target_resource = None
-            
-            if not self.target_position:
-                self.target_position = self._generate_smart_exploration_target()
-                self.logger.debug(f"Nouvelle cible d'exploration aléatoire: {self.target_position}")
-                
-            if not self.movement_manager.move_to(self.target_position):
-                self.target_position = None
-                return True
-                
-            self.target_position = None
-            return True
                 
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour de l'état: {str(e)}")
@@ -187,12 +290,12 @@ class AI:
                 
         return prioritized
 
-    def _execute_action(self) -> bool:
+    async def _execute_action(self) -> bool:
         """Exécute l'action appropriée selon l'état actuel."""
         try:
             food_level = self.inventory_manager.inventory['food']
 
-            self._collect_available_resources()
+            await self._collect_available_resources()
 
             if self.state == "ELEVATING":
                 if self.elevation_in_progress:
@@ -200,7 +303,7 @@ class AI:
                     return True
                 else:
                     self.logger.info("🚀 LANCEMENT DE L'ÉLÉVATION !")
-                    success = self._handle_elevation()
+                    success = await self._handle_elevation()
                     if not success:
                         self.logger.warning("❌ Échec de l'élévation, retour aux opérations normales")
                         self.state = "NORMAL_OPERATIONS"
@@ -208,11 +311,11 @@ class AI:
                     return True
 
             if food_level < self.FOOD_SAFE_LEVEL:
-                self.handle_survival()
+                await self.handle_survival()
                 return True
 
             self.logger.info(f"✅ Nourriture sécurisée ({food_level}). Reprise des opérations.")
-            self._update_state_when_safe()
+            await self._update_state_when_safe()
 
             # Vérifier à nouveau l'état après _update_state_when_safe
             if self.state == "ELEVATING":
@@ -221,7 +324,7 @@ class AI:
                     return True
                 else:
                     self.logger.info("🚀 LANCEMENT DE L'ÉLÉVATION !")
-                    success = self._handle_elevation()
+                    success = await self._handle_elevation()
                     if not success:
                         self.logger.warning("❌ Échec de l'élévation, retour aux opérations normales")
                         self.state = "NORMAL_OPERATIONS"
@@ -229,34 +332,22 @@ class AI:
                     return True
             
             elif self.state == "GATHERING_RESOURCES":
-                self._handle_gathering_resources()
+                await self._handle_gathering_resources()
             
             elif self.state == "AWAITING_PARTICIPANTS":
                 self.logger.info(f"👥 Appel à l'aide pour le rituel niveau {self.player.level + 1}. Besoin de {self.ritual_participants_needed} joueurs.")
-                self.communicator.send_team_message("RITUAL_CALL", f"{self.player.level + 1}:{self.player.id}:{self.player.x},{self.player.y}")
-                time.sleep(1)
+                await self._call_for_ritual(self.player.level + 1)
             
             elif self.state == "JOINING_RITUAL":
                 if self.ritual_target:
                     self.logger.info(f"🎯 Rejoindre le rituel à la position {self.ritual_target}")
-                    if self.movement_manager.move_to(self.ritual_target):
-                        self.logger.info("✅ Arrivé à la position du rituel !")
-                        # Une fois arrivé, on peut s'élever si les conditions sont remplies
-                        if self.elevation_manager.can_elevate():
-                            self.logger.info("✨ Conditions d'élévation remplies, lancement du rituel !")
-                            self.state = "ELEVATING"
-                        else:
-                            self.logger.info("⏳ En attente que les conditions d'élévation soient remplies...")
-                            self.state = "AWAITING_PARTICIPANTS"
-                    else:
-                        self.logger.warning("❌ Impossible d'atteindre la position du rituel")
-                        self.state = "NORMAL_OPERATIONS"
+                    await self._walk_to(self.ritual_target[0], self.ritual_target[1], "ritual")
                 else:
                     self.logger.warning("❌ Pas de cible de rituel définie")
                     self.state = "NORMAL_OPERATIONS"
 
             else:
-                self._explore()
+                await self._explore()
                 
             return True
                 
@@ -264,39 +355,132 @@ class AI:
             self.logger.error(f"Erreur dans _execute_action: {e}", exc_info=True)
             return True
 
-    def handle_survival(self):
+    async def handle_survival(self):
         """Gère les états EMERGENCY_FOOD_SEARCH et SURVIVAL_BUFFERING."""
         if self.inventory_manager.inventory['food'] < self.FOOD_CRITICAL_LEVEL:
             self.logger.critical("🚨🚨 MODE URGENCE CRITIQUE.")
         else:
             self.logger.warning(f"⚠️ MODE SÉCURITÉ : Remplissage des réserves.")
 
-        self.vision_manager.force_update_vision()
+        await self.vision_manager.force_update_vision("survival")
         target = self.vision_manager.find_nearest_object("food")
         
         if target:
-            if self.movement_manager.move_to(target):
-                self._collect_resource_intensively("food")
-        else:
-            self._explore_locally_for_food()
+            self.movement_manager.start_towards(target, purpose="survival")
+            await self._advance_movement()
+        elif not await self._step_towards_known_food():
+            await self._explore_locally_for_food()
+
+    async def _step_towards_known_food(self) -> bool:
+        """Fait un pas vers la nourriture connue la plus proche, par le champ de distances de la carte.
+        
+        Returns:
+            bool: True si un pas a été fait
+        """
+        try:
+            step = self.map.step_towards('food', self.player.x, self.player.y, self.player.get_direction())
+            if step is None:
+                return False
+            remaining = self.map.walking_distance('food', *step)
+            self.logger.info(f"🧭 Nourriture connue à {remaining + 1} cases, pas vers {step}")
+            await self._walk_to(step[0], step[1], "known_food")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erreur lors du pas vers la nourriture connue: {str(e)}")
+            return False
 
-    def _handle_gathering_resources(self):
-        """Gère la collecte de la ressource cible."""
+    async def _handle_gathering_resources(self):
+        """Gère la collecte : suit la tournée planifiée, sinon la ressource cible."""
         if not self.target_resource:
             self.state = "NORMAL_OPERATIONS"
             return
 
+        if await self._follow_gathering_route():
+            return
+
         self.logger.info(f"🔍 Recherche de {self.target_resource}.")
         target = self.vision_manager.find_nearest_object(self.target_resource)
         
         if target:
-            if self.movement_manager.move_to(target):
-                if self._collect_resource_intensively(self.target_resource):
-                    self.vision_manager.force_update_vision()
+            self.movement_manager.start_towards(target, purpose="gathering")
+            await self._advance_movement()
         else:
-            self._explore()
+            await self._explore()
+
+    async def _follow_gathering_route(self) -> bool:
+        """Démarre le trajet vers le prochain arrêt de la tournée, replanifiée si besoin.
+        
+        La tournée est recalculée quand le déficit change ou quand un
+        arrêt ne tient pas ses promesses (ressource déjà prise). Les
+        ressources sont ramassées à l'arrivée, par _collect_route_stop.
+        
+        Returns:
+            bool: True si un arrêt de la tournée a été traité
+        """
+        try:
+            deficit = self.elevation_manager.get_resource_deficit()
+            if deficit != self.gathering_deficit or not self.gathering_route:
+                self.gathering_deficit = deficit
+                self.gathering_route = self.route_optimizer.plan(
+                    self.player.x, self.player.y, deficit,
+                    self.inventory_manager.inventory.get('food', 0)
+                )
+                if self.gathering_route:
+                    self.logger.info(f"🗺️ Tournée de collecte: {len(self.gathering_route)} arrêts pour {deficit}")
+            if not self.gathering_route:
+                return False
+            
+            x, y, _ = self.gathering_route[0]
+            await self._walk_to(x, y, "route")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erreur lors du suivi de la tournée de collecte: {str(e)}")
+            self.gathering_route = []
+            return False
+
+    async def _collect_route_stop(self) -> None:
+        """Ramasse en une rafale les ressources promises par l'arrêt atteint."""
+        try:
+            if not self.gathering_route:
+                return
+            x, y, gain = self.gathering_route[0]
+            takes = [f"Take {resource}" for resource, count in gain.items() for _ in range(count)]
+            results = await self.protocol.pipeline(takes) if takes else []
+            for command, result in zip(takes, results):
+                if result:
+                    resource = command.split(" ", 1)[1]
+                    self.inventory_manager.record_take(resource)
+                    if resource in self.gathering_deficit:
+                        self.gathering_deficit[resource] -= 1
+                        if not self.gathering_deficit[resource]:
+                            del self.gathering_deficit[resource]
+            self.gathering_route.pop(0)
+            if not all(results):
+                self.logger.debug(f"📭 Arrêt ({x}, {y}) incomplet, nouvelle tournée au prochain tour")
+                self.gathering_route = []
+            
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la collecte à l'arrêt de la tournée: {str(e)}")
+            self.gathering_route = []
+
+    async def _call_for_ritual(self, level: int) -> bool:
+        """Diffuse l'appel au rituel, au plus une fois tous les RITUAL_CALL_TICKS.
+        
+        Args:
+            level (int): Niveau visé par le rituel
+            
+        Returns:
+            bool: True si l'appel a été diffusé
+        """
+        if self.last_ritual_call is not None and self.clock.elapsed_ticks(self.last_ritual_call) < self.RITUAL_CALL_TICKS:
+            return False
+        self.last_ritual_call = self.clock.now()
+        await self.communicator.send_team_message("RITUAL_CALL", f"{level}:{self.player.id}:{self.player.x},{self.player.y}")
+        return True
 
-    def _handle_elevation(self) -> bool:
+    async def _handle_elevation(self) -> bool:
         """Gère le processus d'élévation, de la pose des pierres à l'incantation."""
         try:
             next_level = self.player.level + 1
@@ -310,36 +494,36 @@ class AI:
             required_players = requirements.get('players', 1)
             if required_players > 1:
                 self.logger.info(f"🔊 Envoi du broadcast pour rituel niveau {next_level} (besoin de {required_players} joueurs)")
-                self.communicator.send_team_message(
-                    "RITUAL_CALL", 
-                    f"{next_level}:{self.player.id}:{self.player.x},{self.player.y}"
-                )
-                time.sleep(1)  # Petit délai pour éviter le spam
+                await self._call_for_ritual(next_level)
                 
+            drops = []
             for resource, count in requirements.items():
                 if resource == "players":
                     continue
-                on_tile = self.vision_manager.vision_data[0].count(resource) if self.vision_manager.vision_data else 0
+                on_tile = self.vision_manager.count_on_tile(resource)
                 needed_on_tile = count - on_tile
                 
                 to_set = min(self.inventory_manager.inventory.get(resource, 0), needed_on_tile)
                 
                 if to_set > 0:
                     self.logger.info(f"📦 Dépose {to_set} {resource} pour le rituel (déjà {on_tile} sur la case, besoin de {count})")
-                    for _ in range(to_set):
-                        self.protocol.set(resource)
-                        time.sleep(0.1)
+                    drops.extend([f"Set {resource}"] * to_set)
+
+            if drops:
+                for command, result in zip(drops, await self.protocol.pipeline(drops)):
+                    if result:
+                        self.inventory_manager.record_drop(command.split(" ", 1)[1])
 
-            self.vision_manager.force_update_vision()
+            await self.vision_manager.force_update_vision("elevation")
             
             if self.elevation_manager.can_elevate():
                 self.logger.info(f"✨ Conditions parfaites ! Lancement de l'incantation pour le niveau {next_level} !")
-                success = self.protocol.incantation()
+                success = await self.protocol.incantation()
                 
                 if success:
                     self.logger.info("🌟 Élévation en cours ! Attente du résultat...")
                     self.elevation_in_progress = True
-                    self.elevation_start_time = time.time()
+                    self.elevation_start_time = self.clock.now()
                     self.state = "ELEVATING"
                     return True
                 else:
@@ -354,7 +538,7 @@ class AI:
                 
                 if total_players < required_players:
                     self.logger.info(f"👥 Pas assez de joueurs pour le rituel niveau {current_level} ({total_players}/{required_players}). J'appelle à l'aide.")
-                    self.communicator.send_team_message("RITUAL_CALL", f"{next_level}:{self.player.id}:{self.player.x},{self.player.y}")
+                    await self._call_for_ritual(next_level)
                     self.state = "AWAITING_PARTICIPANTS"
                     self.ritual_participants_needed = required_players
                     return True
@@ -366,91 +550,152 @@ class AI:
             self.logger.error(f"Erreur lors de la gestion de l'élévation: {str(e)}")
             return False
         
+    def _sync_vision(self) -> None:
+        """Recale la pose et inscrit dans la carte le dernier Look s'il est nouveau.
+        
+        Le recalage n'a lieu que si le joueur n'a pas bougé depuis le Look ;
+        sinon le Look est inscrit depuis la pose où il a été pris.
+        """
+        if self.vision_manager.last_vision_update != self.last_mapped_vision:
+            self.last_mapped_vision = self.vision_manager.last_vision_update
+            pose = self.movement_manager.pose
+            if self.vision_manager.look_pose == pose.pose:
+                self.vision_manager.relocate(pose.observe(self.vision_manager.look))
+            self._update_map_from_vision()
+
     def _update_map_from_vision(self) -> None:
-        """Met à jour la carte avec les données de vision."""
+        """Met à jour la carte avec le dernier Look, depuis la pose où il a été pris."""
         try:
-            if not self.vision_manager.vision_data:
+            look = self.vision_manager.look
+            if look is None or self.vision_manager.look_pose is None:
                 return
             
-            current_tile = self.vision_manager.vision_data[0]
-            self.map.update_tile(self.player.x, self.player.y, current_tile)
-            
-            for i, tile_content in enumerate(self.vision_manager.vision_data[1:], 1):
-                relative_pos = self._get_relative_position(i)
-                if relative_pos:
-                    abs_x = (self.player.x + relative_pos[0]) % self.map.width
-                    abs_y = (self.player.y + relative_pos[1]) % self.map.height
-                    self.map.update_tile(abs_x, abs_y, tile_content)
+            x, y, direction = self.vision_manager.look_pose
+            offsets = vision_cone.offsets(vision_cone.MAX_LEVEL, direction)[:len(look)]
+            xs, ys = x + offsets[:, 0], y + offsets[:, 1]
+            counts = look.counts[:len(offsets), 1:]
+            timestamp = self.vision_manager.last_vision_update
+            self.vision_manager.belief.observe(xs, ys, counts, timestamp)
+            self.map.update_tiles(xs, ys, counts, timestamp)
                     
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour de la carte: {str(e)}")
 
-    def _get_relative_position(self, index: int) -> Tuple[int, int]:
-        """Calcule la position relative d'une case dans la vision.
-        
-        Args:
-            index (int): Index de la case dans la vision
-            
-        Returns:
-            Tuple[int, int]: Position relative (x, y)
-        """
-        try:
-            if index == 0:
-                return (0, 0)
-            
-            circle = 1
-            while index > circle * 8:
-                index -= circle * 8
-                circle += 1
-            
-            pos_in_circle = (index - 1) % (circle * 8)
-            segment = pos_in_circle // circle
-            
-            if segment == 0:
-                return (0, -circle)
-            elif segment == 1:
-                return (circle, -circle)
-            elif segment == 2:
-                return (circle, 0)
-            elif segment == 3:
-                return (circle, circle)
-            elif segment == 4:
-                return (0, circle)
-            elif segment == 5:
-                return (-circle, circle)
-            elif segment == 6:
-                return (-circle, 0)
-            else:
-                return (-circle, -circle)
-                
-        except Exception as e:
-            self.logger.error(f"Erreur lors du calcul de la position relative: {str(e)}")
-            return (0, 0)
-
-    def _explore(self) -> None:
+    async def _explore(self) -> None:
         """Exploration intelligente de la carte."""
         try:
-            target = self._generate_smart_exploration_target()
+            target = self.target_position or self._generate_smart_exploration_target()
+            self.target_position = None
             if target:
                 self.logger.debug(f"🎯 Exploration vers {target}")
-                if self.movement_manager.move_to(target):
-                    self.logger.debug("✅ Déplacement d'exploration réussi")
-                    self._collect_available_resources()
-                else:
-                    self.logger.debug("❌ Échec du déplacement d'exploration")
+                heading = target[2] if len(target) > 2 else None
+                await self._walk_to(target[0], target[1], "explore", heading)
             else:
                 self.logger.debug("🔍 Aucune cible d'exploration trouvée")
                 
         except Exception as e:
             self.logger.error(f"Erreur lors de l'exploration: {str(e)}")
 
-    def _generate_smart_exploration_target(self) -> Tuple[int, int]:
+    async def _walk_to(self, x: int, y: int, purpose: str, heading: Optional[int] = None) -> bool:
+        """Démarre un trajet vers une case absolue et en fait la première étape.
+        
+        Args:
+            x (int): Coordonnée X cible
+            y (int): Coordonnée Y cible
+            purpose (str): Raison du trajet, qui décide de l'action à l'arrivée
+            heading (Optional[int]): Orientation voulue à l'arrivée, libre si None
+            
+        Returns:
+            bool: True si l'IA continue de fonctionner
+        """
+        self.movement_manager.executor.start(x, y, purpose=purpose, heading=heading)
+        return await self._advance_movement()
+
+    async def _advance_movement(self) -> bool:
+        """Avance le trajet en cours d'une étape, entre deux traitements d'événements.
+        
+        À l'arrivée, l'action dépend de la raison du trajet (_on_arrival).
+        Une meilleure opportunité repérée en exploration annule le trajet ;
+        un message d'équipe l'annule dès sa réception, dans
+        handle_server_message. L'objectif sera recalculé au tour suivant.
+        
+        Returns:
+            bool: True si l'IA continue de fonctionner
+        """
+        executor = self.movement_manager.executor
+        try:
+            status = await executor.step()
+            if status == executor.ARRIVED:
+                self.logger.debug(f"✅ Déplacement réussi ({executor.purpose})")
+                await self._on_arrival(executor.purpose)
+            elif status == executor.FAILED:
+                self.logger.debug(f"❌ Échec du déplacement ({executor.purpose})")
+                self._on_movement_failed(executor.purpose)
+            elif executor.purpose == "explore" and self.movement_manager._check_for_better_opportunities(*executor.target):
+                executor.cancel("meilleure opportunité")
+                await self._collect_available_resources()
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'avancée du déplacement: {str(e)}")
+            executor.cancel()
+            return True
+
+    async def _on_arrival(self, purpose: Optional[str]) -> None:
+        """Action à l'arrivée d'un trajet, selon sa raison.
+        
+        Args:
+            purpose (Optional[str]): Raison du trajet terminé
+        """
+        if purpose == "survival":
+            await self._collect_resource_intensively("food")
+        elif purpose == "known_food":
+            if self.map.walking_distance('food', self.player.x, self.player.y) == 0:
+                await self._collect_resource_intensively("food")
+        elif purpose == "gathering":
+            if self.target_resource and await self._collect_resource_intensively(self.target_resource):
+                await self.vision_manager.force_update_vision("gathering")
+        elif purpose == "route":
+            await self._collect_route_stop()
+        elif purpose == "ritual":
+            self.logger.info("✅ Arrivé à la position du rituel !")
+            # Une fois arrivé, on peut s'élever si les conditions sont remplies
+            if self.elevation_manager.can_elevate():
+                self.logger.info("✨ Conditions d'élévation remplies, lancement du rituel !")
+                self.state = "ELEVATING"
+            else:
+                self.logger.info("⏳ En attente que les conditions d'élévation soient remplies...")
+                self.state = "AWAITING_PARTICIPANTS"
+        elif purpose == "food_search":
+            await self.vision_manager.force_update_vision("survival")
+            if await self._collect_available_resources():
+                self.logger.info("✅ Ressources trouvées lors de l'exploration de sécurité")
+        else:
+            await self._collect_available_resources()
+
+    def _on_movement_failed(self, purpose: Optional[str]) -> None:
+        """Réaction à l'échec d'un trajet, selon sa raison.
+        
+        Args:
+            purpose (Optional[str]): Raison du trajet abandonné
+        """
+        if purpose == "route":
+            self.gathering_route = []
+        elif purpose == "ritual":
+            self.logger.warning("❌ Impossible d'atteindre la position du rituel")
+            self.state = "NORMAL_OPERATIONS"
+
+    def _generate_smart_exploration_target(self) -> Tuple[int, ...]:
         """Génère une cible d'exploration intelligente.
         
         Returns:
-            Tuple[int, int]: Coordonnées de la cible d'exploration
+            Tuple[int, ...]: (x, y), ou (x, y, orientation) pour un point du balayage
         """
         try:
+            coverage_target = self._find_coverage_target()
+            if coverage_target:
+                return coverage_target
+            
             unexplored_target = self._find_unexplored_target()
             if unexplored_target:
                 return unexplored_target
@@ -465,6 +710,25 @@ class AI:
             self.logger.error(f"Erreur lors de la génération de cible d'exploration: {str(e)}")
             return (0, 0)
 
+    def _find_coverage_target(self) -> Optional[Tuple[int, int, int]]:
+        """Prochain point du balayage de la carte.
+        
+        L'orientation du point est gardée : le Look doit y être pris dans
+        l'axe des couloirs pour que leur espacement couvre la carte.
+        
+        Returns:
+            Optional[Tuple[int, int, int]]: (x, y, orientation) du prochain Look, None si la carte est couverte
+        """
+        try:
+            direction = self.player.get_direction()
+            self.coverage_planner.set_level(self.player.level, self.player.x, self.player.y, direction)
+            waypoint = self.coverage_planner.next_target(self.player.x, self.player.y, direction, self.map.explored)
+            return waypoint if waypoint else None
+            
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la recherche de cible de balayage: {str(e)}")
+            return None
+
     def _find_unexplored_target(self) -> Optional[Tuple[int, int]]:
         """Trouve une cible inexplorée.
         
@@ -472,17 +736,7 @@ class AI:
             Optional[Tuple[int, int]]: Coordonnées de la cible ou None
         """
         try:
-            for radius in range(1, 6):
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if abs(dx) + abs(dy) == radius:
-                            target_x = (self.player.x + dx) % self.map.width
-                            target_y = (self.player.y + dy) % self.map.height
-                            
-                            if not self.map.is_explored(target_x, target_y):
-                                return (target_x, target_y)
-            
-            return None
+            return self.map.nearest_frontier(self.player.x, self.player.y, self.player.get_direction())
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la recherche de cible inexplorée: {str(e)}")
@@ -497,18 +751,13 @@ class AI:
         try:
             rare_resources = ['thystame', 'phiras', 'mendiane']
             
-            for radius in range(1, 4):
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if abs(dx) + abs(dy) == radius:
-                            target_x = (self.player.x + dx) % self.map.width
-                            target_y = (self.player.y + dy) % self.map.height
-                            
-                            tile_content = self.map.get_tile_content(target_x, target_y)
-                            if tile_content:
-                                for resource in rare_resources:
-                                    if resource in tile_content:
-                                        return (target_x, target_y)
+            here = (self.player.x % self.map.width, self.player.y % self.map.height)
+            candidates = []
+            for resource in rare_resources:
+                found = self.vision_manager.belief.rank(resource, self.player.x, self.player.y, k=2, max_distance=3)
+                candidates.extend(tile for tile in found if tile[:2] != here)
+            if candidates:
+                return max(candidates, key=lambda tile: tile[2])[:2]
             
             return None
             
@@ -536,7 +785,7 @@ class AI:
             self.logger.error(f"Erreur lors de la génération de cible aléatoire: {str(e)}")
             return (0, 0)
 
-    def _collect_available_resources(self) -> bool:
+    async def _collect_available_resources(self) -> bool:
         """Collecte toutes les ressources disponibles sur la case actuelle.
         
         Returns:
@@ -555,25 +804,21 @@ class AI:
             all_resources = ['food', 'linemate', 'deraumere', 'sibur', 'mendiane', 'phiras', 'thystame']
             
             for resource in all_resources:
-                if resource in current_tile:
+                if self.vision_manager.count_on_tile(resource):
                     self.logger.info(f"🎯 Tentative de collecte de {resource}...")
-                    if self.protocol.take(resource):
+                    if await self.inventory_manager.take_object(resource):
                         self.logger.info(f"✅ {resource} collecté avec succès")
                         collected = True
                     else:
                         self.logger.warning(f"❌ Échec de la collecte de {resource}")
             
-            if collected:
-                self.logger.info("📦 Collecte terminée, mise à jour de l'inventaire...")
-                self.inventory_manager.force_update_inventory()
-            
             return collected
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la collecte de ressources: {str(e)}")
             return False
 
-    def _collect_resource_intensively(self, resource: str) -> bool:
+    async def _collect_resource_intensively(self, resource: str) -> bool:
         """Collecte intensivement une ressource spécifique.
         
         Args:
@@ -583,13 +828,11 @@ class AI:
             bool: True si la ressource a été collectée
         """
         try:
-            if not self.vision_manager.vision_data:
+            if self.vision_manager.view is None:
                 return False
             
-            current_tile = self.vision_manager.vision_data[0]
-            
-            if resource in current_tile:
-                success = self.protocol.take(resource)
+            if self.vision_manager.count_on_tile(resource):
+                success = await self.inventory_manager.take_object(resource)
                 if success:
                     self.logger.info(f"✅ {resource} collecté avec succès")
                     return True
@@ -613,16 +856,10 @@ class AI:
         try:
             import random
             
-            for radius in range(1, 4):
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if abs(dx) + abs(dy) == radius:
-                            target_x = (self.player.x + dx) % self.map.width
-                            target_y = (self.player.y + dy) % self.map.height
-                            
-                            tile_content = self.map.get_tile_content(target_x, target_y)
-                            if tile_content and 'food' in tile_content:
-                                return (target_x, target_y)
+            here = (self.player.x % self.map.width, self.player.y % self.map.height)
+            food = self.map.distances.nearest('food', self.player.x, self.player.y, self.player.get_direction())
+            if food is not None and food != here:
+                return food
             
             direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
             distance = random.randint(3, 8)
@@ -636,25 +873,33 @@ class AI:
             self.logger.error(f"Erreur lors de la génération de cible d'urgence: {str(e)}")
             return (0, 0)
 
-    def _handle_team_messages(self) -> bool:
-        """Gère les messages de l'équipe reçus via broadcast."""
+    def _handle_team_message(self, message: dict) -> bool:
+        """Gère un message de l'équipe reçu via broadcast.
+        
+        Args:
+            message (dict): Message d'équipe parsé
+        
+        Returns:
+            bool: True si le message change l'objectif en cours
+        """
         try:
-            message = self.communicator.receive_broadcast()
-            if not message:
-                return False
-                
             if message.get("team") != self.player.team:
                 return False
                 
             action = message.get("action")
             data = message.get("data", "")
             
+            if action == "RITUAL_CALL":
+                self._handle_ritual_broadcast(message)
+                return self.state == "JOINING_RITUAL"
+            
             # Ajout pour gérer le message RITUAL_LVL3_START
-            if action == "RITUAL_LVL3_START":
+            elif action == "RITUAL_LVL3_START":
                 if self.player.level == 2:
                     self.logger.info("🤝 Réception appel rituel niveau 3 - je me dirige vers l'initiateur")
                     coords = tuple(map(int, data.split(',')))
                     self.target_position = coords
+                    self.ritual_target = coords
                     self.state = "JOINING_RITUAL"
                     self.current_ritual_target = 3
                     return True
@@ -745,7 +990,7 @@ class AI:
             data (str): Données du message
         """
         try:
-            current_time = time.time()
+            current_time = self.clock.now()
             
             if player_id not in self.team_status:
                 self.team_status[player_id] = {
@@ -785,7 +1030,7 @@ class AI:
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour du statut d'équipe: {str(e)}")
 
-    def _announce_leadership(self) -> None:
+    async def _announce_leadership(self) -> None:
         """Annonce sa position de leader si elle est la plus haute de l'équipe."""
         try:
             my_level = self.player.level
@@ -798,31 +1043,30 @@ class AI:
             
             if is_highest and self.team_leader_id != str(self.player.id):
                 self.team_leader_id = str(self.player.id)
-                self.communicator.send_team_message("LEADER_ANNOUNCEMENT", f"{self.player.id}:{my_level}")
+                await self.communicator.send_team_message("LEADER_ANNOUNCEMENT", f"{self.player.id}:{my_level}")
                 self.logger.info(f"👑 J'annonce ma position de leader (niveau {my_level})")
                 
         except Exception as e:
             self.logger.error(f"Erreur lors de l'annonce de leadership: {str(e)}")
 
-    def _detect_and_counter_enemy_rituals(self) -> bool:
+    async def _detect_and_counter_enemy_rituals(self) -> bool:
         """Détecte et contrecarre les rituels ennemis.
         
         Returns:
             bool: True si une action de contre-mesure a été effectuée
         """
         try:
-            if not self.vision_manager.vision_data:
+            view = self.vision_manager.view
+            if view is None:
                 return False
             
-            current_tile_content = self.vision_manager.vision_data[0]
-            
-            player_count = current_tile_content.count('player')
-            stone_count = sum(current_tile_content.count(stone) for stone in ['linemate', 'deraumere', 'sibur', 'mendiane', 'phiras', 'thystame'])
+            player_count = view.count(0, 'player')
+            stone_count = view.stones(0)
             
             if player_count >= 2 and stone_count >= 2:
                 self.logger.warning(f"🚨 Rituel ennemi potentiel détecté ! {player_count} joueurs, {stone_count} pierres")
                 
-                success = self.protocol.eject()
+                success = await self.protocol.eject()
                 if success:
                     self.logger.info("💨 Eject lancé pour contrer le rituel ennemi")
                     return True
@@ -843,11 +1087,10 @@ class AI:
             bool: True si une reproduction d'urgence est nécessaire
         """
         try:
-            current_time = time.time()
             active_players = 0
             
             for player_id, status in self.team_status.items():
-                if current_time - status.get('last_seen', 0) < 30:
+                if self.clock.elapsed_ticks(status.get('last_seen', 0)) < self.TEAM_ACTIVITY_TICKS:
                     active_players += 1
             
             active_players += 1
@@ -862,36 +1105,28 @@ class AI:
             self.logger.error(f"Erreur lors de l'évaluation de la reproduction d'urgence: {str(e)}")
             return False
 
-    def _explore_for_food(self):
+    async def _explore_for_food(self):
         """Fonction d'exploration spécifiquement pour trouver de la nourriture."""
         self.logger.info("🗺 Exploration ciblée pour la nourriture...")
         exploration_target = self._generate_emergency_exploration_target()
         if exploration_target:
             self.logger.info(f"🎯 Exploration vers {exploration_target} pour trouver de la nourriture")
-            if self.movement_manager.move_to(exploration_target):
-                self.vision_manager.force_update_vision()
-                if self._collect_available_resources():
-                    self.logger.info("✅ Ressources trouvées lors de l'exploration de sécurité")
+            await self._walk_to(exploration_target[0], exploration_target[1], "food_search")
         else:
             random_direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-            if self.movement_manager.move_to(random_direction):
-                self.vision_manager.force_update_vision()
-                if self._collect_available_resources():
-                    self.logger.info("✅ Ressources trouvées lors du mouvement aléatoire")
+            self.movement_manager.start_towards(random_direction, purpose="food_search")
+            await self._advance_movement()
 
-    def _update_state_when_safe(self) -> None:
+    async def _update_state_when_safe(self) -> None:
         """Met à jour l'état de l'IA uniquement quand la survie est assurée."""
         try:
-            if self._handle_team_messages():
-                return
-            
-            if self._detect_and_counter_enemy_rituals():
+            if await self._detect_and_counter_enemy_rituals():
                 return
             
             if self._should_fork_emergency():
                 self.logger.warning("🥚 Reproduction d'urgence pour maintenir l'effectif de l'équipe")
-                if self.reproduction_manager.reproduce():
-                    self.communicator.send_team_message("EGG_LAID", f"{self.player.x},{self.player.y}")
+                if await self.reproduction_manager.reproduce():
+                    await self.communicator.send_team_message("EGG_LAID", f"{self.player.x},{self.player.y}")
                 return
             
             if 1 <= self.player.level <= 7:
@@ -914,14 +1149,13 @@ class AI:
 
                 # Si on a toutes les ressources, vérifier le nombre de joueurs
                 required_players = self.elevation_manager.ELEVATION_REQUIREMENTS.get(self.player.level, {}).get("players", 1)
-                player_count_on_tile = self.vision_manager.vision_data[0].count('player') if self.vision_manager.vision_data else 0
-                # L'IA se compte elle-même
-                total_players = player_count_on_tile + 1
+                # La case 0 du Look contient déjà le joueur lui-même
+                total_players = self.vision_manager.count_on_tile('player')
                 
                 if total_players < required_players:
                     self.logger.info(f"👥 Pas assez de joueurs pour le rituel du niveau {self.player.level} ({total_players}/{required_players}). Appel à l'aide.")
                     # Envoyer un broadcast pour demander de l'aide
-                    self.communicator.send_team_message("RITUAL_CALL", f"{next_level}:{self.player.id}:{self.player.x},{self.player.y}")
+                    await self._call_for_ritual(next_level)
                     self.state = "AWAITING_PARTICIPANTS"
                     self.ritual_participants_needed = required_players
                     return
@@ -941,10 +1175,10 @@ class AI:
             self.logger.error(f"Erreur lors de la mise à jour de l'état: {str(e)}")
             self.state = "NORMAL_OPERATIONS"
 
-    def _explore_locally_for_food(self):
+    async def _explore_locally_for_food(self):
         """Fait un pas en avant pour chercher de la nourriture à proximité."""
         self.logger.info("🗺️ Pas de nourriture en vue. Un pas en avant pour rafraîchir la vision.")
-        if self.protocol.forward():
+        if await self.movement_manager.move_forward():
             self.logger.info("✅ Pas en avant effectué, vision rafraîchie")
         else:
             self.logger.warning("❌ Impossible de faire un pas en avant")
\ No newline at end of file
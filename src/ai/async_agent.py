@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+import sys
+import argparse
+import asyncio
+import logging
+from typing import List, Optional
+from core.async_client import AsyncZappyClient
+from core.async_protocol import AsyncZappyProtocol
+from models.player import Player
+from models.map import Map
+from ai import AI
+
+class AsyncAgent:
+    """Agent piloté par une boucle asyncio.
+
+    Le réseau et les attentes entre deux ticks sont gérés par la boucle ;
+    le tick de décision de l'IA (AI.update) est une coroutine dont chaque
+    commande attend sa réponse sur la boucle, sans thread : pendant un
+    aller-retour avec le serveur, les autres agents avancent. Un tick ne
+    dort jamais : les délais de l'IA sont des échéances mesurées par
+    l'horloge du serveur.
+    """
+
+    def __init__(self, hostname: str, port: int, team_name: str,
+                 logger: Optional[logging.Logger] = None):
+        """Initialise l'agent.
+
+        Args:
+            hostname (str): Nom d'hôte du serveur
+            port (int): Port du serveur
+            team_name (str): Nom de l'équipe
+            logger (Optional[Logger]): Logger pour les messages
+        """
+        self.client = AsyncZappyClient(hostname, port, team_name)
+        self.logger = logger or logging.getLogger(__name__)
+        self.protocol: Optional[AsyncZappyProtocol] = None
+        self.ai: Optional[AI] = None
+        self.alive = False
+
+    async def start(self) -> None:
+        """Connecte l'agent et construit son IA."""
+        await self.client.connect()
+        self.protocol = AsyncZappyProtocol(self.client)
+        player = Player(
+            id=self.client.client_num,
+            team=self.client.team_name,
+            x=self.client.map_size[0] // 2,
+            y=self.client.map_size[1] // 2,
+            protocol=self.protocol,
+            logger=self.logger
+        )
+        game_map = Map(self.client.map_size[0], self.client.map_size[1])
+        self.ai = AI(self.protocol, player, game_map, self.logger)
+        self.alive = True
+
+    def handle_events(self) -> bool:
+        """Traite les messages asynchrones reçus depuis le dernier tick.
+
+        Returns:
+            bool: False si le serveur a annoncé la mort du joueur
+        """
+        event = self.client.poll_event()
+        while event is not None:
+            self.logger.info(f"📨 Message asynchrone reçu: {event}")
+            if not self.ai.handle_server_message(event):
+                return False
+            event = self.client.poll_event()
+        return True
+
+    async def update(self) -> bool:
+        """Exécute un tick de l'IA.
+
+        Returns:
+            bool: True si l'agent continue de fonctionner
+        """
+        if not self.client.is_connected() or not self.handle_events():
+            return False
+        if self.ai.elevation_in_progress:
+            return True
+        return await self.ai.update()
+
+    def tick_delay(self) -> float:
+        """Délai avant le prochain tick selon l'état de l'IA.
+
+        Returns:
+            float: Délai en secondes
+        """
+        if self.ai.elevation_in_progress or self.ai.state == "EMERGENCY_FOOD_SEARCH":
+            return 0.1
+        return 0.2
+
+    async def run(self) -> None:
+        """Boucle de l'agent jusqu'à sa mort ou la perte de connexion."""
+        try:
+            while self.alive:
+                self.alive = await self.update()
+                if self.alive:
+                    await asyncio.sleep(self.tick_delay())
+        except ConnectionError as e:
+            self.logger.error(f"🔌 Erreur de connexion: {e}")
+        finally:
+            self.alive = False
+            await self.client.close()
+
+
+async def run_agents(hostname: str, port: int, team_name: str, count: int) -> int:
+    """Connecte et fait tourner plusieurs agents dans une même boucle.
+
+    Args:
+        hostname (str): Nom d'hôte du serveur
+        port (int): Port du serveur
+        team_name (str): Nom de l'équipe
+        count (int): Nombre d'agents
+
+    Returns:
+        int: Nombre d'agents qui ont pu se connecter
+    """
+    logger = logging.getLogger(__name__)
+    agents: List[AsyncAgent] = [AsyncAgent(hostname, port, team_name) for _ in range(count)]
+    results = await asyncio.gather(*(agent.start() for agent in agents), return_exceptions=True)
+    started = [agent for agent, result in zip(agents, results) if not isinstance(result, Exception)]
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Échec de la connexion d'un agent: {result}")
+    logger.info(f"🚀 {len(started)}/{count} agents démarrés dans la boucle asyncio")
+    await asyncio.gather(*(agent.run() for agent in started))
+    return len(started)
+
+
+def main() -> int:
+    """Point d'entrée : plusieurs agents asyncio dans un seul processus.
+
+    Returns:
+        int: Code de sortie
+    """
+    parser = argparse.ArgumentParser(description='Zappy AI asyncio runner', add_help=False)
+    parser.add_argument('-p', '--port', type=int, required=True, help='Port number')
+    parser.add_argument('-n', '--name', type=str, required=True, help='Team name')
+    parser.add_argument('-h', '--host', type=str, default="localhost", help='Machine name')
+    parser.add_argument('-c', '--count', type=int, default=1, help='Number of agents')
+    args = parser.parse_args()
+    try:
+        started = asyncio.run(run_agents(args.host, args.port, args.name, args.count))
+    except KeyboardInterrupt:
+        return 0
+    return 0 if started else 84
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+import asyncio
+import logging
+from collections import deque
+from typing import AsyncIterator, Optional
+from .clock import ServerClock
+from .dispatcher import EventDispatcher, ServerEvent
+
+class AsyncZappyClient:
+    """Variante asyncio de ZappyClient basée sur StreamReader/StreamWriter.
+
+    Une tâche de lecture unique découpe le flux en lignes et les confie à un
+    EventDispatcher : les réponses sont rendues aux commandes en attente dans
+    l'ordre d'envoi, les messages asynchrones du serveur sont publiés par le
+    dispatcher et exposés par events().
+    """
+
+    MAX_PENDING = 10
+
+    def __init__(self, hostname: str, port: int, team_name: str):
+        """Initialise le client Zappy asynchrone.
+
+        Args:
+            hostname (str): Nom d'hôte du serveur
+            port (int): Port du serveur
+            team_name (str): Nom de l'équipe
+        """
+        self.hostname = hostname
+        self.port = port
+        self.team_name = team_name
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.logger = logging.getLogger(__name__)
+        self.map_size = None
+        self.client_num = None
+        self.server_disconnected = False
+        self.pending_replies = deque()
+        self.dispatcher = EventDispatcher()
+        self.clock = ServerClock()
+        self.event_queue: asyncio.Queue = asyncio.Queue()
+        for kind in EventDispatcher.KINDS:
+            self.dispatcher.subscribe(kind, self._on_event)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._read_task: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        """Établit la connexion et effectue le protocole d'authentification."""
+        try:
+            self.logger.info(f"Tentative de connexion à {self.hostname}:{self.port}")
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.hostname, self.port), timeout=7.0)
+
+            welcome = await self._read_line(7.0)
+            if welcome != "WELCOME":
+                raise Exception(f"Message de bienvenue invalide: {welcome}")
+
+            self.writer.write(f"{self.team_name}\n".encode())
+            await self.writer.drain()
+
+            response = await self._read_line(7.0)
+            try:
+                self.client_num = int(response)
+            except ValueError:
+                raise Exception(f"Numéro de client invalide: {response}")
+
+            map_size = await self._read_line(7.0)
+            try:
+                dimensions = map_size.split()
+                if len(dimensions) != 2:
+                    raise Exception(f"Format de dimensions invalide: {map_size}")
+                self.map_size = (int(dimensions[0]), int(dimensions[1]))
+            except ValueError:
+                raise Exception(f"Dimensions invalides: {map_size}")
+
+            self.server_disconnected = False
+            self._slots = asyncio.Semaphore(self.MAX_PENDING)
+            self._read_task = asyncio.create_task(self._read_loop())
+            self.logger.info(f"Connecté au serveur. Client #{self.client_num}, Carte: {self.map_size[0]}x{self.map_size[1]}")
+
+        except Exception as e:
+            self.logger.error(f"Erreur de connexion: {e}")
+            await self.close()
+            raise
+
+    def is_connected(self) -> bool:
+        """Vérifie si la connexion au serveur est toujours active.
+
+        Returns:
+            bool: True si la connexion est active, False sinon
+        """
+        if self.server_disconnected or not self.writer:
+            return False
+        return not self.writer.is_closing()
+
+    async def _read_line(self, timeout: Optional[float] = None) -> str:
+        """Lit une ligne non vide du flux.
+
+        Args:
+            timeout (Optional[float]): Délai maximal en secondes
+
+        Returns:
+            str: Ligne sans son '\\n' final
+
+        Raises:
+            ConnectionError: Si le serveur a fermé la connexion
+        """
+        while True:
+            data = await asyncio.wait_for(self.reader.readline(), timeout)
+            if not data:
+                self.server_disconnected = True
+                raise ConnectionError("Connexion fermée par le serveur")
+            line = data.decode('utf-8', errors='replace').rstrip('\r\n')
+            if line:
+                return line
+
+    def _on_event(self, event: ServerEvent) -> None:
+        """Transmet un événement du dispatcher à la file asynchrone.
+
+        La file du dispatcher est vidée de l'événement : events() et
+        poll_event() sont les seuls consommateurs côté asyncio.
+
+        Args:
+            event (ServerEvent): Événement publié
+        """
+        self.dispatcher.queues[event.kind].pop()
+        self.event_queue.put_nowait(event.line)
+
+    async def _read_loop(self) -> None:
+        """Distribue chaque ligne reçue aux commandes ou à la file d'événements."""
+        try:
+            while True:
+                line = await self._read_line()
+                self.logger.debug(f"Données reçues: {line}")
+                if line == "dead":
+                    self.logger.critical("💀 Message 'dead' reçu du serveur - le joueur est mort !")
+                    self.server_disconnected = True
+                reply = self.dispatcher.route(line)
+                if reply is not None and self.pending_replies:
+                    self.clock.on_reply()
+                    future = self.pending_replies.popleft()
+                    if not future.done():
+                        future.set_result(reply)
+                if self.server_disconnected:
+                    break
+        except (ConnectionError, OSError) as e:
+            self.logger.warning(f"🔌 Fin de la lecture: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.server_disconnected = True
+            self._fail_pending()
+            self.event_queue.put_nowait(None)
+
+    def _fail_pending(self) -> None:
+        """Fait échouer toutes les commandes encore en attente de réponse."""
+        self.dispatcher.pending.clear()
+        self.clock.reset()
+        while self.pending_replies:
+            future = self.pending_replies.popleft()
+            if not future.done():
+                future.set_exception(ConnectionError("Connexion au serveur perdue"))
+
+    def _get_timeout(self, command: str) -> float:
+        """Récupère le timeout pour une commande donnée.
+
+        Args:
+            command (str): Commande envoyée
+
+        Returns:
+            float: Timeout en secondes, selon la fréquence estimée du serveur
+        """
+        return self.clock.timeout(command)
+
+    async def request(self, command: str) -> str:
+        """Envoie une commande et attend sa réponse.
+
+        Plusieurs requêtes concurrentes sont pipelinées : au plus MAX_PENDING
+        commandes sont en vol et les réponses sont associées dans l'ordre.
+
+        Args:
+            command (str): Commande sans le '\\n' final
+
+        Returns:
+            str: Réponse du serveur
+
+        Raises:
+            ConnectionError: Si la connexion est perdue
+        """
+        if not self.is_connected():
+            raise ConnectionError("Connexion au serveur perdue")
+        async with self._slots:
+            future = asyncio.get_running_loop().create_future()
+            self.pending_replies.append(future)
+            self.dispatcher.expect(command)
+            self.clock.on_send(command)
+            try:
+                self.writer.write(f"{command}\n".encode())
+                await self.writer.drain()
+            except (OSError, ConnectionError) as e:
+                self.server_disconnected = True
+                self._fail_pending()
+                raise ConnectionError(f"Erreur d'envoi: {e}")
+            self.logger.debug(f"Envoyé: {command}")
+            return await future
+
+    def poll_event(self) -> Optional[str]:
+        """Rend le prochain message asynchrone sans attendre.
+
+        Returns:
+            Optional[str]: Message en attente, ou None
+        """
+        try:
+            return self.event_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def events(self) -> AsyncIterator[str]:
+        """Itère sur les messages asynchrones jusqu'à la déconnexion.
+
+        Yields:
+            str: Message asynchrone (broadcast, eject, niveau, dead...)
+        """
+        while True:
+            event = await self.event_queue.get()
+            if event is None:
+                return
+            yield event
+
+    async def close(self):
+        """Ferme la connexion avec le serveur."""
+        self.server_disconnected = True
+        if self._read_task and self._read_task is not asyncio.current_task():
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+        self._read_task = None
+        self._fail_pending()
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+            self.writer = None
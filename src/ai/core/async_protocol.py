@@ -0,0 +1,229 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, List, Optional
+from .async_client import AsyncZappyClient
+from .client import ZappyClient
+from .protocol import ZappyProtocol
+
+class AsyncZappyProtocol(ZappyProtocol):
+    """Version non bloquante de ZappyProtocol.
+
+    Les fonctions de parsing et la conversion des réponses sont héritées ;
+    les commandes attendent leur réponse sur la boucle asyncio au lieu de
+    bloquer sur le socket. AI.update et les managers les attendent tels
+    quels. Des appels concurrents (asyncio.gather) partent en rafale grâce
+    au pipeline du client.
+    """
+
+    def __init__(self, client: AsyncZappyClient):
+        """Initialise le protocole avec un client asynchrone.
+
+        Args:
+            client (AsyncZappyClient): Client connecté au serveur
+        """
+        super().__init__(client)
+
+    async def _command(self, command: str) -> Any:
+        """Envoie une commande et convertit sa réponse.
+
+        Args:
+            command (str): Commande sans le '\\n' final
+
+        Returns:
+            Any: Résultat converti comme dans ZappyProtocol.pipeline
+        """
+        self._check_connection()
+        response = (await self.client.request(command)).strip()
+        return self._parse_result(command, response)
+
+    async def forward(self) -> bool:
+        """Avance d'une case."""
+        return await self._command("Forward")
+
+    async def right(self) -> bool:
+        """Tourne à droite."""
+        return await self._command("Right")
+
+    async def left(self) -> bool:
+        """Tourne à gauche."""
+        return await self._command("Left")
+
+    async def look(self) -> str:
+        """Regarde autour du joueur."""
+        return await self._command("Look")
+
+    async def inventory(self) -> str:
+        """Consulte l'inventaire."""
+        return await self._command("Inventory")
+
+    async def broadcast(self, message: str) -> bool:
+        """Envoie un message à tous les joueurs.
+
+        Args:
+            message (str): Message à envoyer
+        """
+        return await self._command(f"Broadcast {message}")
+
+    async def connect_nbr(self) -> int:
+        """Demande le nombre de places disponibles dans l'équipe."""
+        return await self._command("Connect_nbr")
+
+    async def fork(self) -> bool:
+        """Pond un œuf."""
+        return await self._command("Fork")
+
+    async def eject(self) -> bool:
+        """Expulse les joueurs de la case."""
+        return await self._command("Eject")
+
+    async def take(self, object_name: str) -> bool:
+        """Prend un objet.
+
+        Args:
+            object_name (str): Nom de l'objet à prendre
+        """
+        return await self._command(f"Take {object_name}")
+
+    async def set(self, object_name: str) -> bool:
+        """Pose un objet.
+
+        Args:
+            object_name (str): Nom de l'objet à poser
+        """
+        return await self._command(f"Set {object_name}")
+
+    async def incantation(self) -> bool:
+        """Commence un rituel d'élévation."""
+        return await self._command("Incantation")
+
+    async def pipeline(self, commands: List[str]) -> List[Any]:
+        """Envoie une rafale de commandes et rend leurs résultats dans l'ordre.
+
+        Args:
+            commands (List[str]): Commandes à envoyer
+
+        Returns:
+            List[Any]: Résultats dans l'ordre des commandes
+        """
+        return list(await asyncio.gather(*(self._command(c) for c in commands)))
+
+
+
+class PendingReply:
+    """Réponse attendue d'une commande envoyée, livrée par le sélecteur.
+
+    Attendre une réponse pas encore arrivée suspend la coroutine : l'objet
+    est rendu à celui qui la fait avancer (MultiAgentRunner), qui la
+    reprend une fois la réponse livrée.
+    """
+
+    def __init__(self, command: str):
+        """Initialise la réponse attendue.
+
+        Args:
+            command (str): Commande envoyée
+        """
+        self.command = command
+        self.done = False
+        self.response: Optional[str] = None
+        self.error: Optional[Exception] = None
+
+    def set_result(self, response: str) -> None:
+        """Livre la réponse du serveur.
+
+        Args:
+            response (str): Ligne reçue
+        """
+        self.response = response
+        self.done = True
+
+    def set_error(self, error: Exception) -> None:
+        """Fait échouer l'attente.
+
+        Args:
+            error (Exception): Exception levée chez l'appelant
+        """
+        self.error = error
+        self.done = True
+
+    def __await__(self):
+        while not self.done:
+            yield self
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+class SelectorProtocol(AsyncZappyProtocol):
+    """AsyncZappyProtocol sur un ZappyClient surveillé par un sélecteur.
+
+    Les commandes sont écrites aussitôt, au plus MAX_PENDING en vol, et
+    attendent une PendingReply sans lire le socket. Le propriétaire du
+    sélecteur lit le socket quand il est lisible et appelle deliver() :
+    les réponses sont rendues dans l'ordre d'envoi.
+    """
+
+    def __init__(self, client: ZappyClient):
+        """Initialise le protocole.
+
+        Args:
+            client (ZappyClient): Client connecté, lu par le sélecteur
+        """
+        super().__init__(client)
+        self.in_flight: Deque[PendingReply] = deque()
+
+    async def _send(self, command: str) -> PendingReply:
+        """Écrit une commande, après la plus ancienne réponse si la file est pleine.
+
+        Args:
+            command (str): Commande sans le '\\n' final
+
+        Returns:
+            PendingReply: Réponse à attendre
+        """
+        self._check_connection()
+        while len(self.in_flight) >= self.MAX_PENDING:
+            await self.in_flight[0]
+        reply = PendingReply(command)
+        self.client._send(f"{command}\n")
+        self.in_flight.append(reply)
+        return reply
+
+    async def _command(self, command: str) -> Any:
+        """Envoie une commande et convertit sa réponse.
+
+        Args:
+            command (str): Commande sans le '\\n' final
+
+        Returns:
+            Any: Résultat converti comme dans ZappyProtocol.pipeline
+        """
+        reply = await self._send(command)
+        return self._parse_result(command, (await reply).strip())
+
+    async def pipeline(self, commands: List[str]) -> List[Any]:
+        """Envoie une rafale de commandes et rend leurs résultats dans l'ordre.
+
+        Args:
+            commands (List[str]): Commandes à envoyer
+
+        Returns:
+            List[Any]: Résultats dans l'ordre des commandes
+        """
+        replies = [await self._send(command) for command in commands]
+        return [self._parse_result(reply.command, (await reply).strip()) for reply in replies]
+
+    def deliver(self) -> None:
+        """Complète les commandes en vol avec les réponses routées par le client."""
+        replies = self.client.dispatcher.replies
+        while replies and self.in_flight:
+            self.in_flight.popleft().set_result(replies.popleft())
+
+    def fail(self, error: Exception) -> None:
+        """Fait échouer toutes les commandes en vol.
+
+        Args:
+            error (Exception): Exception levée chez chaque appelant
+        """
+        while self.in_flight:
+            self.in_flight.popleft().set_error(error)
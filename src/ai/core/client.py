@@ -1,27 +1,42 @@
 import socket
+import random
 import logging
-from typing import Tuple, Optional
+from typing import Any, Coroutine, Tuple, Optional
+from .line_buffer import LineBuffer
+from .dispatcher import EventDispatcher
+from .clock import ServerClock
+from .recorder import SessionRecorder
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+def run_blocking(coroutine: Coroutine) -> Any:
+    """Mène à son terme une coroutine dont les commandes sont bloquantes.
+    
+    Avec ZappyProtocol, chaque commande se termine sans suspendre : un seul
+    send() suffit, sans boucle asyncio.
+    
+    Args:
+        coroutine (Coroutine): Coroutine à exécuter (ex: AI.update())
+        
+    Returns:
+        Any: Valeur rendue par la coroutine
+        
+    Raises:
+        RuntimeError: Si la coroutine attend une réponse asynchrone
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("La coroutine attend une réponse asynchrone sur un client bloquant")
+
+
 class ZappyClient:
-    TIMEOUTS = {
-        "Forward": 7,
-        "Right": 7,
-        "Left": 7,
-        "Look": 7,
-        "Inventory": 1,
-        "Broadcast": 7,
-        "Connect_nbr": 42,
-        "Fork": 42,
-        "Eject": 7,
-        "Take": 7,
-        "Set": 7,
-        "Incantation": 300
-    }
+    RECV_SIZE = 4096
 
     def __init__(self, hostname: str, port: int, team_name: str):
         """Initialise le client Zappy.
@@ -40,14 +55,17 @@ class ZappyClient:
         self.client_num = None
         self.ai = None
         self.server_disconnected = False
+        self.reader = LineBuffer()
+        self.dispatcher = EventDispatcher()
+        self.clock = ServerClock()
+        self.recorder = None
 
     def connect(self):
         """Établit la connexion avec le serveur et effectue le protocole d'authentification."""
         try:
             self.logger.info(f"Tentative de connexion à {self.hostname}:{self.port}")
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(7.0)
-            self.socket.connect((self.hostname, self.port))
+            self.reader.clear()
+            self.socket = self._open_socket()
             self.logger.info("Socket connecté avec succès")
 
             self.logger.info("En attente du message de bienvenue...")
@@ -87,6 +105,8 @@ class ZappyClient:
             except ValueError:
                 raise Exception(f"Dimensions invalides: {map_size}")
 
+            self.dispatcher.reset()
+            self.clock.reset()
             self.logger.info(f"Connecté au serveur. Client #{self.client_num}, Carte: {self.map_size[0]}x{self.map_size[1]}")
 
         except Exception as e:
@@ -96,6 +116,37 @@ class ZappyClient:
                 self.socket = None
             raise
 
+    def _open_socket(self) -> socket.socket:
+        """Ouvre la connexion TCP vers le serveur.
+
+        Returns:
+            socket.socket: Socket connecté
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(7.0)
+        sock.connect((self.hostname, self.port))
+        return sock
+
+    def start_recording(self, path: str, seed: Optional[int] = None) -> None:
+        """Active l'enregistrement de la session dans un fichier.
+
+        Le module random est réensemencé avec la graine enregistrée pour
+        que le rejeu reprenne les mêmes décisions aléatoires.
+
+        Args:
+            path (str): Fichier d'enregistrement (écrasé s'il existe)
+            seed (Optional[int]): Graine imposée, tirée au hasard si absente
+        """
+        self.stop_recording()
+        self.recorder = SessionRecorder(path, self.hostname, self.port, self.team_name, seed)
+        random.seed(self.recorder.seed)
+
+    def stop_recording(self) -> None:
+        """Arrête l'enregistrement en cours et ferme son fichier."""
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+
     def is_connected(self) -> bool:
         """Vérifie si la connexion au serveur est toujours active.
         
@@ -124,10 +175,9 @@ class ZappyClient:
             command (str): Nom de la commande
             
         Returns:
-            float: Timeout en secondes
+            float: Timeout en secondes, selon la fréquence estimée du serveur
         """
-        cmd_name = command.split()[0]
-        return self.TIMEOUTS.get(cmd_name, 7.0)
+        return self.clock.timeout(command)
 
     def _send(self, message: str):
         """Envoie un message au serveur.
@@ -151,6 +201,10 @@ class ZappyClient:
             self.socket.settimeout(timeout)
             
             self.socket.send(message.encode())
+            if self.recorder:
+                self.recorder.sent(message)
+            self.dispatcher.expect(message)
+            self.clock.on_send(message)
             self.logger.debug(f"Envoyé ({timeout}s): {message.strip()}")
             
         except socket.timeout:
@@ -165,32 +219,90 @@ class ZappyClient:
         finally:
             self.socket.settimeout(None)
 
+    def _next_buffered_line(self) -> Optional[str]:
+        """Extrait la prochaine ligne non vide déjà présente dans le tampon.
+
+        Returns:
+            Optional[str]: Ligne reçue, ou None si aucune ligne complète
+        """
+        while True:
+            line = self.reader.pop_line()
+            if line and self.recorder:
+                self.recorder.received(line)
+            if line is None or line:
+                return line
+
+    def _fill_buffer(self) -> None:
+        """Effectue un recv et ajoute les octets reçus au tampon de lignes.
+
+        Raises:
+            ConnectionError: Si le serveur a fermé la connexion
+        """
+        data = self.socket.recv(self.RECV_SIZE)
+        if not data:
+            self.logger.warning("🔌 Serveur a fermé la connexion")
+            self.server_disconnected = True
+            raise ConnectionError("Connexion fermée par le serveur")
+        self.reader.feed(data)
+
+    def _check_dead(self, line: str) -> None:
+        """Marque la connexion comme perdue si le serveur annonce notre mort.
+
+        Args:
+            line (str): Ligne reçue du serveur
+        """
+        if line == "dead":
+            self.logger.critical("💀 Message 'dead' reçu du serveur - le joueur est mort !")
+            self.server_disconnected = True
+
+    def _route_buffered(self) -> None:
+        """Distribue toutes les lignes complètes du tampon au dispatcher.
+
+        Les réponses arrivées pour une commande en vol sont conservées pour
+        le prochain _receive, les événements sont rangés dans leurs files.
+        """
+        line = self._next_buffered_line()
+        while line is not None:
+            self._check_dead(line)
+            reply = self.dispatcher.route(line)
+            if reply is not None:
+                self.clock.on_reply()
+                self.dispatcher.replies.append(reply)
+            line = self._next_buffered_line()
+
     def _receive(self) -> str:
-        """Reçoit une réponse du serveur."""
+        """Reçoit la prochaine réponse de commande envoyée par le serveur.
+
+        Les lignes déjà présentes dans le tampon sont rendues sans appel
+        système ; sinon on lit le socket jusqu'à obtenir une ligne complète.
+        Les messages asynchrones lus au passage sont confiés au dispatcher.
+        """
         if not self.socket:
             raise Exception("Socket non connecté")
             
         if self.server_disconnected:
             raise ConnectionError("Connexion au serveur perdue")
+
+        if self.dispatcher.replies:
+            return self.dispatcher.replies.popleft()
         
         try:
-            self.logger.debug("En attente de données du serveur...")
-            data = self.socket.recv(4096)
-            if not data:
-                self.logger.warning("🔌 Serveur a fermé la connexion")
-                self.server_disconnected = True
-                raise ConnectionError("Connexion fermée par le serveur")
-            
-            response = data.decode('utf-8').strip()
-            self.logger.debug(f"Données reçues: {response}")
-            
-            # Vérifier si c'est le message "dead"
-            if response == "dead":
-                self.logger.critical("💀 Message 'dead' reçu du serveur - le joueur est mort !")
-                self.server_disconnected = True
-                raise ConnectionError("Joueur mort - connexion fermée par le serveur")
-            
-            return response
+            while True:
+                line = self._next_buffered_line()
+                while line is None:
+                    self.logger.debug("En attente de données du serveur...")
+                    self._fill_buffer()
+                    line = self._next_buffered_line()
+
+                self.logger.debug(f"Données reçues: {line}")
+                
+                self._check_dead(line)
+                reply = self.dispatcher.route(line, expecting_reply=True)
+                if self.server_disconnected:
+                    raise ConnectionError("Joueur mort - connexion fermée par le serveur")
+                if reply is not None:
+                    self.clock.on_reply()
+                    return reply
         except socket.timeout:
             self.logger.error("Timeout lors de la réception des données")
             raise
@@ -214,7 +326,7 @@ class ZappyClient:
                 self.logger.error("🔌 Connexion au serveur perdue, arrêt de l'IA")
                 return False
                 
-            return self.ai.update()
+            return run_blocking(self.ai.update())
         except ConnectionError as e:
             self.logger.error(f"🔌 Erreur de connexion dans l'exécution de l'IA: {e}")
             return False
@@ -227,38 +339,50 @@ class ZappyClient:
         if self.socket:
             self.socket.close()
             self.socket = None
+        self.reader.clear()
+        self.stop_recording()
         self.server_disconnected = True
 
+    def poll_socket(self) -> None:
+        """Lit sans bloquer les données disponibles et les distribue.
+
+        Une lecture n'est faite que si aucune ligne complète n'est déjà
+        dans le tampon.
+        """
+        if not self.socket or self.server_disconnected:
+            return
+
+        if not self.reader.has_line():
+            try:
+                self.socket.settimeout(0.001)
+                data = self.socket.recv(self.RECV_SIZE)
+                if data:
+                    self.reader.feed(data)
+            except socket.timeout:
+                pass
+            except (socket.error, OSError, ConnectionError) as e:
+                self.logger.error(f"Erreur lors de la vérification des messages: {e}")
+                self.server_disconnected = True
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la vérification des messages: {e}")
+            finally:
+                if self.socket:
+                    self.socket.settimeout(None)
+
+        self._route_buffered()
+
     def check_for_messages(self) -> Optional[str]:
-        """Vérifie s'il y a des messages en attente du serveur.
+        """Vérifie s'il y a des messages asynchrones en attente du serveur.
         
         Returns:
             str: Message reçu, ou None s'il n'y en a pas
         """
-        if not self.socket or self.server_disconnected:
+        if not self.socket:
             return None
-            
-        try:
-            self.socket.settimeout(0.001)
-            data = self.socket.recv(4096)
-            if data:
-                message = data.decode('utf-8').strip()
-                self.logger.debug(f"Message reçu: {message}")
-                
-                # Vérifier si c'est le message "dead"
-                if message == "dead":
-                    self.logger.critical("💀 Message 'dead' reçu du serveur - le joueur est mort !")
-                    self.server_disconnected = True
-                
-                return message
-        except socket.timeout:
-            pass
-        except (socket.error, OSError, ConnectionError) as e:
-            self.logger.error(f"Erreur lors de la vérification des messages: {e}")
-            self.server_disconnected = True
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la vérification des messages: {e}")
-        finally:
-            self.socket.settimeout(None)
-            
-        return None
\ No newline at end of file
+
+        self.poll_socket()
+        event = self.dispatcher.pop()
+        if event is None:
+            return None
+        self.logger.debug(f"Message reçu: {event.line}")
+        return event.line
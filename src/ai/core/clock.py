@@ -0,0 +1,206 @@
+import time
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Optional, Tuple
+
+class ServerClock:
+    """Horloge du serveur exprimée en unités de temps (ticks).
+
+    La fréquence du serveur (option -f) n'est pas communiquée aux clients :
+    elle est estimée en ligne à partir de la latence des réponses aux
+    commandes dont le coût est connu. Une commande commence à être exécutée
+    quand la précédente a répondu ; sa durée de service divisée par son coût
+    donne un échantillon de durée de tick, et la médiane des derniers
+    échantillons écarte les valeurs gonflées par un gel (rituel) ou le réseau.
+    """
+
+    DEFAULT_FREQUENCY = 1.0
+    COSTS = {
+        "Forward": 7,
+        "Right": 7,
+        "Left": 7,
+        "Look": 7,
+        "Inventory": 1,
+        "Broadcast": 7,
+        "Connect_nbr": 0,
+        "Fork": 42,
+        "Eject": 7,
+        "Take": 7,
+        "Set": 7,
+        "Incantation": 300
+    }
+    DEFAULT_COST = 7
+    UNTIMED = ("Connect_nbr", "Incantation")
+    WINDOW = 15
+    MIN_TIMEOUT = 1.0
+    TIMEOUT_MARGIN = 2.0
+
+    def __init__(self, frequency: float = DEFAULT_FREQUENCY, time_source: Optional[Callable[[], float]] = None):
+        """Initialise l'horloge.
+
+        Args:
+            frequency (float): Fréquence supposée tant qu'aucune réponse n'a été mesurée
+            time_source (Optional[Callable]): Source de temps virtuelle (rejeu), sinon l'horloge système
+        """
+        self.logger = logging.getLogger(__name__)
+        self.time_source = time_source
+        self.samples: Deque[float] = deque(maxlen=self.WINDOW)
+        self.in_flight: Deque[Tuple[str, float]] = deque()
+        self.last_reply_at = 0.0
+        self._tick_duration = 1.0 / frequency
+
+    @classmethod
+    def of(cls, protocol: Any) -> "ServerClock":
+        """Récupère l'horloge du client d'un protocole, ou en crée une.
+
+        Args:
+            protocol (Any): Protocole dont le client porte l'horloge
+
+        Returns:
+            ServerClock: Horloge partagée avec le client
+        """
+        clock = getattr(getattr(protocol, 'client', None), 'clock', None)
+        return clock if isinstance(clock, cls) else cls()
+
+    @property
+    def tick_duration(self) -> float:
+        """Durée estimée d'une unité de temps en secondes."""
+        return self._tick_duration
+
+    @property
+    def frequency(self) -> float:
+        """Fréquence estimée du serveur (ticks par seconde)."""
+        return 1.0 / self._tick_duration
+
+    def is_calibrated(self) -> bool:
+        """Indique si la fréquence a été mesurée au moins une fois.
+
+        Returns:
+            bool: True si au moins une réponse a été chronométrée
+        """
+        return bool(self.samples)
+
+    def cost(self, command: str) -> int:
+        """Coût d'une commande en unités de temps.
+
+        Args:
+            command (str): Commande, avec ou sans argument
+
+        Returns:
+            int: Coût de la commande
+        """
+        name = command.split()[0] if command.strip() else command
+        return self.COSTS.get(name, self.DEFAULT_COST)
+
+    def seconds(self, ticks: float) -> float:
+        """Convertit une durée en ticks en secondes.
+
+        Args:
+            ticks (float): Durée en unités de temps
+
+        Returns:
+            float: Durée en secondes
+        """
+        return ticks * self._tick_duration
+
+    def ticks(self, seconds: float) -> float:
+        """Convertit une durée en secondes en ticks.
+
+        Args:
+            seconds (float): Durée en secondes
+
+        Returns:
+            float: Durée en unités de temps
+        """
+        return seconds / self._tick_duration
+
+    def now(self) -> float:
+        """Horodatage courant, dans la même base que les last_*_time des managers.
+
+        Returns:
+            float: Temps courant en secondes
+        """
+        if self.time_source:
+            return self.time_source()
+        return time.time()
+
+    def _stamp(self) -> float:
+        """Instant servant à chronométrer les réponses.
+
+        Returns:
+            float: time.monotonic, ou la source de temps virtuelle
+        """
+        if self.time_source:
+            return self.time_source()
+        return time.monotonic()
+
+    def elapsed_ticks(self, since: float) -> float:
+        """Nombre de ticks écoulés depuis un horodatage.
+
+        Args:
+            since (float): Horodatage de départ (now())
+
+        Returns:
+            float: Ticks écoulés
+        """
+        return self.ticks(self.now() - since)
+
+    def timeout(self, command: str) -> float:
+        """Délai d'attente en secondes pour une commande.
+
+        Args:
+            command (str): Commande envoyée
+
+        Returns:
+            float: Timeout en secondes
+        """
+        return max(self.MIN_TIMEOUT, self.seconds(self.cost(command) * self.TIMEOUT_MARGIN))
+
+    def on_send(self, command: str, at: Optional[float] = None) -> None:
+        """Note l'envoi d'une commande (le nom d'équipe de la poignée de main est ignoré).
+
+        Args:
+            command (str): Commande envoyée
+            at (Optional[float]): Instant d'envoi (time.monotonic)
+        """
+        name = command.split()[0] if command.strip() else command
+        if name not in self.COSTS:
+            return
+        self.in_flight.append((name, self._stamp() if at is None else at))
+
+    def on_reply(self, at: Optional[float] = None) -> None:
+        """Note la réponse à la plus ancienne commande en vol.
+
+        Args:
+            at (Optional[float]): Instant de réception (time.monotonic)
+        """
+        if not self.in_flight:
+            return
+        at = self._stamp() if at is None else at
+        name, sent_at = self.in_flight.popleft()
+        started = max(sent_at, self.last_reply_at)
+        self.last_reply_at = at
+        if name not in self.UNTIMED:
+            self.observe(name, at - started)
+
+    def observe(self, command: str, duration: float) -> None:
+        """Ajoute un échantillon de latence pour une commande de coût connu.
+
+        Args:
+            command (str): Commande chronométrée
+            duration (float): Durée de service en secondes
+        """
+        cost = self.cost(command)
+        if cost <= 0 or duration <= 0:
+            return
+        self.samples.append(duration / cost)
+        ordered = sorted(self.samples)
+        previous = self.frequency
+        self._tick_duration = ordered[len(ordered) // 2]
+        if len(self.samples) == 1 or abs(self.frequency - previous) > previous * 0.25:
+            self.logger.info(f"⏱️ Fréquence du serveur estimée à {self.frequency:.1f} ticks/s")
+
+    def reset(self) -> None:
+        """Oublie les commandes en vol (nouvelle connexion), garde l'estimation."""
+        self.in_flight.clear()
+        self.last_reply_at = 0.0
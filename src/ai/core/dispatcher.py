@@ -0,0 +1,210 @@
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+class ServerEvent:
+    """Message asynchrone reçu du serveur."""
+
+    def __init__(self, kind: str, line: str, sequence: int):
+        """Initialise l'événement.
+
+        Args:
+            kind (str): Type d'événement (voir EventDispatcher.KINDS)
+            line (str): Ligne brute reçue
+            sequence (int): Numéro d'ordre d'arrivée
+        """
+        self.kind = kind
+        self.line = line
+        self.sequence = sequence
+
+    def __repr__(self) -> str:
+        return f"ServerEvent({self.kind!r}, {self.line!r})"
+
+
+class EventDispatcher:
+    """Sépare les messages asynchrones du serveur des réponses aux commandes.
+
+    Chaque ligne reçue est classée : une réponse est rendue à la commande en
+    attente la plus ancienne, un événement est publié aux abonnés de son
+    type puis rangé dans la file de ce type pour les consommateurs qui
+    interrogent le dispatcher.
+    """
+
+    MESSAGE = "message"
+    EJECT = "eject"
+    LEVEL = "level"
+    ELEVATION = "elevation"
+    ELEVATION_FAILED = "elevation_failed"
+    DEAD = "dead"
+    UNKNOWN = "unknown"
+    KINDS = (MESSAGE, EJECT, LEVEL, ELEVATION, ELEVATION_FAILED, DEAD, UNKNOWN)
+    MAX_QUEUED = 256
+
+    def __init__(self):
+        """Initialise des files vides pour chaque type d'événement."""
+        self.logger = logging.getLogger(__name__)
+        self.pending: Deque[str] = deque()
+        self.replies: Deque[str] = deque()
+        self.queues: Dict[str, Deque[ServerEvent]] = {kind: deque(maxlen=self.MAX_QUEUED) for kind in self.KINDS}
+        self.subscribers: Dict[str, List[Callable[[ServerEvent], None]]] = {kind: [] for kind in self.KINDS}
+        self.in_ritual = False
+        self._sequence = 0
+
+    def reset(self) -> None:
+        """Oublie les commandes en attente, réponses et événements."""
+        self.pending.clear()
+        self.replies.clear()
+        for events in self.queues.values():
+            events.clear()
+        self.in_ritual = False
+
+    def expect(self, command: str) -> None:
+        """Enregistre une commande envoyée dont la réponse est attendue.
+
+        Args:
+            command (str): Commande envoyée au serveur
+        """
+        name = command.split()[0] if command.strip() else command
+        self.pending.append(name)
+
+    def subscribe(self, kind: str, callback: Callable[[ServerEvent], None]) -> None:
+        """Abonne une fonction à un type d'événement.
+
+        Args:
+            kind (str): Type d'événement
+            callback (Callable): Fonction appelée avec chaque ServerEvent
+        """
+        self.subscribers[kind].append(callback)
+
+    def unsubscribe(self, kind: str, callback: Callable[[ServerEvent], None]) -> None:
+        """Désabonne une fonction d'un type d'événement.
+
+        Args:
+            kind (str): Type d'événement
+            callback (Callable): Fonction à retirer
+        """
+        if callback in self.subscribers[kind]:
+            self.subscribers[kind].remove(callback)
+
+    def classify(self, line: str) -> Optional[str]:
+        """Détermine si une ligne est un événement et de quel type.
+
+        "Elevation underway" est la réponse à notre Incantation si elle est
+        attendue, sinon l'annonce d'un rituel lancé par un autre joueur. Un
+        "ko" sans commande en attente pendant un rituel signale son échec.
+
+        Args:
+            line (str): Ligne reçue
+
+        Returns:
+            Optional[str]: Type d'événement, ou None pour une réponse
+        """
+        if line == "dead":
+            return self.DEAD
+        if line.startswith("message "):
+            return self.MESSAGE
+        if line.startswith("eject:"):
+            return self.EJECT
+        if line.startswith("Current level:"):
+            return self.LEVEL
+        if line == "Elevation underway":
+            if self.pending and self.pending[0] == "Incantation":
+                return None
+            return self.ELEVATION
+        if line == "ko" and not self.pending and self.in_ritual:
+            return self.ELEVATION_FAILED
+        return None
+
+    def route(self, line: str, expecting_reply: bool = False) -> Optional[str]:
+        """Classe une ligne reçue et la distribue.
+
+        Args:
+            line (str): Ligne reçue du serveur
+            expecting_reply (bool): True si l'appelant attend une réponse
+
+        Returns:
+            Optional[str]: La ligne si c'est une réponse, None si c'est un événement
+        """
+        kind = self.classify(line)
+        if line == "Elevation underway":
+            self.in_ritual = True
+        elif kind in (self.LEVEL, self.ELEVATION_FAILED):
+            self.in_ritual = False
+
+        if kind is not None:
+            self.publish(kind, line)
+            return None
+        if self.pending:
+            self.pending.popleft()
+            return line
+        if expecting_reply:
+            return line
+        self.publish(self.UNKNOWN, line)
+        return None
+
+    def publish(self, kind: str, line: str) -> ServerEvent:
+        """Range un événement dans sa file et prévient les abonnés.
+
+        Args:
+            kind (str): Type d'événement
+            line (str): Ligne brute
+
+        Returns:
+            ServerEvent: Événement publié
+        """
+        self._sequence += 1
+        event = ServerEvent(kind, line, self._sequence)
+        self.queues[kind].append(event)
+        for callback in list(self.subscribers[kind]):
+            try:
+                callback(event)
+            except Exception as e:
+                self.logger.error(f"Erreur dans un abonné aux événements '{kind}': {e}")
+        return event
+
+    def pop(self, kind: Optional[str] = None) -> Optional[ServerEvent]:
+        """Retire le plus ancien événement d'un type, ou de tous types.
+
+        Args:
+            kind (Optional[str]): Type voulu, ou None pour l'ordre d'arrivée
+
+        Returns:
+            Optional[ServerEvent]: Événement, ou None si la file est vide
+        """
+        if kind is not None:
+            events = self.queues[kind]
+            return events.popleft() if events else None
+        oldest = None
+        for events in self.queues.values():
+            if events and (oldest is None or events[0].sequence < oldest[0].sequence):
+                oldest = events
+        return oldest.popleft() if oldest is not None else None
+
+    def drain(self, kind: Optional[str] = None) -> List[ServerEvent]:
+        """Retire tous les événements d'un type, ou de tous types.
+
+        Args:
+            kind (Optional[str]): Type voulu, ou None pour tous
+
+        Returns:
+            List[ServerEvent]: Événements dans l'ordre d'arrivée
+        """
+        events = []
+        event = self.pop(kind)
+        while event is not None:
+            events.append(event)
+            event = self.pop(kind)
+        return events
+
+    def has_events(self, kind: Optional[str] = None) -> bool:
+        """Indique si des événements sont en attente.
+
+        Args:
+            kind (Optional[str]): Type voulu, ou None pour tous
+
+        Returns:
+            bool: True si au moins un événement attend
+        """
+        if kind is not None:
+            return bool(self.queues[kind])
+        return any(self.queues.values())
@@ -0,0 +1,81 @@
+from typing import Optional
+
+class LineBuffer:
+    """Tampon de réception découpant le flux du serveur en lignes complètes.
+
+    Les octets reçus sont accumulés dans un bytearray persistant. Chaque appel
+    à pop_line() rend une ligne terminée par '\\n' et conserve le reste pour
+    les lectures suivantes, de sorte qu'une réponse coupée entre deux recv ou
+    deux réponses collées dans un même recv soient traitées correctement.
+    """
+
+    COMPACT_THRESHOLD = 4096
+
+    def __init__(self):
+        """Initialise un tampon vide."""
+        self._buffer = bytearray()
+        self._start = 0
+        self._scan = 0
+
+    def __len__(self) -> int:
+        """Nombre d'octets en attente dans le tampon."""
+        return len(self._buffer) - self._start
+
+    def feed(self, data: bytes) -> None:
+        """Ajoute des octets reçus au tampon.
+
+        Args:
+            data (bytes): Données brutes reçues du socket
+        """
+        self._buffer += data
+
+    def has_line(self) -> bool:
+        """Indique si une ligne complète est disponible.
+
+        Returns:
+            bool: True si pop_line() rendra une ligne
+        """
+        index = self._buffer.find(b'\n', self._scan)
+        if index < 0:
+            self._scan = len(self._buffer)
+            return False
+        return True
+
+    def pop_line(self) -> Optional[str]:
+        """Extrait la prochaine ligne complète du tampon.
+
+        Seule la ligne extraite est décodée ; les octets déjà inspectés ne
+        sont pas reparcourus lors de l'appel suivant.
+
+        Returns:
+            Optional[str]: Ligne sans son '\\n' final, ou None si incomplète
+        """
+        index = self._buffer.find(b'\n', self._scan)
+        if index < 0:
+            self._scan = len(self._buffer)
+            return None
+
+        end = index
+        if end > self._start and self._buffer[end - 1] == 0x0D:
+            end -= 1
+        line = self._buffer[self._start:end].decode('utf-8', errors='replace')
+
+        self._start = index + 1
+        self._scan = self._start
+        self._compact()
+        return line
+
+    def clear(self) -> None:
+        """Vide le tampon."""
+        self._buffer.clear()
+        self._start = 0
+        self._scan = 0
+
+    def _compact(self) -> None:
+        """Libère les octets déjà consommés sans recopier à chaque ligne."""
+        if self._start >= len(self._buffer):
+            self.clear()
+        elif self._start >= self.COMPACT_THRESHOLD and self._start * 2 >= len(self._buffer):
+            del self._buffer[:self._start]
+            self._scan -= self._start
+            self._start = 0
@@ -1,8 +1,19 @@
 import logging
-from typing import Optional
+from collections import deque
+from typing import Any, List, Optional
 from .client import ZappyClient
 
 class ZappyProtocol:
+    """Commandes du protocole Zappy sur un client bloquant.
+
+    Les commandes sont des coroutines pour que l'IA soit la même sur tous
+    les clients : ici elles se terminent sans jamais suspendre, et
+    AsyncZappyProtocol les remplace par des attentes sur la boucle asyncio.
+    """
+
+    MAX_PENDING = 10
+    RAW_COMMANDS = ("Look", "Inventory")
+
     def __init__(self, client: ZappyClient):
         """Initialise le protocole avec un client.
         
@@ -13,6 +24,8 @@ class ZappyProtocol:
         self.logger = logging.getLogger(__name__)
         self.last_response: Optional[str] = None
         self.last_error: Optional[str] = None
+        self.pending_commands = deque()
+        self.completed_results: List[Any] = []
 
     def _check_connection(self):
         """Vérifie si la connexion au serveur est toujours active.
@@ -43,16 +56,117 @@ class ZappyProtocol:
             self.last_error = f"Réponse invalide du serveur: {response}"
             raise ValueError(self.last_error)
 
-    def forward(self) -> bool:
+    def _exchange(self, command: str) -> str:
+        """Envoie une commande et attend sa réponse.
+        
+        Les commandes encore en vol dans le pipeline sont d'abord résolues
+        pour que la réponse lue corresponde bien à cette commande.
+        
+        Args:
+            command (str): Commande sans le '\\n' final
+            
+        Returns:
+            str: Réponse du serveur
+        """
+        self._check_connection()
+        self._drain_pending()
+        self.client._send(f"{command}\n")
+        return self.client._receive().strip()
+
+    def _parse_result(self, command: str, response: str) -> Any:
+        """Convertit la réponse d'une commande pipelinée en résultat.
+        
+        Args:
+            command (str): Commande envoyée
+            response (str): Réponse du serveur
+            
+        Returns:
+            Any: str pour Look/Inventory, int pour Connect_nbr, bool sinon
+        """
+        name = command.split()[0]
+        if name in self.RAW_COMMANDS:
+            self.last_response = response
+            return response
+        if name == "Incantation":
+            self.last_response = response
+            return response == "Elevation underway"
+        try:
+            if name == "Connect_nbr":
+                self.last_response = response
+                return int(response)
+            return self._handle_response(response)
+        except ValueError:
+            self.last_error = f"Réponse invalide du serveur pour {command}: {response}"
+            return 0 if name == "Connect_nbr" else False
+
+    def _complete_oldest(self) -> None:
+        """Lit la réponse de la plus ancienne commande en vol."""
+        command = self.pending_commands.popleft()
+        try:
+            response = self.client._receive().strip()
+        except ConnectionError:
+            self.pending_commands.clear()
+            raise
+        self.completed_results.append(self._parse_result(command, response))
+
+    def _drain_pending(self) -> None:
+        """Attend les réponses de toutes les commandes en vol."""
+        while self.pending_commands:
+            self._complete_oldest()
+
+    def enqueue(self, command: str) -> None:
+        """Envoie une commande sans attendre sa réponse.
+        
+        Au plus MAX_PENDING commandes restent en vol, comme la file du
+        serveur : au-delà, la réponse la plus ancienne est lue d'abord.
+        
+        Args:
+            command (str): Commande sans le '\\n' final (ex: "Take food")
+        """
+        self._check_connection()
+        if len(self.pending_commands) >= self.MAX_PENDING:
+            self._complete_oldest()
+        self.client._send(f"{command}\n")
+        self.pending_commands.append(command)
+
+    def flush(self) -> List[Any]:
+        """Attend toutes les réponses en vol et rend les résultats.
+        
+        Returns:
+            List[Any]: Résultats dans l'ordre d'envoi des commandes
+        """
+        self._drain_pending()
+        results = self.completed_results
+        self.completed_results = []
+        return results
+
+    async def pipeline(self, commands: List[str]) -> List[Any]:
+        """Envoie une rafale de commandes puis récupère leurs résultats.
+        
+        Args:
+            commands (List[str]): Commandes à envoyer dans l'ordre
+            
+        Returns:
+            List[Any]: Résultats dans l'ordre des commandes
+        """
+        try:
+            for command in commands:
+                self.enqueue(command)
+            return self.flush()
+        except ConnectionError:
+            raise
+        except Exception as e:
+            self.last_error = f"Erreur lors de l'envoi groupé: {e}"
+            raise
+
+    async def forward(self) -> bool:
         """Avance d'une case.
         
         Returns:
             bool: True si le mouvement a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send("Forward\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Forward")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -60,16 +174,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors du déplacement: {e}"
             raise
 
-    def right(self) -> bool:
+    async def right(self) -> bool:
         """Tourne à droite.
         
         Returns:
             bool: True si la rotation a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send("Right\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Right")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -77,16 +189,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la rotation: {e}"
             raise
 
-    def left(self) -> bool:
+    async def left(self) -> bool:
         """Tourne à gauche.
         
         Returns:
             bool: True si la rotation a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send("Left\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Left")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -94,16 +204,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la rotation: {e}"
             raise
 
-    def look(self) -> str:
+    async def look(self) -> str:
         """Regarde autour du joueur.
         
         Returns:
             str: Réponse brute du serveur
         """
         try:
-            self._check_connection()
-            self.client._send("Look\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Look")
             self.last_response = response
             return response
         except ConnectionError:
@@ -112,16 +220,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la vision: {e}"
             raise
 
-    def inventory(self) -> str:
+    async def inventory(self) -> str:
         """Consulte l'inventaire.
         
         Returns:
             str: Réponse brute du serveur
         """
         try:
-            self._check_connection()
-            self.client._send("Inventory\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Inventory")
             self.last_response = response
             return response
         except ConnectionError:
@@ -130,7 +236,7 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la consultation de l'inventaire: {e}"
             raise
 
-    def broadcast(self, message: str) -> bool:
+    async def broadcast(self, message: str) -> bool:
         """Envoie un message à tous les joueurs.
         
         Args:
@@ -140,9 +246,7 @@ class ZappyProtocol:
             bool: True si le message a été envoyé, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send(f"Broadcast {message}\n")
-            response = self.client._receive().strip()
+            response = self._exchange(f"Broadcast {message}")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -150,16 +254,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de l'envoi du message: {e}"
             raise
 
-    def connect_nbr(self) -> int:
+    async def connect_nbr(self) -> int:
         """Demande le nombre de places disponibles dans l'équipe.
         
         Returns:
             int: Nombre de places disponibles
         """
         try:
-            self._check_connection()
-            self.client._send("Connect_nbr\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Connect_nbr")
             self.last_response = response
             return int(response)
         except ConnectionError:
@@ -168,16 +270,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la demande de places: {e}"
             raise
 
-    def fork(self) -> bool:
+    async def fork(self) -> bool:
         """Pond un œuf.
         
         Returns:
             bool: True si l'action a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send("Fork\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Fork")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -185,16 +285,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la ponte: {e}"
             raise
 
-    def eject(self) -> bool:
+    async def eject(self) -> bool:
         """Expulse les joueurs de la case.
         
         Returns:
             bool: True si l'action a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send("Eject\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Eject")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -202,7 +300,7 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de l'expulsion: {e}"
             raise
 
-    def take(self, object_name: str) -> bool:
+    async def take(self, object_name: str) -> bool:
         """Prend un objet.
         
         Args:
@@ -212,9 +310,7 @@ class ZappyProtocol:
             bool: True si l'action a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send(f"Take {object_name}\n")
-            response = self.client._receive().strip()
+            response = self._exchange(f"Take {object_name}")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -222,7 +318,7 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors de la prise d'objet: {e}"
             raise
 
-    def set(self, object_name: str) -> bool:
+    async def set(self, object_name: str) -> bool:
         """Pose un objet.
         
         Args:
@@ -232,9 +328,7 @@ class ZappyProtocol:
             bool: True si l'action a réussi, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send(f"Set {object_name}\n")
-            response = self.client._receive().strip()
+            response = self._exchange(f"Set {object_name}")
             return self._handle_response(response)
         except ConnectionError:
             raise
@@ -242,16 +336,14 @@ class ZappyProtocol:
             self.last_error = f"Erreur lors du dépôt d'objet: {e}"
             raise
 
-    def incantation(self) -> bool:
+    async def incantation(self) -> bool:
         """Commence un rituel d'élévation.
         
         Returns:
             bool: True si le rituel a commencé, False sinon
         """
         try:
-            self._check_connection()
-            self.client._send("Incantation\n")
-            response = self.client._receive().strip()
+            response = self._exchange("Incantation")
             if response == "Elevation underway":
                 self.last_response = response
                 return True
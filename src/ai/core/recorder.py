@@ -0,0 +1,123 @@
+import time
+import random
+import logging
+from typing import List, Optional, Tuple
+
+SENT = ">"
+RECEIVED = "<"
+HEADER = "#zappy-session v1"
+
+
+class SessionRecorder:
+    """Enregistre une session client dans un fichier, remplacé à chaque session.
+
+    Une ligne d'en-tête donne l'heure murale de départ et la graine des
+    décisions aléatoires de l'IA, puis chaque commande
+    envoyée et chaque ligne reçue est écrite sous la forme
+    "<t>\\t<sens>\\t<ligne>" où t est le temps monotone écoulé depuis le début.
+    """
+
+    FLUSH_EVERY = 64
+
+    def __init__(self, path: str, hostname: str = "", port: int = 0, team_name: str = "",
+                 seed: Optional[int] = None):
+        """Ouvre le fichier d'enregistrement.
+
+        Args:
+            path (str): Chemin du fichier
+            hostname (str): Serveur enregistré (informatif)
+            port (int): Port du serveur (informatif)
+            team_name (str): Équipe enregistrée (informatif)
+            seed (Optional[int]): Graine du module random, tirée au hasard si absente
+        """
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self.file = open(path, 'w', encoding='utf-8')
+        self.start = time.monotonic()
+        self.records = 0
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+        self.file.write(f"{HEADER}\t{time.time():.6f}\t{hostname}:{port}\t{team_name}\t{self.seed}\n")
+
+    def _write(self, direction: str, line: str) -> None:
+        """Écrit un enregistrement.
+
+        Args:
+            direction (str): SENT ou RECEIVED
+            line (str): Ligne sans '\\n'
+        """
+        if self.file is None:
+            return
+        self.file.write(f"{time.monotonic() - self.start:.6f}\t{direction}\t{line}\n")
+        self.records += 1
+        if self.records % self.FLUSH_EVERY == 0:
+            self.file.flush()
+
+    def sent(self, message: str) -> None:
+        """Enregistre une commande envoyée.
+
+        Args:
+            message (str): Commande envoyée
+        """
+        self._write(SENT, message.rstrip('\n'))
+
+    def received(self, line: str) -> None:
+        """Enregistre une ligne reçue.
+
+        Args:
+            line (str): Ligne reçue
+        """
+        self._write(RECEIVED, line)
+
+    def close(self) -> None:
+        """Vide et ferme le fichier."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.logger.info(f"💾 Session enregistrée dans {self.path} ({self.records} lignes)")
+
+
+class SessionRecording:
+    """Contenu d'un fichier de session chargé en mémoire."""
+
+    def __init__(self, path: str):
+        """Charge un enregistrement.
+
+        Un fichier écrit par une ancienne version peut contenir plusieurs
+        sessions ajoutées à la suite ; seule la première est chargée.
+
+        Args:
+            path (str): Chemin du fichier
+
+        Raises:
+            ValueError: Si le fichier n'est pas un enregistrement de session
+        """
+        self.path = path
+        self.wall_start = 0.0
+        self.server = ""
+        self.team_name = ""
+        self.seed: Optional[int] = None
+        self.events: List[Tuple[float, str, str]] = []
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline().rstrip('\n').split('\t')
+            if header[0] != HEADER:
+                raise ValueError(f"Enregistrement de session invalide: {path}")
+            self.wall_start = float(header[1])
+            self.server = header[2] if len(header) > 2 else ""
+            self.team_name = header[3] if len(header) > 3 else ""
+            if len(header) > 4 and header[4].isdigit():
+                self.seed = int(header[4])
+            for raw in f:
+                if raw.startswith(HEADER):
+                    break
+                parts = raw.rstrip('\n').split('\t', 2)
+                if len(parts) != 3:
+                    continue
+                self.events.append((float(parts[0]), parts[1], parts[2]))
+
+    def duration(self) -> float:
+        """Durée de la session enregistrée.
+
+        Returns:
+            float: Durée en secondes
+        """
+        return self.events[-1][0] if self.events else 0.0
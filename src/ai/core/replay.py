@@ -0,0 +1,170 @@
+import socket
+import logging
+from collections import deque
+from typing import Deque, Optional, Tuple
+from .client import ZappyClient
+from .clock import ServerClock
+from .recorder import SENT, RECEIVED, SessionRecording
+
+class ReplaySocket:
+    """Socket factice qui rejoue une session enregistrée.
+
+    Chaque envoi consomme la prochaine commande enregistrée ; recv rend les
+    lignes reçues jusqu'à la commande enregistrée suivante. Le temps virtuel
+    avance avec les enregistrements consommés, sans attente réelle.
+    """
+
+    def __init__(self, recording: SessionRecording):
+        """Initialise le rejeu.
+
+        Args:
+            recording (SessionRecording): Session à rejouer
+        """
+        self.recording = recording
+        self.logger = logging.getLogger(__name__)
+        self.position = 0
+        self.virtual_time = 0.0
+        self.timeout: Optional[float] = None
+        self.outgoing = b""
+        self.sent: Deque[str] = deque(maxlen=32)
+        self.commands = 0
+        self.divergences = 0
+        self.closed = False
+
+    def now(self) -> float:
+        """Heure murale virtuelle de la session.
+
+        Returns:
+            float: Heure de départ enregistrée plus le temps virtuel écoulé
+        """
+        return self.recording.wall_start + self.virtual_time
+
+    def exhausted(self) -> bool:
+        """Indique si tout l'enregistrement a été rejoué.
+
+        Returns:
+            bool: True si plus rien n'est à rejouer
+        """
+        return self.position >= len(self.recording.events) and not self.outgoing
+
+    def _advance(self) -> Tuple[float, str, str]:
+        """Consomme l'enregistrement suivant et avance le temps virtuel."""
+        event = self.recording.events[self.position]
+        self.position += 1
+        self.virtual_time = max(self.virtual_time, event[0])
+        return event
+
+    def _next_is(self, direction: str) -> bool:
+        """Vérifie le sens du prochain enregistrement."""
+        return self.position < len(self.recording.events) and self.recording.events[self.position][1] == direction
+
+    def idle(self) -> None:
+        """Fait progresser un rejeu où l'IA n'a rien envoyé ni lu.
+
+        Le temps virtuel avance d'abord jusqu'au prochain enregistrement
+        (l'IA attendait la fin d'un cooldown) ; s'il y est déjà, cet
+        enregistrement est consommé pour ne pas boucler indéfiniment.
+        """
+        if self.position >= len(self.recording.events):
+            return
+        when, direction, line = self.recording.events[self.position]
+        if self.virtual_time < when:
+            self.virtual_time = when
+            return
+        self._advance()
+        if direction == RECEIVED:
+            self.outgoing += (line + "\n").encode()
+        else:
+            self.divergences += 1
+
+    def settimeout(self, timeout: Optional[float]) -> None:
+        """Mémorise le timeout demandé (non bloquant si petit)."""
+        self.timeout = timeout
+
+    def connect(self, address) -> None:
+        """Rien à faire : la session est déjà en mémoire."""
+
+    def send(self, data: bytes) -> int:
+        """Consomme la prochaine commande enregistrée.
+
+        Args:
+            data (bytes): Commande envoyée par le client
+
+        Returns:
+            int: Nombre d'octets « envoyés »
+        """
+        if self.closed:
+            raise ConnectionError("Socket de rejeu fermé")
+        if not data:
+            return 0
+        for command in data.decode('utf-8', errors='replace').splitlines():
+            self.commands += 1
+            self.sent.append(command)
+            while self._next_is(RECEIVED):
+                self.outgoing += (self._advance()[2] + "\n").encode()
+            if not self._next_is(SENT):
+                continue
+            expected = self._advance()[2]
+            if expected != command:
+                self.divergences += 1
+                self.logger.debug(f"Divergence du rejeu: attendu '{expected}', envoyé '{command}'")
+        return len(data)
+
+    def recv(self, bufsize: int) -> bytes:
+        """Rend les lignes reçues avant la prochaine commande enregistrée.
+
+        Si le client attend une réponse alors que l'enregistrement attend
+        d'abord une commande, il a divergé : la commande est sautée pour
+        ne pas bloquer. Une session épuisée se comporte comme une fermeture.
+
+        Args:
+            bufsize (int): Taille maximale à rendre
+
+        Returns:
+            bytes: Données « reçues »
+
+        Raises:
+            socket.timeout: En lecture non bloquante sans donnée disponible
+        """
+        if not self.outgoing:
+            if not self._next_is(RECEIVED) and self.timeout is not None and self.timeout < 0.1:
+                raise socket.timeout("Aucune donnée enregistrée avant la prochaine commande")
+            while self._next_is(SENT):
+                self._advance()
+                self.divergences += 1
+            while self._next_is(RECEIVED):
+                self.outgoing += (self._advance()[2] + "\n").encode()
+        data, self.outgoing = self.outgoing[:bufsize], self.outgoing[bufsize:]
+        return data
+
+    def close(self) -> None:
+        """Ferme le socket de rejeu."""
+        self.closed = True
+
+
+class ReplayClient(ZappyClient):
+    """ZappyClient branché sur une session enregistrée au lieu d'un serveur.
+
+    L'horloge du client suit le temps virtuel de la session pour que les
+    cooldowns de l'IA se comportent comme pendant la partie enregistrée.
+    """
+
+    def __init__(self, path: str):
+        """Charge la session à rejouer.
+
+        Args:
+            path (str): Chemin de l'enregistrement
+        """
+        self.recording = SessionRecording(path)
+        host, _, port = self.recording.server.rpartition(':')
+        super().__init__(host or "replay", int(port) if port.isdigit() else 0, self.recording.team_name)
+        self.transport = ReplaySocket(self.recording)
+        self.clock = ServerClock(time_source=self.transport.now)
+
+    def _open_socket(self) -> ReplaySocket:
+        """Rend le socket de rejeu à la place d'une connexion réseau.
+
+        Returns:
+            ReplaySocket: Transport rejouant la session
+        """
+        return self.transport
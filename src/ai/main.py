@@ -11,6 +11,7 @@ from core.protocol import ZappyProtocol
 from models.player import Player
 from models.map import Map
 from ai import AI
+from runner import run_agents
 
 def setup_logging():
     """Configure le système de logging."""
@@ -55,6 +56,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('-n', '--name', type=str, required=True, help='Team name')
     parser.add_argument('-h', '--host', type=str, default="localhost", help='Machine name')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--agents', type=int, default=1, help='Number of agents hosted by this process')
+    parser.add_argument('--record', type=str, default=None, help='Record the session to this file')
     
     if len(sys.argv) == 2 and sys.argv[1] == "-help":
         print("USAGE: ./zappy_ai -p port -n name -h machine")
@@ -87,7 +90,12 @@ def main() -> int:
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
         
+        if args.agents > 1:
+            return run_agents(args.host, args.port, args.name, args.agents, logger=logger)
+        
         client = ZappyClient(args.host, args.port, args.name)
+        if args.record:
+            client.start_recording(args.record)
         try:
             client.connect()
             
@@ -120,70 +128,9 @@ def main() -> int:
                 async_message = client.check_for_messages()
                 if async_message:
                     logger.info(f"📨 Message asynchrone reçu: {async_message}")
-                    
-                    if async_message == "dead":
-                        logger.critical("💀💀💀 LE SERVEUR A ANNONCÉ NOTRE MORT ! ARRÊT IMMÉDIAT ! 💀💀💀")
+                    if not client.ai.handle_server_message(async_message):
                         break
-                    
-                    if async_message.startswith("Current level:"):
-                        new_level = int(async_message.split(": ")[1])
-                        client.ai.player.set_level(new_level)
-                        
-                        if hasattr(client.ai, 'vision_manager') and hasattr(client.ai.vision_manager, 'set_level'):
-                            client.ai.vision_manager.set_level(new_level)
-                        else:
-                            logger.warning(f"⚠️ Impossible de mettre à jour le niveau du vision_manager: {type(client.ai.vision_manager)}")
-                            
-                        client.ai.elevation_in_progress = False
-                        client.ai.state = "NORMAL_OPERATIONS"
-                        logger.info(f"🎉🎉🎉 ÉLÉVATION RÉUSSIE ! NOUVEAU NIVEAU : {new_level} 🎉🎉🎉")
-                        continue
-                    elif async_message == "ko" and client.ai.elevation_in_progress:
-                        logger.warning("❌ Le rituel d'élévation a échoué.")
-                        client.ai.elevation_in_progress = False
-                        client.ai.state = "NORMAL_OPERATIONS"
-                        continue
-                    elif async_message.startswith("message"):
-                        logger.info(f"📢 Broadcast reçu: {async_message}")
-                        if hasattr(client.ai, 'communicator'):
-                            parsed_message = client.ai.communicator.parse_message(async_message)
-                            if parsed_message and parsed_message.get("team") == client.ai.player.team:
-                                logger.info(f"🤝 Message d'équipe reçu: {parsed_message}")
-                                
-                                action = parsed_message.get("action")
-                                if action == "RITUAL_CALL":
-                                    # Traiter l'appel de rituel
-                                    data = parsed_message.get("data", "")
-                                    try:
-                                        parts = data.split(":")
-                                        if len(parts) >= 3:
-                                            target_level = int(parts[0])
-                                            target_id = parts[1]
-                                            coords_str = parts[2]
-                                            target_x, target_y = map(int, coords_str.split(","))
-                                            
-                                            # Vérifier si on peut participer au rituel
-                                            if client.ai.player.level == target_level - 1:
-                                                logger.info(f"🤝 Je suis niveau {client.ai.player.level}, je peux participer au rituel niveau {target_level} !")
-                                                logger.info(f"🎯 Je me dirige vers ({target_x}, {target_y}) pour rejoindre le rituel")
-                                                
-                                                # Définir la cible de mouvement pour rejoindre le rituel
-                                                client.ai.ritual_target = (target_x, target_y)
-                                                client.ai.state = "JOINING_RITUAL"
-                                            else:
-                                                logger.info(f"⚠️ Je suis niveau {client.ai.player.level}, je ne peux pas participer au rituel niveau {target_level}")
-                                    except Exception as e:
-                                        logger.error(f"Erreur lors du parsing du message de rituel: {e}")
-                                        
-                                elif action == "RITUAL_LVL3_START":
-                                    if client.ai.player.level == 2:
-                                        logger.info("🤝 Je suis niveau 2, je peux participer au rituel niveau 3 !")
-                                    else:
-                                        logger.info(f"⚠️ Je suis niveau {client.ai.player.level}, je ne peux pas participer au rituel niveau 3")
-                        continue
-                    else:
-                        logger.debug(f"📨 Message asynchrone non traité: {async_message}")
-                        continue
+                    continue
                 
                 if client.ai.elevation_in_progress:
                     logger.debug("⏳ IA en attente d'élévation, pause...")
@@ -2,7 +2,7 @@ from typing import Tuple, Optional, Any
 import logging
 from core.protocol import ZappyProtocol
 from managers.vision_manager import VisionManager
-import time
+from core.clock import ServerClock
 import random
 
 class CollisionManager:
@@ -28,6 +28,7 @@ class CollisionManager:
         self.stuck_count = 0
         self.max_stuck_count = 3
         self.position_history_size = 5
+        self.clock = ServerClock.of(protocol)
         self.last_collision_time = 0
         self.collision_cooldown = 7
 
@@ -38,7 +39,7 @@ class CollisionManager:
             bool: True si une collision est détectée
         """
         try:
-            if time.time() - self.last_collision_time < self.collision_cooldown:
+            if self.clock.elapsed_ticks(self.last_collision_time) < self.collision_cooldown:
                 return False
                 
             players = self.vision_manager.get_players_in_vision()
@@ -47,7 +48,7 @@ class CollisionManager:
                 
             for player_pos in players:
                 if player_pos == (0, 0):
-                    self.last_collision_time = time.time()
+                    self.last_collision_time = self.clock.now()
                     return True
                     
             return False
@@ -55,7 +56,7 @@ class CollisionManager:
             self.logger.error(f"Erreur lors de la vérification des collisions: {str(e)}")
             return False
 
-    def eject_other_players(self) -> bool:
+    async def eject_other_players(self) -> bool:
         """Éjecte les autres joueurs de la case actuelle.
         
         Returns:
@@ -69,7 +70,7 @@ class CollisionManager:
             current_tile = vision_data[0] if vision_data else ""
             if current_tile.count('player') > 1:
                 self.logger.info("Autre joueur détecté sur la même case. Tentative d'éjection.")
-                success = self.protocol.eject()
+                success = await self.protocol.eject()
                 if success:
                     self.logger.debug("Éjection réussie")
                     return True
@@ -81,7 +82,7 @@ class CollisionManager:
             self.logger.error(f"Erreur lors de l'éjection: {str(e)}")
             return False
 
-    def avoid_collision(self) -> bool:
+    async def avoid_collision(self) -> bool:
         """Évite une collision en se déplaçant.
         
         Returns:
@@ -103,24 +104,24 @@ class CollisionManager:
                 diff = (direction - current_direction) % 4
                 
                 if diff == 1 or diff == 2:
-                    if not self.movement_manager.turn_right():
+                    if not await self.movement_manager.turn_right():
                         continue
                 elif diff == 3:
-                    if not self.movement_manager.turn_left():
+                    if not await self.movement_manager.turn_left():
                         continue
                         
                 case = self.vision_manager.get_case_content(1, 0)
                 if "player" not in case:
-                    if self.movement_manager.move_forward():
+                    if await self.movement_manager.move_forward():
                         self.logger.debug(f"Collision évitée en se déplaçant vers {direction}")
                         return True
                         
             self.logger.debug("Aucune direction libre, tentative de recul")
-            if not self.movement_manager.turn_right():
+            if not await self.movement_manager.turn_right():
                 return False
-            if not self.movement_manager.turn_right():
+            if not await self.movement_manager.turn_right():
                 return False
-            return self.movement_manager.move_forward()
+            return await self.movement_manager.move_forward()
             
         except Exception as e:
             self.logger.error(f"Erreur lors de l'évitement de collision: {str(e)}")
@@ -132,9 +133,9 @@ class CollisionManager:
         Returns:
             bool: True si on peut vérifier les collisions
         """
-        return time.time() - self.last_collision_time >= self.collision_cooldown
+        return self.clock.elapsed_ticks(self.last_collision_time) >= self.collision_cooldown
 
-    def handle_collision(self) -> bool:
+    async def handle_collision(self) -> bool:
         """Gère une collision détectée.
         
         Returns:
@@ -144,7 +145,7 @@ class CollisionManager:
             self.escape_attempts = 0
             return True
 
-        if self.avoid_collision():
+        if await self.avoid_collision():
             self.escape_attempts = 0
             return True
 
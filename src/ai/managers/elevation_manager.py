@@ -1,8 +1,8 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from managers.inventory_manager import InventoryManager
 from core.protocol import ZappyProtocol
+from core.clock import ServerClock
 import logging
-import time
 from managers.vision_manager import VisionManager
 
 class ElevationManager:
@@ -20,6 +20,7 @@ class ElevationManager:
         self.vision_manager = vision_manager
         self.inventory_manager = inventory_manager
         self.logger = logger
+        self.clock = ServerClock.of(protocol)
         self.last_elevation_time = 0
         self.elevation_cooldown = 300
         self.ELEVATION_REQUIREMENTS = {
@@ -32,6 +33,7 @@ class ElevationManager:
             7: {'players': 6, 'linemate': 2, 'deraumere': 2, 'sibur': 2, 'mendiane': 2, 'phiras': 2, 'thystame': 1}
         }
         self.ritual_in_progress = False
+        self.ritual_started_at = 0
         
 
     def can_elevate(self) -> bool:
@@ -56,14 +58,12 @@ class ElevationManager:
                     self.logger.debug(f"Pas assez de {resource} dans l'inventaire pour l'élévation (j'ai {self.inventory_manager.inventory.get(resource, 0)}, besoin de {count})")
                     return False
             
-            current_tile = self.vision_manager.get_case_content(0, 0)
-            if not current_tile:
+            # La case 0 du Look contient déjà le joueur lui-même
+            total_players = self.vision_manager.count_on_tile('player')
+            if not total_players:
                 return False
                 
             required_players = requirements.get('players', 1)
-            player_count = current_tile.count('player')
-            # L'IA se compte elle-même
-            total_players = player_count + 1
             
             if total_players < required_players:
                 self.logger.debug(f"Pas assez de joueurs sur la case ({total_players}/{required_players})")
@@ -77,11 +77,15 @@ class ElevationManager:
             self.logger.error(f"Erreur dans can_elevate: {str(e)}", exc_info=True)
             return False
 
-    def start_elevation(self) -> bool:
+    async def start_elevation(self) -> bool:
         """Démarre une élévation en suivant le plan stratégique.
         
+        La méthode rend la main dès l'incantation acceptée : le résultat
+        arrive 300 unités de temps plus tard par le message « Current
+        level », transmis à finish_ritual.
+        
         Returns:
-            bool: True si l'élévation a réussi
+            bool: True si le rituel a commencé
         """
         try:
             current_level = self.vision_manager.player.level
@@ -100,47 +104,51 @@ class ElevationManager:
                 if resource == 'players':
                     continue
                 for _ in range(count):
-                    if not self.protocol.set(resource):
+                    if not await self.protocol.set(resource):
                         self.logger.error(f"❌ Erreur lors du dépôt de {resource}")
                         return False
+                    self.inventory_manager.record_drop(resource)
                     self.logger.debug(f"✅ {resource} déposé sur la case")
-                    time.sleep(0.1)
             
-            self.vision_manager.force_update_vision()
+            await self.vision_manager.force_update_vision("elevation")
             current_tile = self.vision_manager.get_case_content(0, 0)
             self.logger.info(f"🔍 Vérification finale : case contient {current_tile}")
             
             self.logger.info("🌟 Lancement de l'incantation...")
-            response = self.protocol.incantation()
+            response = await self.protocol.incantation()
             
-            if response == "ko":
+            if not response or response == "ko":
                 self.logger.error("❌ Échec de l'incantation")
                 return False
-                
-            self.logger.info(f"✅ Incantation lancée: {response}")
-            
-            if response == "Elevation underway":
-                self.logger.info("⏳ Rituel en cours... (300 secondes)")
-                time.sleep(300 / 1000)
-                
-                final_response = self.protocol.look()
-                if final_response and "player" in final_response:
-                    self.vision_manager.player.level = next_level
-                    self.vision_manager.set_level(next_level)
-                    self.last_elevation_time = time.time()
-                    self.logger.info(f"🎉 Élévation réussie au niveau {next_level}!")
-                    return True
-                else:
-                    self.logger.error("❌ Échec de l'élévation après l'incantation")
-                    return False
-            else:
+            if response not in (True, "Elevation underway"):
                 self.logger.error(f"❌ Réponse inattendue lors de l'incantation: {response}")
                 return False
                 
+            self.logger.info(f"✅ Incantation lancée: {response}")
+            self.ritual_in_progress = True
+            self.ritual_started_at = self.clock.now()
+            self.logger.info(f"⏳ Rituel en cours... ({self.clock.seconds(ServerClock.COSTS['Incantation']):.1f} secondes), résultat annoncé par le serveur")
+            return True
+                
         except Exception as e:
             self.logger.error(f"❌ Erreur lors de l'élévation: {str(e)}")
             return False
 
+    def finish_ritual(self, level: Optional[int]) -> None:
+        """Termine le rituel en cours à la réception de son résultat.
+        
+        Args:
+            level (Optional[int]): Nouveau niveau annoncé, None si le rituel a échoué
+        """
+        if not self.ritual_in_progress:
+            return
+        self.ritual_in_progress = False
+        if level is not None:
+            self.last_elevation_time = self.clock.now()
+            self.logger.info(f"🎉 Élévation réussie au niveau {level}!")
+        else:
+            self.logger.error("❌ Échec de l'élévation après l'incantation")
+
     def _get_required_players(self, level: int) -> int:
         """Récupère le nombre de joueurs requis pour l'élévation.
         
@@ -179,6 +187,28 @@ class ElevationManager:
             self.logger.error(f"Erreur lors de la récupération des ressources nécessaires: {str(e)}")
             return []
 
+    def get_resource_deficit(self) -> Dict[str, int]:
+        """Quantités manquantes dans l'inventaire pour la prochaine élévation.
+        
+        Returns:
+            Dict[str, int]: Unités manquantes par ressource (seulement celles > 0)
+        """
+        try:
+            requirements = self.ELEVATION_REQUIREMENTS.get(self.vision_manager.player.level)
+            if not requirements:
+                return {}
+            deficit = {}
+            for resource, count in requirements.items():
+                if resource == 'players':
+                    continue
+                missing = count - self.inventory_manager.inventory.get(resource, 0)
+                if missing > 0:
+                    deficit[resource] = missing
+            return deficit
+        except Exception as e:
+            self.logger.error(f"Erreur lors du calcul du déficit de ressources: {str(e)}")
+            return {}
+
     def check_elevation_conditions(self) -> bool:
         """Vérifie si les conditions d'élévation sont remplies.
         
@@ -206,7 +236,7 @@ class ElevationManager:
 
         return True
 
-    def start_ritual(self) -> bool:
+    async def start_ritual(self) -> bool:
         """Démarre le rituel d'élévation.
         
         Returns:
@@ -218,7 +248,7 @@ class ElevationManager:
         if not self.check_elevation_conditions():
             return False
 
-        if not self.protocol.incantation():
+        if not await self.protocol.incantation():
             return False
 
         self.ritual_in_progress = True
@@ -239,7 +269,7 @@ class ElevationManager:
 
         return True
 
-    def complete_ritual(self) -> bool:
+    async def complete_ritual(self) -> bool:
         """Termine le rituel d'élévation.
         
         Returns:
@@ -252,7 +282,7 @@ class ElevationManager:
             self.ritual_in_progress = False
             return False
 
-        response = self.protocol.incantation()
+        response = await self.protocol.incantation()
         if response:
             self.vision_manager.player.level += 1
             self.ritual_in_progress = False
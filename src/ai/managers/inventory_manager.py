@@ -1,21 +1,50 @@
-from typing import Any
+from typing import Any, Optional
 from core.protocol import ZappyProtocol
+from core.clock import ServerClock
 import logging
+import math
 
 class InventoryManager:
-    """Gère l'inventaire du joueur."""
+    """Gère l'inventaire du joueur.
 
-    def __init__(self, protocol: ZappyProtocol, player: Any, logger: logging.Logger):
+    L'inventaire est tenu à jour localement : chaque Take et Set réussi
+    est appliqué sans interroger le serveur, et la nourriture est prédite
+    à partir de la consommation d'une unité toutes les 126 unités de
+    temps et de la fréquence estimée par l'horloge. La commande Inventory
+    n'est envoyée que lorsque l'incertitude de la prédiction dépasse un
+    seuil ou que la nourriture approche du niveau critique.
+
+    Avec une carte, chaque Take et Set est aussi reporté sur la case du
+    joueur : le Look suivant ne le prend pas pour l'action d'un autre
+    joueur ou pour une réapparition.
+    """
+
+    FOOD_TICKS = 126
+    CALIBRATED_ERROR = 0.1
+    UNCALIBRATED_ERROR = 0.5
+
+    def __init__(self, protocol: ZappyProtocol, player: Any, logger: logging.Logger,
+                 critical_food: int = 3, max_uncertainty: float = 2.0, map: Optional[Any] = None):
         """Initialise le gestionnaire d'inventaire.
         
         Args:
             protocol (ZappyProtocol): Protocole de communication
             player (Any): Joueur contrôlé
             logger (Logger): Logger pour les messages
+            critical_food (int): En dessous, l'inventaire est relu à chaque mise à jour
+            max_uncertainty (float): Incertitude (unités de nourriture) déclenchant une relecture
+            map (Optional[Map]): Carte où reporter les Take et Set, aucune par défaut
         """
         self.protocol = protocol
         self.player = player
+        self.map = map
         self.logger = logger
+        self.clock = ServerClock.of(protocol)
+        self.critical_food = critical_food
+        self.max_uncertainty = max_uncertainty
+        self.last_sync: Optional[float] = None
+        self.synced_food = 0
+        self.food_delta = 0
         self.inventory = {
             'food': 0,
             'linemate': 0,
@@ -27,14 +56,67 @@ class InventoryManager:
         }
         self.logger.info(f"inventory created: {self.inventory}")
 
-    def update_inventory(self) -> bool:
-        """Met à jour l'inventaire.
+    def _elapsed_ticks(self) -> float:
+        return max(0.0, self.clock.elapsed_ticks(self.last_sync))
+
+    def predicted_food(self) -> int:
+        """Nourriture prédite depuis la dernière lecture.
+        
+        L'avancement de l'unité entamée n'étant pas connu, la prédiction
+        arrondit à l'unité inférieure.
+        
+        Returns:
+            int: Unités de nourriture estimées
+        """
+        if self.last_sync is None:
+            return self.inventory['food']
+        expected = self.synced_food + self.food_delta - self._elapsed_ticks() / self.FOOD_TICKS
+        return max(0, math.floor(expected))
+
+    def uncertainty(self) -> float:
+        """Incertitude de la prédiction de nourriture, en unités.
+        
+        Une unité pour la consommation entamée, plus l'erreur sur la
+        fréquence du serveur cumulée depuis la dernière lecture.
+        
+        Returns:
+            float: Incertitude, infinie si l'inventaire n'a jamais été lu
+        """
+        if self.last_sync is None:
+            return math.inf
+        error = self.CALIBRATED_ERROR if self.clock.is_calibrated() else self.UNCALIBRATED_ERROR
+        return 1 + error * self._elapsed_ticks() / self.FOOD_TICKS
+
+    def needs_sync(self) -> bool:
+        """Indique si la prédiction ne suffit plus et qu'Inventory doit être envoyé.
+        
+        Returns:
+            bool: True si l'incertitude est trop grande ou la nourriture proche du seuil critique
+        """
+        uncertainty = self.uncertainty()
+        if uncertainty > self.max_uncertainty:
+            return True
+        return self.predicted_food() - uncertainty <= self.critical_food
+
+    async def update_inventory(self) -> bool:
+        """Met à jour l'inventaire, par prédiction tant qu'elle reste fiable.
+        
+        Returns:
+            bool: True si la mise à jour a réussi
+        """
+        if self.needs_sync():
+            return await self._request_inventory()
+        self.inventory['food'] = self.predicted_food()
+        return True
+
+    async def _request_inventory(self) -> bool:
+        """Relit l'inventaire auprès du serveur et recale la prédiction.
         
         Returns:
             bool: True si la mise à jour a réussi
         """
         try:
-            response = self.protocol.inventory()
+            response = await self.protocol.inventory()
             if not response:
                 self.logger.error("Pas de réponse du serveur pour l'inventaire")
                 return False
@@ -65,6 +147,9 @@ class InventoryManager:
                     self.logger.warning(f"Erreur de parsing pour l'item '{item}': {e}")
                     continue
                 
+            self.last_sync = self.clock.now()
+            self.synced_food = self.inventory['food']
+            self.food_delta = 0
             self.logger.debug(f"Inventaire mis à jour: {self.inventory}")
             return True
         except ConnectionError as e:
@@ -74,7 +159,7 @@ class InventoryManager:
             self.logger.error(f"Erreur lors de la mise à jour de l'inventaire: {str(e)}")
             return False
 
-    def force_update_inventory(self) -> bool:
+    async def force_update_inventory(self) -> bool:
         """Force la mise à jour de l'inventaire en ignorant les cooldowns.
         
         Returns:
@@ -82,7 +167,7 @@ class InventoryManager:
         """
         try:
             self.logger.debug("🔄 Mise à jour forcée de l'inventaire")
-            return self.update_inventory()
+            return await self._request_inventory()
         except ConnectionError as e:
             self.logger.error(f"🔌 Erreur de connexion lors de la mise à jour forcée de l'inventaire: {e}")
             return False
@@ -90,7 +175,7 @@ class InventoryManager:
             self.logger.error(f"Erreur lors de la mise à jour forcée de l'inventaire: {str(e)}")
             return False
 
-    def take_object(self, object_type: str) -> bool:
+    async def take_object(self, object_type: str) -> bool:
         """Prend un objet.
         
         Args:
@@ -100,11 +185,9 @@ class InventoryManager:
             bool: True si l'objet a été pris
         """
         try:
-            success = self.protocol.take(object_type)
+            success = await self.protocol.take(object_type)
             if success:
-                if not self.update_inventory():
-                    self.logger.error("Erreur lors de la mise à jour de l'inventaire après prise")
-                    return False
+                self.record_take(object_type)
                 self.logger.debug(f"✅ {object_type} pris avec succès, inventaire: {self.inventory}")
                 return True
             self.logger.debug(f"❌ Impossible de prendre {object_type}: échec de la commande")
@@ -116,7 +199,7 @@ class InventoryManager:
             self.logger.error(f"Erreur lors de la prise d'objet: {str(e)}")
             return False
 
-    def drop_object(self, object_type: str) -> bool:
+    async def drop_object(self, object_type: str) -> bool:
         """Pose un objet.
         
         Args:
@@ -126,9 +209,9 @@ class InventoryManager:
             bool: True si l'objet a été posé
         """
         try:
-            success = self.protocol.set(object_type)
+            success = await self.protocol.set(object_type)
             if success:
-                self.inventory[object_type] -= 1
+                self.record_drop(object_type)
                 return True
             return False
         except ConnectionError as e:
@@ -136,4 +219,39 @@ class InventoryManager:
             return False
         except Exception as e:
             self.logger.error(f"Erreur lors du dépôt d'objet: {str(e)}")
-            return False 
\ No newline at end of file
+            return False 
+
+    def record_take(self, object_type: str) -> None:
+        """Applique localement un Take réussi.
+        
+        Args:
+            object_type (str): Type d'objet pris
+        """
+        self.inventory[object_type] = self.inventory.get(object_type, 0) + 1
+        if object_type == 'food':
+            self.food_delta += 1
+        self._update_tile(object_type, -1)
+
+    def record_drop(self, object_type: str) -> None:
+        """Applique localement un Set réussi.
+        
+        Args:
+            object_type (str): Type d'objet posé
+        """
+        self.inventory[object_type] = max(0, self.inventory.get(object_type, 0) - 1)
+        if object_type == 'food':
+            self.food_delta -= 1
+        self._update_tile(object_type, 1)
+
+    def _update_tile(self, object_type: str, delta: int) -> None:
+        """Reporte un Take ou un Set sur la case du joueur dans la carte.
+        
+        Args:
+            object_type (str): Type d'objet
+            delta (int): Variation du compte de la case
+        """
+        if self.map is None:
+            return
+        x, y = self.player.get_position()
+        tile = self.map.get_tile(x, y)
+        tile.resources[object_type] = max(0, tile.resources[object_type] + delta)
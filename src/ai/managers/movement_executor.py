@@ -0,0 +1,174 @@
+import logging
+from typing import Optional, Tuple
+from models import path_planner
+
+
+class MovementExecutor:
+    """Déplacement reprenable, avancé d'une étape à chaque tour de boucle.
+
+    Chaque appel à step() envoie au plus une branche du plan (rotation
+    puis ligne droite, plafonnée à max_commands) et rend la main : la
+    boucle principale traite les événements entre deux étapes et peut
+    annuler le trajet si l'objectif change.
+    """
+
+    IDLE = "IDLE"
+    MOVING = "MOVING"
+    ARRIVED = "ARRIVED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+    def __init__(self, movement_manager, logger: logging.Logger, max_commands: int = 10, max_failures: int = 3):
+        """Initialise l'exécuteur.
+
+        Args:
+            movement_manager (MovementManager): Gestionnaire qui envoie les commandes
+            logger (Logger): Logger pour les messages
+            max_commands (int): Commandes au plus par étape (file serveur de 10)
+            max_failures (int): Évitements de collision tolérés avant d'abandonner
+        """
+        self.movement_manager = movement_manager
+        self.logger = logger
+        self.max_commands = max_commands
+        self.max_failures = max_failures
+        self.status = self.IDLE
+        self.target: Optional[Tuple[int, int]] = None
+        self.heading: Optional[int] = None
+        self.purpose: Optional[str] = None
+        self.failures = 0
+        self.steps = 0
+        self.max_steps = 0
+
+    @property
+    def active(self) -> bool:
+        """True tant qu'un trajet est en cours."""
+        return self.status == self.MOVING
+
+    def start(self, target_x: int, target_y: int, purpose: Optional[str] = None,
+              heading: Optional[int] = None) -> None:
+        """Démarre un trajet vers une case absolue.
+
+        Args:
+            target_x (int): Coordonnée X cible
+            target_y (int): Coordonnée Y cible
+            purpose (Optional[str]): Raison du trajet, pour l'appelant
+            heading (Optional[int]): Orientation voulue à l'arrivée, libre si None
+        """
+        manager = self.movement_manager
+        self.target = (target_x % manager.map.width, target_y % manager.map.height)
+        self.heading = heading
+        self.purpose = purpose
+        self.status = self.MOVING
+        self.failures = 0
+        self.steps = 0
+        x, y = manager.player.get_position()
+        plan = path_planner.plan_path(
+            x, y, manager.player.get_direction(), self.target[0], self.target[1],
+            manager.map.width, manager.map.height, heading
+        )
+        self.max_steps = len(plan) + self.max_failures
+        self.logger.debug(f"🚶 Trajet vers {self.target} ({len(plan)} commandes)")
+
+    def cancel(self, reason: str = "") -> None:
+        """Abandonne le trajet en cours.
+
+        Args:
+            reason (str): Motif, pour les logs
+        """
+        if self.status == self.MOVING:
+            self.logger.info(f"↩️ Trajet vers {self.target} annulé{': ' + reason if reason else ''}")
+            self.status = self.CANCELLED
+
+    def _next_chunk(self, plan: path_planner.Plan) -> path_planner.Plan:
+        """Première branche du plan : rotations puis pas dans une même direction."""
+        end = 0
+        while end < len(plan) and plan[end] != path_planner.FORWARD:
+            end += 1
+        while end < len(plan) and plan[end] == path_planner.FORWARD:
+            end += 1
+        return plan[:min(end, self.max_commands)]
+
+    def _arrived(self) -> bool:
+        """Indique si la case cible est atteinte, dans l'orientation voulue."""
+        manager = self.movement_manager
+        if manager.player.get_position() != self.target:
+            return False
+        return self.heading is None or manager.player.get_direction() == self.heading
+
+    def _fail(self, message: str) -> str:
+        self.failures += 1
+        self.logger.debug(message)
+        if self.failures >= self.max_failures:
+            self.logger.warning(f"Trajet vers {self.target} abandonné après {self.failures} échecs")
+            self.status = self.FAILED
+        return self.status
+
+    async def step(self) -> str:
+        """Avance d'une branche du plan.
+
+        Returns:
+            str: Statut après l'étape (MOVING tant que le trajet continue)
+        """
+        if self.status != self.MOVING:
+            return self.status
+        manager = self.movement_manager
+        try:
+            x, y = manager.player.get_position()
+            if self._arrived():
+                self.logger.info(f"✅ Arrivé à la destination {self.target}")
+                self.status = self.ARRIVED
+                return self.status
+
+            self.steps += 1
+            if self.steps > self.max_steps:
+                self.logger.warning(f"Destination {self.target} non atteinte après {self.steps - 1} étapes")
+                self.status = self.FAILED
+                return self.status
+
+            if manager._is_stuck():
+                self.logger.warning("Joueur bloqué pendant le déplacement.")
+                await manager._handle_stuck()
+                self.status = self.FAILED
+                return self.status
+
+            collision = manager.collision_manager
+            if collision.check_collision():
+                self.logger.debug("Collision détectée, tentative d'éjection")
+                if not await collision.eject_other_players():
+                    self.logger.debug("Éjection échouée, tentative d'évitement")
+                    if not await collision.avoid_collision():
+                        self.logger.debug("Impossible d'éviter la collision")
+                        self.status = self.FAILED
+                        return self.status
+                    return self._fail("Collision évitée, nouveau plan à l'étape suivante")
+
+            plan = path_planner.plan_path(
+                x, y, manager.player.get_direction(), self.target[0], self.target[1],
+                manager.map.width, manager.map.height, self.heading
+            )
+            if not plan:
+                self.status = self.ARRIVED
+                return self.status
+            if not await manager.execute_plan(self._next_chunk(plan)):
+                self.logger.debug("Échec d'une branche, un obstacle est probablement apparu.")
+                self.status = self.FAILED
+                return self.status
+            if self._arrived():
+                self.logger.info(f"✅ Arrivé à la destination {self.target}")
+                self.status = self.ARRIVED
+            return self.status
+
+        except Exception as e:
+            self.logger.error(f"Erreur lors d'une étape de déplacement: {str(e)}")
+            self.status = self.FAILED
+            return self.status
+
+    async def run(self) -> bool:
+        """Mène le trajet à son terme sans rendre la main.
+
+        Returns:
+            bool: True si la destination est atteinte
+        """
+        while await self.step() == self.MOVING:
+            pass
+        return self.status == self.ARRIVED
@@ -1,12 +1,15 @@
 from typing import Tuple, Optional
 import logging
-import time
 import random
 from managers.vision_manager import VisionManager
 from managers.collision_manager import CollisionManager
+from managers.movement_executor import MovementExecutor
 from core.protocol import ZappyProtocol
+from core.clock import ServerClock
 from models.player import Player
 from models.map import Map
+from models import geometry, path_planner
+from models.pose import PoseEstimator
 
 class MovementManager:
     """Gère les déplacements et les collisions du joueur."""
@@ -27,8 +30,8 @@ class MovementManager:
         self.vision_manager = vision_manager
         self.collision_manager = CollisionManager(protocol, vision_manager, self, logger)
         self.logger = logger
+        self.clock = ServerClock.of(protocol)
         self.last_move_time = 0
-        self.move_cooldown = 0.1
         self.current_direction = 0
         self.target_position: Optional[Tuple[int, int]] = None
         self.stuck_count = 0
@@ -40,8 +43,11 @@ class MovementManager:
         self.stuck_counter = 0
         self.max_stuck = 3
         self.exploration_radius = 5
+        self.executor = MovementExecutor(self, logger)
+        self.pose = PoseEstimator(player, map, logger)
+        self.pose.subscribe(vision_manager.shift)
 
-    def move_to(self, target: Tuple[int, int]) -> bool:
+    async def move_to(self, target: Tuple[int, int]) -> bool:
         """Déplace le joueur vers une position cible de manière itérative.
         
         Args:
@@ -57,14 +63,34 @@ class MovementManager:
             
             self.logger.debug(f"🎯 Déplacement itératif vers ({target_x}, {target_y}) depuis ({current_x}, {current_y})")
             
-            return self.move_to_absolute(target_x, target_y)
+            return await self.move_to_absolute(target_x, target_y)
             
         except Exception as e:
             self.logger.error(f"Erreur lors du déplacement vers la cible: {str(e)}")
             return False
 
-    def move_to_absolute(self, target_x: int, target_y: int) -> bool:
-        """Déplace le joueur vers des coordonnées absolues de manière itérative.
+    def start_towards(self, target: Tuple[int, int], purpose: Optional[str] = None) -> Tuple[int, int]:
+        """Démarre un trajet vers une position relative, sans l'exécuter.
+        
+        Le trajet est ensuite avancé par self.executor.step() à chaque tour
+        de boucle.
+        
+        Args:
+            target (Tuple[int, int]): Position cible relative
+            purpose (Optional[str]): Raison du trajet, pour l'appelant
+            
+        Returns:
+            Tuple[int, int]: Position cible absolue
+        """
+        current_x, current_y = self.player.get_position()
+        self.executor.start(current_x + target[0], current_y + target[1], purpose=purpose)
+        return self.executor.target
+
+    async def move_to_absolute(self, target_x: int, target_y: int) -> bool:
+        """Déplace le joueur vers des coordonnées absolues, sans rendre la main.
+        
+        Pour un trajet entrecoupé d'autres actions, utiliser self.executor
+        (start puis step à chaque tour de boucle).
         
         Args:
             target_x (int): Coordonnée X absolue de la cible
@@ -74,83 +100,36 @@ class MovementManager:
             bool: True si le déplacement a réussi
         """
         try:
-            max_attempts = 10
-            attempts = 0
+            self.executor.start(target_x, target_y)
+            return await self.executor.run()
             
-            while attempts < max_attempts:
-                current_x, current_y = self.player.get_position()
-                
-                if (current_x, current_y) == (target_x, target_y):
-                    self.logger.info(f"✅ Arrivé à la destination ({target_x}, {target_y})")
-                    return True
-                
-                if self._is_stuck():
-                    self.logger.warning("Joueur bloqué pendant le déplacement.")
-                    self._handle_stuck()
-                    return False
-                
-                if not self.can_move():
-                    self.logger.debug("Cooldown de déplacement actif, attente...")
-                    time.sleep(0.1)
-                    attempts += 1
-                    continue
-                
-                if self.collision_manager.check_collision():
-                    self.logger.debug("Collision détectée, tentative d'éjection")
-                    if self.collision_manager.eject_other_players():
-                        self.logger.debug("Éjection réussie, tentative de déplacement")
-                        time.sleep(0.1)
-                    else:
-                        self.logger.debug("Éjection échouée, tentative d'évitement")
-                        if not self.collision_manager.avoid_collision():
-                            self.logger.debug("Impossible d'éviter la collision")
-                            return False
-                
-                rel_x, rel_y = self._calculate_shortest_path(current_x, current_y, target_x, target_y)
-                
-                self.logger.debug(f"Position actuelle: ({current_x}, {current_y}), Cible: ({target_x}, {target_y}), Relatif: ({rel_x}, {rel_y})")
-                
-                if rel_x == 0 and rel_y == 0:
-                    self.logger.info(f"✅ Arrivé à la destination ({target_x}, {target_y})")
-                    return True
-                
-                current_direction = self.player.get_direction()
-                target_direction = -1
-                
-                if rel_y < 0:
-                    target_direction = 0
-                elif rel_y > 0:
-                    target_direction = 2
-                elif rel_x < 0:
-                    target_direction = 3
-                elif rel_x > 0:
-                    target_direction = 1
-                
-                if target_direction == -1:
-                    self.logger.info(f"✅ Arrivé à la destination ({target_x}, {target_y})")
-                    return True
-                
-                if current_direction != target_direction:
-                    if not self.orient_towards(target_direction):
-                        self.logger.debug("Échec de l'orientation")
-                        return False
-                
-                if not self.move_forward():
-                    self.logger.debug("Échec de l'avancement, un obstacle est probablement apparu.")
-                    return False
-                
-                if self._check_for_better_opportunities(target_x, target_y):
-                    self.logger.info("🎯 Meilleure opportunité détectée, changement de cap !")
-                    return True
-                
-                time.sleep(0.1)
-                attempts += 1
-            
-            self.logger.warning(f"Nombre maximum de tentatives atteint ({max_attempts})")
+        except Exception as e:
+            self.logger.error(f"Erreur lors du déplacement itératif: {str(e)}")
             return False
+
+    async def execute_plan(self, plan: path_planner.Plan) -> bool:
+        """Envoie un plan complet en une seule rafale et suit la position.
+        
+        Args:
+            plan (Plan): Commandes Left/Right/Forward à exécuter
             
+        Returns:
+            bool: True si toutes les commandes ont réussi
+        """
+        try:
+            results = await self.protocol.pipeline(list(plan))
+            done = 0
+            for result in results:
+                if not result:
+                    break
+                done += 1
+            if done:
+                self.pose.apply(plan[:done])
+                self.last_move_time = self.clock.now()
+            self.logger.debug(f"Plan exécuté: {done}/{len(plan)} commandes, position {self.player.get_position()}")
+            return done == len(plan)
         except Exception as e:
-            self.logger.error(f"Erreur lors du déplacement itératif: {str(e)}")
+            self.logger.error(f"Erreur lors de l'exécution du plan: {str(e)}")
             return False
 
     def _calculate_shortest_path(self, current_x: int, current_y: int, target_x: int, target_y: int) -> Tuple[int, int]:
@@ -165,16 +144,7 @@ class MovementManager:
         Returns:
             Tuple[int, int]: Vecteur relatif (dx, dy) vers la cible
         """
-        dx = target_x - current_x
-        dy = target_y - current_y
-        
-        if abs(dx) > self.map.width // 2:
-            dx = dx - self.map.width if dx > 0 else dx + self.map.width
-        
-        if abs(dy) > self.map.height // 2:
-            dy = dy - self.map.height if dy > 0 else dy + self.map.height
-        
-        return dx, dy
+        return geometry.relative(current_x, current_y, target_x, target_y, self.map.width, self.map.height)
 
     def _get_direction_to_target(self, dx: int, dy: int) -> int:
         """Calcule la direction vers une cible.
@@ -209,7 +179,7 @@ class MovementManager:
                 
         return False
 
-    def _handle_stuck(self) -> None:
+    async def _handle_stuck(self) -> None:
         """Gère le blocage du joueur."""
         self.stuck_count += 1
         if self.stuck_count >= self.max_stuck_count:
@@ -219,19 +189,22 @@ class MovementManager:
             self.logger.warning(f"Joueur bloqué (tentative {self.stuck_count}/{self.max_stuck_count}). Tentative de déblocage.")
             
             actions = [
-                lambda: self.turn_right(),
-                lambda: self.turn_left(),
-                lambda: self.turn_right() and self.turn_right(),
-                lambda: self.turn_left() and self.turn_left(),
-                lambda: self.turn_right() and self.move_forward(),
-                lambda: self.turn_left() and self.move_forward()
+                (self.turn_right,),
+                (self.turn_left,),
+                (self.turn_right, self.turn_right),
+                (self.turn_left, self.turn_left),
+                (self.turn_right, self.move_forward),
+                (self.turn_left, self.move_forward)
             ]
             
             random.shuffle(actions)
             
             for action in actions:
                 try:
-                    if action():
+                    for move in action:
+                        if not await move():
+                            break
+                    else:
                         self.logger.info("Déblocage réussi")
                         self.position_history = []
                         self.stuck_count = 0
@@ -243,37 +216,17 @@ class MovementManager:
             self.position_history = []
             self.logger.error("Impossible de se débloquer après plusieurs tentatives")
 
-    def can_move(self) -> bool:
-        """Vérifie si le joueur peut se déplacer.
-        
-        Returns:
-            bool: True si le joueur peut se déplacer
-        """
-        return time.time() - self.last_move_time >= self.move_cooldown
-
-    def move_forward(self) -> bool:
+    async def move_forward(self) -> bool:
         """Fait avancer le joueur d'une case.
         
         Returns:
             bool: True si le déplacement a réussi
         """
         try:
-            response = self.protocol.forward()
+            response = await self.protocol.forward()
             if response:
-                x, y = self.player.get_position()
-                direction = self.player.get_direction()
-                
-                if direction == 0:
-                    y = (y - 1) % self.map.height
-                elif direction == 1:
-                    x = (x + 1) % self.map.width
-                elif direction == 2:
-                    y = (y + 1) % self.map.height
-                else:
-                    x = (x - 1) % self.map.width
-                    
-                self.player.set_position(x, y)
-                self.last_move_time = time.time()
+                self.pose.apply((path_planner.FORWARD,))
+                self.last_move_time = self.clock.now()
                 self.logger.debug(f"Déplacement vers {self.player.get_position()}")
                 return True
             self.logger.debug(f"Échec de l'avancement")
@@ -282,18 +235,44 @@ class MovementManager:
             self.logger.error(f"Erreur lors du déplacement: {str(e)}")
             return False
 
-    def turn_left(self) -> bool:
+    async def walk_forward(self, steps: int) -> bool:
+        """Avance de plusieurs cases en une seule rafale de commandes Forward.
+        
+        Args:
+            steps (int): Nombre de cases à parcourir en ligne droite
+            
+        Returns:
+            bool: True si toutes les cases ont été parcourues
+        """
+        if steps <= 1:
+            return await self.move_forward()
+        try:
+            results = await self.protocol.pipeline(["Forward"] * steps)
+            done = 0
+            for result in results:
+                if not result:
+                    break
+                done += 1
+            if done:
+                self.pose.apply((path_planner.FORWARD,) * done)
+                self.last_move_time = self.clock.now()
+            self.logger.debug(f"Rafale de {done}/{steps} pas vers {self.player.get_position()}")
+            return done == steps
+        except Exception as e:
+            self.logger.error(f"Erreur lors du déplacement groupé: {str(e)}")
+            return False
+
+    async def turn_left(self) -> bool:
         """Fait tourner le joueur vers la gauche.
         
         Returns:
             bool: True si la rotation a réussi
         """
         try:
-            response = self.protocol.left()
+            response = await self.protocol.left()
             if response:
-                direction = (self.player.get_direction() - 1) % 4
-                self.player.set_direction(direction)
-                self.last_move_time = time.time()
+                direction = self.pose.apply((path_planner.LEFT,))[2]
+                self.last_move_time = self.clock.now()
                 self.logger.debug(f"Rotation vers la gauche: {direction}")
                 return True
             self.logger.debug(f"Échec de la rotation gauche")
@@ -302,18 +281,17 @@ class MovementManager:
             self.logger.error(f"Erreur lors de la rotation: {str(e)}")
             return False
 
-    def turn_right(self) -> bool:
+    async def turn_right(self) -> bool:
         """Fait tourner le joueur vers la droite.
         
         Returns:
             bool: True si la rotation a réussi
         """
         try:
-            response = self.protocol.right()
+            response = await self.protocol.right()
             if response:
-                direction = (self.player.get_direction() + 1) % 4
-                self.player.set_direction(direction)
-                self.last_move_time = time.time()
+                direction = self.pose.apply((path_planner.RIGHT,))[2]
+                self.last_move_time = self.clock.now()
                 self.logger.debug(f"Rotation vers la droite: {direction}")
                 return True
             self.logger.debug(f"Échec de la rotation droite")
@@ -332,7 +310,7 @@ class MovementManager:
         self.position_history = []
         self.collision_manager.reset()
 
-    def orient_towards(self, target_direction: int) -> bool:
+    async def orient_towards(self, target_direction: int) -> bool:
         """Oriente le joueur vers une direction spécifique de manière optimale.
         
         Args:
@@ -350,10 +328,10 @@ class MovementManager:
             diff = (target_direction - current_direction) % 4
             
             if diff == 1 or diff == 2:
-                if not self.turn_right():
+                if not await self.turn_right():
                     return False
             elif diff == 3:
-                if not self.turn_left():
+                if not await self.turn_left():
                     return False
             
             return True
@@ -365,6 +343,10 @@ class MovementManager:
     def _check_for_better_opportunities(self, target_x: int, target_y: int) -> bool:
         """Vérifie s'il y a de meilleures opportunités (ressources plus proches) après un déplacement.
         
+        Lit la vision décalée par l'estimateur de pose sans envoyer de Look :
+        c'est le planificateur de vision qui décide, au tour suivant, si une
+        nouvelle observation vaut son coût.
+        
         Args:
             target_x (int): Coordonnée X de la cible actuelle
             target_y (int): Coordonnée Y de la cible actuelle
@@ -373,11 +355,12 @@ class MovementManager:
             bool: True si une meilleure opportunité a été détectée
         """
         try:
-            if not self.vision_manager.force_update_vision():
+            if self.vision_manager.view is None:
                 return False
             
             current_x, current_y = self.player.get_position()
-            current_distance = abs(target_x - current_x) + abs(target_y - current_y)
+            current_distance = geometry.distance(current_x, current_y, target_x, target_y,
+                                                 self.map.width, self.map.height)
             
             for y in range(-self.vision_manager.level, self.vision_manager.level + 1):
                 for x in range(-self.vision_manager.level, self.vision_manager.level + 1):
@@ -1,7 +1,7 @@
 # reproduction_manager.py
-import time
 import logging
 from core.protocol import ZappyProtocol
+from core.clock import ServerClock
 
 class ReproductionManager:
     """Gère la logique de reproduction (fork) du joueur."""
@@ -14,6 +14,7 @@ class ReproductionManager:
         """
         self.protocol = protocol
         self.logger = logger
+        self.clock = ServerClock.of(protocol)
         self.last_fork_time = 0
         self.cooldown = 42
 
@@ -22,23 +23,23 @@ class ReproductionManager:
         Returns:
             bool: True si la commande Fork est autorisée
         """
-        return time.time() - self.last_fork_time > self.cooldown
-    def reproduce(self) -> bool:
+        return self.clock.elapsed_ticks(self.last_fork_time) > self.cooldown
+    async def reproduce(self) -> bool:
         """Effectue un fork si possible et s'il reste des slots de connexion."""
         if not self.can_fork():
             self.logger.debug("⏳ Cooldown actif, fork non autorisé pour le moment.")
             return False
 
         try:
-            available_slots = self.protocol.connect_nbr()
+            available_slots = await self.protocol.connect_nbr()
             if available_slots <= 0:
                 self.logger.info("🚫 Aucun slot disponible, fork inutile.")
                 return False
 
             self.logger.info(f"🧬 Tentative de fork (slots restants: {available_slots})")
-            success = self.protocol.fork()
+            success = await self.protocol.fork()
             if success:
-                self.last_fork_time = time.time()
+                self.last_fork_time = self.clock.now()
                 self.logger.info("🥚 Fork réussi (œuf pondu)")
                 return True
             else:
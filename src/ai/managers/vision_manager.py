@@ -1,12 +1,30 @@
 from typing import Dict, List, Tuple, Optional
 import logging
 from core.protocol import ZappyProtocol
-import time
+from core.clock import ServerClock
 from models.player import Player
 from models.map import Map
+from models.vision import Vision, ITEMS, WIDTH
+import numpy as np
+from models import geometry, vision_cone
+from models.look_scheduler import LookScheduler
+from models.belief import BeliefMap
+from models.map import RESOURCE_INDEX
 
 class VisionManager:
-    """Gère la vision du joueur selon les règles du jeu."""
+    """Gère la vision du joueur selon les règles du jeu.
+
+    `look` est le dernier Look tel que reçu, pris depuis `look_pose`.
+    `view` est le cône vu depuis la pose actuelle : après chaque
+    déplacement ou rotation confirmé, il est recalculé sans Look en
+    reprenant les cases encore couvertes par la vue précédente et, pour
+    les autres, le contenu de la carte. `origin` indique pour chaque
+    case d'où vient son contenu (SEEN, MEMORY ou UNKNOWN).
+    """
+
+    SEEN = 0
+    MEMORY = 1
+    UNKNOWN = 2
 
     def __init__(self, protocol: ZappyProtocol, player: Player, map: Map, logger: logging.Logger):
         """Initialise le gestionnaire de vision.
@@ -21,32 +39,65 @@ class VisionManager:
         self.player = player
         self.map = map
         self.logger = logger
-        self.vision = []
-        self.vision_data = []
+        self.view: Optional[Vision] = None
+        self.view_pose: Optional[Tuple[int, int, int]] = None
+        self.origin: Optional[np.ndarray] = None
+        self.look: Optional[Vision] = None
+        self.look_pose: Optional[Tuple[int, int, int]] = None
         self.level = 1
+        self.clock = ServerClock.of(protocol)
         self.last_vision_update = 0
-        self.vision_cooldown = 7
-        self.vision_cache = {}
-        self.cache_duration = 30
+        self.cache_generations = 30
+        self.scheduler = LookScheduler(map, self.clock)
+        self.belief = BeliefMap(map, self.clock)
+
+    @property
+    def vision(self) -> List[List[str]]:
+        """Dernière vision au format liste de listes (construit à la demande)."""
+        return self.view.to_lists() if self.view is not None else []
+
+    @vision.setter
+    def vision(self, tiles: Optional[List[List[str]]]) -> None:
+        self.view = Vision.from_tiles(tiles) if tiles else None
+
+    @property
+    def vision_data(self) -> List[List[str]]:
+        """Alias historique de vision."""
+        return self.vision
+
+    @vision_data.setter
+    def vision_data(self, tiles: Optional[List[List[str]]]) -> None:
+        self.vision = tiles
+
+    def _pose(self) -> Tuple[int, int, int]:
+        x, y = self.player.get_position()
+        return x, y, self.player.get_direction()
+
+    def _view_matches(self, pose: Tuple[int, int, int]) -> bool:
+        """Indique si la vue courante correspond à la pose du joueur.
+        
+        Une vue prise ou décalée depuis une autre pose ne peut pas
+        remplacer un Look, quelle que soit la décision du planificateur.
+        """
+        return self.view is not None and self.view_pose == pose
 
-    def update_vision(self) -> bool:
-        """Met à jour la vision du joueur.
+    async def update_vision(self, reason: str = "tick") -> bool:
+        """Met à jour la vision du joueur si le Look en vaut la peine.
+        
+        Args:
+            reason (str): Raison de la demande, voir look_scheduler.REASONS
         
         Returns:
             bool: True si la mise à jour a réussi
         """
         try:
-            if time.time() - self.last_vision_update < self.vision_cooldown:
+            pose = self._pose()
+            if not self.scheduler.should_look(pose, self.level, reason) and self._view_matches(pose):
                 return True
                 
-            response = self.protocol.look()
-            self.vision = self._parse_vision(response)
-            self.vision_data = self.vision
-            self.last_vision_update = time.time()
-            
-            self._update_vision_cache()
+            self._store_look(await self.protocol.look(), pose, reason)
             
-            self.logger.debug(f"Vision mise à jour: {self.vision}")
+            self.logger.debug(f"Vision mise à jour: {len(self.view)} cases")
             return True
         except ConnectionError as e:
             self.logger.error(f"🔌 Erreur de connexion lors de la mise à jour de la vision: {e}")
@@ -55,22 +106,28 @@ class VisionManager:
             self.logger.error(f"Erreur lors de la mise à jour de la vision: {str(e)}")
             return False
 
-    def force_update_vision(self) -> bool:
-        """Force la mise à jour de la vision en ignorant le cooldown.
+    async def force_update_vision(self, reason: str = "forced") -> bool:
+        """Demande une vision fraîche pour une décision en attente.
+        
+        La demande passe par le planificateur avec le poids de sa raison :
+        "forced" et "elevation" envoient toujours un Look, les autres
+        seulement si la vue actuelle est trop ancienne ou trop décalée.
+        
+        Args:
+            reason (str): Raison de la demande, voir look_scheduler.REASONS
         
         Returns:
-            bool: True si la mise à jour a réussi
+            bool: True si la vision est à jour
         """
         try:
-            self.logger.debug("🔄 Mise à jour forcée de la vision (ignorant le cooldown)")
-            response = self.protocol.look()
-            self.vision = self._parse_vision(response)
-            self.vision_data = self.vision
-            self.last_vision_update = time.time()
-            
-            self._update_vision_cache()
+            pose = self._pose()
+            if not self.scheduler.should_look(pose, self.level, reason) and self._view_matches(pose):
+                self.logger.debug(f"👁️ Look ({reason}) jugé inutile, vision conservée")
+                return True
+            self.logger.debug(f"🔄 Mise à jour forcée de la vision ({reason})")
+            self._store_look(await self.protocol.look(), pose, reason)
             
-            self.logger.debug(f"Vision forcée mise à jour: {self.vision}")
+            self.logger.debug(f"Vision forcée mise à jour: {len(self.view)} cases")
             return True
         except ConnectionError as e:
             self.logger.error(f"🔌 Erreur de connexion lors de la mise à jour forcée de la vision: {e}")
@@ -79,31 +136,71 @@ class VisionManager:
             self.logger.error(f"Erreur lors de la mise à jour forcée de la vision: {str(e)}")
             return False
 
-    def _update_vision_cache(self) -> None:
-        """Met à jour le cache de vision."""
+    def _store_look(self, response: str, pose: Tuple[int, int, int], reason: str) -> None:
+        """Enregistre la réponse d'un Look comme vue courante."""
+        self.look = Vision.parse(response)
+        self.look_pose = pose
+        self.view = self.look
+        self.view_pose = pose
+        self.origin = np.full(len(self.look), self.SEEN, dtype=np.uint8)
+        self.last_vision_update = self.clock.now()
+        self.scheduler.record_look(pose, self.level, reason)
+
+    def _cone(self, pose: Tuple[int, int, int], tiles: int) -> np.ndarray:
+        """Indices à plat des cases du cône vu depuis une pose."""
+        offsets = vision_cone.offsets(vision_cone.MAX_LEVEL, pose[2])[:tiles]
+        cols = (pose[0] + offsets[:, 0]) % self.map.width
+        rows = (pose[1] + offsets[:, 1]) % self.map.height
+        return rows * self.map.width + cols
+
+    def shift(self, pose: Tuple[int, int, int]) -> None:
+        """Recalcule la vue pour une nouvelle pose, sans Look.
+        
+        Les cases déjà dans la vue gardent leur contenu et leur origine ;
+        les cases nouvellement exposées sont reprises de la carte
+        (MEMORY) ou laissées vides (UNKNOWN) si la carte ne les connaît
+        pas. Le joueur est déplacé de l'ancienne case 0 vers la nouvelle.
+        
+        Args:
+            pose (Tuple[int, int, int]): Nouvelle pose (x, y, orientation)
+        """
         try:
-            current_time = time.time()
-            player_pos = self.player.get_position()
+            if self.view is None or self.view_pose is None or pose == self.view_pose:
+                return
+            tiles = len(self.view)
+            previous = self.view.counts.astype(np.int32)
+            previous[0, 0] = max(0, previous[0, 0] - 1)
+            lookup = np.full(self.map.width * self.map.height, -1, dtype=np.intp)
+            lookup[self._cone(self.view_pose, tiles)] = np.arange(tiles)
+            cone = self._cone(pose, tiles)
+            source = lookup[cone]
+            kept = source >= 0
             
-            expired_keys = []
-            for key, (timestamp, _) in self.vision_cache.items():
-                if current_time - timestamp > self.cache_duration:
-                    expired_keys.append(key)
-                    
-            for key in expired_keys:
-                del self.vision_cache[key]
-                
-            for y in range(-self.level, self.level + 1):
-                for x in range(-self.level, self.level + 1):
-                    case_content = self.get_case_content(x, y)
-                    if case_content:
-                        cache_x = (player_pos[0] + x) % self.map.width
-                        cache_y = (player_pos[1] + y) % self.map.height
-                        cache_key = (cache_x, cache_y)
-                        self.vision_cache[cache_key] = (current_time, case_content)
-                        
+            counts = np.zeros((tiles, WIDTH), dtype=np.int32)
+            origin = np.full(tiles, self.UNKNOWN, dtype=np.uint8)
+            counts[kept] = previous[source[kept]]
+            origin[kept] = self.origin[source[kept]]
+            remembered = ~kept & self.map.explored.ravel()[cone]
+            counts[remembered, 1:] = self.map.resources.reshape(-1, WIDTH - 1)[cone[remembered]]
+            origin[remembered] = self.MEMORY
+            counts[0, 0] += 1
+            
+            self.view = Vision(counts.astype(np.uint16))
+            self.view_pose = pose
+            self.origin = origin
+            self.logger.debug(f"Vue décalée vers {pose}: {int(kept.sum())}/{tiles} cases conservées")
         except Exception as e:
-            self.logger.error(f"Erreur lors de la mise à jour du cache: {str(e)}")
+            self.logger.error(f"Erreur lors du décalage de la vision: {str(e)}")
+
+    def relocate(self, pose: Tuple[int, int, int]) -> None:
+        """Rattache le dernier Look et la vue à une pose recalée.
+        
+        Args:
+            pose (Tuple[int, int, int]): Pose corrigée où le Look a été pris
+        """
+        if self.view_pose == self.look_pose:
+            self.view_pose = pose
+        self.look_pose = pose
 
     def _parse_vision(self, response: str) -> List[List[str]]:
         """Parse la réponse de la commande Look.
@@ -119,15 +216,7 @@ class VisionManager:
             List[List[str]]: Liste des cases vues
         """
         try:
-            response = response.strip('[]')
-            cases = response.split(',')
-            
-            vision = []
-            for case in cases:
-                items = case.strip().split()
-                vision.append(items)
-                
-            return vision
+            return Vision.parse(response).to_lists()
         except Exception as e:
             self.logger.error(f"Erreur lors du parsing de la vision: {str(e)}")
             raise
@@ -143,52 +232,73 @@ class VisionManager:
             List[str]: Contenu de la case
         """
         try:
-            index = self._get_vision_index(x, y)
-            if 0 <= index < len(self.vision):
-                return self.vision[index]
-            return []
+            if self.view is None:
+                return []
+            return self.view.content(self._get_vision_index(x, y))
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération du contenu de la case: {str(e)}")
             return []
 
-    def _get_vision_index(self, x: int, y: int) -> int:
-        """Calcule l'index dans la vision pour une position relative.
-        
-        Pour le niveau 1, la vision est de 1 case dans chaque direction.
-        Format: [0, 1, 2, 3, 4, 5, 6, 7, 8]
-        Où 0 est la case du joueur, et les autres sont autour dans le sens horaire:
-        7 0 1
-        6   2
-        5 4 3
+    def count_on_tile(self, item: str, x: int = 0, y: int = 0) -> int:
+        """Nombre d'exemplaires d'un objet sur une case de la vision.
         
         Args:
+            item (str): Objet compté (player, food, pierre)
             x (int): Position X relative
             y (int): Position Y relative
             
         Returns:
-            int: Index dans la vision
+            int: Nombre d'exemplaires, 0 hors vision
         """
-        if x == 0 and y == 0:
+        if self.view is None:
             return 0
+        return self.view.count(self._get_vision_index(x, y), item)
+
+    def _tile_positions(self) -> Tuple[Tuple[int, int], ...]:
+        """Position relative de chaque index de la vision.
+        
+        Returns:
+            Tuple[Tuple[int, int], ...]: (x, y) de chaque case, dans l'ordre de Look
+        """
+        return vision_cone.positions(self.level, self.player.get_direction())
+
+    def _positions_with(self, item: str, max_distance: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Positions relatives des cases vues contenant un objet.
+        
+        Args:
+            item (str): Objet cherché
+            max_distance (Optional[int]): Distance de Manhattan maximale
             
-        if x == 1 and y == 0:
-            return 1
-        elif x == 1 and y == 1:
-            return 2
-        elif x == 0 and y == 1:
-            return 3
-        elif x == -1 and y == 1:
-            return 4
-        elif x == -1 and y == 0:
-            return 5
-        elif x == -1 and y == -1:
-            return 6
-        elif x == 0 and y == -1:
-            return 7
-        elif x == 1 and y == -1:
-            return 8
+        Returns:
+            List[Tuple[int, int]]: Positions, dans l'ordre de la vision
+        """
+        if self.view is None:
+            return []
+        positions = self._tile_positions()
+        found = []
+        for index in self.view.tiles_with(item).tolist():
+            if index >= len(positions):
+                break
+            pos = positions[index]
+            if max_distance is not None and abs(pos[0]) + abs(pos[1]) > max_distance:
+                continue
+            found.append(pos)
+        return found
+
+    def _get_vision_index(self, x: int, y: int) -> int:
+        """Calcule l'index dans la vision pour une position relative.
+        
+        Lecture directe dans les tables du cône de vision, qui tiennent
+        compte du niveau et de l'orientation du joueur.
+        
+        Args:
+            x (int): Position X relative
+            y (int): Position Y relative
             
-        return -1
+        Returns:
+            int: Index dans la vision, -1 hors du cône
+        """
+        return vision_cone.index_of(x, y, self.level, self.player.get_direction())
 
     def find_nearest_object(self, object_type: str) -> Optional[Tuple[int, int]]:
         """Trouve l'objet le plus proche d'un type donné.
@@ -200,17 +310,8 @@ class VisionManager:
             Optional[Tuple[int, int]]: Position relative de l'objet le plus proche
         """
         try:
-            nearest = None
-            min_distance = float('inf')
-            
-            for y in range(-self.level, self.level + 1):
-                for x in range(-self.level, self.level + 1):
-                    case = self.get_case_content(x, y)
-                    if object_type in case:
-                        distance = abs(x) + abs(y)
-                        if distance < min_distance:
-                            min_distance = distance
-                            nearest = (x, y)
+            positions = self._positions_with(object_type)
+            nearest = min(positions, key=lambda pos: abs(pos[0]) + abs(pos[1])) if positions else None
                             
             if not nearest:
                 nearest = self._find_in_cache(object_type)
@@ -221,7 +322,12 @@ class VisionManager:
             return None
 
     def _find_in_cache(self, object_type: str) -> Optional[Tuple[int, int]]:
-        """Trouve un objet dans le cache de vision.
+        """Trouve une ressource hors de la vision, parmi les cases récentes de la carte.
+        
+        Le cache est la carte elle-même : une case y reste tant qu'elle a
+        été vue lors des `cache_generations` derniers Look inscrits, et la
+        case retenue est celle au meilleur rendement attendu par case
+        parcourue selon la croyance.
         
         Args:
             object_type (str): Type d'objet à chercher
@@ -230,26 +336,16 @@ class VisionManager:
             Optional[Tuple[int, int]]: Position relative de l'objet
         """
         try:
+            if object_type not in RESOURCE_INDEX:
+                return None
             player_pos = self.player.get_position()
-            nearest = None
-            min_distance = float('inf')
-            
-            for (cache_x, cache_y), (timestamp, case_content) in self.vision_cache.items():
-                if object_type in case_content:
-                    rel_x = (cache_x - player_pos[0]) % self.map.width
-                    rel_y = (cache_y - player_pos[1]) % self.map.height
-                    
-                    if rel_x > self.map.width // 2:
-                        rel_x -= self.map.width
-                    if rel_y > self.map.height // 2:
-                        rel_y -= self.map.height
-                        
-                    distance = abs(rel_x) + abs(rel_y)
-                    if distance < min_distance:
-                        min_distance = distance
-                        nearest = (rel_x, rel_y)
-                        
-            return nearest
+            found = self.belief.rank(object_type, player_pos[0], player_pos[1],
+                                     within=self.map.recent(self.cache_generations))
+            if not found:
+                return None
+                
+            return geometry.relative(player_pos[0], player_pos[1], found[0][0], found[0][1],
+                                     self.map.width, self.map.height)
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la recherche dans le cache: {str(e)}")
@@ -261,13 +357,7 @@ class VisionManager:
         Returns:
             List[Tuple[int, int]]: Liste des positions relatives des joueurs
         """
-        players = []
-        for y in range(-self.level, self.level + 1):
-            for x in range(-self.level, self.level + 1):
-                case = self.get_case_content(x, y)
-                if "player" in case:
-                    players.append((x, y))
-        return players
+        return self._positions_with("player")
 
     def get_vision_range(self) -> int:
         """Retourne la portée de vision selon le niveau.
@@ -285,7 +375,7 @@ class VisionManager:
         """
         return self.vision.get_current_position()
 
-    def find_nearest_resource(self, resource_type: str) -> Optional[Tuple[int, int]]:
+    async def find_nearest_resource(self, resource_type: str) -> Optional[Tuple[int, int]]:
         """Trouve la ressource la plus proche d'un type donné.
         
         Args:
@@ -295,7 +385,7 @@ class VisionManager:
             Optional[Tuple[int, int]]: Position de la ressource la plus proche
         """
         if not self.vision_data:
-            if not self.update_vision():
+            if not await self.update_vision():
                 return None
                 
         pos = self.find_nearest_object(resource_type)
@@ -344,7 +434,7 @@ class VisionManager:
         else:
             return pos[0] < 0
 
-    def get_players_in_range(self, max_distance: int = 2) -> List[Tuple[int, int]]:
+    async def get_players_in_range(self, max_distance: int = 2) -> List[Tuple[int, int]]:
         """Trouve tous les joueurs dans un rayon donné.
         
         Args:
@@ -354,18 +444,24 @@ class VisionManager:
             List[Tuple[int, int]]: Liste des positions des joueurs
         """
         if not self.vision_data:
-            if not self.update_vision():
+            if not await self.update_vision():
                 return []
                 
         return self.vision.get_players_in_range(max_distance)
 
-    def can_update_vision(self) -> bool:
-        """Vérifie si la vision peut être mise à jour.
+    def can_update_vision(self, reason: str = "tick") -> bool:
+        """Vérifie si un Look serait envoyé, sans compter de demande.
+        
+        Args:
+            reason (str): Raison de la demande, voir look_scheduler.REASONS
         
         Returns:
-            bool: True si la vision peut être mise à jour
+            bool: True si la vue ne correspond pas à la pose ou si le planificateur juge le Look utile
         """
-        return time.time() - self.last_vision_update >= self.vision_cooldown
+        pose = self._pose()
+        if not self._view_matches(pose):
+            return True
+        return self.scheduler.value(pose, self.level, reason) >= self.scheduler.threshold
 
     def get_case_position(self, index: int) -> Tuple[int, int]:
         """
@@ -388,7 +484,7 @@ class VisionManager:
         self.level = level
         self.logger.info(f"Niveau de vision mis à jour: {self.level}")
 
-    def get_resources_in_range(self, max_distance: int = 2) -> Dict[str, List[Tuple[int, int]]]:
+    async def get_resources_in_range(self, max_distance: int = 2) -> Dict[str, List[Tuple[int, int]]]:
         """Récupère toutes les ressources dans un rayon donné.
         
         Args:
@@ -398,23 +494,12 @@ class VisionManager:
             Dict[str, List[Tuple[int, int]]]: Dictionnaire des ressources et leurs positions
         """
         if not self.vision_data:
-            if not self.update_vision():
+            if not await self.update_vision():
                 return {}
                 
-        resources = {}
-        
-        for resource_type in ["food", "linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame"]:
-            resources[resource_type] = []
-            for y in range(-self.level, self.level + 1):
-                for x in range(-self.level, self.level + 1):
-                    if abs(x) + abs(y) <= max_distance:
-                        case_content = self.get_case_content(x, y)
-                        if resource_type in case_content:
-                            resources[resource_type].append((x, y))
-            
-        return resources
+        return {resource: self._positions_with(resource, max_distance) for resource in ITEMS[1:]}
 
-    def is_position_safe(self, position: Tuple[int, int]) -> bool:
+    async def is_position_safe(self, position: Tuple[int, int]) -> bool:
         """Vérifie si une position est sûre (pas de joueurs hostiles).
         
         Args:
@@ -424,13 +509,12 @@ class VisionManager:
             bool: True si la position est sûre, False sinon
         """
         if not self.vision_data:
-            if not self.update_vision():
+            if not await self.update_vision():
                 return False
                 
-        case_content = self.get_case_content(position[0], position[1])
-        return "player" not in case_content
+        return self.count_on_tile("player", position[0], position[1]) == 0
 
-    def get_best_path_to_resource(self, resource_type: str) -> List[Tuple[int, int]]:
+    async def get_best_path_to_resource(self, resource_type: str) -> List[Tuple[int, int]]:
         """Trouve le meilleur chemin vers une ressource.
         
         Args:
@@ -440,10 +524,10 @@ class VisionManager:
             List[Tuple[int, int]]: Liste des positions à suivre
         """
         if not self.vision_data:
-            if not self.update_vision():
+            if not await self.update_vision():
                 return []
                 
-        target = self.find_nearest_resource(resource_type)
+        target = await self.find_nearest_resource(resource_type)
         if not target:
             return []
             
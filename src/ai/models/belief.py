@@ -0,0 +1,165 @@
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from models import geometry
+from models.map import RESOURCES, RESOURCE_INDEX
+
+DENSITY = np.array([0.5, 0.3, 0.15, 0.1, 0.1, 0.08, 0.05])
+"""Densités de ressources par case du sujet, dans l'ordre de RESOURCES."""
+
+
+class BeliefMap:
+    """Croyance sur le contenu des cases, qui s'estompe avec l'âge.
+
+    Chaque ressource suit un processus de naissance et de mort par case :
+    des unités apparaissent au taux ρ (réapparitions du serveur) et
+    chaque unité disparaît au taux δ (ramassée par un autre joueur).
+    Partant de c unités vues il y a t unités de temps, on attend
+
+        E = c·e^(-δt) + ρ·(1 - e^(-δt)) / δ
+
+    qui tend vers l'équilibre ρ/δ ; e^(-δt) sert de confiance. ρ et δ
+    sont appris à chaque nouvelle observation d'une case déjà vue, à
+    partir d'un a priori calé sur les densités du sujet.
+    """
+
+    def __init__(self, map, clock, prior_lifetime: float = 1000.0, prior_weight: float = 5000.0):
+        """Initialise la croyance.
+
+        Args:
+            map (Map): Carte connue (comptes et horodatages)
+            clock (ServerClock): Horloge du serveur, pour convertir les âges en unités de temps
+            prior_lifetime (float): Durée de vie a priori d'une unité au sol
+            prior_weight (float): Poids de l'a priori, en unités de temps × case
+        """
+        self.map = map
+        self.clock = clock
+        depletion = 1.0 / prior_lifetime
+        self.respawn_events = DENSITY * depletion * prior_weight
+        self.empty_exposure = np.full(len(RESOURCES), prior_weight)
+        self.depletion_events = np.full(len(RESOURCES), depletion * prior_weight)
+        self.unit_exposure = np.full(len(RESOURCES), prior_weight)
+
+    @property
+    def respawn_rate(self) -> np.ndarray:
+        """Unités apparaissant par case et par unité de temps (ρ), par ressource."""
+        return self.respawn_events / self.empty_exposure
+
+    @property
+    def depletion_rate(self) -> np.ndarray:
+        """Probabilité par unité de temps qu'une unité disparaisse (δ), par ressource."""
+        return self.depletion_events / self.unit_exposure
+
+    @property
+    def equilibrium(self) -> np.ndarray:
+        """Nombre d'unités attendu sur une case jamais vue (ρ/δ), par ressource."""
+        return self.respawn_rate / self.depletion_rate
+
+    def observe(self, xs: Sequence[int], ys: Sequence[int], counts: np.ndarray, timestamp: float) -> None:
+        """Apprend ρ et δ d'une nouvelle observation, avant son inscription dans la carte.
+
+        Une case vue vide qui porte des unités compte pour ρ ; des unités
+        disparues d'une case comptent pour δ.
+
+        Args:
+            xs (Sequence[int]): Coordonnées X des cases observées
+            ys (Sequence[int]): Coordonnées Y des cases observées
+            counts (np.ndarray): Comptes observés (n, 7) dans l'ordre de RESOURCES
+            timestamp (float): Horodatage de l'observation
+        """
+        cols = np.asarray(xs) % self.map.width
+        rows = np.asarray(ys) % self.map.height
+        elapsed = self.clock.ticks(timestamp - self.map.last_seen[rows, cols])
+        known = self.map.explored[rows, cols] & (elapsed > 0)
+        if not known.any():
+            return
+        before = self.map.resources[rows[known], cols[known]].astype(np.float64)
+        after = np.asarray(counts, dtype=np.float64)[known]
+        dt = elapsed[known][:, None]
+        empty = before == 0
+        self.respawn_events += np.where(empty, after, 0).sum(axis=0)
+        self.empty_exposure += np.where(empty, dt, 0).sum(axis=0)
+        self.depletion_events += np.maximum(before - after, 0).sum(axis=0)
+        self.unit_exposure += (before * dt).sum(axis=0)
+
+    def _ages(self, now: Optional[float]) -> np.ndarray:
+        now = self.clock.now() if now is None else now
+        return np.maximum(self.clock.ticks(now - self.map.last_seen), 0)
+
+    def confidence(self, resource: Optional[str] = None, now: Optional[float] = None) -> np.ndarray:
+        """Confiance dans les comptes de la carte, 0 pour une case jamais vue.
+
+        Args:
+            resource (Optional[str]): Ressource, toutes si None
+            now (Optional[float]): Horodatage courant, celui de l'horloge par défaut
+
+        Returns:
+            np.ndarray: (h, w) pour une ressource, (h, w, 7) sinon
+        """
+        rates = self.depletion_rate if resource is None else self.depletion_rate[RESOURCE_INDEX[resource]]
+        ages = self._ages(now)
+        if resource is None:
+            ages = ages[..., None]
+            explored = self.map.explored[..., None]
+        else:
+            explored = self.map.explored
+        return np.where(explored, np.exp(-rates * ages), 0.0)
+
+    def expected(self, resource: Optional[str] = None, now: Optional[float] = None) -> np.ndarray:
+        """Nombre d'unités attendu sur chaque case de la carte.
+
+        Args:
+            resource (Optional[str]): Ressource, toutes si None
+            now (Optional[float]): Horodatage courant, celui de l'horloge par défaut
+
+        Returns:
+            np.ndarray: (h, w) pour une ressource, (h, w, 7) sinon
+        """
+        if resource is None:
+            seen = self.map.resources.astype(np.float64)
+            depletion, respawn = self.depletion_rate, self.respawn_rate
+        else:
+            index = RESOURCE_INDEX[resource]
+            seen = self.map.resources[..., index].astype(np.float64)
+            depletion, respawn = self.depletion_rate[index], self.respawn_rate[index]
+        decay = self.confidence(resource, now)
+        expected = seen * decay + respawn * (1 - decay) / depletion
+        explored = self.map.explored if resource is not None else self.map.explored[..., None]
+        return np.where(explored, expected, respawn / depletion)
+
+    def rank(self, resource: str, x: int, y: int, k: int = 1, max_distance: Optional[int] = None,
+             min_expected: float = 0.5, known_only: bool = True,
+             within: Optional[np.ndarray] = None, now: Optional[float] = None) -> List[Tuple[int, int, float]]:
+        """Meilleures cases pour une ressource, par rendement attendu par case parcourue.
+
+        Le score d'une case est E / (distance + 1) : la case du joueur
+        coûte un Take, une case à d pas en coûte d de plus.
+
+        Args:
+            resource (str): Ressource cherchée
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            k (int): Nombre de cases voulues
+            max_distance (Optional[int]): Distance de Manhattan torique maximale
+            min_expected (float): Nombre d'unités attendu minimal
+            known_only (bool): Ignorer les cases jamais vues
+            within (Optional[np.ndarray]): Masque (h, w) des cases admises
+            now (Optional[float]): Horodatage courant, celui de l'horloge par défaut
+
+        Returns:
+            List[Tuple[int, int, float]]: (x, y, score), du meilleur au moins bon
+        """
+        expected = self.expected(resource, now)
+        distances = geometry.distances_from(x, y, self.map.width, self.map.height)
+        mask = expected >= min_expected
+        if known_only:
+            mask &= self.map.explored
+        if max_distance is not None:
+            mask &= distances <= max_distance
+        if within is not None:
+            mask &= within
+        rows, cols = np.nonzero(mask)
+        if not len(rows):
+            return []
+        scores = expected[rows, cols] / (distances[rows, cols] + 1)
+        order = np.lexsort((cols, rows, distances[rows, cols], -scores))[:k]
+        return [(int(cols[i]), int(rows[i]), float(scores[i])) for i in order]
@@ -0,0 +1,156 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from models import vision_cone
+
+Waypoint = Tuple[int, int, int]
+DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def look_spacing(level: int) -> int:
+    """Nombre de Forward entre deux Look pour balayer au moindre coût.
+
+    Avec un Look tous les s pas, chaque ligne de la voie est vue au moins
+    à la distance level - s + 1 : la bande couverte fait
+    2 * (level - s + 1) + 1 cases de large. Le coût par case de carte est
+    (1 + 1/s) commandes divisé par cette largeur ; on garde le s minimal.
+
+    Args:
+        level (int): Niveau du joueur
+
+    Returns:
+        int: Pas entre deux Look (1 à level + 1)
+    """
+    level = max(1, min(level, vision_cone.MAX_LEVEL))
+    return min(range(1, level + 2), key=lambda s: (1 + 1 / s) / (2 * (level - s + 1) + 1))
+
+
+def lane_width(level: int) -> int:
+    """Largeur de la bande observée en suivant une voie."""
+    level = max(1, min(level, vision_cone.MAX_LEVEL))
+    return 2 * (level - look_spacing(level) + 1) + 1
+
+
+class CoveragePlanner:
+    """Balayage en voies parallèles d'une carte torique.
+
+    Sur un tore, inutile de faire demi-tour au bout d'une voie : on la
+    parcourt sur toute la longueur, on se décale d'une largeur de bande
+    puis on repart dans le même sens. Le plan est une liste de points
+    (x, y, orientation) où faire un Look ; les points dont le cône ne
+    contient plus de case inexplorée sont sautés, et le plan est refait
+    depuis la position courante quand le niveau change.
+    """
+
+    def __init__(self, width: int, height: int, level: int = 1):
+        """Initialise le planificateur.
+
+        Args:
+            width (int): Largeur de la carte
+            height (int): Hauteur de la carte
+            level (int): Niveau du joueur
+        """
+        self.width = width
+        self.height = height
+        self.level = level
+        self.waypoints: List[Waypoint] = []
+        self.cursor = 0
+
+    def _lane_cost(self, length: int, across: int) -> int:
+        """Commandes pour balayer des voies de `length` cases sur `across` cases."""
+        spacing = look_spacing(self.level)
+        band = lane_width(self.level)
+        lanes = -(-across // band)
+        looks = -(-length // spacing)
+        return lanes * (looks * spacing + looks) + (lanes - 1) * (band + 2)
+
+    def plan(self, x: int, y: int, orientation: int) -> List[Waypoint]:
+        """Construit le plan de balayage depuis une position.
+
+        Les voies suivent l'axe le moins coûteux ; à coût égal, celui de
+        l'orientation actuelle pour éviter des rotations.
+
+        Args:
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+        Returns:
+            List[Waypoint]: Points (x, y, orientation) où faire un Look
+        """
+        horizontal_cost = self._lane_cost(self.width, self.height)
+        vertical_cost = self._lane_cost(self.height, self.width)
+        if horizontal_cost != vertical_cost:
+            horizontal = horizontal_cost < vertical_cost
+        else:
+            horizontal = orientation in (1, 3)
+        if horizontal:
+            heading = orientation if orientation in (1, 3) else 1
+            length, across = self.width, self.height
+        else:
+            heading = orientation if orientation in (0, 2) else 2
+            length, across = self.height, self.width
+        shift = (heading + 1) % 4
+        spacing = look_spacing(self.level)
+        band = lane_width(self.level)
+        dx, dy = DELTAS[heading]
+        sx, sy = DELTAS[shift]
+
+        waypoints = []
+        cx, cy = x, y
+        for lane in range(-(-across // band)):
+            if lane:
+                cx, cy = cx + sx * band, cy + sy * band
+            for _ in range(-(-length // spacing)):
+                cx, cy = cx + dx * spacing, cy + dy * spacing
+                waypoints.append((cx % self.width, cy % self.height, heading))
+        self.waypoints = waypoints
+        self.cursor = 0
+        return waypoints
+
+    def set_level(self, level: int, x: int, y: int, orientation: int) -> None:
+        """Met à jour le niveau et refait le plan s'il a changé.
+
+        Args:
+            level (int): Nouveau niveau
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            orientation (int): Orientation du joueur
+        """
+        if level != self.level:
+            self.level = level
+            self.plan(x, y, orientation)
+
+    def _reveals(self, waypoint: Waypoint, explored: np.ndarray) -> bool:
+        """Indique si un Look depuis ce point verrait une case inexplorée."""
+        wx, wy, heading = waypoint
+        offsets = vision_cone.offsets(self.level, heading)
+        return not explored[(wy + offsets[:, 1]) % self.height, (wx + offsets[:, 0]) % self.width].all()
+
+    def next_target(self, x: int, y: int, orientation: int, explored: np.ndarray) -> Optional[Waypoint]:
+        """Prochain point utile du plan.
+
+        Le plan est construit au premier appel. Les points atteints ou
+        dont le cône est déjà exploré sont abandonnés.
+
+        Args:
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            orientation (int): Orientation du joueur
+            explored (np.ndarray): Masque (h, w) des cases explorées
+
+        Returns:
+            Optional[Waypoint]: (x, y, orientation) du prochain Look, None si la carte est couverte
+        """
+        if not self.waypoints:
+            self.plan(x, y, orientation)
+        here = (x % self.width, y % self.height)
+        while self.cursor < len(self.waypoints):
+            waypoint = self.waypoints[self.cursor]
+            if waypoint[:2] != here and self._reveals(waypoint, explored):
+                return waypoint
+            self.cursor += 1
+        return None
+
+    def remaining(self) -> int:
+        """Nombre de points restant dans le plan."""
+        return len(self.waypoints) - self.cursor
@@ -0,0 +1,186 @@
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from models import geometry
+from models.path_planner import DELTAS
+
+UNREACHABLE = np.iinfo(np.int32).max
+"""Distance d'une case quand aucune instance de la ressource n'est connue."""
+
+
+class DistanceFields:
+    """Champs de distances de marche vers l'instance connue la plus proche, par ressource.
+
+    Sur le tore sans obstacle, la distance de marche d'une case est la
+    plus petite distance de Manhattan torique à une source. Les sources
+    de toutes les ressources sont suivies, mais un champ n'est construit
+    qu'à sa première consultation, puis tenu à jour : une source ajoutée
+    est fusionnée tout de suite (minimum avec son champ) ; une source
+    retirée n'allonge que les cases dont elle était la plus proche, qui
+    sont retrouvées en partant d'elle et recalculées seules.
+    """
+
+    NEIGHBOURS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+    def __init__(self, width: int, height: int, resources: Iterable[str]):
+        """Initialise des champs vides.
+
+        Args:
+            width (int): Largeur de la carte
+            height (int): Hauteur de la carte
+            resources (Iterable[str]): Ressources suivies
+        """
+        self.width = width
+        self.height = height
+        self.sources: Dict[str, np.ndarray] = {
+            resource: np.zeros((height, width), dtype=bool) for resource in resources
+        }
+        self._fields: Dict[str, np.ndarray] = {}
+        self.rebuilds = 0
+        self.repaired = 0
+
+    def set_present(self, resource: str, x: int, y: int, present: bool) -> None:
+        """Ajoute ou retire une source.
+
+        Args:
+            resource (str): Ressource
+            x (int): Coordonnée X
+            y (int): Coordonnée Y
+            present (bool): True si la ressource est désormais sur la case
+        """
+        sources = self.sources.get(resource)
+        if sources is None:
+            return
+        col, row = x % self.width, y % self.height
+        if sources[row, col] == present:
+            return
+        sources[row, col] = present
+        field = self._fields.get(resource)
+        if field is None:
+            return
+        if present:
+            np.minimum(field, geometry.distances_from(col, row, self.width, self.height), out=field)
+        else:
+            self._repair(resource, col, row)
+
+    def _rebuild(self, resource: str) -> None:
+        """Parcours en largeur depuis toutes les sources, un anneau par itération."""
+        sources = self.sources[resource]
+        field = np.full(sources.shape, UNREACHABLE, dtype=np.int32)
+        field[sources] = 0
+        frontier = sources.copy()
+        distance = 0
+        while frontier.any():
+            distance += 1
+            grown = (np.roll(frontier, 1, axis=0) | np.roll(frontier, -1, axis=0)
+                     | np.roll(frontier, 1, axis=1) | np.roll(frontier, -1, axis=1))
+            frontier = grown & (field == UNREACHABLE)
+            field[frontier] = distance
+        self._fields[resource] = field
+        self.rebuilds += 1
+
+    def _repair(self, resource: str, col: int, row: int) -> None:
+        """Recalcule les seules cases dont la source retirée était la plus proche.
+
+        Une telle case est à distance f de la source, et son voisin vers
+        la source l'est aussi à f - 1 : la zone se parcourt depuis la
+        source, sans sortir d'elle. Ses cases prennent ensuite la
+        distance à la source restante la plus proche.
+        """
+        field = self._fields[resource]
+        affected = [(col, row)]
+        seen = {(col, row)}
+        for x, y in affected:
+            reach = int(field[y, x]) + 1
+            for dx, dy in self.NEIGHBOURS:
+                nx, ny = (x + dx) % self.width, (y + dy) % self.height
+                if (nx, ny) in seen or field[ny, nx] != reach:
+                    continue
+                if geometry.distance(nx, ny, col, row, self.width, self.height) == reach:
+                    seen.add((nx, ny))
+                    affected.append((nx, ny))
+        xs = np.array([x for x, _ in affected])
+        ys = np.array([y for _, y in affected])
+        rows, cols = np.nonzero(self.sources[resource])
+        if len(rows):
+            field[ys, xs] = geometry.distance(xs[:, None], ys[:, None], cols[None, :], rows[None, :],
+                                              self.width, self.height).min(axis=1)
+        else:
+            field[ys, xs] = UNREACHABLE
+        self.repaired += len(affected)
+
+    def field(self, resource: str) -> np.ndarray:
+        """Champ (h, w) d'une ressource, UNREACHABLE partout si aucune n'est connue.
+
+        Le champ est construit à la première consultation.
+
+        Args:
+            resource (str): Ressource
+
+        Returns:
+            np.ndarray: Distances de marche, indexées [y, x]
+        """
+        if resource not in self._fields:
+            self._rebuild(resource)
+        return self._fields[resource]
+    def distance(self, resource: str, x: int, y: int) -> Optional[int]:
+        """Distance de marche d'une case à l'instance connue la plus proche.
+
+        Args:
+            resource (str): Ressource
+            x (int): Coordonnée X
+            y (int): Coordonnée Y
+
+        Returns:
+            Optional[int]: Nombre de Forward, None si aucune instance n'est connue
+        """
+        if resource not in self.sources:
+            return None
+        value = int(self.field(resource)[y % self.height, x % self.width])
+        return None if value == UNREACHABLE else value
+
+    def step(self, resource: str, x: int, y: int, orientation: int = 0) -> Optional[Tuple[int, int]]:
+        """Case voisine qui rapproche de l'instance connue la plus proche (pas de gradient).
+
+        À distance égale, la case droit devant est préférée, puis celles
+        à un quart de tour, pour éviter les rotations.
+
+        Args:
+            resource (str): Ressource
+            x (int): Position X
+            y (int): Position Y
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+        Returns:
+            Optional[Tuple[int, int]]: Case voisine, None sur une source ou sans source connue
+        """
+        current = self.distance(resource, x, y)
+        if not current:
+            return None
+        field = self.field(resource)
+        for turn in (0, 1, 3, 2):
+            dx, dy = DELTAS[(orientation + turn) % 4]
+            nx, ny = (x + dx) % self.width, (y + dy) % self.height
+            if field[ny, nx] < current:
+                return nx, ny
+        return None
+
+    def nearest(self, resource: str, x: int, y: int, orientation: int = 0) -> Optional[Tuple[int, int]]:
+        """Instance connue la plus proche, en suivant le gradient depuis une case.
+
+        Args:
+            resource (str): Ressource
+            x (int): Position X
+            y (int): Position Y
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+        Returns:
+            Optional[Tuple[int, int]]: Coordonnées de la source, None si aucune n'est connue
+        """
+        if self.distance(resource, x, y) is None:
+            return None
+        position = (x % self.width, y % self.height)
+        while True:
+            following = self.step(resource, position[0], position[1], orientation)
+            if following is None:
+                return position
+            position = following
@@ -0,0 +1,85 @@
+from typing import Optional, Tuple
+import numpy as np
+from models import geometry
+from models.resource_index import ResourceIndex
+
+FRONTIER = "frontier"
+NEIGHBOURS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+MAX_TURNS = 3
+
+
+class FrontierTracker:
+    """Frontière d'exploration : cases inexplorées voisines d'une case explorée.
+
+    Mise à jour à chaque changement du masque `explored` de la carte, en ne
+    touchant que la case modifiée et ses quatre voisines. Les cases de la
+    frontière sont rangées dans un ResourceIndex pour la recherche de la
+    plus proche.
+    """
+
+    def __init__(self, explored: np.ndarray):
+        """Initialise la frontière à partir d'un masque d'exploration.
+
+        Args:
+            explored (np.ndarray): Masque (h, w) partagé avec la carte
+        """
+        self.explored = explored
+        self.height, self.width = explored.shape
+        self.index = ResourceIndex(self.width, self.height, (FRONTIER,))
+        rows, cols = np.nonzero(explored)
+        for col, row in zip(cols.tolist(), rows.tolist()):
+            self.refresh(col, row)
+
+    def __len__(self) -> int:
+        return self.index.count(FRONTIER)
+
+    def __contains__(self, position: Tuple[int, int]) -> bool:
+        return self.index.contains(FRONTIER, position[0], position[1])
+
+    def _is_frontier(self, col: int, row: int) -> bool:
+        if self.explored[row, col]:
+            return False
+        for dx, dy in NEIGHBOURS:
+            if self.explored[(row + dy) % self.height, (col + dx) % self.width]:
+                return True
+        return False
+
+    def refresh(self, col: int, row: int) -> None:
+        """Recalcule l'appartenance d'une case et de ses voisines.
+
+        À appeler après chaque changement de `explored[row, col]`.
+
+        Args:
+            col (int): Coordonnée X de la case modifiée
+            row (int): Coordonnée Y de la case modifiée
+        """
+        for dx, dy in ((0, 0),) + NEIGHBOURS:
+            x, y = (col + dx) % self.width, (row + dy) % self.height
+            self.index.set_present(FRONTIER, x, y, self._is_frontier(x, y))
+
+    def nearest(self, x: int, y: int, orientation: int) -> Optional[Tuple[int, int]]:
+        """Case de la frontière la moins coûteuse à atteindre.
+
+        Le coût est le nombre de commandes : pas de Forward (distance de
+        Manhattan torique) plus rotations. Les rotations ajoutent au plus
+        MAX_TURNS, donc seules les cases à moins de MAX_TURNS de la plus
+        proche sont départagées.
+
+        Args:
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+        Returns:
+            Optional[Tuple[int, int]]: Coordonnées absolues, None si la frontière est vide
+        """
+        closest = self.index.nearest(FRONTIER, x, y)
+        if not closest:
+            return None
+        reach = self.index.distance(x, y, *closest[0]) + MAX_TURNS
+        candidates = self.index.nearest(FRONTIER, x, y, k=len(self), max_distance=reach)
+        xs = np.array([pos[0] for pos in candidates])
+        ys = np.array([pos[1] for pos in candidates])
+        costs = geometry.cost(x, y, orientation, xs, ys, self.width, self.height)
+        best = int(np.argmin(costs))
+        return candidates[best]
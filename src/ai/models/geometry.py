@@ -0,0 +1,157 @@
+from typing import Tuple, Union
+import numpy as np
+
+Coordinate = Union[int, np.ndarray]
+"""Entier ou tableau NumPy : toutes les fonctions du module diffusent (broadcasting)."""
+
+
+def wrap(delta: Coordinate, size: int) -> Coordinate:
+    """Ramène un décalage dans ]-size/2, size/2] : le plus court sur le tore.
+
+    Args:
+        delta (Coordinate): Décalage(s) brut(s)
+        size (int): Taille de l'axe
+
+    Returns:
+        Coordinate: Décalage(s) signé(s) le(s) plus court(s)
+    """
+    delta = delta % size
+    return delta - size * (delta > size // 2)
+
+
+def torus_delta(a: Coordinate, b: Coordinate, size: int) -> Coordinate:
+    """Distance la plus courte entre deux coordonnées sur un axe torique.
+
+    Args:
+        a (Coordinate): Première(s) coordonnée(s)
+        b (Coordinate): Seconde(s) coordonnée(s)
+        size (int): Taille de l'axe
+
+    Returns:
+        Coordinate: min(|a - b|, size - |a - b|)
+    """
+    delta = abs(a - b) % size
+    if isinstance(delta, np.ndarray):
+        return np.minimum(delta, size - delta)
+    return min(delta, size - delta)
+
+
+def relative(x: Coordinate, y: Coordinate, target_x: Coordinate, target_y: Coordinate,
+             width: int, height: int) -> Tuple[Coordinate, Coordinate]:
+    """Vecteur (dx, dy) le plus court de (x, y) vers la cible.
+
+    Args:
+        x (Coordinate): Position(s) X de départ
+        y (Coordinate): Position(s) Y de départ
+        target_x (Coordinate): Position(s) X cible(s)
+        target_y (Coordinate): Position(s) Y cible(s)
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+
+    Returns:
+        Tuple[Coordinate, Coordinate]: Décalages signés (dx, dy)
+    """
+    return wrap(target_x - x, width), wrap(target_y - y, height)
+
+
+def distance(x1: Coordinate, y1: Coordinate, x2: Coordinate, y2: Coordinate,
+             width: int, height: int) -> Coordinate:
+    """Distance de Manhattan torique, pour une paire ou plusieurs à la fois.
+
+    Avec des tableaux `xs[:, None]` et `xs[None, :]`, donne la matrice
+    des distances entre deux ensembles de cases.
+
+    Args:
+        x1 (Coordinate): Position(s) X de départ
+        y1 (Coordinate): Position(s) Y de départ
+        x2 (Coordinate): Position(s) X d'arrivée
+        y2 (Coordinate): Position(s) Y d'arrivée
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+
+    Returns:
+        Coordinate: Nombre de Forward
+    """
+    return torus_delta(x1, x2, width) + torus_delta(y1, y2, height)
+
+
+def _turns_between(current: Coordinate, target: Coordinate) -> np.ndarray:
+    """Nombre de quarts de tour pour passer d'une orientation à une autre."""
+    diff = (np.asarray(target) - current) % 4
+    return np.minimum(diff, 4 - diff)
+
+
+def turns_to_reach(dx: Coordinate, dy: Coordinate, orientation: int) -> Coordinate:
+    """Rotations minimales pour atteindre une case relative en ligne brisée.
+
+    Le joueur parcourt un axe puis l'autre ; on garde le meilleur ordre.
+
+    Args:
+        dx (Coordinate): Décalage(s) X (positif vers l'est)
+        dy (Coordinate): Décalage(s) Y (positif vers le sud)
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+    Returns:
+        Coordinate: Nombre de Left/Right nécessaires (0 à 3)
+    """
+    dx, dy = np.asarray(dx), np.asarray(dy)
+    horizontal = _turns_between(orientation, np.where(dx > 0, 1, 3))
+    vertical = _turns_between(orientation, np.where(dy > 0, 2, 0))
+    turns = np.where(dx != 0,
+                     np.where(dy != 0, np.minimum(horizontal, vertical) + 1, horizontal),
+                     np.where(dy != 0, vertical, 0))
+    return int(turns) if turns.ndim == 0 else turns
+
+
+def cost(x: Coordinate, y: Coordinate, orientation: int, target_x: Coordinate, target_y: Coordinate,
+         width: int, height: int) -> Coordinate:
+    """Nombre de commandes (Forward et rotations) pour atteindre une ou plusieurs cases.
+
+    Args:
+        x (Coordinate): Position X du joueur
+        y (Coordinate): Position Y du joueur
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+        target_x (Coordinate): Position(s) X cible(s)
+        target_y (Coordinate): Position(s) Y cible(s)
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+
+    Returns:
+        Coordinate: Forward plus rotations
+    """
+    dx, dy = relative(x, y, target_x, target_y, width, height)
+    return abs(dx) + abs(dy) + turns_to_reach(dx, dy, orientation)
+
+
+def distances_from(x: int, y: int, width: int, height: int) -> np.ndarray:
+    """Distance de Manhattan torique de (x, y) à chaque case de la carte.
+
+    Args:
+        x (int): Position X
+        y (int): Position Y
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+
+    Returns:
+        np.ndarray: (height, width), indexé [y, x]
+    """
+    dx = torus_delta(np.arange(width), x % width, width)
+    dy = torus_delta(np.arange(height), y % height, height)
+    return dy[:, None] + dx[None, :]
+
+
+def costs_from(x: int, y: int, orientation: int, width: int, height: int) -> np.ndarray:
+    """Nombre de commandes pour atteindre chaque case de la carte, rotations comprises.
+
+    Args:
+        x (int): Position X du joueur
+        y (int): Position Y du joueur
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+
+    Returns:
+        np.ndarray: (height, width), indexé [y, x]
+    """
+    ys, xs = np.mgrid[0:height, 0:width]
+    return cost(x, y, orientation, xs, ys, width, height)
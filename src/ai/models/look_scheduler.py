@@ -0,0 +1,170 @@
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+import numpy as np
+from models import geometry, vision_cone
+
+Pose = Tuple[int, int, int]
+
+REASONS = {
+    "tick": 0.0,
+    "explore": 0.25,
+    "gathering": 0.25,
+    "opportunity": 0.25,
+    "survival": 0.25,
+    "forced": 0.5,
+    "elevation": 1.0,
+}
+"""Poids de la décision en attente : à 0.5 ou plus, le Look est toujours envoyé."""
+
+
+class LookScheduler:
+    """Décide si un Look vaut ses 7 unités de temps.
+
+    La valeur d'un Look est la plus grande de deux fractions, plus le
+    poids de la raison de la demande (la décision en attente) :
+
+    - cases du cône hors du cône du dernier Look (déplacements et
+      rotations depuis) et inexplorées ou périmées dans la carte ;
+    - âge du dernier Look rapporté à `max_age`.
+
+    Le Look est envoyé quand la valeur atteint `threshold`. Chaque
+    demande est comptée par état et par raison pour suivre le rythme
+    des Look.
+    """
+
+    def __init__(self, map, clock, threshold: float = 0.5, max_age: float = 126):
+        """Initialise le planificateur.
+
+        Args:
+            map (Map): Carte connue (explored, last_seen)
+            clock (ServerClock): Horloge du serveur
+            threshold (float): Valeur à partir de laquelle un Look est envoyé
+            max_age (float): Âge (unités de temps) au-delà duquel une information est périmée
+        """
+        self.map = map
+        self.clock = clock
+        self.threshold = threshold
+        self.max_age = max_age
+        self.last_pose: Optional[Pose] = None
+        self.last_level = 0
+        self.last_look_at: Optional[float] = None
+        self.state = "UNKNOWN"
+        self.requests: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.looks: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.state_ticks: Dict[str, float] = defaultdict(float)
+        self._last_request_at: Optional[float] = None
+
+    def _cone(self, pose: Pose, level: int) -> np.ndarray:
+        """Indices à plat des cases du cône vu depuis une pose."""
+        x, y, direction = pose
+        offsets = vision_cone.offsets(level, direction)
+        cols = (x + offsets[:, 0]) % self.map.width
+        rows = (y + offsets[:, 1]) % self.map.height
+        return rows * self.map.width + cols
+
+    def moves(self, pose: Pose) -> int:
+        """Commandes minimales séparant la pose du dernier Look de la pose actuelle."""
+        if self.last_pose is None:
+            return 0
+        steps = geometry.distance(pose[0], pose[1], self.last_pose[0], self.last_pose[1],
+                                  self.map.width, self.map.height)
+        turns = (pose[2] - self.last_pose[2]) % 4
+        return steps + min(turns, 4 - turns)
+
+    def information(self, pose: Pose, level: int) -> float:
+        """Part du cône qui apporterait une information nouvelle.
+
+        Une case compte si elle n'était pas dans le cône du dernier Look
+        et que la carte ne la connaît pas, ou seulement depuis plus de
+        `max_age` unités de temps.
+
+        Args:
+            pose (Pose): Pose actuelle (x, y, orientation)
+            level (int): Niveau du joueur
+
+        Returns:
+            float: Fraction entre 0 et 1
+        """
+        cone = self._cone(pose, level)
+        unseen = np.ones(len(cone), dtype=bool)
+        if self.last_pose is not None:
+            unseen = ~np.isin(cone, self._cone(self.last_pose, self.last_level))
+        age = self.clock.ticks(self.clock.now() - self.map.last_seen.ravel()[cone])
+        stale = ~self.map.explored.ravel()[cone] | (age > self.max_age)
+        return float(np.mean(unseen & stale))
+
+    def value(self, pose: Pose, level: int, reason: str = "tick") -> float:
+        """Valeur estimée d'un Look depuis une pose.
+
+        Args:
+            pose (Pose): Pose actuelle (x, y, orientation)
+            level (int): Niveau du joueur
+            reason (str): Raison de la demande (voir REASONS)
+
+        Returns:
+            float: Valeur à comparer au seuil
+        """
+        weight = REASONS.get(reason, REASONS["forced"])
+        if self.last_look_at is None:
+            return 1.0 + weight
+        if not self.moves(pose) and level == self.last_level:
+            information = 0.0
+        else:
+            information = self.information(pose, level)
+        age = min(1.0, self.clock.elapsed_ticks(self.last_look_at) / self.max_age)
+        return max(information, age) + weight
+
+    def should_look(self, pose: Pose, level: int, reason: str = "tick") -> bool:
+        """Décide d'envoyer ou non un Look et compte la demande.
+
+        Args:
+            pose (Pose): Pose actuelle (x, y, orientation)
+            level (int): Niveau du joueur
+            reason (str): Raison de la demande (voir REASONS)
+
+        Returns:
+            bool: True si le Look doit être envoyé
+        """
+        now = self.clock.now()
+        if self._last_request_at is not None:
+            self.state_ticks[self.state] += max(0.0, self.clock.ticks(now - self._last_request_at))
+        self._last_request_at = now
+        self.requests[(self.state, reason)] += 1
+        return self.value(pose, level, reason) >= self.threshold
+
+    def record_look(self, pose: Pose, level: int, reason: str = "tick") -> None:
+        """Note un Look envoyé.
+
+        Args:
+            pose (Pose): Pose au moment du Look
+            level (int): Niveau du joueur
+            reason (str): Raison de la demande
+        """
+        self.last_pose = pose
+        self.last_level = level
+        self.last_look_at = self.clock.now()
+        self.looks[(self.state, reason)] += 1
+
+    def look_rate(self, state: str) -> float:
+        """Look envoyés pour 100 unités de temps passées dans un état.
+
+        Args:
+            state (str): État de l'IA
+
+        Returns:
+            float: Nombre de Look pour 100 unités de temps
+        """
+        ticks = self.state_ticks.get(state, 0.0)
+        looks = sum(count for (looked_state, _), count in self.looks.items() if looked_state == state)
+        return 100.0 * looks / ticks if ticks else 0.0
+
+    def summary(self) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        """Demandes et Look envoyés, par état puis par raison.
+
+        Returns:
+            Dict[str, Dict[str, Tuple[int, int]]]: {état: {raison: (demandes, Look)}}
+        """
+        result: Dict[str, Dict[str, Tuple[int, int]]] = defaultdict(dict)
+        for (state, reason), count in self.requests.items():
+            result[state][reason] = (count, self.looks.get((state, reason), 0))
+        return dict(result)
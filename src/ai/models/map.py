@@ -1,69 +1,207 @@
 import logging
 import time
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from models.resource_index import ResourceIndex
+from models.frontier import FrontierTracker
+from models.distance_field import DistanceFields
+
+RESOURCES = ("food", "linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame")
+RESOURCE_INDEX = {name: index for index, name in enumerate(RESOURCES)}
+
+
+class ResourceCounts(MutableMapping):
+    """Vue dictionnaire sur les 7 compteurs d'une case de la carte.
+
+    Lectures et écritures vont directement dans le tenseur de la carte,
+    et l'index spatial suit chaque écriture.
+    """
+
+    def __init__(self, counts: np.ndarray, index: Optional[ResourceIndex] = None, x: int = 0, y: int = 0):
+        """
+        Args:
+            counts (np.ndarray): Vue (7,) sur le tenseur de ressources
+            index (Optional[ResourceIndex]): Index spatial à tenir à jour
+            x (int): Coordonnée X de la case
+            y (int): Coordonnée Y de la case
+        """
+        self._counts = counts
+        self._index = index
+        self._x = x
+        self._y = y
+
+    def __getitem__(self, resource: str) -> int:
+        return int(self._counts[RESOURCE_INDEX[resource]])
+
+    def __setitem__(self, resource: str, count: int) -> None:
+        self._counts[RESOURCE_INDEX[resource]] = count
+        if self._index is not None:
+            self._index.set_present(resource, self._x, self._y, count > 0)
+
+    def __delitem__(self, resource: str) -> None:
+        raise TypeError("Les ressources d'une tuile ne peuvent pas être supprimées")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RESOURCES)
+
+    def __len__(self) -> int:
+        return len(RESOURCES)
+
+    def copy(self) -> Dict[str, int]:
+        """Copie indépendante sous forme de dict."""
+        return dict(zip(RESOURCES, self._counts.tolist()))
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
 
 class Tile:
-    def __init__(self, x, y):
+    """Façade d'une case : lit et écrit dans les tableaux de la Map.
+
+    Une tuile créée sans carte possède sa propre carte 1×1.
+    """
+
+    def __init__(self, x: int, y: int, map: Optional["Map"] = None):
+        """
+        Args:
+            x (int): Coordonnée X
+            y (int): Coordonnée Y
+            map (Optional[Map]): Carte qui stocke la case
+        """
         self.x = x
         self.y = y
-        self.resources = {
-            "food": 0,
-            "linemate": 0,
-            "deraumere": 0,
-            "sibur": 0,
-            "mendiane": 0,
-            "phiras": 0,
-            "thystame": 0,
-        }
-        self.players = []
-        self.last_updated = None
-        self.is_explored = False
-        self.logger = logging.getLogger(__name__)
-        # self.logger.info(f"map tile created: {self.resources} {self.players}")
+        if map is None:
+            map = Map(1, 1)
+            self._col, self._row = 0, 0
+        else:
+            self._col, self._row = x, y
+        self._map = map
+        self.resources = ResourceCounts(map.resources[self._row, self._col], map.index, self._col, self._row)
+
+    @property
+    def is_explored(self) -> bool:
+        return bool(self._map.explored[self._row, self._col])
+
+    @is_explored.setter
+    def is_explored(self, value: bool) -> None:
+        self._map.explored[self._row, self._col] = value
+        self._map.frontier.refresh(self._col, self._row)
+
+    @property
+    def last_updated(self) -> Optional[float]:
+        stamp = float(self._map.last_seen[self._row, self._col])
+        return stamp if stamp else None
+
+    @last_updated.setter
+    def last_updated(self, value: Optional[float]) -> None:
+        self._map.last_seen[self._row, self._col] = value or 0.0
+
+    @property
+    def players(self) -> list:
+        return self._map.players.setdefault((self._col, self._row), [])
+
+    @players.setter
+    def players(self, value: list) -> None:
+        self._map.players[(self._col, self._row)] = list(value)
+
+
+class _TileRow:
+    """Ligne de `Map.grid`, construit les tuiles à la demande."""
+
+    def __init__(self, map: "Map", y: int):
+        self._map = map
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._map.width
+
+    def __getitem__(self, x: int) -> Tile:
+        if not -self._map.width <= x < self._map.width:
+            raise IndexError("indice de colonne hors de la carte")
+        return Tile(x % self._map.width, self._y, self._map)
+
+
+class _TileGrid:
+    """Accès `grid[y][x]` historique, sans objet Tile permanent."""
+
+    def __init__(self, map: "Map"):
+        self._map = map
+
+    def __len__(self) -> int:
+        return self._map.height
+
+    def __getitem__(self, y: int) -> _TileRow:
+        if not -self._map.height <= y < self._map.height:
+            raise IndexError("indice de ligne hors de la carte")
+        return _TileRow(self._map, y % self._map.height)
+
 
 class Map:
+    """Carte connue du joueur, stockée en tableaux NumPy.
+
+    - resources : (h, w, 7) uint16, comptes dans l'ordre de RESOURCES
+    - explored : (h, w) bool
+    - last_seen : (h, w) float64, horodatage de la dernière observation (0 = jamais)
+    - seen_generation : (h, w) uint32, numéro de la dernière mise à jour groupée
+      (un Look) ayant vu la case (0 = jamais) ; `generation` est le numéro courant
+    - index : positions de chaque ressource, pour les recherches de proximité
+    - distances : distance de marche de chaque case à la ressource connue la plus proche
+    - frontier : cases inexplorées au bord de la zone explorée
+    """
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.grid = [[Tile(x, y) for x in range(width)] for y in range(height)]
+        self.resources = np.zeros((height, width, len(RESOURCES)), dtype=np.uint16)
+        self.explored = np.zeros((height, width), dtype=bool)
+        self.last_seen = np.zeros((height, width), dtype=np.float64)
+        self.seen_generation = np.zeros((height, width), dtype=np.uint32)
+        self.generation = 0
+        self.players: Dict[Tuple[int, int], list] = {}
+        self.index = ResourceIndex(width, height, RESOURCES)
+        self.distances = DistanceFields(width, height, RESOURCES)
+        self.index.subscribe(self.distances.set_present)
+        self.frontier = FrontierTracker(self.explored)
+        self.grid = _TileGrid(self)
         self.logger = logging.getLogger(__name__)
 
     def get_tile(self, x, y):
         """Récupère une tuile aux coordonnées données."""
-        return self.grid[y % self.height][x % self.width]
+        return Tile(x % self.width, y % self.height, self)
 
     def is_explored(self, x: int, y: int) -> bool:
         """Vérifie si une tuile a déjà été explorée.
-        
+
         Args:
             x (int): Coordonnée X
             y (int): Coordonnée Y
-            
+
         Returns:
             bool: True si la tuile a été explorée, False sinon
         """
         try:
-            tile = self.get_tile(x, y)
-            return tile.is_explored
+            return bool(self.explored[y % self.height, x % self.width])
         except Exception as e:
             self.logger.error(f"Erreur lors de la vérification d'exploration de ({x}, {y}): {e}")
             return False
 
     def get_tile_content(self, x: int, y: int) -> dict:
         """Retourne le contenu d'une tuile.
-        
+
         Args:
             x (int): Coordonnée X
             y (int): Coordonnée Y
-            
+
         Returns:
             dict: Contenu de la tuile (ressources et joueurs)
         """
         try:
-            tile = self.get_tile(x, y)
+            col, row = x % self.width, y % self.height
             return {
-                'resources': tile.resources.copy(),
-                'players': tile.players.copy(),
-                'is_explored': tile.is_explored
+                'resources': dict(zip(RESOURCES, self.resources[row, col].tolist())),
+                'players': list(self.players.get((col, row), [])),
+                'is_explored': bool(self.explored[row, col])
             }
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération du contenu de ({x}, {y}): {e}")
@@ -71,70 +209,167 @@ class Map:
 
     def update_tile(self, x: int, y: int, content: list):
         """Met à jour le contenu d'une tuile.
-        
+
         Args:
             x (int): Coordonnée X
             y (int): Coordonnée Y
             content (list): Contenu de la tuile (liste d'objets)
         """
         try:
-            tile = self.get_tile(x, y)
-            
-            for resource in tile.resources:
-                tile.resources[resource] = 0
-            
+            col, row = x % self.width, y % self.height
+            counts = [0] * len(RESOURCES)
             for item in content:
-                if item in tile.resources:
-                    tile.resources[item] += 1
-            
-            tile.is_explored = True
-            tile.last_updated = time.time()
-            
-            self.logger.debug(f"Tuile ({x},{y}) mise à jour : {tile.resources}")
-            
+                index = RESOURCE_INDEX.get(item)
+                if index is not None:
+                    counts[index] += 1
+            for resource, count in zip(RESOURCES, counts):
+                self.index.set_present(resource, col, row, count > 0)
+            self.resources[row, col] = counts
+            self._explore(col, row)
+            self.last_seen[row, col] = time.time()
+
+            self.logger.debug(f"Tuile ({x},{y}) mise à jour : {dict(zip(RESOURCES, counts))}")
+
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour de la tuile ({x}, {y}): {e}")
 
+    def update_tiles(self, xs: Sequence[int], ys: Sequence[int], counts: np.ndarray,
+                     timestamp: Optional[float] = None) -> None:
+        """Met à jour plusieurs tuiles en une seule affectation vectorisée.
+
+        Args:
+            xs (Sequence[int]): Coordonnées X (ramenées sur le tore)
+            ys (Sequence[int]): Coordonnées Y (ramenées sur le tore)
+            counts (np.ndarray): Comptes (n, 7) dans l'ordre de RESOURCES
+            timestamp (Optional[float]): Horodatage, time.time() par défaut
+        """
+        try:
+            cols = np.asarray(xs) % self.width
+            rows = np.asarray(ys) % self.height
+            counts = np.asarray(counts)
+            flat = rows * self.width + cols
+            _, last = np.unique(flat[::-1], return_index=True)
+            if len(last) != len(flat):
+                keep = len(flat) - 1 - last
+                rows, cols, counts = rows[keep], cols[keep], counts[keep]
+            changed = np.nonzero((self.resources[rows, cols] > 0) != (counts > 0))
+            for tile, resource in zip(*changed):
+                self.index.set_present(RESOURCES[resource], int(cols[tile]), int(rows[tile]), bool(counts[tile, resource]))
+            self.resources[rows, cols] = counts
+            fresh = np.flatnonzero(~self.explored[rows, cols])
+            self.explored[rows, cols] = True
+            for tile in fresh.tolist():
+                self.frontier.refresh(int(cols[tile]), int(rows[tile]))
+            self.last_seen[rows, cols] = time.time() if timestamp is None else timestamp
+            self.generation += 1
+            self.seen_generation[rows, cols] = self.generation
+            self.logger.debug(f"{len(cols)} tuiles mises à jour")
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la mise à jour groupée des tuiles: {e}")
+
+    def recent(self, generations: int) -> np.ndarray:
+        """Cases vues lors des `generations` dernières mises à jour groupées.
+
+        Args:
+            generations (int): Nombre de mises à jour groupées (Look) retenues
+
+        Returns:
+            np.ndarray: Masque (h, w) des cases encore fraîches
+        """
+        return (self.seen_generation > 0) & (self.generation - self.seen_generation < generations)
+
+    def _explore(self, col: int, row: int) -> None:
+        """Marque une case explorée et met la frontière à jour si elle change."""
+        if not self.explored[row, col]:
+            self.explored[row, col] = True
+            self.frontier.refresh(col, row)
+
     def mark_as_explored(self, x: int, y: int):
         """Marque une tuile comme explorée.
-        
+
         Args:
             x (int): Coordonnée X
             y (int): Coordonnée Y
         """
         try:
-            tile = self.get_tile(x, y)
-            tile.is_explored = True
-            tile.last_updated = time.time()
+            col, row = x % self.width, y % self.height
+            self._explore(col, row)
+            self.last_seen[row, col] = time.time()
         except Exception as e:
             self.logger.error(f"Erreur lors du marquage d'exploration de ({x}, {y}): {e}")
 
-    def get_unexplored_tiles(self) -> list:
+    def get_unexplored_tiles(self) -> List[Tuple[int, int]]:
         """Récupère la liste des tuiles non explorées.
-        
+
         Returns:
             list: Liste des coordonnées (x, y) des tuiles non explorées
         """
-        unexplored = []
-        for y in range(self.height):
-            for x in range(self.width):
-                if not self.is_explored(x, y):
-                    unexplored.append((x, y))
-        return unexplored
+        rows, cols = np.nonzero(~self.explored)
+        return list(zip(cols.tolist(), rows.tolist()))
 
-    def get_tiles_with_resource(self, resource: str) -> list:
+    def get_tiles_with_resource(self, resource: str) -> List[Tuple[int, int]]:
         """Récupère la liste des tuiles contenant une ressource spécifique.
-        
+
         Args:
             resource (str): Nom de la ressource
-            
+
         Returns:
             list: Liste des coordonnées (x, y) des tuiles contenant la ressource
         """
-        tiles_with_resource = []
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.get_tile(x, y)
-                if tile.resources.get(resource, 0) > 0:
-                    tiles_with_resource.append((x, y))
-        return tiles_with_resource
+        return self.index.positions(resource)
+
+    def nearest_resource(self, resource: str, x: int, y: int, k: int = 1,
+                         max_distance: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Les k tuiles connues les plus proches contenant une ressource.
+
+        Args:
+            resource (str): Nom de la ressource
+            x (int): Position X de référence
+            y (int): Position Y de référence
+            k (int): Nombre de tuiles voulues
+            max_distance (Optional[int]): Distance de Manhattan torique maximale
+
+        Returns:
+            List[Tuple[int, int]]: Coordonnées, de la plus proche à la plus lointaine
+        """
+        return self.index.nearest(resource, x, y, k, max_distance)
+
+    def walking_distance(self, resource: str, x: int, y: int) -> Optional[int]:
+        """Distance de marche d'une case à la ressource connue la plus proche.
+
+        Args:
+            resource (str): Nom de la ressource
+            x (int): Coordonnée X
+            y (int): Coordonnée Y
+
+        Returns:
+            Optional[int]: Nombre de Forward, None si la ressource n'est connue nulle part
+        """
+        return self.distances.distance(resource, x, y)
+
+    def step_towards(self, resource: str, x: int, y: int, orientation: int = 0) -> Optional[Tuple[int, int]]:
+        """Case voisine qui rapproche de la ressource connue la plus proche.
+
+        Args:
+            resource (str): Nom de la ressource
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+        Returns:
+            Optional[Tuple[int, int]]: Case voisine, None sur la ressource ou si elle est inconnue
+        """
+        return self.distances.step(resource, x, y, orientation)
+
+    def nearest_frontier(self, x: int, y: int, orientation: int = 0) -> Optional[Tuple[int, int]]:
+        """Case inexplorée de la frontière la moins coûteuse à atteindre.
+
+        Args:
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+        Returns:
+            Optional[Tuple[int, int]]: Coordonnées, None si aucune case n'est à la frontière
+        """
+        return self.frontier.nearest(x, y, orientation)
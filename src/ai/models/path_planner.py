@@ -0,0 +1,129 @@
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+FORWARD = "Forward"
+LEFT = "Left"
+RIGHT = "Right"
+DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+Plan = Tuple[str, ...]
+
+
+def _rotation(current: int, target: int) -> Plan:
+    """Rotations minimales pour passer d'une orientation à une autre."""
+    diff = (target - current) % 4
+    if diff == 1:
+        return (RIGHT,)
+    if diff == 2:
+        return (RIGHT, RIGHT)
+    if diff == 3:
+        return (LEFT,)
+    return ()
+
+
+@lru_cache(maxsize=None)
+def plan_relative(dx: int, dy: int, direction: int, heading: Optional[int] = None) -> Plan:
+    """Plus courte suite de commandes pour un déplacement relatif.
+
+    Left, Right et Forward coûtent tous 7 unités de temps : le plan
+    optimal minimise le nombre de commandes. Il suffit de comparer les
+    deux trajets en L (axe X puis Y, ou l'inverse), chacun précédé de
+    la rotation la plus courte et, si une orientation d'arrivée est
+    imposée, suivi de la rotation vers celle-ci. Les plans sont
+    mémorisés par (dx, dy, direction, heading).
+
+    Args:
+        dx (int): Décalage X (positif vers l'est)
+        dy (int): Décalage Y (positif vers le sud)
+        direction (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+        heading (Optional[int]): Orientation voulue à l'arrivée, libre si None
+
+    Returns:
+        Plan: Commandes à envoyer dans l'ordre
+    """
+    legs = []
+    if dx:
+        legs.append((1 if dx > 0 else 3, abs(dx)))
+    if dy:
+        legs.append((2 if dy > 0 else 0, abs(dy)))
+    best: Plan = ()
+    for order in (legs, legs[::-1]):
+        plan: Plan = ()
+        facing = direction
+        for leg, steps in order:
+            plan += _rotation(facing, leg) + (FORWARD,) * steps
+            facing = leg
+        if heading is not None:
+            plan += _rotation(facing, heading)
+        if not best or len(plan) < len(best):
+            best = plan
+    return best
+
+
+def _candidates(delta: int, size: int) -> Tuple[int, ...]:
+    """Décalages équivalents sur un axe torique : par un côté ou par l'autre."""
+    delta %= size
+    return (delta, delta - size) if delta else (0,)
+
+
+def plan_path(x: int, y: int, direction: int, target_x: int, target_y: int,
+              width: int, height: int, heading: Optional[int] = None) -> Plan:
+    """Plan optimal vers une case absolue sur le tore.
+
+    Chaque axe peut être parcouru dans les deux sens ; on garde la
+    combinaison au plus petit nombre de commandes, à égalité la plus
+    courte en distance.
+
+    Args:
+        x (int): Position X actuelle
+        y (int): Position Y actuelle
+        direction (int): Orientation actuelle
+        target_x (int): Position X cible
+        target_y (int): Position Y cible
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+        heading (Optional[int]): Orientation voulue à l'arrivée, libre si None
+
+    Returns:
+        Plan: Commandes à envoyer dans l'ordre
+    """
+    best: Plan = ()
+    best_key = None
+    for dx in _candidates(target_x - x, width):
+        for dy in _candidates(target_y - y, height):
+            plan = plan_relative(dx, dy, direction, heading)
+            key = (len(plan), abs(dx) + abs(dy))
+            if best_key is None or key < best_key:
+                best, best_key = plan, key
+    return best
+
+
+def plan_cost(plan: Plan, cost: int = 7) -> int:
+    """Durée d'un plan en unités de temps."""
+    return len(plan) * cost
+
+
+def simulate(x: int, y: int, direction: int, commands: Iterable[str],
+             width: int, height: int) -> Tuple[int, int, int]:
+    """Position et orientation après une suite de commandes réussies.
+
+    Args:
+        x (int): Position X de départ
+        y (int): Position Y de départ
+        direction (int): Orientation de départ
+        commands (Iterable[str]): Commandes exécutées
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+
+    Returns:
+        Tuple[int, int, int]: (x, y, direction) d'arrivée
+    """
+    for command in commands:
+        if command == FORWARD:
+            dx, dy = DELTAS[direction]
+            x, y = (x + dx) % width, (y + dy) % height
+        elif command == RIGHT:
+            direction = (direction + 1) % 4
+        elif command == LEFT:
+            direction = (direction - 1) % 4
+    return x, y, direction
@@ -4,8 +4,10 @@ from core.protocol import ZappyProtocol
 
 class PlayerCommunicator:
     """
-    Gère la communication entre joueurs (broadcast, réception, parsing).
-    Utilise le protocole du projet pour envoyer et recevoir des messages.
+    Gère la communication entre joueurs (broadcast, parsing).
+    Utilise le protocole du projet pour envoyer les messages ; les
+    broadcasts reçus sont livrés à l'IA par le dispatcher du client,
+    via AI.handle_server_message, et seulement par ce chemin.
     """
 
     def __init__(self, protocol: ZappyProtocol, player, logger: Optional[logging.Logger] = None):
@@ -19,7 +21,7 @@ class PlayerCommunicator:
         self.player = player
         self.logger = logger or logging.getLogger(__name__)
 
-    def broadcast(self, message: str) -> bool:
+    async def broadcast(self, message: str) -> bool:
         """
         Envoie un message à tous les joueurs via le protocole broadcast.
 
@@ -30,7 +32,7 @@ class PlayerCommunicator:
             bool: True si l'envoi a réussi, False sinon
         """
         try:
-            success = self.protocol.broadcast(message)
+            success = await self.protocol.broadcast(message)
             if success:
                 self.logger.info(f"Broadcast envoyé: {message}")
                 return True
@@ -41,32 +43,6 @@ class PlayerCommunicator:
             self.logger.error(f"Erreur lors du broadcast: {e}")
             return False
 
-    def receive_broadcast(self) -> Optional[Dict[str, Any]]:
-        """
-        Récupère et parse un message broadcast reçu via le protocole (si disponible).
-
-        Retour type:
-            dict: Dictionnaire contenant les informations du message, ou None si aucun message
-        """
-        try:
-            if hasattr(self.protocol.client, 'socket'):
-                import select
-                ready, _, _ = select.select([self.protocol.client.socket], [], [], 0.001)
-                if ready:
-                    try:
-                        message = self.protocol.client.socket.recv(1024).decode('utf-8').strip()
-                        if message.startswith("message"):
-                            parsed = self.parse_message(message)
-                            self.logger.info(f"📨 Message reçu: {parsed}")
-                            return parsed
-                    except:
-                        pass
-            
-            return None
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la réception du message: {e}")
-            return None
-
     def parse_message(self, raw_message: str) -> Dict[str, Any]:
         """
         Parse un message brut reçu (format: "message K, text" ou "team:action:data").
@@ -124,7 +100,7 @@ class PlayerCommunicator:
             self.logger.error(f"Erreur lors du parsing du message: {e}")
             return {"raw": raw_message}
 
-    def send_team_message(self, action: str, data: str = "") -> bool:
+    async def send_team_message(self, action: str, data: str = "") -> bool:
         """
         Envoie un message structuré à l'équipe (format: "team:action:data").
 
@@ -137,15 +113,4 @@ class PlayerCommunicator:
         """
         team = getattr(self.player, "team", "unknown")
         message = f"{team}:{action}:{data}"
-        return self.broadcast(message)
-
-    def handle_incoming_messages(self, callback=None):
-        """
-        Vérifie s'il y a un message reçu et exécute un callback si besoin.
-
-        Args:
-            callback (callable): Fonction à appeler avec le message parsé
-        """
-        msg = self.receive_broadcast()
-        if msg and callback:
-            callback(msg)
\ No newline at end of file
+        return await self.broadcast(message)
@@ -0,0 +1,177 @@
+import logging
+from typing import Callable, Iterable, List, Optional, Tuple
+import numpy as np
+from models import path_planner, vision_cone
+from models.vision import Vision
+
+Pose = Tuple[int, int, int]
+
+EJECT_HEADINGS = {1: 0, 3: 3, 5: 2, 7: 1}
+"""Secteur de l'éjecteur (1 devant, 3 à gauche, 5 derrière, 7 à droite) → quart de tour relatif."""
+
+
+class PoseEstimator:
+    """Estimation de la position du joueur par navigation à l'estime.
+
+    La pose (x, y, orientation) du joueur est avancée à chaque commande
+    réussie et à chaque éjection. Comme une éjection au secteur inconnu
+    ou une commande perdue peut la décaler, chaque nouveau Look est
+    comparé à la carte connue pour toutes les poses proches de
+    l'estimée : si une autre pose explique nettement mieux ce qui est
+    vu, le joueur y est recalé.
+    """
+
+    def __init__(self, player, map, logger: Optional[logging.Logger] = None, search_radius: int = 1,
+                 min_overlap: int = 4, margin: float = 0.5):
+        """Initialise l'estimateur.
+
+        Args:
+            player (Player): Joueur dont la pose est suivie
+            map (Map): Carte connue
+            logger (Optional[Logger]): Logger pour les messages
+            search_radius (int): Distance des poses candidates autour de l'estimée
+            min_overlap (int): Cases explorées du cône nécessaires pour comparer
+            margin (float): Écart moyen par case exigé pour changer de pose
+        """
+        self.player = player
+        self.map = map
+        self.logger = logger or logging.getLogger(__name__)
+        self.search_radius = search_radius
+        self.min_overlap = min_overlap
+        self.margin = margin
+        self.uncertainty = 0
+        self.corrections = 0
+        self.listeners: List[Callable[[Pose], None]] = []
+
+    def subscribe(self, callback: Callable[[Pose], None]) -> None:
+        """Abonne une fonction aux déplacements confirmés (commandes et éjections).
+
+        Args:
+            callback (Callable): Fonction appelée avec la nouvelle pose
+        """
+        self.listeners.append(callback)
+
+    def _moved(self, pose: Pose) -> None:
+        for callback in self.listeners:
+            callback(pose)
+
+    @property
+    def pose(self) -> Pose:
+        """Pose estimée (x, y, orientation)."""
+        x, y = self.player.get_position()
+        return x, y, self.player.get_direction()
+
+    def _set(self, x: int, y: int, direction: int) -> None:
+        self.player.set_position(x % self.map.width, y % self.map.height)
+        self.player.set_direction(direction)
+
+    def apply(self, commands: Iterable[str]) -> Pose:
+        """Applique des commandes Forward/Left/Right réussies.
+
+        Args:
+            commands (Iterable[str]): Commandes acceptées par le serveur
+
+        Returns:
+            Pose: Nouvelle pose estimée
+        """
+        pose = path_planner.simulate(*self.pose, commands, self.map.width, self.map.height)
+        self._set(*pose)
+        self._moved(pose)
+        return pose
+
+    def eject(self, sector: int) -> Pose:
+        """Applique une éjection reçue ("eject: K").
+
+        Le joueur est poussé d'une case à l'opposé de l'éjecteur, sans
+        changer d'orientation. Un secteur inattendu élargit la recherche
+        au prochain Look.
+
+        Args:
+            sector (int): Secteur d'où vient l'éjecteur
+
+        Returns:
+            Pose: Nouvelle pose estimée
+        """
+        x, y, direction = self.pose
+        if sector not in EJECT_HEADINGS:
+            self.uncertainty += 1
+            self.logger.warning(f"⚠️ Éjection au secteur {sector} inattendu, position incertaine")
+            return x, y, direction
+        heading = (direction + EJECT_HEADINGS[sector] + 2) % 4
+        dx, dy = path_planner.DELTAS[heading]
+        self._set(x + dx, y + dy, direction)
+        self.logger.info(f"💥 Éjecté vers ({(x + dx) % self.map.width}, {(y + dy) % self.map.height})")
+        self._moved(self.pose)
+        return self.pose
+
+    def candidates(self) -> List[Tuple[int, int]]:
+        """Positions candidates, l'estimée en premier puis par distance croissante."""
+        x, y, _ = self.pose
+        radius = self.search_radius + self.uncertainty
+        found = []
+        for distance in range(radius + 1):
+            for dx in range(-distance, distance + 1):
+                rest = distance - abs(dx)
+                for dy in sorted({-rest, rest}):
+                    position = ((x + dx) % self.map.width, (y + dy) % self.map.height)
+                    if position not in found:
+                        found.append(position)
+        return found
+
+    def score(self, view: Vision, positions: List[Tuple[int, int]], direction: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Écart entre un Look et la carte pour chaque position candidate.
+
+        Args:
+            view (Vision): Résultat du Look
+            positions (List[Tuple[int, int]]): Positions candidates
+            direction (int): Orientation du joueur
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Écart moyen par case explorée (inf si
+            trop peu de cases connues) et nombre de cases explorées comparées
+        """
+        offsets = vision_cone.offsets(vision_cone.MAX_LEVEL, direction)[:len(view)]
+        xs = np.array([p[0] for p in positions], dtype=np.intp)
+        ys = np.array([p[1] for p in positions], dtype=np.intp)
+        cols = (xs[:, None] + offsets[:, 0]) % self.map.width
+        rows = (ys[:, None] + offsets[:, 1]) % self.map.height
+        known = self.map.explored[rows, cols]
+        seen = view.counts[:len(offsets), 1:].astype(np.int32)
+        diff = np.abs(self.map.resources[rows, cols].astype(np.int32) - seen).sum(axis=2)
+        overlap = known.sum(axis=1)
+        mismatch = np.where(known, diff, 0).sum(axis=1)
+        rate = np.full(len(positions), np.inf)
+        enough = overlap >= self.min_overlap
+        rate[enough] = mismatch[enough] / overlap[enough]
+        return rate, overlap
+
+    def observe(self, view: Optional[Vision]) -> Pose:
+        """Recale la pose sur un Look frais, avant de l'inscrire dans la carte.
+
+        Args:
+            view (Optional[Vision]): Résultat du Look pris à la pose actuelle
+
+        Returns:
+            Pose: Pose estimée après recalage
+        """
+        if view is None or not len(view):
+            return self.pose
+        x, y, direction = self.pose
+        positions = self.candidates()
+        rate, _ = self.score(view, positions, direction)
+        if not np.isfinite(rate[0]):
+            if np.isfinite(rate).any() and self.uncertainty:
+                best = int(np.argmin(rate))
+            else:
+                return self.pose
+        else:
+            best = int(np.argmin(rate))
+            if rate[best] > rate[0] - self.margin:
+                self.uncertainty = 0
+                return self.pose
+        bx, by = positions[best]
+        self.corrections += 1
+        self.uncertainty = 0
+        self.logger.info(f"📍 Position recalée de ({x}, {y}) à ({bx}, {by}) d'après la vision")
+        self._set(bx, by, direction)
+        return self.pose
@@ -0,0 +1,172 @@
+import heapq
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from models.geometry import torus_delta
+
+BUCKET_SIZE = 8
+
+
+class ResourceIndex:
+    """Index spatial par ressource, tenu à jour case par case.
+
+    Les positions de chaque ressource sont rangées dans des seaux de
+    BUCKET_SIZE × BUCKET_SIZE cases. Une recherche des k plus proches
+    parcourt les anneaux de seaux autour du joueur et s'arrête dès que
+    l'anneau suivant ne peut plus contenir de case plus proche : le coût
+    dépend de la densité locale, pas de la taille de la carte.
+    """
+
+    def __init__(self, width: int, height: int, resources: Iterable[str], bucket_size: int = BUCKET_SIZE):
+        """Initialise un index vide.
+
+        Args:
+            width (int): Largeur de la carte
+            height (int): Hauteur de la carte
+            resources (Iterable[str]): Ressources indexées
+            bucket_size (int): Côté d'un seau, en cases
+        """
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self.columns = -(-width // bucket_size)
+        self.rows = -(-height // bucket_size)
+        uneven = width % bucket_size or height % bucket_size
+        self._slack = bucket_size if uneven else 0
+        self._buckets: Dict[str, Dict[Tuple[int, int], Set[Tuple[int, int]]]] = {
+            resource: {} for resource in resources
+        }
+        self._counts: Dict[str, int] = {resource: 0 for resource in self._buckets}
+        self.listeners: List[Callable[[str, int, int, bool], None]] = []
+
+    def subscribe(self, callback: Callable[[str, int, int, bool], None]) -> None:
+        """Abonne une fonction aux changements de l'index.
+
+        Args:
+            callback (Callable): Fonction appelée avec (ressource, x, y, présente)
+        """
+        self.listeners.append(callback)
+
+    def _changed(self, resource: str, x: int, y: int, present: bool) -> None:
+        for callback in self.listeners:
+            callback(resource, x, y, present)
+
+    def _bucket(self, x: int, y: int) -> Tuple[int, int]:
+        return x // self.bucket_size, y // self.bucket_size
+
+    def add(self, resource: str, x: int, y: int) -> None:
+        """Signale la présence d'une ressource sur une case."""
+        buckets = self._buckets.get(resource)
+        if buckets is None:
+            return
+        x, y = x % self.width, y % self.height
+        cell = buckets.setdefault(self._bucket(x, y), set())
+        if (x, y) not in cell:
+            cell.add((x, y))
+            self._counts[resource] += 1
+            self._changed(resource, x, y, True)
+
+    def discard(self, resource: str, x: int, y: int) -> None:
+        """Signale qu'une ressource n'est plus sur une case."""
+        buckets = self._buckets.get(resource)
+        if buckets is None:
+            return
+        x, y = x % self.width, y % self.height
+        key = self._bucket(x, y)
+        cell = buckets.get(key)
+        if cell and (x, y) in cell:
+            cell.remove((x, y))
+            self._counts[resource] -= 1
+            if not cell:
+                del buckets[key]
+            self._changed(resource, x, y, False)
+
+    def set_present(self, resource: str, x: int, y: int, present: bool) -> None:
+        """Ajoute ou retire une case selon la présence de la ressource."""
+        if present:
+            self.add(resource, x, y)
+        else:
+            self.discard(resource, x, y)
+
+    def update(self, x: int, y: int, present: Iterable[str]) -> None:
+        """Remplace l'ensemble des ressources indexées sur une case.
+
+        Args:
+            x (int): Coordonnée X
+            y (int): Coordonnée Y
+            present (Iterable[str]): Ressources désormais présentes
+        """
+        present = set(present)
+        for resource in self._buckets:
+            self.set_present(resource, x, y, resource in present)
+
+    def count(self, resource: str) -> int:
+        """Nombre de cases indexées pour une ressource."""
+        return self._counts.get(resource, 0)
+
+    def contains(self, resource: str, x: int, y: int) -> bool:
+        """Indique si une case est indexée pour une ressource."""
+        buckets = self._buckets.get(resource)
+        if not buckets:
+            return False
+        x, y = x % self.width, y % self.height
+        return (x, y) in buckets.get(self._bucket(x, y), ())
+
+    def positions(self, resource: str) -> List[Tuple[int, int]]:
+        """Toutes les cases indexées pour une ressource, triées par (y, x)."""
+        found = [pos for cell in self._buckets.get(resource, {}).values() for pos in cell]
+        return sorted(found, key=lambda pos: (pos[1], pos[0]))
+
+    def distance(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """Distance de Manhattan sur le tore."""
+        return torus_delta(x1, x2, self.width) + torus_delta(y1, y2, self.height)
+
+    def _ring(self, bx: int, by: int, radius: int) -> Set[Tuple[int, int]]:
+        """Seaux à distance de Tchebychev `radius` du seau (bx, by), sur le tore."""
+        if radius == 0:
+            return {(bx, by)}
+        ring = set()
+        for offset in range(-radius, radius + 1):
+            for cx, cy in ((bx + offset, by - radius), (bx + offset, by + radius),
+                           (bx - radius, by + offset), (bx + radius, by + offset)):
+                ring.add((cx % self.columns, cy % self.rows))
+        return ring
+
+    def nearest(self, resource: str, x: int, y: int, k: int = 1,
+                max_distance: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Les k cases les plus proches contenant une ressource.
+
+        Args:
+            resource (str): Ressource cherchée
+            x (int): Position X de référence
+            y (int): Position Y de référence
+            k (int): Nombre de cases voulues
+            max_distance (Optional[int]): Distance de Manhattan torique maximale
+
+        Returns:
+            List[Tuple[int, int]]: Positions absolues, de la plus proche à la plus lointaine
+        """
+        buckets = self._buckets.get(resource)
+        if not buckets or k <= 0:
+            return []
+        x, y = x % self.width, y % self.height
+        bx, by = self._bucket(x, y)
+        best: List[Tuple[int, int, int]] = []
+        seen: Set[Tuple[int, int]] = set()
+        max_radius = max(self.columns, self.rows) // 2 + 1
+        for radius in range(max_radius + 1):
+            bound = (radius - 1) * self.bucket_size + 1 - self._slack
+            if len(best) >= k and -best[0][0] < bound:
+                break
+            if max_distance is not None and bound > max_distance:
+                break
+            for key in self._ring(bx, by, radius) - seen:
+                seen.add(key)
+                for px, py in buckets.get(key, ()):
+                    dist = self.distance(x, y, px, py)
+                    if max_distance is not None and dist > max_distance:
+                        continue
+                    entry = (-dist, -py, -px)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+        return [(-px, -py) for _, py, px in sorted(best, reverse=True)]
@@ -0,0 +1,214 @@
+from typing import Dict, List, Optional, Tuple
+from models.map import Map, RESOURCE_INDEX
+
+Stop = Tuple[int, int, Dict[str, int]]
+
+COMMAND_TICKS = 7
+FOOD_TICKS = 126
+FOOD_RESERVE = 2
+
+
+class RouteOptimizer:
+    """Tournée de collecte couvrant tout un déficit de ressources.
+
+    Variante de l'orientation : on choisit un sous-ensemble de cases
+    connues de la carte et leur ordre pour ramasser tout le déficit en
+    marchant le moins possible, avec des arrêts nourriture si la
+    tournée dépasse la réserve.
+
+    - construction gloutonne : prochaine case au meilleur rapport
+      distance / unités utiles ramassées ;
+    - amélioration 2-opt de l'ordre, puis retrait des arrêts devenus
+      superflus ;
+    - insertion au moindre coût de cases de nourriture tant que la
+      durée dépasse le budget, sinon troncature au budget.
+    """
+
+    def __init__(self, map: Map, candidates_per_unit: int = 3, max_candidates: int = 12):
+        """Initialise l'optimiseur.
+
+        Args:
+            map (Map): Carte connue, avec son index spatial
+            candidates_per_unit (int): Cases candidates par unité manquante
+            max_candidates (int): Plafond de cases candidates par ressource
+        """
+        self.map = map
+        self.candidates_per_unit = candidates_per_unit
+        self.max_candidates = max_candidates
+
+    def _distance(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        return self.map.index.distance(a[0], a[1], b[0], b[1])
+
+    def _available(self, position: Tuple[int, int], resource: str) -> int:
+        return int(self.map.resources[position[1], position[0], RESOURCE_INDEX[resource]])
+
+    def _candidates(self, x: int, y: int, deficit: Dict[str, int]) -> List[Tuple[int, int]]:
+        """Cases connues les plus proches pour chaque ressource manquante."""
+        found = []
+        for resource, count in deficit.items():
+            k = min(self.max_candidates, count * self.candidates_per_unit)
+            for position in self.map.nearest_resource(resource, x, y, k=k):
+                if position not in found:
+                    found.append(position)
+        return found
+
+    def _gain(self, position: Tuple[int, int], remaining: Dict[str, int]) -> Dict[str, int]:
+        """Unités utiles ramassables sur une case."""
+        gain = {}
+        for resource, count in remaining.items():
+            take = min(count, self._available(position, resource))
+            if take > 0:
+                gain[resource] = take
+        return gain
+
+    def _length(self, start: Tuple[int, int], positions: List[Tuple[int, int]]) -> int:
+        total, current = 0, start
+        for position in positions:
+            total += self._distance(current, position)
+            current = position
+        return total
+
+    def _two_opt(self, start: Tuple[int, int], positions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Inverse des segments tant que la tournée (ouverte) raccourcit."""
+        improved = True
+        while improved:
+            improved = False
+            for i in range(len(positions) - 1):
+                for j in range(i + 1, len(positions)):
+                    candidate = positions[:i] + positions[i:j + 1][::-1] + positions[j + 1:]
+                    if self._length(start, candidate) < self._length(start, positions):
+                        positions = candidate
+                        improved = True
+        return positions
+
+    def _assign(self, positions: List[Tuple[int, int]], deficit: Dict[str, int]) -> Tuple[List[Stop], Dict[str, int]]:
+        """Répartit le déficit sur les cases dans l'ordre de passage."""
+        remaining = {resource: count for resource, count in deficit.items() if count > 0}
+        stops = []
+        for x, y in positions:
+            gain = self._gain((x, y), remaining)
+            for resource, take in gain.items():
+                remaining[resource] -= take
+                if not remaining[resource]:
+                    del remaining[resource]
+            stops.append((x, y, gain))
+        return stops, remaining
+
+    def _prune(self, start: Tuple[int, int], positions: List[Tuple[int, int]],
+               deficit: Dict[str, int]) -> List[Tuple[int, int]]:
+        """Retire les arrêts sans lesquels on ramasse encore autant."""
+        missing = sum(self._assign(positions, deficit)[1].values())
+        changed = True
+        while changed:
+            changed = False
+            for index in sorted(range(len(positions)), key=lambda i: -self._distance(start, positions[i])):
+                trial = positions[:index] + positions[index + 1:]
+                if sum(self._assign(trial, deficit)[1].values()) == missing:
+                    positions = trial
+                    changed = True
+                    break
+        return positions
+
+    def ticks(self, x: int, y: int, stops: List[Stop]) -> int:
+        """Durée estimée d'une tournée : pas, une rotation par arrêt, et Take.
+
+        Args:
+            x (int): Position X de départ
+            y (int): Position Y de départ
+            stops (List[Stop]): Arrêts de la tournée
+
+        Returns:
+            int: Durée en unités de temps
+        """
+        steps = self._length((x, y), [(sx, sy) for sx, sy, _ in stops])
+        takes = sum(sum(gain.values()) for _, _, gain in stops)
+        return (steps + len(stops) + takes) * COMMAND_TICKS
+
+    def _budget(self, food: int, stops: List[Stop]) -> int:
+        """Unités de temps disponibles, nourriture ramassée en route comprise."""
+        picked = sum(gain.get("food", 0) for _, _, gain in stops)
+        return (food + picked - FOOD_RESERVE) * FOOD_TICKS
+
+    def _add_food(self, x: int, y: int, positions: List[Tuple[int, int]], deficit: Dict[str, int],
+                  food: int) -> List[Tuple[int, int]]:
+        """Insère des arrêts nourriture au moindre détour tant que le budget est dépassé."""
+        food_tiles = self.map.nearest_resource("food", x, y, k=self.max_candidates)
+        while True:
+            stops, _ = self._assign(positions, deficit)
+            stops = self._with_food(stops)
+            if self.ticks(x, y, stops) <= self._budget(food, stops):
+                return positions
+            best, best_cost = None, None
+            for tile in food_tiles:
+                if tile in positions:
+                    continue
+                for index in range(len(positions) + 1):
+                    trial = positions[:index] + [tile] + positions[index:]
+                    cost = self._length((x, y), trial)
+                    if best_cost is None or cost < best_cost:
+                        best, best_cost = trial, cost
+            if best is None:
+                return positions
+            positions = best
+
+    def _with_food(self, stops: List[Stop]) -> List[Stop]:
+        """Ajoute à chaque arrêt la nourriture présente sur sa case."""
+        result = []
+        for x, y, gain in stops:
+            available = self._available((x, y), "food")
+            if available and "food" not in gain:
+                gain = dict(gain, food=available)
+            result.append((x, y, gain))
+        return result
+
+    def _truncate(self, x: int, y: int, stops: List[Stop], food: int) -> List[Stop]:
+        """Garde le plus long préfixe de la tournée qui tient dans le budget."""
+        while stops and self.ticks(x, y, stops) > self._budget(food, stops):
+            stops = stops[:-1]
+        return stops
+
+    def plan(self, x: int, y: int, deficit: Dict[str, int], food: int) -> List[Stop]:
+        """Calcule la tournée de collecte.
+
+        Args:
+            x (int): Position X du joueur
+            y (int): Position Y du joueur
+            deficit (Dict[str, int]): Unités manquantes par ressource
+            food (int): Unités de nourriture en inventaire
+
+        Returns:
+            List[Stop]: Arrêts (x, y, {ressource: quantité à prendre}), vide si rien n'est connu
+        """
+        start = (x % self.map.width, y % self.map.height)
+        remaining = {resource: count for resource, count in deficit.items() if count > 0}
+        candidates = self._candidates(start[0], start[1], remaining)
+        positions: List[Tuple[int, int]] = []
+        current = start
+        while remaining and candidates:
+            best: Optional[Tuple[int, int]] = None
+            best_score = None
+            for position in candidates:
+                gain = self._gain(position, remaining)
+                if not gain:
+                    continue
+                score = (self._distance(current, position) + 1) / sum(gain.values())
+                if best_score is None or score < best_score:
+                    best, best_score = position, score
+            if best is None:
+                break
+            for resource, take in self._gain(best, remaining).items():
+                remaining[resource] -= take
+                if not remaining[resource]:
+                    del remaining[resource]
+            positions.append(best)
+            candidates.remove(best)
+            current = best
+
+        if not positions:
+            return []
+        positions = self._two_opt(start, positions)
+        positions = self._prune(start, positions, deficit)
+        positions = self._add_food(start[0], start[1], positions, deficit, food)
+        positions = self._two_opt(start, positions)
+        stops, _ = self._assign(positions, deficit)
+        return self._truncate(start[0], start[1], self._with_food(stops), food)
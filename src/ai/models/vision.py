@@ -0,0 +1,169 @@
+from typing import List, Optional, Union
+import numpy as np
+
+ITEMS = ("player", "food", "linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame")
+COLUMNS = {name: index for index, name in enumerate(ITEMS)}
+STONES = ITEMS[2:]
+WIDTH = len(ITEMS)
+
+_FIRST_LETTER = np.full(256, -1, dtype=np.intp)
+for _name, _column in COLUMNS.items():
+    if _name != "phiras":
+        _FIRST_LETTER[ord(_name[0])] = _column
+_SEPARATOR = np.zeros(256, dtype=bool)
+_SEPARATOR[list(b" ,[")] = True
+_COMMA = ord(",")
+_H = ord("h")
+
+
+class Vision:
+    """Résultat d'un Look sous forme de matrice de comptes.
+
+    Chaque case vue occupe une ligne de `counts` (cases × {player, food,
+    6 pierres}, uint16). Les requêtes portent sur des colonnes entières au
+    lieu de reparcourir des listes de chaînes. Les objets inconnus (œufs...)
+    sont ignorés.
+    """
+
+    def __init__(self, counts: np.ndarray):
+        """Initialise la vision à partir d'une matrice déjà construite.
+
+        Args:
+            counts (np.ndarray): Matrice (cases, len(ITEMS)) de comptes
+        """
+        self.counts = counts
+        self._lists: Optional[List[List[str]]] = None
+
+    @classmethod
+    def parse(cls, response: Union[str, bytes]) -> "Vision":
+        """Construit la matrice directement depuis les octets de la réponse.
+
+        Le tampon est vu par NumPy sans copie. Un objet commence par une
+        lettre précédée d'un séparateur (' ', ',', '[') et sa colonne se
+        déduit de sa première lettre ('p' suivi de 'h' pour phiras). Le
+        numéro de case est le nombre de virgules qui le précèdent, puis
+        np.bincount remplit la matrice. Le coût ne dépend pas du nombre
+        d'objets par case.
+
+        Args:
+            response (Union[str, bytes]): Réponse brute à Look, "[...]"
+
+        Returns:
+            Vision: Vision parsée
+        """
+        if isinstance(response, str):
+            response = response.encode('ascii', errors='replace')
+        buf = np.frombuffer(response, dtype=np.uint8)
+        if not buf.size:
+            return cls(np.zeros((1, WIDTH), dtype=np.uint16))
+        tiles = np.cumsum(buf == _COMMA)
+        starts = np.flatnonzero(_SEPARATOR[buf[:-1]]) + 1
+        if _FIRST_LETTER[buf[0]] >= 0:
+            starts = np.concatenate(([0], starts))
+        columns = _FIRST_LETTER[buf[starts]]
+        known = columns >= 0
+        starts = starts[known]
+        columns = columns[known]
+        second = buf[np.minimum(starts + 1, buf.size - 1)]
+        columns[(columns == COLUMNS["player"]) & (second == _H)] = COLUMNS["phiras"]
+        count = int(tiles[-1]) + 1
+        counts = np.bincount(tiles[starts] * WIDTH + columns, minlength=count * WIDTH)
+        return cls(counts.astype(np.uint16).reshape(count, WIDTH))
+
+    @classmethod
+    def from_tiles(cls, tiles: List[List[str]]) -> "Vision":
+        """Construit la vision depuis l'ancien format liste de listes.
+
+        Args:
+            tiles (List[List[str]]): Objets de chaque case
+
+        Returns:
+            Vision: Vision équivalente
+        """
+        counts = np.zeros((len(tiles), WIDTH), dtype=np.uint16)
+        for index, tile in enumerate(tiles):
+            for item in tile:
+                column = COLUMNS.get(item)
+                if column is not None:
+                    counts[index, column] += 1
+        vision = cls(counts)
+        vision._lists = [list(tile) for tile in tiles]
+        return vision
+
+    def __len__(self) -> int:
+        return self.counts.shape[0]
+
+    def count(self, index: int, item: str) -> int:
+        """Nombre d'exemplaires d'un objet sur une case.
+
+        Args:
+            index (int): Index de la case dans la vision
+            item (str): Nom de l'objet
+
+        Returns:
+            int: Nombre d'exemplaires, 0 si la case ou l'objet est inconnu
+        """
+        column = COLUMNS.get(item)
+        if column is None or not 0 <= index < len(self):
+            return 0
+        return int(self.counts[index, column])
+
+    def has(self, index: int, item: str) -> bool:
+        """Indique si un objet est présent sur une case."""
+        return self.count(index, item) > 0
+
+    def column(self, item: str) -> np.ndarray:
+        """Comptes d'un objet sur toutes les cases.
+
+        Args:
+            item (str): Nom de l'objet
+
+        Returns:
+            np.ndarray: Vecteur (cases,)
+        """
+        return self.counts[:, COLUMNS[item]]
+
+    def tiles_with(self, item: str) -> np.ndarray:
+        """Index des cases contenant un objet.
+
+        Args:
+            item (str): Nom de l'objet
+
+        Returns:
+            np.ndarray: Index triés
+        """
+        if item not in COLUMNS:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.column(item))
+
+    def stones(self, index: int) -> int:
+        """Nombre total de pierres sur une case."""
+        if not 0 <= index < len(self):
+            return 0
+        return int(self.counts[index, 2:].sum())
+
+    def content(self, index: int) -> List[str]:
+        """Objets d'une case, au format liste de chaînes.
+
+        Args:
+            index (int): Index de la case
+
+        Returns:
+            List[str]: Objets de la case, [] hors vision
+        """
+        if not 0 <= index < len(self):
+            return []
+        return self.to_lists()[index]
+
+    def to_lists(self) -> List[List[str]]:
+        """Vision au format liste de listes, calculée une seule fois.
+
+        Returns:
+            List[List[str]]: Objets de chaque case
+        """
+        if self._lists is None:
+            self._lists = [
+                [item for item, count in zip(ITEMS, row) for _ in range(count)]
+                for row in self.counts.tolist()
+            ]
+        return self._lists
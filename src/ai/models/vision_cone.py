@@ -0,0 +1,120 @@
+from typing import Dict, Tuple
+import numpy as np
+
+MAX_LEVEL = 8
+ORIENTATIONS = 4
+MAX_TILES = (MAX_LEVEL + 1) ** 2
+
+
+def tile_count(level: int) -> int:
+    """Nombre de cases renvoyées par Look à un niveau donné.
+
+    Args:
+        level (int): Niveau du joueur (1 à 8)
+
+    Returns:
+        int: (level + 1)², soit 4 au niveau 1 et 81 au niveau 8
+    """
+    return (level + 1) ** 2
+
+
+def _relative(side: int, forward: int, orientation: int) -> Tuple[int, int]:
+    """Passe du repère du joueur (côté, avant) au repère de la carte.
+
+    Même convention que le serveur : y croît vers le sud, 0=Nord, 1=Est,
+    2=Sud, 3=Ouest.
+    """
+    if orientation == 0:
+        return side, -forward
+    if orientation == 1:
+        return forward, side
+    if orientation == 2:
+        return -side, forward
+    return -forward, -side
+
+
+def _build() -> Tuple[np.ndarray, np.ndarray]:
+    """Construit les tables index → (dx, dy) et (dx, dy) → index.
+
+    Look parcourt le cône ligne par ligne, de la plus proche à la plus
+    lointaine, et chaque ligne de gauche à droite : la case (côté, avant)
+    a l'index avant² + avant + côté. Le cône d'un niveau est donc un
+    préfixe de celui du niveau suivant, et une table au niveau 8 suffit
+    pour tous les niveaux.
+    """
+    offsets = np.zeros((ORIENTATIONS, MAX_TILES, 2), dtype=np.intp)
+    indices = np.full((ORIENTATIONS, 2 * MAX_LEVEL + 1, 2 * MAX_LEVEL + 1), -1, dtype=np.intp)
+    for orientation in range(ORIENTATIONS):
+        for forward in range(MAX_LEVEL + 1):
+            for side in range(-forward, forward + 1):
+                index = forward * forward + forward + side
+                dx, dy = _relative(side, forward, orientation)
+                offsets[orientation, index] = dx, dy
+                indices[orientation, dy + MAX_LEVEL, dx + MAX_LEVEL] = index
+    offsets.flags.writeable = False
+    indices.flags.writeable = False
+    return offsets, indices
+
+
+OFFSETS, INDICES = _build()
+"""OFFSETS[orientation, index] = (dx, dy) ; INDICES[orientation, dy + 8, dx + 8] = index ou -1."""
+
+_OFFSET_TUPLES = tuple(tuple(map(tuple, table.tolist())) for table in OFFSETS)
+_INDEX_MAPS: Tuple[Dict[Tuple[int, int], int], ...] = tuple(
+    {offset: index for index, offset in enumerate(table)} for table in _OFFSET_TUPLES
+)
+
+
+def offsets(level: int, orientation: int) -> np.ndarray:
+    """Décalages (dx, dy) de toutes les cases vues, dans l'ordre de Look.
+
+    Args:
+        level (int): Niveau du joueur
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+    Returns:
+        np.ndarray: Vue en lecture seule de forme (cases, 2)
+    """
+    return OFFSETS[orientation % ORIENTATIONS, :tile_count(min(level, MAX_LEVEL))]
+
+
+def offset(index: int, orientation: int) -> Tuple[int, int]:
+    """Décalage (dx, dy) d'une case de la vision.
+
+    Args:
+        index (int): Index de la case dans la réponse à Look
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+    Returns:
+        Tuple[int, int]: Position relative au joueur
+    """
+    return _OFFSET_TUPLES[orientation % ORIENTATIONS][index]
+
+
+def index_of(dx: int, dy: int, level: int, orientation: int) -> int:
+    """Index dans la réponse à Look de la case à (dx, dy).
+
+    Args:
+        dx (int): Position X relative
+        dy (int): Position Y relative
+        level (int): Niveau du joueur
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+    Returns:
+        int: Index de la case, -1 si elle est hors du cône
+    """
+    index = _INDEX_MAPS[orientation % ORIENTATIONS].get((dx, dy), -1)
+    return index if index < tile_count(min(level, MAX_LEVEL)) else -1
+
+
+def positions(level: int, orientation: int) -> Tuple[Tuple[int, int], ...]:
+    """Décalages (dx, dy) des cases vues, sous forme de tuples Python.
+
+    Args:
+        level (int): Niveau du joueur
+        orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+
+    Returns:
+        Tuple[Tuple[int, int], ...]: Décalage de chaque case, dans l'ordre de Look
+    """
+    return _OFFSET_TUPLES[orientation % ORIENTATIONS][:tile_count(min(level, MAX_LEVEL))]
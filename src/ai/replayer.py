@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import sys
+import argparse
+import logging
+import time
+import random
+from typing import Dict, Optional
+from core.protocol import ZappyProtocol
+from core.replay import ReplayClient
+from models.player import Player
+from models.map import Map
+from ai import AI
+
+def replay_session(path: str, logger: Optional[logging.Logger] = None, seed: int = 0) -> Dict[str, float]:
+    """Rejoue une session enregistrée à pleine vitesse, sans serveur.
+
+    La boucle reprend celle de main.py : messages asynchrones d'abord, puis
+    un tick de l'IA. Le temps virtuel suit les horodatages enregistrés et
+    le module random reprend la graine de l'enregistrement.
+
+    Args:
+        path (str): Fichier produit par ZappyClient.start_recording
+        logger (Optional[Logger]): Logger pour les messages
+        seed (int): Graine utilisée si l'enregistrement n'en contient pas
+
+    Returns:
+        Dict[str, float]: Statistiques du rejeu (ticks, divergences, décisions/s...)
+    """
+    logger = logger or logging.getLogger(__name__)
+    client = ReplayClient(path)
+    random.seed(client.recording.seed if client.recording.seed is not None else seed)
+    client.connect()
+    protocol = ZappyProtocol(client)
+    player = Player(
+        id=client.client_num,
+        team=client.team_name,
+        x=client.map_size[0] // 2,
+        y=client.map_size[1] // 2,
+        protocol=protocol,
+        logger=logger
+    )
+    game_map = Map(client.map_size[0], client.map_size[1])
+    client.ai = AI(protocol, player, game_map, logger)
+    transport = client.transport
+
+    updates = 0
+    update_time = 0.0
+    start = time.perf_counter()
+    try:
+        while not transport.exhausted():
+            message = client.check_for_messages()
+            if message:
+                if not client.ai.handle_server_message(message):
+                    break
+                continue
+            position = transport.position
+            if not client.ai.elevation_in_progress:
+                tick_start = time.perf_counter()
+                alive = client.run()
+                update_time += time.perf_counter() - tick_start
+                updates += 1
+                if not alive:
+                    break
+            if transport.position == position:
+                transport.idle()
+    finally:
+        client.close()
+    wall_time = time.perf_counter() - start
+
+    return {
+        "updates": updates,
+        "commands": transport.commands,
+        "divergences": transport.divergences,
+        "game_time": transport.virtual_time,
+        "wall_time": wall_time,
+        "update_time": update_time,
+        "decisions_per_second": updates / update_time if update_time else 0.0,
+        "speedup": transport.virtual_time / wall_time if wall_time else 0.0,
+    }
+
+
+def main() -> int:
+    """Point d'entrée : rejoue un enregistrement et affiche les statistiques.
+
+    Returns:
+        int: Code de sortie
+    """
+    parser = argparse.ArgumentParser(description='Zappy AI session replay')
+    parser.add_argument('session', type=str, help='Recorded session file')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed when the recording has none')
+    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.WARNING)
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    try:
+        stats = replay_session(args.session, logger, args.seed)
+    except (OSError, ValueError) as e:
+        logger.error(f"Impossible de rejouer la session: {e}")
+        return 84
+    logger.info(
+        f"🎬 {stats['updates']} ticks IA, {stats['commands']} commandes, {stats['divergences']} divergences"
+    )
+    logger.info(
+        f"⏱️ {stats['game_time']:.2f}s de jeu rejouées en {stats['wall_time']:.2f}s "
+        f"(x{stats['speedup']:.1f}), {stats['decisions_per_second']:.1f} décisions/s"
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+
+import sys
+import argparse
+import heapq
+import logging
+import selectors
+import time
+from typing import Coroutine, Dict, List, Optional
+from core.client import ZappyClient
+from core.async_protocol import PendingReply, SelectorProtocol
+from models.player import Player
+from models.map import Map
+from ai import AI
+
+class ManagedAgent:
+    """Un agent hébergé par le MultiAgentRunner."""
+
+    def __init__(self, index: int, client: ZappyClient, ai: AI):
+        """Initialise l'agent.
+
+        Args:
+            index (int): Numéro de l'agent dans le runner
+            client (ZappyClient): Client connecté de l'agent
+            ai (AI): IA de l'agent, sur un SelectorProtocol
+        """
+        self.index = index
+        self.client = client
+        self.ai = ai
+        self.protocol: SelectorProtocol = ai.protocol
+        self.alive = True
+        self.task: Optional[Coroutine] = None
+        self.waiting: Optional[PendingReply] = None
+        self.ticks = 0
+        self.events = 0
+        self.cpu_time = 0.0
+        self.next_tick = 0.0
+
+    @property
+    def busy(self) -> bool:
+        """True tant qu'un tick attend des réponses du serveur."""
+        return self.task is not None
+
+    def tick_delay(self) -> float:
+        """Délai avant le prochain tick selon l'état de l'IA.
+
+        Returns:
+            float: Délai en secondes
+        """
+        if self.ai.elevation_in_progress or self.ai.state == "EMERGENCY_FOOD_SEARCH":
+            return 0.1
+        return 0.2
+
+
+class MultiAgentRunner:
+    """Héberge N agents dans un seul processus autour d'un sélecteur (epoll).
+
+    Le socket de chaque agent reste surveillé par le sélecteur. Un tick
+    (AI.update) est une coroutine sur un SelectorProtocol : elle écrit ses
+    commandes puis rend la main en attendant leurs réponses. Quand le
+    socket devient lisible, les réponses sont livrées et la coroutine
+    reprend ; pendant ce temps les autres agents avancent. Il n'y a ni
+    thread ni time.sleep, et le débit ne dépend pas du temps d'aller-retour
+    multiplié par un nombre de threads. Les messages asynchrones sont
+    traités entre deux ticks. Le temps CPU est compté par agent.
+    """
+
+    def __init__(self, hostname: str, port: int, team_name: str, count: int,
+                 logger: Optional[logging.Logger] = None):
+        """Initialise le runner.
+
+        Args:
+            hostname (str): Nom d'hôte du serveur
+            port (int): Port du serveur
+            team_name (str): Nom de l'équipe
+            count (int): Nombre d'agents à héberger
+            logger (Optional[Logger]): Logger pour les messages
+        """
+        self.hostname = hostname
+        self.port = port
+        self.team_name = team_name
+        self.count = count
+        self.logger = logger or logging.getLogger(__name__)
+        self.selector = selectors.DefaultSelector()
+        self.agents: List[ManagedAgent] = []
+        self.finished: Dict[int, ManagedAgent] = {}
+        self.failed_connections = 0
+        self.timers = []
+
+    def spawn(self) -> int:
+        """Connecte les agents au serveur.
+
+        Une connexion refusée est signalée et n'empêche pas les suivantes.
+
+        Returns:
+            int: Nombre d'agents connectés
+        """
+        for attempt in range(self.count):
+            client = ZappyClient(self.hostname, self.port, self.team_name)
+            try:
+                client.connect()
+            except Exception as e:
+                self.failed_connections += 1
+                self.logger.error(f"Échec de la connexion de l'agent {attempt + 1}/{self.count}: {e}")
+                continue
+            protocol = SelectorProtocol(client)
+            player = Player(
+                id=client.client_num,
+                team=client.team_name,
+                x=client.map_size[0] // 2,
+                y=client.map_size[1] // 2,
+                protocol=protocol,
+                logger=self.logger
+            )
+            game_map = Map(client.map_size[0], client.map_size[1])
+            client.ai = AI(protocol, player, game_map, self.logger)
+            agent = ManagedAgent(len(self.agents), client, client.ai)
+            self.agents.append(agent)
+            self.selector.register(client.socket, selectors.EVENT_READ, agent)
+            self._schedule(agent, time.monotonic())
+        if self.failed_connections:
+            self.logger.warning(f"⚠️ {self.failed_connections} connexion(s) refusée(s) sur {self.count}")
+        self.logger.info(f"🚀 {len(self.agents)}/{self.count} agents connectés dans un seul processus")
+        return len(self.agents)
+
+    def _schedule(self, agent: ManagedAgent, when: float) -> None:
+        """Programme le prochain tick d'un agent.
+
+        Args:
+            agent (ManagedAgent): Agent concerné
+            when (float): Échéance (time.monotonic)
+        """
+        agent.next_tick = when
+        heapq.heappush(self.timers, (when, agent.index))
+
+    def _retire(self, agent: ManagedAgent) -> None:
+        """Retire un agent mort ou déconnecté de la boucle.
+
+        Args:
+            agent (ManagedAgent): Agent à retirer
+        """
+        if not agent.alive and agent.index in self.finished:
+            return
+        agent.alive = False
+        self.finished[agent.index] = agent
+        if agent.task is not None:
+            agent.task.close()
+            agent.task = None
+            agent.waiting = None
+        try:
+            self.selector.unregister(agent.client.socket)
+        except (KeyError, ValueError):
+            pass
+        agent.client.close()
+        self.logger.info(f"👋 Agent {agent.index} arrêté ({agent.ticks} ticks, {agent.cpu_time:.3f}s CPU)")
+
+    def _handle_events(self, agent: ManagedAgent) -> None:
+        """Traite les messages asynchrones classés par le dispatcher de l'agent.
+
+        Args:
+            agent (ManagedAgent): Agent concerné
+        """
+        for event in agent.client.dispatcher.drain():
+            if not agent.alive:
+                break
+            agent.events += 1
+            if not agent.ai.handle_server_message(event.line):
+                agent.alive = False
+
+    def _on_readable(self, agent: ManagedAgent) -> None:
+        """Lit le socket d'un agent, livre ses réponses et reprend son tick.
+
+        Hors tick, les messages asynchrones sont traités tout de suite ;
+        pendant un tick, ils attendent sa fin.
+
+        Args:
+            agent (ManagedAgent): Agent dont le socket est lisible
+        """
+        start = time.thread_time()
+        try:
+            agent.client._fill_buffer()
+            agent.client._route_buffered()
+            agent.protocol.deliver()
+        except (ConnectionError, OSError) as e:
+            self.logger.error(f"🔌 Agent {agent.index}: {e}")
+            agent.alive = False
+            agent.protocol.fail(ConnectionError(f"Connexion au serveur perdue: {e}"))
+        if not agent.busy:
+            self._handle_events(agent)
+        agent.cpu_time += time.thread_time() - start
+        if agent.busy and agent.waiting.done:
+            self._resume(agent)
+        elif not agent.alive:
+            self._retire(agent)
+
+    def _resume(self, agent: ManagedAgent) -> None:
+        """Fait avancer le tick d'un agent jusqu'à sa prochaine attente.
+
+        Args:
+            agent (ManagedAgent): Agent dont la réponse attendue est arrivée
+        """
+        start = time.thread_time()
+        finished = True
+        try:
+            agent.waiting = agent.task.send(None)
+            if not isinstance(agent.waiting, PendingReply):
+                raise RuntimeError(f"Attente inattendue dans le tick: {agent.waiting!r}")
+            finished = False
+        except StopIteration as stop:
+            alive = bool(stop.value)
+        except Exception as e:
+            self.logger.error(f"Erreur dans le tick de l'agent {agent.index}: {e}")
+            alive = False
+        agent.cpu_time += time.thread_time() - start
+        if finished:
+            self._finish_tick(agent, alive)
+
+    def _start_tick(self, agent: ManagedAgent) -> None:
+        """Démarre le tick d'un agent.
+
+        Args:
+            agent (ManagedAgent): Agent dont le tick est dû
+        """
+        if agent.ai.elevation_in_progress:
+            self._schedule(agent, time.monotonic() + agent.tick_delay())
+            return
+        agent.task = agent.ai.update()
+        self._resume(agent)
+
+    def _finish_tick(self, agent: ManagedAgent, alive: bool) -> None:
+        """Clôt un tick, traite les messages reçus pendant celui-ci et programme le suivant.
+
+        Args:
+            agent (ManagedAgent): Agent concerné
+            alive (bool): Valeur rendue par AI.update
+        """
+        agent.task.close()
+        agent.task = None
+        agent.waiting = None
+        agent.ticks += 1
+        if not alive or not agent.alive:
+            self._retire(agent)
+            return
+        start = time.thread_time()
+        self._handle_events(agent)
+        agent.cpu_time += time.thread_time() - start
+        if not agent.alive:
+            self._retire(agent)
+        else:
+            self._schedule(agent, time.monotonic() + agent.tick_delay())
+
+    def _fire_timers(self) -> None:
+        """Démarre les ticks dont l'échéance est passée."""
+        now = time.monotonic()
+        while self.timers and self.timers[0][0] <= now:
+            when, index = heapq.heappop(self.timers)
+            agent = self.agents[index]
+            if agent.alive and not agent.busy and agent.next_tick == when:
+                self._start_tick(agent)
+
+    def running(self) -> int:
+        """Nombre d'agents encore actifs.
+
+        Returns:
+            int: Agents vivants
+        """
+        return sum(1 for agent in self.agents if agent.alive)
+
+    def run(self, duration: Optional[float] = None, report_interval: Optional[float] = None) -> None:
+        """Boucle principale : sélecteur, échéances des ticks et rapports.
+
+        Args:
+            duration (Optional[float]): Durée maximale en secondes
+            report_interval (Optional[float]): Période des rapports CPU
+        """
+        deadline = time.monotonic() + duration if duration else None
+        next_report = time.monotonic() + report_interval if report_interval else None
+        while self.running():
+            now = time.monotonic()
+            if deadline and now >= deadline:
+                break
+            timeout = self.timers[0][0] - now if self.timers else 1.0
+            if deadline:
+                timeout = min(timeout, deadline - now)
+            for key, _ in self.selector.select(max(0.0, timeout)):
+                if key.data.alive:
+                    self._on_readable(key.data)
+            self._fire_timers()
+            if next_report and time.monotonic() >= next_report:
+                self.log_report()
+                next_report = time.monotonic() + report_interval
+
+    def report(self) -> List[Dict[str, float]]:
+        """Statistiques par agent.
+
+        Returns:
+            List[Dict[str, float]]: Ticks, événements et temps CPU de chaque agent
+        """
+        return [
+            {
+                "agent": agent.index,
+                "client": agent.client.client_num,
+                "alive": agent.alive,
+                "ticks": agent.ticks,
+                "events": agent.events,
+                "cpu_time": agent.cpu_time,
+                "cpu_per_tick": agent.cpu_time / agent.ticks if agent.ticks else 0.0,
+            }
+            for agent in self.agents
+        ]
+
+    def log_report(self) -> None:
+        """Écrit le rapport CPU par agent dans les logs."""
+        total = 0.0
+        for stats in self.report():
+            total += stats["cpu_time"]
+            self.logger.info(
+                f"📊 Agent {stats['agent']} (client #{stats['client']}, {'vivant' if stats['alive'] else 'mort'}): "
+                f"{stats['ticks']} ticks, {stats['events']} événements, "
+                f"{stats['cpu_time']:.3f}s CPU, {stats['cpu_per_tick'] * 1000:.2f}ms/tick"
+            )
+        self.logger.info(f"📊 Total: {total:.3f}s CPU pour {len(self.agents)} agents")
+
+    def close(self) -> None:
+        """Ferme toutes les connexions."""
+        for agent in self.agents:
+            if agent.alive:
+                self._retire(agent)
+        self.selector.close()
+
+
+def run_agents(hostname: str, port: int, team_name: str, count: int,
+               report_interval: Optional[float] = None,
+               logger: Optional[logging.Logger] = None) -> int:
+    """Lance et fait tourner plusieurs agents dans le processus courant.
+
+    Args:
+        hostname (str): Nom d'hôte du serveur
+        port (int): Port du serveur
+        team_name (str): Nom de l'équipe
+        count (int): Nombre d'agents
+        report_interval (Optional[float]): Période des rapports CPU
+        logger (Optional[Logger]): Logger pour les messages
+
+    Returns:
+        int: Code de sortie
+    """
+    runner = MultiAgentRunner(hostname, port, team_name, count, logger)
+    try:
+        if not runner.spawn():
+            return 84
+        runner.run(report_interval=report_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runner.close()
+        runner.log_report()
+    return 0
+
+
+def main() -> int:
+    """Point d'entrée du runner multi-agents.
+
+    Returns:
+        int: Code de sortie
+    """
+    parser = argparse.ArgumentParser(description='Zappy AI multi-agent runner', add_help=False)
+    parser.add_argument('-p', '--port', type=int, required=True, help='Port number')
+    parser.add_argument('-n', '--name', type=str, required=True, help='Team name')
+    parser.add_argument('-h', '--host', type=str, default="localhost", help='Machine name')
+    parser.add_argument('-c', '--count', type=int, default=1, help='Number of agents')
+    parser.add_argument('--report', type=float, default=None, help='CPU report interval (s)')
+    args = parser.parse_args()
+    return run_agents(args.host, args.port, args.name, args.count, args.report)
+
+if __name__ == "__main__":
+    sys.exit(main())
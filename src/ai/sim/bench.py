@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import sys
+import argparse
+import logging
+import time
+from typing import Dict, List
+from sim.server import StandInServer
+from runner import MultiAgentRunner
+
+def run_benchmark(bots: int, teams: int = 2, frequency: float = 100, duration: float = 10.0,
+                  width: int = 20, height: int = 20,
+                  latency: float = 0.0, jitter: float = 0.0, seed: int = 0) -> List[Dict[str, float]]:
+    """Fait jouer des agents contre le serveur de substitution.
+
+    Le serveur tourne dans un thread, les agents de chaque équipe dans un
+    MultiAgentRunner ; les runners sont avancés tour à tour dans le thread
+    courant.
+
+    Args:
+        bots (int): Nombre total d'agents
+        teams (int): Nombre d'équipes
+        frequency (float): Fréquence du serveur
+        duration (float): Durée du benchmark en secondes
+        width (int): Largeur de la carte
+        height (int): Hauteur de la carte
+        latency (float): Latence simulée (s)
+        jitter (float): Gigue simulée (s)
+        seed (int): Graine de la partie
+
+    Returns:
+        List[Dict[str, float]]: Rapport par agent (voir MultiAgentRunner.report)
+    """
+    names = [f"team{i + 1}" for i in range(teams)]
+    per_team = -(-bots // teams)
+    server = StandInServer(width, height, names, per_team, frequency, latency, jitter, seed)
+    port = server.start_in_thread()
+    runners = [MultiAgentRunner("127.0.0.1", port, name, per_team) for name in names]
+    try:
+        for runner in runners:
+            runner.spawn()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline and any(runner.running() for runner in runners):
+            for runner in runners:
+                if runner.running():
+                    runner.run(duration=0.05)
+    finally:
+        for runner in runners:
+            runner.close()
+        server.stop_thread()
+    return [stats for runner in runners for stats in runner.report()]
+
+
+def main() -> int:
+    """Point d'entrée du benchmark.
+
+    Returns:
+        int: Code de sortie
+    """
+    parser = argparse.ArgumentParser(description='Zappy AI benchmark against the stand-in server')
+    parser.add_argument('-b', '--bots', type=int, default=20, help='Number of agents')
+    parser.add_argument('-t', '--teams', type=int, default=2, help='Number of teams')
+    parser.add_argument('-f', '--freq', type=float, default=100, help='Server frequency')
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='Duration (s)')
+    parser.add_argument('--size', type=int, default=20, help='Map width and height')
+    parser.add_argument('--latency', type=float, default=0.0, help='Added latency (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Added jitter (s)')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    report = run_benchmark(args.bots, args.teams, args.freq, args.duration,
+                           args.size, args.size, args.latency, args.jitter)
+    ticks = sum(stats["ticks"] for stats in report)
+    cpu = sum(stats["cpu_time"] for stats in report)
+    alive = sum(1 for stats in report if stats["alive"])
+    logger.info(f"📊 {len(report)} agents ({alive} vivants), {ticks} ticks, {ticks / args.duration:.1f} ticks/s, "
+                f"{cpu:.3f}s CPU, {cpu * 1000 / ticks if ticks else 0.0:.2f}ms/tick")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+
+import sys
+import argparse
+import asyncio
+import logging
+import random
+import threading
+from collections import deque
+from typing import Deque, List, Optional
+from sim.world import World, SimPlayer, FOOD_UNITS
+
+COSTS = {
+    "Forward": 7, "Right": 7, "Left": 7, "Look": 7, "Inventory": 1, "Broadcast": 7,
+    "Connect_nbr": 0, "Fork": 42, "Eject": 7, "Take": 7, "Set": 7, "Incantation": 300
+}
+RESOURCE_RESPAWN = 20
+
+
+class Connection:
+    """Connexion d'un client IA au serveur de substitution."""
+
+    MAX_QUEUED = 10
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Initialise la connexion.
+
+        Args:
+            reader (StreamReader): Flux entrant
+            writer (StreamWriter): Flux sortant
+        """
+        self.reader = reader
+        self.writer = writer
+        self.player: Optional[SimPlayer] = None
+        self.queue: Deque[str] = deque()
+        self.busy = False
+        self.send_at = 0.0
+        self.food_timer: Optional[asyncio.TimerHandle] = None
+
+
+class StandInServer:
+    """Serveur Zappy en Python pur pour les tests d'intégration et les benchmarks.
+
+    Implémente le protocole IA (poignée de main, commandes, décroissance de
+    la nourriture, réapparition des ressources, rituels) sur une boucle
+    asyncio. Le temps du jeu avance à `frequency` unités par seconde : une
+    fréquence élevée accélère la partie. Une latence et une gigue peuvent
+    être ajoutées aux réponses pour reproduire un réseau réel.
+    """
+
+    def __init__(self, width: int = 10, height: int = 10, teams: Optional[List[str]] = None,
+                 clients_nb: int = 3, frequency: float = 100, latency: float = 0.0,
+                 jitter: float = 0.0, seed: Optional[int] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        """Initialise le serveur.
+
+        Args:
+            width (int): Largeur de la carte
+            height (int): Hauteur de la carte
+            teams (Optional[List[str]]): Noms des équipes
+            clients_nb (int): Places initiales par équipe
+            frequency (float): Unités de temps par seconde
+            latency (float): Latence ajoutée à chaque réponse (s)
+            jitter (float): Gigue maximale ajoutée à la latence (s)
+            seed (Optional[int]): Graine pour une partie reproductible
+            host (str): Adresse d'écoute
+            port (int): Port d'écoute, 0 pour un port libre
+        """
+        self.world = World(width, height, teams or ["team1", "team2"], clients_nb, seed)
+        self.frequency = frequency
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger(__name__)
+        self.connections: List[Connection] = []
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._respawn: Optional[asyncio.TimerHandle] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    def seconds(self, ticks: float) -> float:
+        """Durée réelle d'un nombre d'unités de temps."""
+        return ticks / self.frequency
+
+    async def start(self) -> int:
+        """Ouvre le port d'écoute et lance la réapparition des ressources.
+
+        Returns:
+            int: Port effectivement utilisé
+        """
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._respawn = self.loop.call_later(self.seconds(RESOURCE_RESPAWN), self._respawn_resources)
+        self.logger.info(f"🧪 Serveur de substitution sur {self.host}:{self.port} "
+                         f"({self.world.width}x{self.world.height}, f={self.frequency})")
+        return self.port
+
+    async def stop(self) -> None:
+        """Ferme le port d'écoute et toutes les connexions."""
+        if self._respawn:
+            self._respawn.cancel()
+        for connection in list(self.connections):
+            self._disconnect(connection)
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    def start_in_thread(self) -> int:
+        """Fait tourner le serveur dans un thread dédié.
+
+        Returns:
+            int: Port d'écoute
+        """
+        ready = threading.Event()
+
+        def serve():
+            asyncio.run(self._serve(ready))
+
+        self._thread = threading.Thread(target=serve, daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.port
+
+    async def _serve(self, ready: threading.Event) -> None:
+        """Boucle du thread : démarre, signale, puis attend l'arrêt."""
+        self._stopped = asyncio.Event()
+        await self.start()
+        ready.set()
+        await self._stopped.wait()
+        await self.stop()
+
+    def stop_thread(self) -> None:
+        """Arrête un serveur lancé par start_in_thread."""
+        if self._thread and self.loop:
+            self.loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join()
+            self._thread = None
+
+    def _respawn_resources(self) -> None:
+        """Réapparition périodique des ressources."""
+        self.world.spawn_resources()
+        self._respawn = self.loop.call_later(self.seconds(RESOURCE_RESPAWN), self._respawn_resources)
+
+    def _send(self, connection: Connection, text: str) -> None:
+        """Envoie une ligne en respectant la latence simulée et l'ordre.
+
+        Args:
+            connection (Connection): Destinataire
+            text (str): Ligne sans '\\n'
+        """
+        data = f"{text}\n".encode()
+        if not self.latency and not self.jitter:
+            if not connection.writer.is_closing():
+                connection.writer.write(data)
+            return
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        when = max(self.loop.time() + delay, connection.send_at)
+        connection.send_at = when
+        self.loop.call_at(when, self._write, connection, data)
+
+    def _write(self, connection: Connection, data: bytes) -> None:
+        """Écrit des données différées si la connexion est encore ouverte."""
+        if not connection.writer.is_closing():
+            connection.writer.write(data)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Gère un client : poignée de main puis lecture des commandes."""
+        connection = Connection(reader, writer)
+        self.connections.append(connection)
+        try:
+            writer.write(b"WELCOME\n")
+            team = (await reader.readline()).decode(errors='replace').strip()
+            player = self.world.join(team)
+            if player is None:
+                writer.write(b"ko\n")
+                return
+            connection.player = player
+            writer.write(f"{self.world.slots[team]}\n{self.world.width} {self.world.height}\n".encode())
+            connection.food_timer = self.loop.call_later(self.seconds(FOOD_UNITS), self._eat, connection)
+            while connection.player and connection.player.alive:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors='replace').strip()
+                if command and len(connection.queue) < Connection.MAX_QUEUED:
+                    connection.queue.append(command)
+                    self._start_next(connection)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._disconnect(connection)
+
+    def _disconnect(self, connection: Connection) -> None:
+        """Retire le joueur et ferme la connexion."""
+        if connection.food_timer:
+            connection.food_timer.cancel()
+        if connection.player:
+            self.world.remove(connection.player)
+        if connection in self.connections:
+            self.connections.remove(connection)
+        connection.writer.close()
+
+    def _eat(self, connection: Connection) -> None:
+        """Consomme une unité de nourriture ou tue le joueur."""
+        player = connection.player
+        if not player or not player.alive:
+            return
+        if player.inventory[0] <= 0:
+            self._send(connection, "dead")
+            self.world.remove(player)
+            self.loop.call_later(self.latency + self.jitter, self._disconnect, connection)
+            return
+        player.inventory[0] -= 1
+        connection.food_timer = self.loop.call_later(self.seconds(FOOD_UNITS), self._eat, connection)
+
+    def _connection_of(self, player: SimPlayer) -> Optional[Connection]:
+        """Retrouve la connexion d'un joueur."""
+        for connection in self.connections:
+            if connection.player is player:
+                return connection
+        return None
+
+    def _start_next(self, connection: Connection) -> None:
+        """Démarre la prochaine commande de la file si le joueur est libre.
+
+        Args:
+            connection (Connection): Connexion du joueur
+        """
+        player = connection.player
+        if connection.busy or player.frozen or not player.alive or not connection.queue:
+            return
+        command = connection.queue[0]
+        name = command.split()[0]
+        if name == "Incantation":
+            participants = self.world.ritual_participants(player.x, player.y, player.level)
+            if participants is None:
+                connection.queue.popleft()
+                self._send(connection, "ko")
+                self._start_next(connection)
+                return
+            for participant in participants:
+                participant.frozen = True
+                other = self._connection_of(participant)
+                if other:
+                    self._send(other, "Elevation underway")
+            connection.busy = True
+            self.loop.call_later(self.seconds(COSTS[name]), self._finish_ritual, connection,
+                                 player.x, player.y, player.level, participants)
+            return
+        connection.busy = True
+        self.loop.call_later(self.seconds(COSTS.get(name, 0)), self._complete, connection)
+
+    def _complete(self, connection: Connection) -> None:
+        """Applique la commande en tête de file et envoie sa réponse."""
+        connection.busy = False
+        player = connection.player
+        if not player or not player.alive or not connection.queue:
+            return
+        command = connection.queue.popleft()
+        self._send(connection, self._execute(connection, command))
+        self._start_next(connection)
+
+    def _execute(self, connection: Connection, command: str) -> str:
+        """Exécute une commande et rend sa réponse.
+
+        Args:
+            connection (Connection): Connexion émettrice
+            command (str): Commande complète
+
+        Returns:
+            str: Réponse à envoyer
+        """
+        player = connection.player
+        name, _, argument = command.partition(" ")
+        if name == "Forward":
+            self.world.forward(player)
+        elif name in ("Right", "Left"):
+            self.world.turn(player, name == "Right")
+        elif name == "Look":
+            return self.world.look(player)
+        elif name == "Inventory":
+            return self.world.inventory(player)
+        elif name == "Broadcast":
+            for other in self.connections:
+                if other.player and other.player is not player and other.player.alive:
+                    k = self.world.direction(other.player, player.x, player.y)
+                    self._send(other, f"message {k}, {argument}")
+        elif name == "Connect_nbr":
+            return str(self.world.slots[player.team])
+        elif name == "Fork":
+            self.world.fork(player)
+        elif name == "Eject":
+            pushed = self.world.eject(player)
+            for other, k in pushed:
+                target = self._connection_of(other)
+                if target:
+                    self._send(target, f"eject: {k}")
+            return "ok" if pushed else "ko"
+        elif name == "Take":
+            return "ok" if self.world.take(player, argument) else "ko"
+        elif name == "Set":
+            return "ok" if self.world.set(player, argument) else "ko"
+        else:
+            return "ko"
+        return "ok"
+
+    def _finish_ritual(self, connection: Connection, x: int, y: int, level: int,
+                       participants: List[SimPlayer]) -> None:
+        """Termine un rituel et prévient tous les participants."""
+        success = self.world.complete_ritual(x, y, level, participants)
+        for participant in participants:
+            participant.frozen = False
+            other = self._connection_of(participant)
+            if not other:
+                continue
+            self._send(other, f"Current level: {participant.level}" if success else "ko")
+        if connection.queue:
+            connection.queue.popleft()
+        connection.busy = False
+        winner = self.world.winner()
+        if winner:
+            self.logger.info(f"🏆 L'équipe {winner} a gagné la partie")
+        for participant in participants:
+            other = self._connection_of(participant)
+            if other:
+                self._start_next(other)
+
+
+def main() -> int:
+    """Point d'entrée du serveur de substitution.
+
+    Returns:
+        int: Code de sortie
+    """
+    parser = argparse.ArgumentParser(description='Zappy stand-in server', add_help=False)
+    parser.add_argument('-p', '--port', type=int, default=4242, help='Port number')
+    parser.add_argument('-x', '--width', type=int, default=10, help='Map width')
+    parser.add_argument('-y', '--height', type=int, default=10, help='Map height')
+    parser.add_argument('-n', '--names', nargs='+', default=["team1", "team2"], help='Team names')
+    parser.add_argument('-c', '--clients', type=int, default=3, help='Initial slots per team')
+    parser.add_argument('-f', '--freq', type=float, default=100, help='Time units per second')
+    parser.add_argument('--latency', type=float, default=0.0, help='Added reply latency (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Maximum added jitter (s)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    server = StandInServer(args.width, args.height, args.names, args.clients, args.freq,
+                           args.latency, args.jitter, args.seed, "0.0.0.0", args.port)
+
+    async def serve():
+        await server.start()
+        await server.server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+
+RESOURCES = ("food", "linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame")
+DENSITY = (0.5, 0.3, 0.15, 0.1, 0.1, 0.08, 0.05)
+FOOD_UNITS = 126
+ELEVATION_REQUIREMENTS = {
+    1: (1, (0, 1, 0, 0, 0, 0, 0)),
+    2: (2, (0, 1, 1, 1, 0, 0, 0)),
+    3: (2, (0, 2, 0, 1, 0, 2, 0)),
+    4: (4, (0, 1, 1, 2, 0, 1, 0)),
+    5: (4, (0, 1, 2, 1, 3, 0, 0)),
+    6: (6, (0, 1, 2, 3, 0, 1, 0)),
+    7: (6, (0, 2, 2, 2, 2, 2, 1)),
+}
+
+
+class SimPlayer:
+    """Joueur simulé par le serveur de substitution."""
+
+    def __init__(self, player_id: int, team: str, x: int, y: int, orientation: int):
+        """Initialise le joueur.
+
+        Args:
+            player_id (int): Identifiant unique
+            team (str): Équipe du joueur
+            x (int): Position X
+            y (int): Position Y
+            orientation (int): 0=Nord, 1=Est, 2=Sud, 3=Ouest
+        """
+        self.id = player_id
+        self.team = team
+        self.x = x
+        self.y = y
+        self.orientation = orientation
+        self.level = 1
+        self.inventory = [10, 0, 0, 0, 0, 0, 0]
+        self.alive = True
+        self.frozen = False
+
+
+class World:
+    """État du jeu : carte torique, ressources, joueurs et œufs.
+
+    Implémente les règles du protocole IA sans notion de temps ni de
+    réseau ; le StandInServer décide quand appliquer chaque action.
+    """
+
+    DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+    def __init__(self, width: int, height: int, teams: List[str], clients_nb: int, seed: Optional[int] = None):
+        """Initialise le monde.
+
+        Args:
+            width (int): Largeur de la carte
+            height (int): Hauteur de la carte
+            teams (List[str]): Noms des équipes
+            clients_nb (int): Places initiales par équipe
+            seed (Optional[int]): Graine du générateur aléatoire
+        """
+        self.width = width
+        self.height = height
+        self.random = random.Random(seed)
+        self.tiles = [[[0] * len(RESOURCES) for _ in range(width)] for _ in range(height)]
+        self.totals = [0] * len(RESOURCES)
+        self.players: Dict[int, SimPlayer] = {}
+        self.occupants: Dict[Tuple[int, int], List[SimPlayer]] = {}
+        self.slots = {team: clients_nb for team in teams}
+        self.eggs: Dict[str, List[Tuple[int, int]]] = {team: [] for team in teams}
+        self._next_id = 0
+        self.spawn_resources()
+
+    def spawn_resources(self) -> None:
+        """Complète chaque ressource jusqu'à sa densité cible."""
+        for index, density in enumerate(DENSITY):
+            target = max(1, int(self.width * self.height * density))
+            for _ in range(target - self.totals[index]):
+                x = self.random.randrange(self.width)
+                y = self.random.randrange(self.height)
+                self.tiles[y][x][index] += 1
+                self.totals[index] += 1
+
+    def join(self, team: str) -> Optional[SimPlayer]:
+        """Fait entrer un joueur dans une équipe.
+
+        Args:
+            team (str): Nom de l'équipe
+
+        Returns:
+            Optional[SimPlayer]: Nouveau joueur, ou None sans place libre
+        """
+        if self.slots.get(team, 0) <= 0:
+            return None
+        self.slots[team] -= 1
+        if self.eggs[team]:
+            x, y = self.eggs[team].pop(self.random.randrange(len(self.eggs[team])))
+        else:
+            x, y = self.random.randrange(self.width), self.random.randrange(self.height)
+        player = SimPlayer(self._next_id, team, x, y, self.random.randrange(4))
+        self._next_id += 1
+        self.players[player.id] = player
+        self.occupants.setdefault((x, y), []).append(player)
+        return player
+
+    def remove(self, player: SimPlayer) -> None:
+        """Retire un joueur mort ou déconnecté.
+
+        Args:
+            player (SimPlayer): Joueur à retirer
+        """
+        player.alive = False
+        self.players.pop(player.id, None)
+        tile = self.occupants.get((player.x, player.y), [])
+        if player in tile:
+            tile.remove(player)
+
+    def _move(self, player: SimPlayer, x: int, y: int) -> None:
+        """Déplace un joueur en tenant l'index des occupants à jour."""
+        self.occupants[(player.x, player.y)].remove(player)
+        player.x, player.y = x % self.width, y % self.height
+        self.occupants.setdefault((player.x, player.y), []).append(player)
+
+    def forward(self, player: SimPlayer) -> None:
+        """Avance d'une case dans la direction du joueur."""
+        dx, dy = self.DELTAS[player.orientation]
+        self._move(player, player.x + dx, player.y + dy)
+
+    def turn(self, player: SimPlayer, right: bool) -> None:
+        """Tourne le joueur d'un quart de tour."""
+        player.orientation = (player.orientation + (1 if right else 3)) % 4
+
+    def relative_tile(self, player: SimPlayer, side: int, forward: int) -> Tuple[int, int]:
+        """Case absolue vue à (side, forward) dans le repère du joueur.
+
+        Args:
+            player (SimPlayer): Joueur observateur
+            side (int): Décalage latéral, positif vers la droite
+            forward (int): Distance devant le joueur
+
+        Returns:
+            Tuple[int, int]: Coordonnées absolues
+        """
+        if player.orientation == 0:
+            dx, dy = side, -forward
+        elif player.orientation == 1:
+            dx, dy = forward, side
+        elif player.orientation == 2:
+            dx, dy = -side, forward
+        else:
+            dx, dy = -forward, -side
+        return (player.x + dx) % self.width, (player.y + dy) % self.height
+
+    def look(self, player: SimPlayer) -> str:
+        """Réponse à Look : cases ligne par ligne, de gauche à droite.
+
+        Args:
+            player (SimPlayer): Joueur observateur
+
+        Returns:
+            str: Contenu des cases visibles
+        """
+        tiles = []
+        for forward in range(player.level + 1):
+            for side in range(-forward, forward + 1):
+                x, y = self.relative_tile(player, side, forward)
+                items = ["player"] * len(self.occupants.get((x, y), []))
+                for index, count in enumerate(self.tiles[y][x]):
+                    items.extend([RESOURCES[index]] * count)
+                tiles.append(" ".join(items))
+        return "[" + ",".join(tiles) + "]"
+
+    def inventory(self, player: SimPlayer) -> str:
+        """Réponse à Inventory.
+
+        Args:
+            player (SimPlayer): Joueur concerné
+
+        Returns:
+            str: Inventaire au format du serveur
+        """
+        return "[" + ", ".join(f"{name} {count}" for name, count in zip(RESOURCES, player.inventory)) + "]"
+
+    def take(self, player: SimPlayer, name: str) -> bool:
+        """Ramasse un objet sur la case du joueur."""
+        if name not in RESOURCES:
+            return False
+        index = RESOURCES.index(name)
+        tile = self.tiles[player.y][player.x]
+        if tile[index] <= 0:
+            return False
+        tile[index] -= 1
+        self.totals[index] -= 1
+        player.inventory[index] += 1
+        return True
+
+    def set(self, player: SimPlayer, name: str) -> bool:
+        """Pose un objet de l'inventaire sur la case du joueur."""
+        if name not in RESOURCES:
+            return False
+        index = RESOURCES.index(name)
+        if player.inventory[index] <= 0:
+            return False
+        player.inventory[index] -= 1
+        self.tiles[player.y][player.x][index] += 1
+        self.totals[index] += 1
+        return True
+
+    def direction(self, receiver: SimPlayer, x: int, y: int) -> int:
+        """Secteur (0-8) d'où provient un son émis en (x, y).
+
+        Le plus court chemin sur le tore est utilisé ; 1 est devant le
+        receveur et les secteurs tournent dans le sens trigonométrique.
+
+        Args:
+            receiver (SimPlayer): Joueur qui reçoit
+            x (int): Position X de la source
+            y (int): Position Y de la source
+
+        Returns:
+            int: Secteur, 0 si la source est sur la case du receveur
+        """
+        dx = (x - receiver.x) % self.width
+        dy = (y - receiver.y) % self.height
+        if dx > self.width / 2:
+            dx -= self.width
+        if dy > self.height / 2:
+            dy -= self.height
+        if dx == 0 and dy == 0:
+            return 0
+        if receiver.orientation == 0:
+            right, front = dx, -dy
+        elif receiver.orientation == 1:
+            right, front = dy, dx
+        elif receiver.orientation == 2:
+            right, front = -dx, dy
+        else:
+            right, front = -dy, -dx
+        angle = math.degrees(math.atan2(-right, front)) % 360
+        return int(((angle + 22.5) % 360) // 45) + 1
+
+    def eject(self, player: SimPlayer) -> List[Tuple[SimPlayer, int]]:
+        """Pousse les autres joueurs de la case et détruit les œufs.
+
+        Args:
+            player (SimPlayer): Joueur qui éjecte
+
+        Returns:
+            List[Tuple[SimPlayer, int]]: Joueurs poussés et direction d'arrivée
+        """
+        dx, dy = self.DELTAS[player.orientation]
+        pushed = []
+        for other in list(self.occupants.get((player.x, player.y), [])):
+            if other is player:
+                continue
+            self._move(other, other.x + dx, other.y + dy)
+            pushed.append((other, self.direction(other, player.x, player.y)))
+        for team, eggs in self.eggs.items():
+            kept = [egg for egg in eggs if egg != (player.x, player.y)]
+            self.slots[team] -= len(eggs) - len(kept)
+            self.eggs[team] = kept
+        return pushed
+
+    def fork(self, player: SimPlayer) -> None:
+        """Pond un œuf qui ouvre une place dans l'équipe."""
+        self.eggs[player.team].append((player.x, player.y))
+        self.slots[player.team] += 1
+
+    def ritual_participants(self, x: int, y: int, level: int) -> Optional[List[SimPlayer]]:
+        """Vérifie les conditions d'élévation sur une case.
+
+        Args:
+            x (int): Position X
+            y (int): Position Y
+            level (int): Niveau des participants
+
+        Returns:
+            Optional[List[SimPlayer]]: Participants, ou None si les conditions manquent
+        """
+        if level not in ELEVATION_REQUIREMENTS:
+            return None
+        players_needed, stones = ELEVATION_REQUIREMENTS[level]
+        participants = [p for p in self.occupants.get((x, y), []) if p.level == level]
+        if len(participants) < players_needed:
+            return None
+        tile = self.tiles[y][x]
+        if any(tile[index] < count for index, count in enumerate(stones)):
+            return None
+        return participants
+
+    def complete_ritual(self, x: int, y: int, level: int, participants: List[SimPlayer]) -> bool:
+        """Termine un rituel : consomme les pierres et élève les participants.
+
+        Args:
+            x (int): Position X
+            y (int): Position Y
+            level (int): Niveau de départ
+            participants (List[SimPlayer]): Joueurs engagés au départ
+
+        Returns:
+            bool: True si l'élévation a eu lieu
+        """
+        present = self.ritual_participants(x, y, level)
+        if present is None:
+            return False
+        _, stones = ELEVATION_REQUIREMENTS[level]
+        for index, count in enumerate(stones):
+            self.tiles[y][x][index] -= count
+            self.totals[index] -= count
+        for player in participants:
+            if player in present:
+                player.level += 1
+        return True
+
+    def winner(self) -> Optional[str]:
+        """Équipe ayant six joueurs au niveau 8, s'il y en a une.
+
+        Returns:
+            Optional[str]: Nom de l'équipe gagnante
+        """
+        for team in self.slots:
+            if sum(1 for p in self.players.values() if p.team == team and p.level >= 8) >= 6:
+                return team
+        return None
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ai import AI
+from core.protocol import ZappyProtocol
+from core.clock import ServerClock
+from models.player import Player
+from models.map import Map
+from models.playerCommunicator import PlayerCommunicator
+
+
+class TestAI(unittest.TestCase):
+    """Tests unitaires pour AI."""
+
+    def setUp(self):
+        """Construit une IA sur un protocole factice et une horloge virtuelle à 1 tick par seconde."""
+        self.now = [1000.0]
+        self.protocol = Mock(spec=ZappyProtocol)
+        self.protocol.client = Mock()
+        self.protocol.client.clock = ServerClock(frequency=1.0, time_source=lambda: self.now[0])
+        self.player = Player(1, "team", 5, 5, self.protocol, Mock())
+        self.map = Map(10, 10)
+        self.ai = AI(self.protocol, self.player, self.map, Mock())
+        self.ai.communicator = Mock(spec=PlayerCommunicator)
+
+    def test_ritual_call_rate_limited(self):
+        """Test de l'appel au rituel limité par une échéance en ticks, sans attente."""
+        with patch('time.sleep', side_effect=AssertionError("attente réelle")):
+            self.assertTrue(asyncio.run(self.ai._call_for_ritual(2)))
+            self.now[0] += self.ai.RITUAL_CALL_TICKS - 1
+            self.assertFalse(asyncio.run(self.ai._call_for_ritual(2)))
+            self.now[0] += 1
+            self.assertTrue(asyncio.run(self.ai._call_for_ritual(2)))
+
+        self.assertEqual(self.ai.communicator.send_team_message.call_count, 2)
+
+    def test_elevation_call_rate_limited(self):
+        """Test d'un seul appel au rituel quand l'élévation manque de joueurs."""
+        self.player.level = 2
+        
+        self.assertTrue(asyncio.run(self.ai._handle_elevation()))
+        
+        self.assertEqual(self.ai.state, "AWAITING_PARTICIPANTS")
+        self.assertEqual(self.ai.communicator.send_team_message.call_count, 1)
+
+    def test_ritual_consumes_stones_on_map(self):
+        """Test du retrait des pierres du rituel de la case du joueur."""
+        tile = self.map.get_tile(5, 5)
+        tile.resources['linemate'] = 2
+        
+        self.assertTrue(self.ai.handle_server_message("Current level: 2"))
+        
+        self.assertEqual(self.map.get_tile(5, 5).resources['linemate'], 1)
+        self.assertEqual(self.player.level, 2)
+
+    def test_team_message_handled_once_from_server_message(self):
+        """Test d'un broadcast d'équipe traité par handle_server_message, qui annule le trajet."""
+        self.player.level = 2
+        self.ai.communicator = PlayerCommunicator(self.protocol, self.player, Mock())
+        self.ai.movement_manager.executor.start(9, 9)
+        
+        self.assertTrue(self.ai.handle_server_message("message 3, team:RITUAL_LVL3_START:4,4"))
+        
+        self.assertEqual(self.ai.state, "JOINING_RITUAL")
+        self.assertEqual(self.ai.ritual_target, (4, 4))
+        self.assertFalse(self.ai.movement_manager.executor.active)
+
+    def test_gathering_route_walks_one_leg_per_tick(self):
+        """Test d'une tournée avancée d'une branche par tour, ramassée à l'arrivée."""
+        self.protocol.pipeline.side_effect = lambda commands: [True] * len(commands)
+        self.ai.elevation_manager.get_resource_deficit = Mock(return_value={'linemate': 1})
+        self.ai.gathering_deficit = {'linemate': 1}
+        self.ai.gathering_route = [(7, 3, {'linemate': 1})]
+        
+        self.assertTrue(asyncio.run(self.ai._follow_gathering_route()))
+        
+        self.assertTrue(self.ai.movement_manager.executor.active)
+        self.protocol.pipeline.assert_called_once_with(["Forward", "Forward"])
+        
+        asyncio.run(self.ai._advance_movement())
+        
+        self.assertEqual(self.player.get_position(), (7, 3))
+        self.protocol.pipeline.assert_called_with(["Take linemate"])
+        self.assertEqual(self.ai.inventory_manager.inventory['linemate'], 1)
+        self.assertEqual(self.ai.gathering_route, [])
+
+    def test_joining_ritual_checks_elevation_on_arrival(self):
+        """Test de l'arrivée au rituel traitée par le trajet pas à pas."""
+        self.protocol.pipeline.side_effect = lambda commands: [True] * len(commands)
+        self.ai.state = "JOINING_RITUAL"
+        
+        self.assertTrue(asyncio.run(self.ai._walk_to(5, 3, "ritual")))
+        
+        self.assertEqual(self.player.get_position(), (5, 3))
+        self.assertEqual(self.ai.state, "AWAITING_PARTICIPANTS")
+        
+        self.ai.state = "JOINING_RITUAL"
+        self.protocol.pipeline.side_effect = lambda commands: [False] * len(commands)
+        asyncio.run(self.ai._walk_to(9, 9, "ritual"))
+        
+        self.assertEqual(self.ai.state, "NORMAL_OPERATIONS")
+
+    def test_emergency_keeps_food_walk(self):
+        """Test d'un trajet vers la nourriture poursuivi en urgence, contrairement à l'exploration."""
+        self.protocol.pipeline.side_effect = lambda commands: [True] * len(commands)
+        self.protocol.look.return_value = "[player]"
+        self.protocol.inventory.return_value = "[food 0]"
+        executor = self.ai.movement_manager.executor
+        executor.start(7, 3, purpose="survival")
+        
+        asyncio.run(self.ai.update())
+        
+        self.assertEqual(executor.purpose, "survival")
+        self.assertNotEqual(executor.status, executor.CANCELLED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.async_client import AsyncZappyClient
+from core.async_protocol import AsyncZappyProtocol
+from async_agent import AsyncAgent
+
+class FakeServer:
+    """Serveur minimal répondant aux commandes selon une table fixe."""
+
+    def __init__(self, replies, events=None):
+        self.replies = replies
+        self.events = events or {}
+        self.received = []
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader, writer):
+        writer.write(b"WELCOME\n")
+        await reader.readline()
+        writer.write(b"3\n10 8\n")
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode().strip()
+            self.received.append(command)
+            if command in self.events:
+                writer.write(self.events[command].encode())
+            writer.write(f"{self.replies.get(command, 'ko')}\n".encode())
+            await writer.drain()
+        writer.close()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+class TestAsyncZappyClient(unittest.IsolatedAsyncioTestCase):
+    """Tests unitaires pour AsyncZappyClient et AsyncZappyProtocol."""
+
+    async def asyncSetUp(self):
+        """Démarre un serveur local et connecte un client."""
+        self.server = FakeServer(
+            {"Forward": "ok", "Look": "[player, food]", "Inventory": "[food 9]", "Connect_nbr": "2"},
+            {"Look": "message 4, team:HELLO:\n"}
+        )
+        port = await self.server.start()
+        self.client = AsyncZappyClient("127.0.0.1", port, "team")
+        await self.client.connect()
+        self.protocol = AsyncZappyProtocol(self.client)
+
+    async def asyncTearDown(self):
+        """Ferme le client et le serveur."""
+        await self.client.close()
+        await self.server.stop()
+
+    async def test_connect_handshake(self):
+        """Test du protocole d'authentification."""
+        self.assertEqual(self.client.client_num, 3)
+        self.assertEqual(self.client.map_size, (10, 8))
+        self.assertTrue(self.client.is_connected())
+
+    async def test_commands(self):
+        """Test des commandes awaitables."""
+        self.assertTrue(await self.protocol.forward())
+        self.assertFalse(await self.protocol.take("food"))
+        self.assertEqual(await self.protocol.inventory(), "[food 9]")
+        self.assertEqual(await self.protocol.connect_nbr(), 2)
+
+    async def test_events_separated_from_replies(self):
+        """Test de la séparation des événements et des réponses."""
+        result = await self.protocol.look()
+        
+        self.assertEqual(result, "[player, food]")
+        self.assertEqual(self.client.poll_event(), "message 4, team:HELLO:")
+        self.assertIsNone(self.client.poll_event())
+
+    async def test_pipeline_order(self):
+        """Test de l'ordre des résultats d'une rafale."""
+        result = await self.protocol.pipeline(["Forward", "Set food", "Inventory", "Forward"])
+        
+        self.assertEqual(result, [True, False, "[food 9]", True])
+        self.assertEqual(self.server.received, ["Forward", "Set food", "Inventory", "Forward"])
+
+    async def test_events_iterator_ends_on_close(self):
+        """Test de l'itérateur d'événements jusqu'à la déconnexion."""
+        await self.protocol.look()
+        await self.client.close()
+        
+        events = [event async for event in self.client.events()]
+        
+        self.assertEqual(events, ["message 4, team:HELLO:"])
+
+    async def test_agent_tick_awaits_protocol(self):
+        """Test d'un tick de l'IA attendu sur la boucle, sans thread de travail."""
+        agent = AsyncAgent("127.0.0.1", self.client.port, "team")
+        await agent.start()
+        loop = asyncio.get_running_loop()
+        
+        with patch.object(loop, 'run_in_executor', side_effect=AssertionError("thread de travail")):
+            self.assertTrue(await agent.update())
+        
+        self.assertIsInstance(agent.protocol, AsyncZappyProtocol)
+        self.assertIn("Look", self.server.received)
+        self.assertIn("Inventory", self.server.received)
+        await agent.client.close()
+
+if __name__ == '__main__':
+    unittest.main()
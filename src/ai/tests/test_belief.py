@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import numpy as np
+from unittest.mock import Mock
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.belief import BeliefMap, DENSITY
+from models.map import Map, RESOURCE_INDEX
+from core.clock import ServerClock
+from managers.inventory_manager import InventoryManager
+
+FOOD = RESOURCE_INDEX['food']
+LINEMATE = RESOURCE_INDEX['linemate']
+
+
+class TestBeliefMap(unittest.TestCase):
+    """Tests unitaires pour BeliefMap."""
+
+    def setUp(self):
+        """Prépare une carte 20x20 et une horloge virtuelle à 1 tick par seconde."""
+        self.now = [1000.0]
+        self.clock = ServerClock(frequency=1.0, time_source=lambda: self.now[0])
+        self.map = Map(20, 20)
+        self.belief = BeliefMap(self.map, self.clock)
+
+    def _see(self, x, y, food):
+        """Observe une case avec `food` unités de nourriture à l'instant courant."""
+        counts = np.zeros((1, 7))
+        counts[0, FOOD] = food
+        self.belief.observe([x], [y], counts, self.now[0])
+        self.map.update_tiles([x], [y], counts, self.now[0])
+
+    def test_prior_equilibrium(self):
+        """Test de l'équilibre a priori égal aux densités du sujet."""
+        np.testing.assert_allclose(self.belief.equilibrium, DENSITY)
+
+    def test_unexplored_expects_equilibrium(self):
+        """Test d'une case jamais vue : compte attendu à l'équilibre, confiance nulle."""
+        self.assertAlmostEqual(self.belief.expected('food')[3, 3], 0.5)
+        self.assertEqual(self.belief.confidence('food')[3, 3], 0.0)
+
+    def test_expected_decays_with_age(self):
+        """Test de la décroissance du compte vu vers l'équilibre."""
+        self._see(3, 3, 4)
+
+        self.assertAlmostEqual(self.belief.expected('food')[3, 3], 4.0)
+        self.now[0] += 1000
+        decay = np.exp(-1.0)
+        self.assertAlmostEqual(self.belief.confidence('food')[3, 3], decay)
+        self.assertAlmostEqual(self.belief.expected('food')[3, 3], 4 * decay + 0.5 * (1 - decay))
+        self.assertEqual(self.belief.expected().shape, (20, 20, 7))
+
+    def test_observe_learns_respawn(self):
+        """Test de l'apprentissage du taux de réapparition sur une case vue vide."""
+        self._see(3, 3, 0)
+        self.now[0] += 100
+        self._see(3, 3, 3)
+
+        self.assertAlmostEqual(self.belief.respawn_rate[FOOD], (2.5 + 3) / 5100)
+        self.assertAlmostEqual(self.belief.depletion_rate[FOOD], 0.001)
+
+    def test_observe_learns_depletion(self):
+        """Test de l'apprentissage du taux de disparition sur une case vidée."""
+        self._see(3, 3, 2)
+        self.now[0] += 100
+        self._see(3, 3, 0)
+
+        self.assertAlmostEqual(self.belief.depletion_rate[FOOD], 7 / 5200)
+        self.assertAlmostEqual(self.belief.respawn_rate[FOOD], 0.0005)
+
+    def test_own_actions_not_learned(self):
+        """Test d'un Take et d'un Set du joueur, reportés dans la carte et absents de ρ et δ."""
+        self._see(3, 3, 2)
+        player = Mock()
+        player.get_position.return_value = (3, 3)
+        inventory = InventoryManager(Mock(), player, Mock(), map=self.map)
+        depletion = self.belief.depletion_events.copy()
+        respawn = self.belief.respawn_events.copy()
+
+        inventory.record_take('food')
+        inventory.record_drop('linemate')
+        self.now[0] += 100
+        counts = np.zeros((1, 7))
+        counts[0, FOOD] = 1
+        counts[0, LINEMATE] = 1
+        self.belief.observe([3], [3], counts, self.now[0])
+
+        np.testing.assert_array_equal(self.belief.depletion_events, depletion)
+        np.testing.assert_array_equal(self.belief.respawn_events, respawn)
+
+    def test_observe_ignores_new_tiles(self):
+        """Test sans apprentissage sur une première observation."""
+        self._see(3, 3, 5)
+
+        np.testing.assert_allclose(self.belief.equilibrium, DENSITY)
+
+    def test_rank_by_yield_per_distance(self):
+        """Test du classement par rendement attendu par case parcourue."""
+        self._see(6, 5, 1)
+        self._see(8, 5, 3)
+        self._see(5, 5, 0)
+
+        ranked = self.belief.rank('food', 5, 5, k=3)
+
+        self.assertEqual(ranked, [(8, 5, 0.75), (6, 5, 0.5)])
+
+    def test_rank_max_distance(self):
+        """Test de la distance maximale, mesurée sur le tore."""
+        self._see(6, 5, 1)
+        self._see(8, 5, 3)
+        self._see(19, 5, 1)
+
+        ranked = self.belief.rank('food', 0, 5, k=3, max_distance=2)
+
+        self.assertEqual([tile[:2] for tile in ranked], [(19, 5)])
+
+    def test_rank_unknown_tiles(self):
+        """Test des cases jamais vues, ignorées sauf demande contraire."""
+        self.assertEqual(self.belief.rank('food', 15, 15), [])
+        self.assertEqual(self.belief.rank('food', 15, 15, known_only=False), [(15, 15, 0.5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
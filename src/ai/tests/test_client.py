@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import sys
 import os
 import socket
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from core.client import ZappyClient
+from core.client import ZappyClient, run_blocking
 
 class TestZappyClient(unittest.TestCase):
     """Tests unitaires pour ZappyClient."""
@@ -124,19 +125,37 @@ class TestZappyClient(unittest.TestCase):
         """Test de la récupération du timeout pour Forward."""
         result = self.client._get_timeout("Forward")
         
-        self.assertEqual(result, 7.0)
+        self.assertEqual(result, 14.0)
 
     def test_get_timeout_inventory(self):
         """Test de la récupération du timeout pour Inventory."""
         result = self.client._get_timeout("Inventory")
         
-        self.assertEqual(result, 1.0)
+        self.assertEqual(result, 2.0)
 
     def test_get_timeout_unknown(self):
         """Test de la récupération du timeout pour une commande inconnue."""
         result = self.client._get_timeout("Unknown")
         
-        self.assertEqual(result, 7.0)
+        self.assertEqual(result, 14.0)
+
+    def test_get_timeout_follows_frequency(self):
+        """Test du timeout mis à l'échelle par la fréquence estimée."""
+        self.client.clock.observe("Forward", 0.7)
+        
+        self.assertEqual(self.client._get_timeout("Forward"), 1.4)
+        self.assertEqual(self.client._get_timeout("Inventory"), 1.0)
+
+    def test_replies_calibrate_clock(self):
+        """Test de l'estimation de la fréquence à partir des réponses."""
+        self.client.socket = Mock()
+        self.client.socket.recv.side_effect = [b"ok\n"]
+        
+        with patch('time.monotonic', side_effect=[10.0, 10.07]):
+            self.client._send("Forward\n")
+            self.client._receive()
+        
+        self.assertAlmostEqual(self.client.clock.frequency, 100.0)
 
     def test_send_success(self):
         """Test de l'envoi réussi."""
@@ -188,6 +207,25 @@ class TestZappyClient(unittest.TestCase):
         
         self.assertEqual(result, "test response")
 
+    def test_receive_coalesced_lines(self):
+        """Test de deux réponses reçues dans un même paquet."""
+        self.client.socket = Mock()
+        self.client.socket.recv.side_effect = [b"ok\nko\n"]
+        
+        self.assertEqual(self.client._receive(), "ok")
+        self.assertEqual(self.client._receive(), "ko")
+        self.client.socket.recv.assert_called_once()
+
+    def test_receive_split_line(self):
+        """Test d'une réponse coupée entre deux paquets."""
+        self.client.socket = Mock()
+        self.client.socket.recv.side_effect = [b"[player, fo", b"od]\n"]
+        
+        result = self.client._receive()
+        
+        self.assertEqual(result, "[player, food]")
+        self.assertEqual(self.client.socket.recv.call_count, 2)
+
     def test_receive_no_socket(self):
         """Test de la réception sans socket."""
         self.client.socket = None
@@ -242,6 +280,20 @@ class TestZappyClient(unittest.TestCase):
         
         self.assertFalse(result)
 
+    def test_run_drives_update_without_loop(self):
+        """Test d'un tick de l'IA mené à son terme sans boucle asyncio."""
+        self.client.is_connected = Mock(return_value=True)
+        self.client.ai = Mock()
+        self.client.ai.update = AsyncMock(return_value=True)
+        
+        self.assertTrue(self.client.run())
+        self.client.ai.update.assert_awaited_once()
+
+    def test_run_blocking_rejects_suspension(self):
+        """Test du refus d'une coroutine qui attend une réponse asynchrone."""
+        with self.assertRaises(RuntimeError):
+            run_blocking(asyncio.sleep(0))
+
     def test_close_no_socket(self):
         """Test de la fermeture sans socket."""
         self.client.socket = None
@@ -257,6 +309,48 @@ class TestZappyClient(unittest.TestCase):
         
         self.assertEqual(result, "test message")
 
+    def test_check_for_messages_uses_buffer(self):
+        """Test de la lecture d'un message déjà présent dans le tampon."""
+        self.client.socket = Mock()
+        self.client.socket.recv.side_effect = [b"ok\nmessage 2, hello\n"]
+        
+        self.assertEqual(self.client._receive(), "ok")
+        result = self.client.check_for_messages()
+        
+        self.assertEqual(result, "message 2, hello")
+        self.client.socket.recv.assert_called_once()
+
+    def test_check_for_messages_partial_line(self):
+        """Test d'un message incomplet conservé pour plus tard."""
+        self.client.socket = Mock()
+        self.client.socket.recv.return_value = b"message 2, hel"
+        
+        result = self.client.check_for_messages()
+        
+        self.assertIsNone(result)
+        self.assertEqual(len(self.client.reader), len(b"message 2, hel"))
+
+    def test_receive_skips_interleaved_events(self):
+        """Test d'un broadcast reçu avant la réponse attendue."""
+        self.client.socket = Mock()
+        self.client.socket.recv.side_effect = [b"message 1, team:HELLO:\neject: 2\nok\n"]
+        self.client._send("Forward\n")
+        
+        result = self.client._receive()
+        
+        self.assertEqual(result, "ok")
+        self.assertEqual(self.client.check_for_messages(), "message 1, team:HELLO:")
+        self.assertEqual(self.client.check_for_messages(), "eject: 2")
+
+    def test_check_for_messages_keeps_pending_reply(self):
+        """Test d'une réponse lue pendant une vérification de messages."""
+        self.client.socket = Mock()
+        self.client.socket.recv.side_effect = [b"ok\nmessage 5, hi\n"]
+        self.client._send("Forward\n")
+        
+        self.assertEqual(self.client.check_for_messages(), "message 5, hi")
+        self.assertEqual(self.client._receive(), "ok")
+
     def test_check_for_messages_no_data(self):
         """Test de la vérification de messages sans données."""
         self.client.socket = Mock()
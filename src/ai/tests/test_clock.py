@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.clock import ServerClock
+
+class TestServerClock(unittest.TestCase):
+    """Tests unitaires pour ServerClock."""
+
+    def setUp(self):
+        """Initialise une horloge non calibrée pour chaque test."""
+        self.clock = ServerClock()
+
+    def test_init(self):
+        """Test de l'initialisation de l'horloge."""
+        self.assertEqual(self.clock.frequency, ServerClock.DEFAULT_FREQUENCY)
+        self.assertFalse(self.clock.is_calibrated())
+
+    def test_cost(self):
+        """Test du coût des commandes en ticks."""
+        self.assertEqual(self.clock.cost("Forward"), 7)
+        self.assertEqual(self.clock.cost("Take food"), 7)
+        self.assertEqual(self.clock.cost("Inventory"), 1)
+        self.assertEqual(self.clock.cost("Fork"), 42)
+        self.assertEqual(self.clock.cost("Unknown"), ServerClock.DEFAULT_COST)
+
+    def test_conversions(self):
+        """Test des conversions entre ticks et secondes."""
+        clock = ServerClock(frequency=50)
+        
+        self.assertAlmostEqual(clock.seconds(100), 2.0)
+        self.assertAlmostEqual(clock.ticks(2.0), 100)
+
+    def test_estimate_from_sequential_replies(self):
+        """Test de l'estimation sur des commandes envoyées une à une."""
+        self.clock.on_send("Forward", at=0.0)
+        self.clock.on_reply(at=0.07)
+        self.clock.on_send("Inventory", at=1.0)
+        self.clock.on_reply(at=1.01)
+        
+        self.assertTrue(self.clock.is_calibrated())
+        self.assertAlmostEqual(self.clock.frequency, 100.0)
+
+    def test_estimate_from_pipelined_replies(self):
+        """Test de l'estimation sur une rafale : le service commence à la réponse précédente."""
+        for _ in range(3):
+            self.clock.on_send("Forward", at=0.0)
+        for at in (0.35, 0.70, 1.05):
+            self.clock.on_reply(at=at)
+        
+        self.assertAlmostEqual(self.clock.frequency, 20.0)
+
+    def test_untimed_and_handshake_ignored(self):
+        """Test des commandes dont la latence ne dit rien de la fréquence."""
+        self.clock.on_send("team1\n", at=0.0)
+        self.clock.on_send("Incantation", at=0.0)
+        self.clock.on_reply(at=0.5)
+        self.clock.on_send("Connect_nbr", at=1.0)
+        self.clock.on_reply(at=1.5)
+        
+        self.assertFalse(self.clock.is_calibrated())
+        self.assertEqual(len(self.clock.in_flight), 0)
+
+    def test_outlier_rejected(self):
+        """Test d'un échantillon gonflé par un gel du joueur."""
+        for _ in range(4):
+            self.clock.observe("Forward", 0.07)
+        self.clock.observe("Forward", 30.0)
+        
+        self.assertAlmostEqual(self.clock.frequency, 100.0)
+
+    def test_elapsed_ticks(self):
+        """Test du nombre de ticks écoulés."""
+        clock = ServerClock(frequency=100)
+        with patch('time.time', return_value=1000.5):
+            self.assertAlmostEqual(clock.elapsed_ticks(1000.0), 50)
+
+    def test_timeout(self):
+        """Test du timeout en secondes selon la fréquence."""
+        self.assertEqual(self.clock.timeout("Fork"), 84.0)
+        self.clock.observe("Forward", 0.07)
+        self.assertEqual(self.clock.timeout("Forward"), ServerClock.MIN_TIMEOUT)
+
+    def test_of_shares_client_clock(self):
+        """Test du partage de l'horloge du client."""
+        protocol = Mock()
+        protocol.client.clock = self.clock
+        
+        self.assertIs(ServerClock.of(protocol), self.clock)
+        self.assertIsInstance(ServerClock.of(Mock()), ServerClock)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import logging
 import sys
 import os
@@ -69,7 +70,7 @@ class TestCollisionManager(unittest.TestCase):
         self.vision_manager_mock.vision_data = [['player', 'player']]
         self.protocol_mock.eject.return_value = True
         
-        result = self.collision_manager.eject_other_players()
+        result = asyncio.run(self.collision_manager.eject_other_players())
         
         self.assertTrue(result)
         self.protocol_mock.eject.assert_called_once()
@@ -79,7 +80,7 @@ class TestCollisionManager(unittest.TestCase):
         self.vision_manager_mock.vision_data = [['player', 'player']]
         self.protocol_mock.eject.return_value = False
         
-        result = self.collision_manager.eject_other_players()
+        result = asyncio.run(self.collision_manager.eject_other_players())
         
         self.assertFalse(result)
 
@@ -87,7 +88,7 @@ class TestCollisionManager(unittest.TestCase):
         """Test de l'éjection sans autres joueurs."""
         self.vision_manager_mock.vision_data = [['player']]
         
-        result = self.collision_manager.eject_other_players()
+        result = asyncio.run(self.collision_manager.eject_other_players())
         
         self.assertTrue(result)
         self.protocol_mock.eject.assert_not_called()
@@ -96,7 +97,7 @@ class TestCollisionManager(unittest.TestCase):
         """Test de l'éjection avec vision vide."""
         self.vision_manager_mock.vision_data = []
         
-        result = self.collision_manager.eject_other_players()
+        result = asyncio.run(self.collision_manager.eject_other_players())
         
         self.assertFalse(result)
 
@@ -108,7 +109,7 @@ class TestCollisionManager(unittest.TestCase):
         self.movement_manager_mock.turn_right.return_value = True
         self.movement_manager_mock.move_forward.return_value = True
         
-        result = self.collision_manager.avoid_collision()
+        result = asyncio.run(self.collision_manager.avoid_collision())
         
         self.assertTrue(result)
 
@@ -116,7 +117,7 @@ class TestCollisionManager(unittest.TestCase):
         """Test de l'évitement de collision sans joueurs."""
         self.vision_manager_mock.get_players_in_vision.return_value = []
         
-        result = self.collision_manager.avoid_collision()
+        result = asyncio.run(self.collision_manager.avoid_collision())
         
         self.assertFalse(result)
 
@@ -128,7 +129,7 @@ class TestCollisionManager(unittest.TestCase):
         self.movement_manager_mock.turn_right.return_value = True
         self.movement_manager_mock.move_forward.return_value = False
         
-        result = self.collision_manager.avoid_collision()
+        result = asyncio.run(self.collision_manager.avoid_collision())
         
         self.assertFalse(result)
 
@@ -158,7 +159,7 @@ class TestCollisionManager(unittest.TestCase):
         """Test de la gestion de collision sans collision."""
         self.collision_manager.check_collision = Mock(return_value=False)
         
-        result = self.collision_manager.handle_collision()
+        result = asyncio.run(self.collision_manager.handle_collision())
         
         self.assertTrue(result)
         self.assertEqual(self.collision_manager.escape_attempts, 0)
@@ -166,9 +167,9 @@ class TestCollisionManager(unittest.TestCase):
     def test_handle_collision_avoided(self):
         """Test de la gestion de collision évitée."""
         self.collision_manager.check_collision = Mock(return_value=True)
-        self.collision_manager.avoid_collision = Mock(return_value=True)
+        self.collision_manager.avoid_collision = AsyncMock(return_value=True)
         
-        result = self.collision_manager.handle_collision()
+        result = asyncio.run(self.collision_manager.handle_collision())
         
         self.assertTrue(result)
         self.assertEqual(self.collision_manager.escape_attempts, 0)
@@ -176,10 +177,10 @@ class TestCollisionManager(unittest.TestCase):
     def test_handle_collision_not_avoided(self):
         """Test de la gestion de collision non évitée."""
         self.collision_manager.check_collision = Mock(return_value=True)
-        self.collision_manager.avoid_collision = Mock(return_value=False)
+        self.collision_manager.avoid_collision = AsyncMock(return_value=False)
         initial_attempts = self.collision_manager.escape_attempts
         
-        result = self.collision_manager.handle_collision()
+        result = asyncio.run(self.collision_manager.handle_collision())
         
         self.assertFalse(result)
         self.assertEqual(self.collision_manager.escape_attempts, initial_attempts + 1)
@@ -236,7 +237,7 @@ class TestCollisionManager(unittest.TestCase):
         self.vision_manager_mock.vision_data = [['player', 'player']]
         self.protocol_mock.eject.side_effect = Exception("Test error")
         
-        result = self.collision_manager.eject_other_players()
+        result = asyncio.run(self.collision_manager.eject_other_players())
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -245,7 +246,7 @@ class TestCollisionManager(unittest.TestCase):
         """Test de l'évitement de collision avec exception."""
         self.vision_manager_mock.get_players_in_vision.side_effect = Exception("Test error")
         
-        result = self.collision_manager.avoid_collision()
+        result = asyncio.run(self.collision_manager.avoid_collision())
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
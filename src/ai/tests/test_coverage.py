@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.coverage import CoveragePlanner, look_spacing, lane_width
+from models import vision_cone
+
+
+class TestCoveragePlanner(unittest.TestCase):
+    """Tests unitaires pour le planificateur de balayage."""
+
+    def _observe(self, explored, waypoint, level):
+        """Marque les cases vues par un Look depuis un point du plan."""
+        x, y, heading = waypoint
+        offsets = vision_cone.offsets(level, heading)
+        height, width = explored.shape
+        explored[(y + offsets[:, 1]) % height, (x + offsets[:, 0]) % width] = True
+
+    def test_spacing_and_width(self):
+        """Test du pas entre Look et de la largeur de bande."""
+        self.assertEqual((look_spacing(1), lane_width(1)), (1, 3))
+        self.assertEqual((look_spacing(8), lane_width(8)), (2, 15))
+
+    def test_plan_covers_every_tile(self):
+        """Test de la couverture complète de la carte par le plan."""
+        for width, height, level in ((10, 10, 1), (17, 9, 2), (50, 50, 4), (7, 30, 8)):
+            planner = CoveragePlanner(width, height, level)
+            explored = np.zeros((height, width), dtype=bool)
+            for waypoint in planner.plan(3, 2, 1):
+                self._observe(explored, waypoint, level)
+            self.assertTrue(explored.all(), (width, height, level))
+
+    def test_plan_follows_orientation(self):
+        """Test du sens des voies selon l'orientation du joueur."""
+        planner = CoveragePlanner(12, 12)
+        self.assertEqual(planner.plan(0, 0, 3)[0], (11, 0, 3))
+        self.assertEqual(planner.plan(0, 0, 0)[0], (0, 11, 0))
+
+    def test_next_target_skips_explored(self):
+        """Test de l'abandon des points dont le cône est déjà exploré."""
+        planner = CoveragePlanner(10, 10)
+        explored = np.zeros((10, 10), dtype=bool)
+        first = planner.next_target(0, 0, 1, explored)
+        self.assertEqual(first, (1, 0, 1))
+        self._observe(explored, first, 1)
+        self._observe(explored, (2, 0, 1), 1)
+        self.assertEqual(planner.next_target(1, 0, 1, explored), (3, 0, 1))
+
+    def test_next_target_done(self):
+        """Test d'une carte entièrement explorée."""
+        planner = CoveragePlanner(5, 5)
+        self.assertIsNone(planner.next_target(0, 0, 1, np.ones((5, 5), dtype=bool)))
+        self.assertEqual(planner.remaining(), 0)
+
+    def test_replan_on_level_change(self):
+        """Test du nouveau plan quand le niveau augmente."""
+        planner = CoveragePlanner(40, 40)
+        before = len(planner.plan(0, 0, 1))
+        planner.set_level(3, 0, 0, 1)
+        self.assertLess(planner.remaining(), before)
+        planner.set_level(3, 5, 5, 1)
+        self.assertEqual(planner.waypoints[0], (1, 0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.dispatcher import EventDispatcher
+
+class TestEventDispatcher(unittest.TestCase):
+    """Tests unitaires pour EventDispatcher."""
+
+    def setUp(self):
+        """Initialise un dispatcher vide pour chaque test."""
+        self.dispatcher = EventDispatcher()
+
+    def test_classify_events(self):
+        """Test de la classification des messages asynchrones."""
+        self.assertEqual(self.dispatcher.classify("message 3, hello"), EventDispatcher.MESSAGE)
+        self.assertEqual(self.dispatcher.classify("eject: 2"), EventDispatcher.EJECT)
+        self.assertEqual(self.dispatcher.classify("Current level: 3"), EventDispatcher.LEVEL)
+        self.assertEqual(self.dispatcher.classify("dead"), EventDispatcher.DEAD)
+        self.assertIsNone(self.dispatcher.classify("ok"))
+        self.assertIsNone(self.dispatcher.classify("[player, food]"))
+
+    def test_reply_routed_to_pending_command(self):
+        """Test du routage d'une réponse vers la commande en attente."""
+        self.dispatcher.expect("Forward\n")
+        
+        self.assertIsNone(self.dispatcher.route("message 1, hi"))
+        self.assertEqual(self.dispatcher.route("ok"), "ok")
+        self.assertEqual(len(self.dispatcher.pending), 0)
+        self.assertEqual(self.dispatcher.pop(EventDispatcher.MESSAGE).line, "message 1, hi")
+
+    def test_unsolicited_line_without_pending(self):
+        """Test d'une ligne inattendue sans commande en attente."""
+        self.assertIsNone(self.dispatcher.route("ok"))
+        self.assertEqual(self.dispatcher.pop().kind, EventDispatcher.UNKNOWN)
+        self.assertEqual(self.dispatcher.route("ok", expecting_reply=True), "ok")
+
+    def test_incantation_reply_and_ritual_events(self):
+        """Test de la réponse d'incantation puis de l'échec du rituel."""
+        self.dispatcher.expect("Incantation")
+        
+        self.assertEqual(self.dispatcher.route("Elevation underway"), "Elevation underway")
+        self.assertTrue(self.dispatcher.in_ritual)
+        self.assertIsNone(self.dispatcher.route("ko"))
+        self.assertEqual(self.dispatcher.pop().kind, EventDispatcher.ELEVATION_FAILED)
+        self.assertFalse(self.dispatcher.in_ritual)
+
+    def test_elevation_started_by_other_player(self):
+        """Test d'un rituel lancé par un autre joueur sur notre case."""
+        self.dispatcher.expect("Look")
+        
+        self.assertIsNone(self.dispatcher.route("Elevation underway"))
+        self.assertIsNone(self.dispatcher.route("Current level: 2"))
+        self.assertEqual(self.dispatcher.route("[player]"), "[player]")
+        kinds = [event.kind for event in self.dispatcher.drain()]
+        self.assertEqual(kinds, [EventDispatcher.ELEVATION, EventDispatcher.LEVEL])
+
+    def test_subscribers_called(self):
+        """Test de l'appel des abonnés."""
+        callback = Mock()
+        self.dispatcher.subscribe(EventDispatcher.EJECT, callback)
+        
+        self.dispatcher.route("eject: 4")
+        self.dispatcher.unsubscribe(EventDispatcher.EJECT, callback)
+        self.dispatcher.route("eject: 1")
+        
+        callback.assert_called_once()
+        self.assertEqual(callback.call_args.args[0].line, "eject: 4")
+
+    def test_subscriber_error_does_not_break_routing(self):
+        """Test d'un abonné qui lève une exception."""
+        self.dispatcher.subscribe(EventDispatcher.MESSAGE, Mock(side_effect=ValueError("boom")))
+        
+        self.dispatcher.route("message 2, hi")
+        
+        self.assertTrue(self.dispatcher.has_events(EventDispatcher.MESSAGE))
+
+    def test_pop_in_arrival_order(self):
+        """Test de l'ordre d'arrivée entre plusieurs types."""
+        self.dispatcher.route("eject: 1")
+        self.dispatcher.route("message 2, a")
+        self.dispatcher.route("eject: 3")
+        
+        lines = [event.line for event in self.dispatcher.drain()]
+        
+        self.assertEqual(lines, ["eject: 1", "message 2, a", "eject: 3"])
+        self.assertFalse(self.dispatcher.has_events())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.distance_field import DistanceFields, UNREACHABLE
+from models import geometry
+
+
+class TestDistanceFields(unittest.TestCase):
+    """Tests unitaires pour DistanceFields."""
+
+    def setUp(self):
+        """Prépare des champs vides sur une carte 10x8."""
+        self.fields = DistanceFields(10, 8, ("food", "sibur"))
+
+    def _expected(self, sources):
+        """Champ de référence : distance torique minimale aux sources."""
+        return np.min([geometry.distances_from(x, y, 10, 8) for x, y in sources], axis=0)
+
+    def test_empty_field(self):
+        """Test d'un champ sans source connue."""
+        self.assertIsNone(self.fields.distance("food", 3, 3))
+        self.assertTrue((self.fields.field("food") == UNREACHABLE).all())
+        self.assertIsNone(self.fields.step("food", 3, 3))
+        self.assertIsNone(self.fields.nearest("food", 3, 3))
+
+    def test_fields_built_on_demand(self):
+        """Test d'un champ construit à sa première consultation seulement."""
+        self.fields.set_present("food", 1, 1, True)
+        self.fields.set_present("sibur", 2, 2, True)
+        self.fields.set_present("sibur", 2, 2, False)
+
+        self.assertEqual(self.fields.rebuilds, 0)
+        self.assertEqual(self.fields.distance("food", 1, 3), 2)
+        self.assertEqual(self.fields.rebuilds, 1)
+        self.assertNotIn("sibur", self.fields._fields)
+
+    def test_add_sources_incrementally(self):
+        """Test de la fusion immédiate des sources ajoutées."""
+        self.fields.set_present("food", 1, 1, True)
+        self.fields.field("food")
+        self.fields.set_present("food", 8, 6, True)
+
+        np.testing.assert_array_equal(self.fields.field("food"), self._expected([(1, 1), (8, 6)]))
+        self.assertEqual(self.fields.distance("food", 9, 0), 3)
+        self.assertEqual(self.fields.rebuilds, 1)
+        self.assertIsNone(self.fields.distance("sibur", 1, 1))
+
+    def test_remove_source_repairs_locally(self):
+        """Test de la réparation locale après un retrait, sans parcours de toute la carte."""
+        for x, y in ((1, 1), (8, 6), (5, 2), (5, 3)):
+            self.fields.set_present("food", x, y, True)
+        self.fields.field("food")
+        self.fields.set_present("food", 5, 2, False)
+
+        np.testing.assert_array_equal(self.fields.field("food"), self._expected([(1, 1), (8, 6), (5, 3)]))
+        self.assertEqual(self.fields.rebuilds, 1)
+        self.assertLess(self.fields.repaired, 10 * 8 // 2)
+
+    def test_random_removals_match_reference(self):
+        """Test de champs réparés identiques au calcul de référence."""
+        rng = np.random.default_rng(4)
+        present = set()
+        self.fields.field("food")
+        for _ in range(200):
+            x, y = int(rng.integers(10)), int(rng.integers(8))
+            add = (x, y) not in present
+            self.fields.set_present("food", x, y, add)
+            if add:
+                present.add((x, y))
+            else:
+                present.discard((x, y))
+            if present:
+                np.testing.assert_array_equal(self.fields.field("food"), self._expected(sorted(present)))
+            else:
+                self.assertIsNone(self.fields.distance("food", x, y))
+        self.assertEqual(self.fields.rebuilds, 1)
+
+    def test_remove_last_source(self):
+        """Test du retrait de la dernière source."""
+        self.fields.set_present("food", 1, 1, True)
+        self.fields.set_present("food", 1, 1, False)
+
+        self.assertIsNone(self.fields.distance("food", 1, 1))
+
+    def test_step_prefers_facing(self):
+        """Test du pas de gradient, droit devant à distance égale."""
+        self.fields.set_present("food", 7, 2, True)
+
+        self.assertEqual(self.fields.step("food", 5, 5, orientation=0), (5, 4))
+        self.assertEqual(self.fields.step("food", 5, 5, orientation=1), (6, 5))
+        self.assertEqual(self.fields.step("food", 5, 5, orientation=2), (6, 5))
+        self.assertIsNone(self.fields.step("food", 7, 2))
+
+    def test_nearest_follows_gradient(self):
+        """Test de la source la plus proche, à travers les bords."""
+        self.fields.set_present("food", 9, 4, True)
+        self.fields.set_present("food", 4, 4, True)
+
+        self.assertEqual(self.fields.nearest("food", 1, 4), (9, 4))
+        self.assertEqual(self.fields.nearest("food", 4, 4), (4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
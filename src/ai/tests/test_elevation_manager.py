@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch
 import logging
@@ -30,7 +31,7 @@ class TestElevationManager(unittest.TestCase):
         self.player_mock.level = 1
         self.player_mock.inventory = self.inventory_manager_mock
         self.vision_manager_mock.player = self.player_mock
-        self.vision_manager_mock.get_case_content.return_value = ['player']
+        self.vision_manager_mock.count_on_tile.return_value = 1
         
         self.inventory_manager_mock.inventory = {
             'food': 5,
@@ -59,7 +60,7 @@ class TestElevationManager(unittest.TestCase):
         """Test de la vérification si l'élévation est possible (vrai)."""
         self.player_mock.level = 1
         self.inventory_manager_mock.inventory['linemate'] = 1
-        self.vision_manager_mock.get_case_content.return_value = ['player']
+        self.vision_manager_mock.count_on_tile.return_value = 1
         
         result = self.elevation_manager.can_elevate()
         
@@ -69,7 +70,7 @@ class TestElevationManager(unittest.TestCase):
         """Test de la vérification si l'élévation est possible (faux - ressources manquantes)."""
         self.player_mock.level = 1
         self.inventory_manager_mock.inventory['linemate'] = 0
-        self.vision_manager_mock.get_case_content.return_value = ['player']
+        self.vision_manager_mock.count_on_tile.return_value = 1
         
         result = self.elevation_manager.can_elevate()
         
@@ -81,7 +82,7 @@ class TestElevationManager(unittest.TestCase):
         self.inventory_manager_mock.inventory['linemate'] = 1
         self.inventory_manager_mock.inventory['deraumere'] = 1
         self.inventory_manager_mock.inventory['sibur'] = 1
-        self.vision_manager_mock.get_case_content.return_value = ['player']  # Seulement 1 joueur
+        self.vision_manager_mock.count_on_tile.return_value = 1  # Seulement 1 joueur
         
         result = self.elevation_manager.can_elevate()
         
@@ -99,24 +100,42 @@ class TestElevationManager(unittest.TestCase):
         """Test du démarrage d'élévation avec succès."""
         self.player_mock.level = 1
         self.inventory_manager_mock.inventory['linemate'] = 1
-        self.vision_manager_mock.get_case_content.return_value = ['player']
+        self.vision_manager_mock.count_on_tile.return_value = 1
         self.protocol_mock.set.return_value = True
         self.protocol_mock.incantation.return_value = "Elevation underway"
         self.protocol_mock.look.return_value = "[player]"
         self.vision_manager_mock.force_update_vision.return_value = True
         
-        result = self.elevation_manager.start_elevation()
+        result = asyncio.run(self.elevation_manager.start_elevation())
         
         self.assertTrue(result)
         self.protocol_mock.set.assert_called()
         self.protocol_mock.incantation.assert_called_once()
 
+    def test_start_elevation_does_not_wait(self):
+        """Test du démarrage sans attente : le résultat arrive par « Current level »."""
+        self.player_mock.level = 1
+        self.protocol_mock.set.return_value = True
+        self.protocol_mock.incantation.return_value = True
+        
+        with patch('time.sleep', side_effect=AssertionError("attente réelle")):
+            result = asyncio.run(self.elevation_manager.start_elevation())
+        
+        self.assertTrue(result)
+        self.assertTrue(self.elevation_manager.ritual_in_progress)
+        self.protocol_mock.look.assert_not_called()
+        
+        self.elevation_manager.finish_ritual(2)
+        
+        self.assertFalse(self.elevation_manager.ritual_in_progress)
+        self.assertGreater(self.elevation_manager.last_elevation_time, 0)
+
     def test_start_elevation_cannot_elevate(self):
         """Test du démarrage d'élévation impossible."""
         self.player_mock.level = 1
         self.inventory_manager_mock.inventory['linemate'] = 0
         
-        result = self.elevation_manager.start_elevation()
+        result = asyncio.run(self.elevation_manager.start_elevation())
         
         self.assertFalse(result)
 
@@ -124,10 +143,10 @@ class TestElevationManager(unittest.TestCase):
         """Test du démarrage d'élévation avec échec de dépôt."""
         self.player_mock.level = 1
         self.inventory_manager_mock.inventory['linemate'] = 1
-        self.vision_manager_mock.get_case_content.return_value = ['player']
+        self.vision_manager_mock.count_on_tile.return_value = 1
         self.protocol_mock.set.return_value = False
         
-        result = self.elevation_manager.start_elevation()
+        result = asyncio.run(self.elevation_manager.start_elevation())
         
         self.assertFalse(result)
 
@@ -135,11 +154,11 @@ class TestElevationManager(unittest.TestCase):
         """Test du démarrage d'élévation avec échec d'incantation."""
         self.player_mock.level = 1
         self.inventory_manager_mock.inventory['linemate'] = 1
-        self.vision_manager_mock.get_case_content.return_value = ['player']
+        self.vision_manager_mock.count_on_tile.return_value = 1
         self.protocol_mock.set.return_value = True
         self.protocol_mock.incantation.return_value = "ko"
         
-        result = self.elevation_manager.start_elevation()
+        result = asyncio.run(self.elevation_manager.start_elevation())
         
         self.assertFalse(result)
 
@@ -193,6 +212,23 @@ class TestElevationManager(unittest.TestCase):
         
         self.assertEqual(result, [])
 
+    def test_get_resource_deficit(self):
+        """Test du calcul des quantités manquantes."""
+        self.player_mock.level = 3
+        self.inventory_manager_mock.inventory['linemate'] = 1
+        self.inventory_manager_mock.inventory['sibur'] = 1
+        self.inventory_manager_mock.inventory['phiras'] = 0
+        
+        result = self.elevation_manager.get_resource_deficit()
+        
+        self.assertEqual(result, {'linemate': 1, 'phiras': 2})
+
+    def test_get_resource_deficit_invalid_level(self):
+        """Test du déficit pour un niveau invalide."""
+        self.player_mock.level = 999
+        
+        self.assertEqual(self.elevation_manager.get_resource_deficit(), {})
+
     def test_get_current_level(self):
         """Test de la récupération du niveau actuel."""
         self.player_mock.level = 3
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.map import Map
+from models.geometry import turns_to_reach
+
+
+class TestTurnsToReach(unittest.TestCase):
+    """Tests unitaires pour le calcul des rotations."""
+
+    def test_straight_ahead(self):
+        """Test d'une case droit devant."""
+        self.assertEqual(turns_to_reach(0, -3, 0), 0)
+
+    def test_behind(self):
+        """Test d'une case derrière le joueur."""
+        self.assertEqual(turns_to_reach(0, 2, 0), 2)
+
+    def test_diagonal(self):
+        """Test d'une case en diagonale."""
+        self.assertEqual(turns_to_reach(2, -1, 0), 1)
+        self.assertEqual(turns_to_reach(2, 1, 0), 2)
+
+    def test_same_tile(self):
+        """Test de la case du joueur."""
+        self.assertEqual(turns_to_reach(0, 0, 3), 0)
+
+
+class TestFrontierTracker(unittest.TestCase):
+    """Tests unitaires pour la frontière d'exploration de la carte."""
+
+    def setUp(self):
+        """Initialise une carte 10×8."""
+        self.map = Map(10, 8)
+
+    def test_empty_map_has_no_frontier(self):
+        """Test d'une carte sans case explorée."""
+        self.assertEqual(len(self.map.frontier), 0)
+        self.assertIsNone(self.map.nearest_frontier(0, 0))
+
+    def test_single_explored_tile(self):
+        """Test des quatre voisines d'une case explorée."""
+        self.map.update_tile(0, 0, [])
+        self.assertEqual(len(self.map.frontier), 4)
+        self.assertIn((9, 0), self.map.frontier)
+        self.assertIn((0, 7), self.map.frontier)
+        self.assertNotIn((0, 0), self.map.frontier)
+
+    def test_frontier_moves_with_exploration(self):
+        """Test du déplacement de la frontière quand on explore."""
+        self.map.update_tiles([0, 1], [0, 0], [[0] * 7, [0] * 7])
+        self.assertNotIn((1, 0), self.map.frontier)
+        self.assertIn((2, 0), self.map.frontier)
+        self.assertEqual(len(self.map.frontier), 6)
+
+    def test_tile_facade_updates_frontier(self):
+        """Test de la mise à jour par la façade Tile."""
+        self.map.grid[3][3].is_explored = True
+        self.assertIn((3, 2), self.map.frontier)
+        self.map.grid[3][3].is_explored = False
+        self.assertEqual(len(self.map.frontier), 0)
+
+    def test_nearest_accounts_for_turns(self):
+        """Test du départage par le nombre de rotations."""
+        self.map.mark_as_explored(5, 4)
+        self.assertEqual(self.map.nearest_frontier(5, 4, 0), (5, 3))
+        self.assertEqual(self.map.nearest_frontier(5, 4, 1), (6, 4))
+        self.assertEqual(self.map.nearest_frontier(5, 4, 2), (5, 5))
+
+    def test_fully_explored_map(self):
+        """Test d'une carte entièrement explorée."""
+        for y in range(8):
+            for x in range(10):
+                self.map.mark_as_explored(x, y)
+        self.assertEqual(len(self.map.frontier), 0)
+        self.assertIsNone(self.map.nearest_frontier(2, 2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models import geometry
+
+
+class TestGeometry(unittest.TestCase):
+    """Tests unitaires pour le module geometry."""
+
+    def test_wrap(self):
+        """Test du décalage le plus court, scalaire et vectorisé."""
+        self.assertEqual(geometry.wrap(6, 10), -4)
+        self.assertEqual(geometry.wrap(-6, 10), 4)
+        self.assertEqual(geometry.wrap(5, 10), 5)
+        np.testing.assert_array_equal(geometry.wrap(np.array([0, 3, 7, -1]), 10), [0, 3, -3, -1])
+
+    def test_torus_delta(self):
+        """Test de la distance sur un axe torique."""
+        self.assertEqual(geometry.torus_delta(1, 29, 30), 2)
+        np.testing.assert_array_equal(geometry.torus_delta(np.arange(5), 0, 5), [0, 1, 2, 2, 1])
+
+    def test_relative(self):
+        """Test du vecteur relatif le plus court à travers les bords."""
+        self.assertEqual(geometry.relative(8, 5, 2, 5, 10, 10), (4, 0))
+        self.assertEqual(geometry.relative(1, 1, 9, 2, 10, 10), (-2, 1))
+
+    def test_distance_pairs(self):
+        """Test de la distance entre plusieurs paires et en matrice."""
+        xs = np.array([0, 9, 5])
+        ys = np.array([0, 0, 5])
+
+        np.testing.assert_array_equal(geometry.distance(xs, ys, 0, 0, 10, 10), [0, 1, 10])
+        matrix = geometry.distance(xs[:, None], ys[:, None], xs[None, :], ys[None, :], 10, 10)
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertEqual(matrix[0, 1], 1)
+        np.testing.assert_array_equal(matrix, matrix.T)
+
+    def test_turns_to_reach(self):
+        """Test des rotations, scalaires et vectorisées."""
+        self.assertEqual(geometry.turns_to_reach(0, -3, 0), 0)
+        self.assertEqual(geometry.turns_to_reach(0, 2, 0), 2)
+        self.assertEqual(geometry.turns_to_reach(2, 1, 0), 2)
+        np.testing.assert_array_equal(
+            geometry.turns_to_reach(np.array([0, 0, 2, 2, 0]), np.array([-3, 2, -1, 1, 0]), 0),
+            [0, 2, 1, 2, 0])
+
+    def test_distances_from(self):
+        """Test du champ de distances depuis un point vers toute la carte."""
+        field = geometry.distances_from(0, 0, 6, 4)
+
+        self.assertEqual(field.shape, (4, 6))
+        self.assertEqual(field[0, 0], 0)
+        self.assertEqual(field[0, 5], 1)
+        self.assertEqual(field[3, 3], 4)
+
+    def test_costs_from(self):
+        """Test du champ de coûts avec rotations."""
+        costs = geometry.costs_from(5, 5, 0, 10, 10)
+
+        self.assertEqual(costs[4, 5], 1)
+        self.assertEqual(costs[6, 5], 3)
+        self.assertEqual(costs[4, 6], 3)
+        self.assertEqual(costs[5, 5], 0)
+        self.assertEqual(costs[3, 5], geometry.cost(5, 5, 0, 5, 3, 10, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch
 import logging
@@ -11,6 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from managers.inventory_manager import InventoryManager
 from core.protocol import ZappyProtocol
+from core.clock import ServerClock
 
 class TestInventoryManager(unittest.TestCase):
     """Tests unitaires pour InventoryManager."""
@@ -39,7 +41,7 @@ class TestInventoryManager(unittest.TestCase):
         self.protocol_mock.take.return_value = True
         self.protocol_mock.inventory.return_value = "[food 1, linemate 0]"
         
-        result = self.inventory_manager.take_object("food")
+        result = asyncio.run(self.inventory_manager.take_object("food"))
         
         self.assertTrue(result)
         self.protocol_mock.take.assert_called_once_with("food")
@@ -48,7 +50,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la prise d'objet en échec."""
         self.protocol_mock.take.return_value = False
         
-        result = self.inventory_manager.take_object("food")
+        result = asyncio.run(self.inventory_manager.take_object("food"))
         
         self.assertFalse(result)
 
@@ -56,7 +58,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la prise d'objet avec erreur de connexion."""
         self.protocol_mock.take.side_effect = ConnectionError("Connexion perdue")
         
-        result = self.inventory_manager.take_object("food")
+        result = asyncio.run(self.inventory_manager.take_object("food"))
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -66,7 +68,7 @@ class TestInventoryManager(unittest.TestCase):
         self.inventory_manager.inventory['food'] = 5
         self.protocol_mock.set.return_value = True
         
-        result = self.inventory_manager.drop_object("food")
+        result = asyncio.run(self.inventory_manager.drop_object("food"))
         
         self.assertTrue(result)
         self.protocol_mock.set.assert_called_once_with("food")
@@ -77,7 +79,7 @@ class TestInventoryManager(unittest.TestCase):
         self.inventory_manager.inventory['food'] = 5
         self.protocol_mock.set.return_value = False
         
-        result = self.inventory_manager.drop_object("food")
+        result = asyncio.run(self.inventory_manager.drop_object("food"))
         
         self.assertFalse(result)
         self.assertEqual(self.inventory_manager.inventory['food'], 5)  # Ne change pas
@@ -87,7 +89,7 @@ class TestInventoryManager(unittest.TestCase):
         self.inventory_manager.inventory['food'] = 5
         self.protocol_mock.set.side_effect = ConnectionError("Connexion perdue")
         
-        result = self.inventory_manager.drop_object("food")
+        result = asyncio.run(self.inventory_manager.drop_object("food"))
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -96,7 +98,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec succès."""
         self.protocol_mock.inventory.return_value = "[food 5, linemate 2]"
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertTrue(result)
         self.assertEqual(self.inventory_manager.inventory['food'], 5)
@@ -106,7 +108,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec erreur de connexion."""
         self.protocol_mock.inventory.side_effect = ConnectionError("Connexion perdue")
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -115,7 +117,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec réponse invalide."""
         self.protocol_mock.inventory.return_value = "invalid"
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertFalse(result)
 
@@ -123,7 +125,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec réponse vide."""
         self.protocol_mock.inventory.return_value = ""
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertFalse(result)
 
@@ -131,7 +133,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour forcée d'inventaire avec succès."""
         self.protocol_mock.inventory.return_value = "[food 3, deraumere 1]"
         
-        result = self.inventory_manager.force_update_inventory()
+        result = asyncio.run(self.inventory_manager.force_update_inventory())
         
         self.assertTrue(result)
         self.assertEqual(self.inventory_manager.inventory['food'], 3)
@@ -141,7 +143,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour forcée d'inventaire avec erreur de connexion."""
         self.protocol_mock.inventory.side_effect = ConnectionError("Connexion perdue")
         
-        result = self.inventory_manager.force_update_inventory()
+        result = asyncio.run(self.inventory_manager.force_update_inventory())
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -150,7 +152,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec format d'item invalide."""
         self.protocol_mock.inventory.return_value = "[food 5, invalid_item, linemate 2]"
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertTrue(result)  # Continue malgré l'erreur
         self.assertEqual(self.inventory_manager.inventory['food'], 5)
@@ -160,7 +162,7 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec item inconnu."""
         self.protocol_mock.inventory.return_value = "[food 5, unknown_item 3, linemate 2]"
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertTrue(result)  # Continue malgré l'item inconnu
         self.assertEqual(self.inventory_manager.inventory['food'], 5)
@@ -170,11 +172,75 @@ class TestInventoryManager(unittest.TestCase):
         """Test de la mise à jour d'inventaire avec items vides."""
         self.protocol_mock.inventory.return_value = "[food 5, , linemate 2]"
         
-        result = self.inventory_manager.update_inventory()
+        result = asyncio.run(self.inventory_manager.update_inventory())
         
         self.assertTrue(result)  # Ignore les items vides
         self.assertEqual(self.inventory_manager.inventory['food'], 5)
         self.assertEqual(self.inventory_manager.inventory['linemate'], 2)
 
+    def _virtual_clock(self):
+        """Remplace l'horloge par une horloge virtuelle à 1 tick par seconde."""
+        now = [0.0]
+        self.inventory_manager.clock = ServerClock(frequency=1.0, time_source=lambda: now[0])
+        return now
+
+    def test_update_inventory_predicts_after_sync(self):
+        """Test de la prédiction sans commande Inventory après une lecture."""
+        now = self._virtual_clock()
+        self.protocol_mock.inventory.return_value = "[food 10, linemate 1]"
+        asyncio.run(self.inventory_manager.update_inventory())
+        
+        now[0] = 130.0
+        result = asyncio.run(self.inventory_manager.update_inventory())
+        
+        self.assertTrue(result)
+        self.protocol_mock.inventory.assert_called_once()
+        self.assertEqual(self.inventory_manager.inventory['food'], 8)
+
+    def test_update_inventory_resyncs_when_uncertain(self):
+        """Test de la relecture quand l'incertitude dépasse le seuil."""
+        now = self._virtual_clock()
+        self.protocol_mock.inventory.return_value = "[food 20]"
+        asyncio.run(self.inventory_manager.update_inventory())
+        
+        now[0] = 3 * 126.0
+        asyncio.run(self.inventory_manager.update_inventory())
+        
+        self.assertEqual(self.protocol_mock.inventory.call_count, 2)
+
+    def test_update_inventory_resyncs_near_critical(self):
+        """Test de la relecture à chaque mise à jour près du seuil critique."""
+        self._virtual_clock()
+        self.protocol_mock.inventory.return_value = "[food 4]"
+        asyncio.run(self.inventory_manager.update_inventory())
+        
+        asyncio.run(self.inventory_manager.update_inventory())
+        
+        self.assertEqual(self.protocol_mock.inventory.call_count, 2)
+
+    def test_take_and_drop_applied_locally(self):
+        """Test de l'application locale des Take et Set réussis."""
+        now = self._virtual_clock()
+        self.protocol_mock.inventory.return_value = "[food 10, sibur 0]"
+        asyncio.run(self.inventory_manager.update_inventory())
+        self.protocol_mock.take.return_value = True
+        self.protocol_mock.set.return_value = True
+        
+        asyncio.run(self.inventory_manager.take_object("food"))
+        asyncio.run(self.inventory_manager.take_object("sibur"))
+        asyncio.run(self.inventory_manager.drop_object("sibur"))
+        asyncio.run(self.inventory_manager.take_object("sibur"))
+        now[0] = 10.0
+        asyncio.run(self.inventory_manager.update_inventory())
+        
+        self.protocol_mock.inventory.assert_called_once()
+        self.assertEqual(self.inventory_manager.inventory['food'], 10)
+        self.assertEqual(self.inventory_manager.inventory['sibur'], 1)
+
+    def test_uncertainty_before_first_sync(self):
+        """Test de l'incertitude infinie tant que l'inventaire n'a pas été lu."""
+        self.assertTrue(self.inventory_manager.needs_sync())
+        self.assertEqual(self.inventory_manager.uncertainty(), float('inf'))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.line_buffer import LineBuffer
+
+class TestLineBuffer(unittest.TestCase):
+    """Tests unitaires pour LineBuffer."""
+
+    def setUp(self):
+        """Initialise un tampon vide pour chaque test."""
+        self.buffer = LineBuffer()
+
+    def test_empty_buffer(self):
+        """Test d'un tampon vide."""
+        self.assertIsNone(self.buffer.pop_line())
+        self.assertFalse(self.buffer.has_line())
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_single_line(self):
+        """Test d'une ligne complète."""
+        self.buffer.feed(b"ok\n")
+        
+        self.assertTrue(self.buffer.has_line())
+        self.assertEqual(self.buffer.pop_line(), "ok")
+        self.assertIsNone(self.buffer.pop_line())
+
+    def test_coalesced_lines(self):
+        """Test de deux lignes reçues dans un même paquet."""
+        self.buffer.feed(b"ok\nmessage 3, team:HELLO:\n")
+        
+        self.assertEqual(self.buffer.pop_line(), "ok")
+        self.assertEqual(self.buffer.pop_line(), "message 3, team:HELLO:")
+        self.assertIsNone(self.buffer.pop_line())
+
+    def test_split_line(self):
+        """Test d'une ligne coupée entre deux paquets."""
+        self.buffer.feed(b"[player, fo")
+        self.assertIsNone(self.buffer.pop_line())
+        
+        self.buffer.feed(b"od, linemate]\nok")
+        
+        self.assertEqual(self.buffer.pop_line(), "[player, food, linemate]")
+        self.assertIsNone(self.buffer.pop_line())
+        self.assertEqual(len(self.buffer), 2)
+
+    def test_carriage_return_removed(self):
+        """Test de la suppression du '\\r' final."""
+        self.buffer.feed(b"WELCOME\r\n")
+        
+        self.assertEqual(self.buffer.pop_line(), "WELCOME")
+
+    def test_compaction_keeps_leftover(self):
+        """Test de la conservation du reste après compaction."""
+        payload = b"".join(b"ok\n" for _ in range(3000)) + b"partial"
+        self.buffer.feed(payload)
+        
+        for _ in range(3000):
+            self.assertEqual(self.buffer.pop_line(), "ok")
+        self.buffer.feed(b" line\n")
+        
+        self.assertEqual(self.buffer.pop_line(), "partial line")
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_clear(self):
+        """Test du vidage du tampon."""
+        self.buffer.feed(b"ok\nko")
+        self.buffer.clear()
+        
+        self.assertIsNone(self.buffer.pop_line())
+        self.assertEqual(len(self.buffer), 0)
+
+if __name__ == '__main__':
+    unittest.main()
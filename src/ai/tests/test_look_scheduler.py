@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.look_scheduler import LookScheduler
+from models.map import Map
+from core.clock import ServerClock
+
+
+class TestLookScheduler(unittest.TestCase):
+    """Tests unitaires pour LookScheduler."""
+
+    def setUp(self):
+        """Prépare une carte 20x20 et une horloge virtuelle à 1 tick par seconde."""
+        self.now = [1000.0]
+        self.clock = ServerClock(frequency=1.0, time_source=lambda: self.now[0])
+        self.map = Map(20, 20)
+        self.scheduler = LookScheduler(self.map, self.clock)
+
+    def _look(self, pose, level=1, reason="tick"):
+        """Simule un Look envoyé et inscrit dans la carte."""
+        self.scheduler.record_look(pose, level, reason)
+        cone = self.scheduler._cone(pose, level)
+        self.map.update_tiles(cone % 20, cone // 20, np.zeros((len(cone), 7)), self.now[0])
+
+    def test_first_request_looks(self):
+        """Test du premier Look toujours envoyé."""
+        self.assertTrue(self.scheduler.should_look((5, 5, 0), 1))
+
+    def test_no_move_skips(self):
+        """Test de l'absence de Look sans déplacement ni délai."""
+        self._look((5, 5, 0))
+        self.now[0] += 7
+
+        self.assertFalse(self.scheduler.should_look((5, 5, 0), 1))
+
+    def test_move_into_unknown_looks(self):
+        """Test du Look après un pas vers une zone inconnue."""
+        self._look((5, 5, 0))
+
+        self.assertAlmostEqual(self.scheduler.information((5, 4, 0), 1), 0.75)
+        self.assertTrue(self.scheduler.should_look((5, 4, 0), 1))
+
+    def test_move_into_known_area_skips(self):
+        """Test de l'absence de Look en revenant sur des cases vues récemment."""
+        self._look((5, 4, 0))
+        self._look((5, 5, 0))
+
+        self.assertEqual(self.scheduler.information((5, 4, 0), 1), 0.0)
+        self.assertFalse(self.scheduler.should_look((5, 4, 0), 1))
+
+    def test_high_level_small_move_skips(self):
+        """Test d'un pas de côté à haut niveau : le cône change peu."""
+        self._look((10, 10, 0), level=6)
+        self.map.explored[:] = True
+        self.map.last_seen[:] = self.now[0]
+
+        self.assertFalse(self.scheduler.should_look((11, 10, 0), 6))
+
+    def test_age_triggers_look(self):
+        """Test du Look quand la vue a vieilli."""
+        self._look((5, 5, 0))
+        self.now[0] += 70
+
+        self.assertTrue(self.scheduler.should_look((5, 5, 0), 1))
+
+    def test_reason_weight(self):
+        """Test du poids de la décision en attente."""
+        self._look((5, 5, 0))
+        self.now[0] += 40
+
+        self.assertFalse(self.scheduler.should_look((5, 5, 0), 1, "tick"))
+        self.assertTrue(self.scheduler.should_look((5, 5, 0), 1, "survival"))
+        self.assertTrue(self.scheduler.should_look((5, 5, 0), 1, "elevation"))
+
+    def test_moves(self):
+        """Test du nombre de commandes depuis le dernier Look."""
+        self._look((0, 0, 0))
+
+        self.assertEqual(self.scheduler.moves((19, 2, 1)), 4)
+
+    def test_stats_per_state(self):
+        """Test du comptage des demandes et du rythme des Look par état."""
+        self.scheduler.state = "EXPLORING"
+        self.scheduler.should_look((5, 5, 0), 1)
+        self._look((5, 5, 0))
+        self.now[0] += 50
+        self.scheduler.should_look((5, 5, 0), 1)
+
+        self.assertEqual(self.scheduler.summary(), {"EXPLORING": {"tick": (2, 1)}})
+        self.assertAlmostEqual(self.scheduler.look_rate("EXPLORING"), 2.0)
+        self.assertEqual(self.scheduler.look_rate("ELEVATING"), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
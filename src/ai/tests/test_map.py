@@ -6,6 +6,7 @@ import logging
 import sys
 import os
 import time
+import numpy as np
 
 # Ajouter le répertoire parent au path pour les imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -193,6 +194,67 @@ class TestMap(unittest.TestCase):
         tiles = self.map.get_tiles_with_resource('nonexistent_resource')
         self.assertEqual(len(tiles), 0)
     
+    def test_arrays_shape(self):
+        """Test la forme des tableaux de la carte."""
+        self.assertEqual(self.map.resources.shape, (8, 10, 7))
+        self.assertEqual(self.map.explored.shape, (8, 10))
+        self.assertEqual(self.map.last_seen.shape, (8, 10))
+
+    def test_tile_writes_to_arrays(self):
+        """Test que la façade Tile écrit dans les tableaux."""
+        self.map.get_tile(5, 3).resources['sibur'] = 4
+        self.assertEqual(self.map.resources[3, 5, 3], 4)
+
+    def test_update_tiles(self):
+        """Test la mise à jour groupée de plusieurs tuiles."""
+        counts = np.array([[1, 0, 0, 0, 0, 0, 0], [0, 2, 0, 0, 0, 0, 1]], dtype=np.uint16)
+        self.map.update_tiles([1, 12], [-1, 2], counts, timestamp=42.0)
+
+        self.assertEqual(self.map.get_tile(1, 7).resources['food'], 1)
+        self.assertEqual(self.map.get_tile(2, 2).resources['linemate'], 2)
+        self.assertEqual(self.map.get_tile(2, 2).resources['thystame'], 1)
+        self.assertTrue(self.map.is_explored(2, 2))
+        self.assertEqual(self.map.get_tile(1, 7).last_updated, 42.0)
+        self.assertEqual(len(self.map.get_unexplored_tiles()), 78)
+
+    def test_recent_generations(self):
+        """Test de l'expiration des cases par numéro de mise à jour groupée."""
+        self.map.update_tiles([1], [1], np.zeros((1, 7)))
+        self.map.update_tiles([2], [2], np.zeros((1, 7)))
+        self.map.update_tiles([3], [3], np.zeros((1, 7)))
+
+        recent = self.map.recent(2)
+        self.assertEqual(self.map.generation, 3)
+        self.assertFalse(recent[1, 1])
+        self.assertTrue(recent[2, 2])
+        self.assertTrue(recent[3, 3])
+        self.assertEqual(int(recent.sum()), 2)
+
+    def test_nearest_resource(self):
+        """Test de la recherche de la ressource connue la plus proche."""
+        self.map.update_tile(9, 3, ['food'])
+        self.map.update_tile(5, 5, ['food'])
+        self.map.get_tile(2, 3).resources['food'] = 1
+
+        self.assertEqual(self.map.nearest_resource('food', 0, 3), [(9, 3)])
+        self.assertEqual(self.map.nearest_resource('food', 0, 3, k=2), [(9, 3), (2, 3)])
+
+        self.map.update_tile(9, 3, [])
+        self.assertEqual(self.map.nearest_resource('food', 0, 3), [(2, 3)])
+
+    def test_walking_distance_follows_writes(self):
+        """Test du champ de distances tenu à jour par les écritures de la carte."""
+        self.map.update_tile(9, 3, ['food'])
+        self.map.get_tile(2, 3).resources['food'] = 1
+
+        self.assertEqual(self.map.walking_distance('food', 0, 3), 1)
+        self.assertEqual(self.map.step_towards('food', 0, 3, orientation=3), (9, 3))
+
+        self.map.update_tile(9, 3, [])
+        self.assertEqual(self.map.walking_distance('food', 0, 3), 2)
+        self.assertEqual(self.map.step_towards('food', 0, 3, orientation=3), (1, 3))
+        self.assertIsNone(self.map.walking_distance('thystame', 0, 3))
+
     def test_map_edge_cases(self):
         """Test les cas limites de la carte."""
         # Carte de taille 1x1
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from managers.movement_executor import MovementExecutor
+from models import path_planner
+
+
+class TestMovementExecutor(unittest.TestCase):
+    """Tests unitaires pour MovementExecutor."""
+
+    def setUp(self):
+        """Prépare un gestionnaire de mouvement simulé sur une carte 10x10."""
+        self.pose = [5, 5, 0]
+        self.manager = Mock()
+        self.manager.map.width = 10
+        self.manager.map.height = 10
+        self.manager.player.get_position.side_effect = lambda: (self.pose[0], self.pose[1])
+        self.manager.player.get_direction.side_effect = lambda: self.pose[2]
+        self.manager._is_stuck.return_value = False
+        self.manager.collision_manager.check_collision.return_value = False
+        self.manager.collision_manager.eject_other_players = AsyncMock()
+        self.manager.collision_manager.avoid_collision = AsyncMock()
+        self.manager._handle_stuck = AsyncMock()
+        self.sent = []
+        self.manager.execute_plan = AsyncMock(side_effect=self._execute)
+        self.executor = MovementExecutor(self.manager, Mock())
+
+    def _execute(self, plan):
+        self.sent.append(tuple(plan))
+        self.pose[:] = path_planner.simulate(*self.pose, plan, 10, 10)
+        return True
+
+    def test_idle_by_default(self):
+        """Test de l'état initial."""
+        self.assertEqual(self.executor.status, MovementExecutor.IDLE)
+        self.assertFalse(self.executor.active)
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.IDLE)
+
+    def test_one_leg_per_step(self):
+        """Test de l'envoi d'une seule branche du plan par étape."""
+        self.executor.start(7, 3)
+
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.MOVING)
+        self.assertEqual(self.sent, [("Forward", "Forward")])
+
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.ARRIVED)
+        self.assertEqual(self.sent[1], ("Right", "Forward", "Forward"))
+        self.assertEqual((self.pose[0], self.pose[1]), (7, 3))
+        self.assertFalse(self.executor.active)
+
+    def test_arrival_heading(self):
+        """Test d'un trajet qui ne se termine qu'une fois tourné vers l'orientation voulue."""
+        self.executor.start(5, 3, heading=1)
+
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.MOVING)
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.ARRIVED)
+        self.assertEqual(self.sent, [("Forward", "Forward"), ("Right",)])
+        self.assertEqual(self.pose, [5, 3, 1])
+
+    def test_chunk_capped(self):
+        """Test du plafonnement du nombre de commandes par étape."""
+        self.manager.map.width = 30
+        self.manager.map.height = 30
+        self.executor.max_commands = 4
+        self.executor.start(5, 20)
+
+        asyncio.run(self.executor.step())
+
+        self.assertEqual(len(self.sent[0]), 4)
+
+    def test_already_there(self):
+        """Test d'un trajet vers la case actuelle."""
+        self.executor.start(5, 5)
+
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.ARRIVED)
+        self.manager.execute_plan.assert_not_called()
+
+    def test_cancel(self):
+        """Test de l'annulation en cours de route."""
+        self.executor.start(7, 3)
+        asyncio.run(self.executor.step())
+
+        self.executor.cancel("test")
+
+        self.assertEqual(self.executor.status, MovementExecutor.CANCELLED)
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.CANCELLED)
+        self.assertEqual(len(self.sent), 1)
+
+    def test_execute_failure(self):
+        """Test de l'échec d'une branche."""
+        self.manager.execute_plan.side_effect = None
+        self.manager.execute_plan.return_value = False
+        self.executor.start(7, 3)
+
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.FAILED)
+
+    def test_collision_retries_then_fails(self):
+        """Test de l'abandon après trop d'évitements de collision."""
+        self.manager.collision_manager.check_collision.return_value = True
+        self.manager.collision_manager.eject_other_players.return_value = False
+        self.manager.collision_manager.avoid_collision.return_value = True
+        self.executor.start(7, 3)
+
+        self.assertFalse(asyncio.run(self.executor.run()))
+        self.assertEqual(self.executor.failures, self.executor.max_failures)
+
+    def test_stuck(self):
+        """Test de l'arrêt quand le joueur est bloqué."""
+        self.manager._is_stuck.return_value = True
+        self.executor.start(7, 3)
+
+        self.assertEqual(asyncio.run(self.executor.step()), MovementExecutor.FAILED)
+        self.manager._handle_stuck.assert_called_once()
+
+    def test_run_bounded_without_progress(self):
+        """Test de l'arrêt quand la position ne change jamais."""
+        self.manager.execute_plan.side_effect = None
+        self.manager.execute_plan.return_value = True
+        self.executor.start(7, 3)
+
+        self.assertFalse(asyncio.run(self.executor.run()))
+        self.assertLessEqual(self.manager.execute_plan.call_count, self.executor.max_steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import logging
@@ -53,7 +54,6 @@ class TestMovementManager(unittest.TestCase):
     def test_initialization(self):
         """Test de l'initialisation du MovementManager."""
         self.assertIsNotNone(self.movement_manager)
-        self.assertEqual(self.movement_manager.move_cooldown, 0.1)
         self.assertEqual(self.movement_manager.max_stuck_count, 3)
 
     def test_move_to_same_position(self):
@@ -61,7 +61,7 @@ class TestMovementManager(unittest.TestCase):
         self.player_mock.get_position.return_value = (5, 5)
         target = (0, 0)  # Position relative à la position actuelle
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
         # Le mouvement vers la même position devrait réussir
         self.assertTrue(result)
@@ -70,92 +70,94 @@ class TestMovementManager(unittest.TestCase):
         """Test du mouvement vers le nord."""
         self.player_mock.get_position.return_value = (5, 5)
         self.player_mock.get_direction.return_value = 0  # Nord
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True] * 2
         target = (0, -2)  # 2 cases au nord
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
         # Le mouvement peut échouer selon la logique de calcul de distance
         # On vérifie juste que la méthode a été appelée
-        self.protocol_mock.forward.assert_called()
+        self.protocol_mock.pipeline.assert_called_with(["Forward"] * 2)
 
     def test_move_to_south(self):
         """Test du mouvement vers le sud."""
         self.player_mock.get_position.return_value = (5, 5)
         self.player_mock.get_direction.return_value = 2  # Sud
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True] * 2
         target = (0, 2)  # 2 cases au sud
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
-        self.protocol_mock.forward.assert_called()
+        self.protocol_mock.pipeline.assert_called_with(["Forward"] * 2)
 
     def test_move_to_east(self):
         """Test du mouvement vers l'est."""
         self.player_mock.get_position.return_value = (5, 5)
         self.player_mock.get_direction.return_value = 1  # Est
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True] * 2
         target = (2, 0)  # 2 cases à l'est
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
-        self.protocol_mock.forward.assert_called()
+        self.protocol_mock.pipeline.assert_called_with(["Forward"] * 2)
 
     def test_move_to_west(self):
         """Test du mouvement vers l'ouest."""
         self.player_mock.get_position.return_value = (5, 5)
         self.player_mock.get_direction.return_value = 3  # Ouest
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True] * 2
         target = (-2, 0)  # 2 cases à l'ouest
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
-        self.protocol_mock.forward.assert_called()
+        self.protocol_mock.pipeline.assert_called_with(["Forward"] * 2)
 
     def test_move_to_with_rotation(self):
         """Test du mouvement avec rotation nécessaire."""
         self.player_mock.get_position.return_value = (5, 5)
         self.player_mock.get_direction.return_value = 0  # Nord
         self.protocol_mock.right.return_value = True
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True] * 2
         target = (2, 0)  # Est
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
-        # On vérifie que les méthodes ont été appelées
-        self.protocol_mock.right.assert_called()
-        self.protocol_mock.forward.assert_called()
+        # La rotation part dans la même rafale que les pas
+        self.protocol_mock.pipeline.assert_called_with(["Right", "Forward", "Forward"])
 
     def test_move_to_wrapping(self):
         """Test du mouvement avec wrapping torique."""
         self.player_mock.get_position.return_value = (5, 5)
         self.player_mock.get_direction.return_value = 0  # Nord
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True] * 5
         target = (0, -5)  # Bord nord de la carte
         
-        result = self.movement_manager.move_to(target)
+        result = asyncio.run(self.movement_manager.move_to(target))
         
-        self.protocol_mock.forward.assert_called()
+        self.protocol_mock.pipeline.assert_called_with(["Forward"] * 5)
 
     def test_move_to_absolute_success(self):
         """Test du mouvement vers des coordonnées absolues réussi."""
-        self.player_mock.get_position.return_value = (5, 5)
-        self.protocol_mock.forward.return_value = True
+        position = [(5, 5)]
+        self.player_mock.get_position.side_effect = lambda: position[0]
+        self.player_mock.set_position.side_effect = lambda x, y: position.__setitem__(0, (x, y))
+        self.protocol_mock.pipeline.return_value = [True] * 3
         
-        result = self.movement_manager.move_to_absolute(7, 5)
+        result = asyncio.run(self.movement_manager.move_to_absolute(7, 5))
         
-        # Le mouvement peut échouer selon la logique de calcul
-        # On vérifie juste que les méthodes ont été appelées
-        self.protocol_mock.forward.assert_called()
+        self.assertTrue(result)
+        self.protocol_mock.pipeline.assert_called_once_with(["Right", "Forward", "Forward"])
+        self.player_mock.set_position.assert_called_with(7, 5)
+        self.player_mock.set_direction.assert_called_with(1)
 
     def test_move_to_absolute_with_collision(self):
         """Test du mouvement avec collision."""
         self.player_mock.get_position.return_value = (5, 5)
         self.movement_manager.collision_manager.check_collision.return_value = True
         self.movement_manager.collision_manager.eject_other_players.return_value = True
-        self.protocol_mock.forward.return_value = True
+        self.protocol_mock.pipeline.return_value = [True, True]
         
-        result = self.movement_manager.move_to_absolute(7, 5)
+        result = asyncio.run(self.movement_manager.move_to_absolute(7, 5))
         
         self.movement_manager.collision_manager.check_collision.assert_called()
         self.movement_manager.collision_manager.eject_other_players.assert_called()
@@ -166,7 +168,7 @@ class TestMovementManager(unittest.TestCase):
         self.movement_manager.collision_manager.check_collision.return_value = True
         self.movement_manager.collision_manager.eject_other_players.return_value = False
         
-        result = self.movement_manager.move_to_absolute(7, 5)
+        result = asyncio.run(self.movement_manager.move_to_absolute(7, 5))
         
         self.assertFalse(result)
 
@@ -174,18 +176,28 @@ class TestMovementManager(unittest.TestCase):
         """Test du mouvement avec échec de déplacement."""
         self.player_mock.get_position.return_value = (5, 5)
         self.movement_manager.collision_manager.check_collision.return_value = False
-        self.protocol_mock.forward.return_value = False
+        self.protocol_mock.pipeline.return_value = [False, False]
         
-        result = self.movement_manager.move_to_absolute(7, 5)
+        result = asyncio.run(self.movement_manager.move_to_absolute(7, 5))
         
         self.assertFalse(result)
 
+    def test_execute_plan_partial(self):
+        """Test de l'exécution d'un plan interrompu."""
+        self.protocol_mock.pipeline.return_value = [True, True, False]
+        
+        result = asyncio.run(self.movement_manager.execute_plan(("Right", "Forward", "Forward")))
+        
+        self.assertFalse(result)
+        self.player_mock.set_position.assert_called_with(6, 5)
+        self.player_mock.set_direction.assert_called_with(1)
+
     def test_orient_towards_same_direction(self):
         """Test de l'orientation vers la même direction."""
         self.player_mock.get_direction.return_value = 1  # Est
         target_direction = 1
         
-        result = self.movement_manager.orient_towards(target_direction)
+        result = asyncio.run(self.movement_manager.orient_towards(target_direction))
         
         self.assertTrue(result)
         self.protocol_mock.right.assert_not_called()
@@ -197,7 +209,7 @@ class TestMovementManager(unittest.TestCase):
         self.protocol_mock.right.return_value = True
         target_direction = 1  # Est
         
-        result = self.movement_manager.orient_towards(target_direction)
+        result = asyncio.run(self.movement_manager.orient_towards(target_direction))
         
         self.assertTrue(result)
         self.protocol_mock.right.assert_called()
@@ -206,7 +218,7 @@ class TestMovementManager(unittest.TestCase):
         """Test de l'avancement avec succès."""
         self.protocol_mock.forward.return_value = True
         
-        result = self.movement_manager.move_forward()
+        result = asyncio.run(self.movement_manager.move_forward())
         
         self.assertTrue(result)
         self.protocol_mock.forward.assert_called_once()
@@ -215,15 +227,48 @@ class TestMovementManager(unittest.TestCase):
         """Test de l'avancement en échec."""
         self.protocol_mock.forward.return_value = False
         
-        result = self.movement_manager.move_forward()
+        result = asyncio.run(self.movement_manager.move_forward())
         
         self.assertFalse(result)
 
+    def test_walk_forward_burst(self):
+        """Test de l'avancement groupé en une seule rafale."""
+        self.player_mock.get_position.return_value = (5, 5)
+        self.player_mock.get_direction.return_value = 1  # Est
+        self.protocol_mock.pipeline.return_value = [True, True, True]
+        
+        result = asyncio.run(self.movement_manager.walk_forward(3))
+        
+        self.assertTrue(result)
+        self.protocol_mock.pipeline.assert_called_once_with(["Forward"] * 3)
+        self.protocol_mock.forward.assert_not_called()
+        self.player_mock.set_position.assert_called_once_with(8, 5)
+
+    def test_walk_forward_partial(self):
+        """Test d'une rafale interrompue par un échec."""
+        self.player_mock.get_position.return_value = (5, 0)
+        self.player_mock.get_direction.return_value = 0  # Nord
+        self.protocol_mock.pipeline.return_value = [True, False, True]
+        
+        result = asyncio.run(self.movement_manager.walk_forward(3))
+        
+        self.assertFalse(result)
+        self.player_mock.set_position.assert_called_once_with(5, 9)
+
+    def test_walk_forward_single_step(self):
+        """Test d'un seul pas sans pipeline."""
+        self.protocol_mock.forward.return_value = True
+        
+        result = asyncio.run(self.movement_manager.walk_forward(1))
+        
+        self.assertTrue(result)
+        self.protocol_mock.pipeline.assert_not_called()
+
     def test_turn_left_success(self):
         """Test de la rotation à gauche avec succès."""
         self.protocol_mock.left.return_value = True
         
-        result = self.movement_manager.turn_left()
+        result = asyncio.run(self.movement_manager.turn_left())
         
         self.assertTrue(result)
         self.protocol_mock.left.assert_called_once()
@@ -232,22 +277,27 @@ class TestMovementManager(unittest.TestCase):
         """Test de la rotation à droite avec succès."""
         self.protocol_mock.right.return_value = True
         
-        result = self.movement_manager.turn_right()
+        result = asyncio.run(self.movement_manager.turn_right())
         
         self.assertTrue(result)
         self.protocol_mock.right.assert_called_once()
 
-    def test_can_move(self):
-        """Test de la vérification si le joueur peut bouger."""
-        result = self.movement_manager.can_move()
-        
-        self.assertIsInstance(result, bool)
-
     def test_check_for_better_opportunities(self):
         """Test de la vérification d'opportunités meilleures."""
         result = self.movement_manager._check_for_better_opportunities(7, 5)
         
         self.assertIsInstance(result, bool)
+        self.vision_manager_mock.force_update_vision.assert_not_called()
+        self.vision_manager_mock.update_vision.assert_not_called()
+
+    def test_start_towards_relative_target(self):
+        """Test du démarrage d'un trajet relatif, sans commande envoyée."""
+        target = self.movement_manager.start_towards((-7, 2), purpose="survival")
+        
+        self.assertEqual(target, (8, 7))
+        self.assertTrue(self.movement_manager.executor.active)
+        self.assertEqual(self.movement_manager.executor.purpose, "survival")
+        self.protocol_mock.pipeline.assert_not_called()
 
     def test_calculate_shortest_path_simple(self):
         """Test du calcul de chemin le plus court simple."""
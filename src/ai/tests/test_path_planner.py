@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models import path_planner
+from models.path_planner import plan_relative, plan_path, plan_cost, simulate
+
+
+class TestPathPlanner(unittest.TestCase):
+    """Tests unitaires pour le planificateur de chemins."""
+
+    def test_straight_line(self):
+        """Test d'un déplacement droit devant."""
+        self.assertEqual(plan_relative(0, -3, 0), ("Forward",) * 3)
+
+    def test_turn_then_walk(self):
+        """Test d'un déplacement nécessitant une rotation."""
+        self.assertEqual(plan_relative(-2, 0, 0), ("Left", "Forward", "Forward"))
+        self.assertEqual(plan_relative(0, 1, 0), ("Right", "Right", "Forward"))
+
+    def test_best_axis_order(self):
+        """Test du choix de l'axe parcouru en premier."""
+        self.assertEqual(plan_relative(1, -2, 0), ("Forward", "Forward", "Right", "Forward"))
+
+    def test_same_tile(self):
+        """Test d'un déplacement nul."""
+        self.assertEqual(plan_relative(0, 0, 2), ())
+
+    def test_arrival_heading(self):
+        """Test d'une orientation imposée à l'arrivée, qui peut changer l'ordre des axes."""
+        self.assertEqual(plan_relative(1, -2, 0, 0), ("Right", "Forward", "Left", "Forward", "Forward"))
+        self.assertEqual(plan_relative(0, 0, 2, 1), ("Left",))
+        self.assertEqual(plan_path(5, 5, 0, 5, 3, 10, 10, 2), ("Forward", "Forward", "Right", "Right"))
+
+    def test_memoized(self):
+        """Test de la mémorisation des plans."""
+        plan_relative.cache_clear()
+        plan_relative(3, 4, 1)
+        plan_relative(3, 4, 1)
+        self.assertEqual(plan_relative.cache_info().hits, 1)
+
+    def test_torus_picks_cheapest_side(self):
+        """Test du choix du sens de parcours sur le tore."""
+        self.assertEqual(plan_path(5, 5, 0, 5, 0, 10, 10), ("Forward",) * 5)
+        self.assertEqual(plan_path(1, 0, 3, 8, 0, 10, 10), ("Forward",) * 3)
+
+    def test_plan_is_optimal(self):
+        """Test de l'optimalité contre une recherche en largeur."""
+        width, height = 7, 6
+        for direction in range(4):
+            distances = {(0, 0, direction): 0}
+            frontier = [(0, 0, direction)]
+            while frontier:
+                following = []
+                for state in frontier:
+                    for command in ("Forward", "Left", "Right"):
+                        nxt = simulate(*state, [command], width, height)
+                        if nxt not in distances:
+                            distances[nxt] = distances[state] + 1
+                            following.append(nxt)
+                frontier = following
+            for tx in range(width):
+                for ty in range(height):
+                    best = min(d for (x, y, _), d in distances.items() if (x, y) == (tx, ty))
+                    plan = plan_path(0, 0, direction, tx, ty, width, height)
+                    self.assertEqual(len(plan), best)
+                    self.assertEqual(simulate(0, 0, direction, plan, width, height)[:2], (tx, ty))
+
+    def test_plan_cost(self):
+        """Test de la durée d'un plan."""
+        self.assertEqual(plan_cost((path_planner.RIGHT, path_planner.FORWARD)), 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+import numpy as np
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.pose import PoseEstimator
+from models.player import Player
+from models.map import Map
+from models.vision import Vision, WIDTH
+from models import vision_cone
+
+
+class TestPoseEstimator(unittest.TestCase):
+    """Tests unitaires pour PoseEstimator."""
+
+    def setUp(self):
+        """Prépare un joueur au centre d'une carte 10x10."""
+        self.map = Map(10, 10)
+        self.player = Player(1, "team", 5, 5, Mock(), Mock())
+        self.estimator = PoseEstimator(self.player, self.map, Mock())
+        rng = np.random.default_rng(7)
+        self.world = rng.integers(0, 3, size=(10, 10, 7)).astype(np.uint16)
+
+    def _look(self, x, y, direction, level=1):
+        """Construit le Look vu depuis une pose réelle du monde de test."""
+        offsets = vision_cone.offsets(level, direction)
+        counts = np.zeros((len(offsets), WIDTH), dtype=np.uint16)
+        counts[:, 1:] = self.world[(y + offsets[:, 1]) % 10, (x + offsets[:, 0]) % 10]
+        counts[0, 0] = 1
+        return Vision(counts)
+
+    def _explore_all(self):
+        """Rend toute la carte connue et conforme au monde de test."""
+        ys, xs = np.mgrid[0:10, 0:10]
+        self.map.update_tiles(xs.ravel(), ys.ravel(), self.world.reshape(-1, 7))
+
+    def test_apply_commands(self):
+        """Test de la navigation à l'estime sur Forward/Left/Right."""
+        pose = self.estimator.apply(["Right", "Forward", "Forward", "Left", "Forward"])
+
+        self.assertEqual(pose, (7, 4, 0))
+        self.assertEqual(self.player.get_position(), (7, 4))
+        self.assertEqual(self.player.get_direction(), 0)
+
+    def test_apply_wraps(self):
+        """Test du passage de bord sur le tore."""
+        self.estimator.apply(["Forward"] * 6)
+
+        self.assertEqual(self.player.get_position(), (5, 9))
+
+    def test_eject_from_behind(self):
+        """Test d'une éjection par un joueur placé derrière."""
+        pose = self.estimator.eject(5)
+
+        self.assertEqual(pose, (5, 4, 0))
+
+    def test_eject_from_left(self):
+        """Test d'une éjection par un joueur placé à gauche."""
+        self.player.set_direction(1)
+
+        pose = self.estimator.eject(3)
+
+        self.assertEqual(pose, (5, 6, 1))
+
+    def test_eject_unknown_sector(self):
+        """Test d'une éjection au secteur inattendu."""
+        pose = self.estimator.eject(2)
+
+        self.assertEqual(pose, (5, 5, 0))
+        self.assertEqual(self.estimator.uncertainty, 1)
+        self.assertEqual(len(self.estimator.candidates()), 13)
+
+    def test_listeners_on_confirmed_moves(self):
+        """Test de la notification des déplacements confirmés uniquement."""
+        moves = []
+        self.estimator.subscribe(moves.append)
+        self._explore_all()
+
+        self.estimator.apply(["Left"])
+        self.estimator.eject(1)
+        self.estimator.observe(self._look(3, 5, 3, level=2))
+
+        self.assertEqual(moves, [(5, 5, 3), (6, 5, 3)])
+
+    def test_candidates_start_with_estimate(self):
+        """Test de l'ordre des positions candidates."""
+        candidates = self.estimator.candidates()
+
+        self.assertEqual(candidates[0], (5, 5))
+        self.assertEqual(len(candidates), 5)
+
+    def test_observe_keeps_correct_pose(self):
+        """Test du maintien d'une pose cohérente avec la carte."""
+        self._explore_all()
+
+        pose = self.estimator.observe(self._look(5, 5, 0, level=2))
+
+        self.assertEqual(pose, (5, 5, 0))
+        self.assertEqual(self.estimator.corrections, 0)
+
+    def test_observe_corrects_drift(self):
+        """Test du recalage après une dérive d'une case."""
+        self._explore_all()
+
+        pose = self.estimator.observe(self._look(6, 5, 0, level=2))
+
+        self.assertEqual(pose, (6, 5, 0))
+        self.assertEqual(self.estimator.corrections, 1)
+
+    def test_observe_without_knowledge(self):
+        """Test sans carte connue : la pose estimée est conservée."""
+        pose = self.estimator.observe(self._look(6, 5, 0))
+
+        self.assertEqual(pose, (5, 5, 0))
+
+    def test_observe_tolerates_small_changes(self):
+        """Test de la marge : une ressource ramassée ne déplace pas la pose."""
+        self._explore_all()
+        self.world[4, 5, 0] += 1
+
+        pose = self.estimator.observe(self._look(5, 5, 0, level=2))
+
+        self.assertEqual(pose, (5, 5, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from unittest.mock import Mock, MagicMock, patch
 import logging
@@ -67,7 +68,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.forward()
+        result = asyncio.run(self.protocol.forward())
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Forward\n")
@@ -78,7 +79,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ko"
         
-        result = self.protocol.forward()
+        result = asyncio.run(self.protocol.forward())
         
         self.assertFalse(result)
 
@@ -87,14 +88,14 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = False
         
         with self.assertRaises(ConnectionError):
-            self.protocol.forward()
+            asyncio.run(self.protocol.forward())
 
     def test_right_success(self):
         """Test de la rotation à droite réussie."""
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.right()
+        result = asyncio.run(self.protocol.right())
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Right\n")
@@ -104,7 +105,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.left()
+        result = asyncio.run(self.protocol.left())
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Left\n")
@@ -114,7 +115,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "[player, food]"
         
-        result = self.protocol.look()
+        result = asyncio.run(self.protocol.look())
         
         self.assertEqual(result, "[player, food]")
         self.assertEqual(self.protocol.last_response, "[player, food]")
@@ -125,7 +126,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "[food 5, linemate 2]"
         
-        result = self.protocol.inventory()
+        result = asyncio.run(self.protocol.inventory())
         
         self.assertEqual(result, "[food 5, linemate 2]")
         self.assertEqual(self.protocol.last_response, "[food 5, linemate 2]")
@@ -136,7 +137,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.broadcast("test message")
+        result = asyncio.run(self.protocol.broadcast("test message"))
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Broadcast test message\n")
@@ -146,7 +147,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "5"
         
-        result = self.protocol.connect_nbr()
+        result = asyncio.run(self.protocol.connect_nbr())
         
         self.assertEqual(result, 5)
         self.assertEqual(self.protocol.last_response, "5")
@@ -158,14 +159,14 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock._receive.return_value = "invalid"
         
         with self.assertRaises(ValueError):
-            self.protocol.connect_nbr()
+            asyncio.run(self.protocol.connect_nbr())
 
     def test_fork_success(self):
         """Test de la ponte réussie."""
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.fork()
+        result = asyncio.run(self.protocol.fork())
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Fork\n")
@@ -175,7 +176,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.eject()
+        result = asyncio.run(self.protocol.eject())
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Eject\n")
@@ -185,7 +186,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.take("food")
+        result = asyncio.run(self.protocol.take("food"))
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Take food\n")
@@ -195,7 +196,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ok"
         
-        result = self.protocol.set("food")
+        result = asyncio.run(self.protocol.set("food"))
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Set food\n")
@@ -205,7 +206,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "Elevation underway"
         
-        result = self.protocol.incantation()
+        result = asyncio.run(self.protocol.incantation())
         
         self.assertTrue(result)
         self.client_mock._send.assert_called_once_with("Incantation\n")
@@ -215,7 +216,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock.is_connected.return_value = True
         self.client_mock._receive.return_value = "ko"
         
-        result = self.protocol.incantation()
+        result = asyncio.run(self.protocol.incantation())
         
         self.assertFalse(result)
 
@@ -243,7 +244,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock._send.side_effect = Exception("Test error")
         
         with self.assertRaises(Exception):
-            self.protocol.forward()
+            asyncio.run(self.protocol.forward())
         
         self.assertIn("Erreur lors du déplacement", self.protocol.last_error)
 
@@ -253,7 +254,7 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock._send.side_effect = Exception("Test error")
         
         with self.assertRaises(Exception):
-            self.protocol.look()
+            asyncio.run(self.protocol.look())
         
         self.assertIn("Erreur lors de la vision", self.protocol.last_error)
 
@@ -263,9 +264,54 @@ class TestZappyProtocol(unittest.TestCase):
         self.client_mock._send.side_effect = Exception("Test error")
         
         with self.assertRaises(Exception):
-            self.protocol.broadcast("test")
+            asyncio.run(self.protocol.broadcast("test"))
         
         self.assertIn("Erreur lors de l'envoi du message", self.protocol.last_error)
 
+    def test_pipeline_ordered_results(self):
+        """Test de l'envoi groupé avec résultats dans l'ordre."""
+        self.client_mock.is_connected.return_value = True
+        self.client_mock._receive.side_effect = ["ok", "ko", "[food 3]", "2"]
+        
+        result = asyncio.run(self.protocol.pipeline(["Forward", "Take food", "Inventory", "Connect_nbr"]))
+        
+        self.assertEqual(result, [True, False, "[food 3]", 2])
+        sent = [c.args[0] for c in self.client_mock._send.call_args_list]
+        self.assertEqual(sent, ["Forward\n", "Take food\n", "Inventory\n", "Connect_nbr\n"])
+        self.assertEqual(len(self.protocol.pending_commands), 0)
+
+    def test_pipeline_limits_in_flight(self):
+        """Test de la limite de commandes en vol."""
+        self.client_mock.is_connected.return_value = True
+        in_flight = []
+        self.client_mock._send.side_effect = lambda msg: in_flight.append(len(self.protocol.pending_commands))
+        self.client_mock._receive.return_value = "ok"
+        
+        result = asyncio.run(self.protocol.pipeline(["Forward"] * 15))
+        
+        self.assertEqual(result, [True] * 15)
+        self.assertLessEqual(max(in_flight), ZappyProtocol.MAX_PENDING - 1)
+
+    def test_single_command_drains_pipeline(self):
+        """Test d'une commande simple après des commandes en vol."""
+        self.client_mock.is_connected.return_value = True
+        self.client_mock._receive.side_effect = ["ok", "ok", "ko"]
+        self.protocol.enqueue("Set linemate")
+        self.protocol.enqueue("Set sibur")
+        
+        result = asyncio.run(self.protocol.forward())
+        
+        self.assertFalse(result)
+        self.assertEqual(self.protocol.flush(), [True, True])
+
+    def test_pipeline_connection_lost(self):
+        """Test de la perte de connexion pendant une rafale."""
+        self.client_mock.is_connected.return_value = True
+        self.client_mock._receive.side_effect = ConnectionError("Connexion perdue")
+        
+        with self.assertRaises(ConnectionError):
+            asyncio.run(self.protocol.pipeline(["Forward", "Forward"]))
+        self.assertEqual(len(self.protocol.pending_commands), 0)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
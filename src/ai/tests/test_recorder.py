@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.recorder import SessionRecorder, SessionRecording, SENT, RECEIVED
+from core.client import ZappyClient
+
+class TestSessionRecorder(unittest.TestCase):
+    """Tests unitaires pour SessionRecorder et SessionRecording."""
+
+    def setUp(self):
+        """Crée un fichier d'enregistrement temporaire."""
+        fd, self.path = tempfile.mkstemp(suffix=".session")
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        """Supprime le fichier temporaire."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_record_and_load(self):
+        """Test d'un aller-retour enregistrement puis chargement."""
+        recorder = SessionRecorder(self.path, "localhost", 4242, "team1", seed=42)
+        recorder.received("WELCOME")
+        recorder.sent("Broadcast a\tb\n")
+        recorder.received("ok")
+        recorder.close()
+        
+        recording = SessionRecording(self.path)
+        
+        self.assertEqual(recording.server, "localhost:4242")
+        self.assertEqual(recording.team_name, "team1")
+        self.assertEqual(recording.seed, 42)
+        self.assertEqual([(d, l) for _, d, l in recording.events],
+                         [(RECEIVED, "WELCOME"), (SENT, "Broadcast a\tb"), (RECEIVED, "ok")])
+        timestamps = [t for t, _, _ in recording.events]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_new_recording_replaces_previous(self):
+        """Test d'un second enregistrement dans le même fichier."""
+        for line in ("first", "second"):
+            recorder = SessionRecorder(self.path)
+            recorder.received(line)
+            recorder.close()
+        
+        recording = SessionRecording(self.path)
+        
+        self.assertEqual([l for _, _, l in recording.events], ["second"])
+
+    def test_appended_sessions_load_first(self):
+        """Test d'un ancien fichier contenant deux sessions à la suite."""
+        with open(self.path, 'w') as f:
+            f.write("#zappy-session v1\t1.0\t:0\tteam1\n0.1\t<\tfirst\n")
+            f.write("#zappy-session v1\t2.0\t:0\tteam1\n0.1\t<\tsecond\n")
+        
+        recording = SessionRecording(self.path)
+        
+        self.assertEqual([l for _, _, l in recording.events], ["first"])
+
+    def test_invalid_file(self):
+        """Test du chargement d'un fichier qui n'est pas une session."""
+        with open(self.path, 'w') as f:
+            f.write("not a session\n")
+        
+        with self.assertRaises(ValueError):
+            SessionRecording(self.path)
+
+    def test_client_records_traffic(self):
+        """Test de l'enregistrement des envois et réceptions du client."""
+        client = ZappyClient("localhost", 4242, "team1")
+        client.socket = Mock()
+        client.socket.recv.side_effect = [b"message 1, hi\nok\n"]
+        client.start_recording(self.path)
+        
+        client._send("Forward\n")
+        client._receive()
+        client.close()
+        
+        recording = SessionRecording(self.path)
+        self.assertIsNone(client.recorder)
+        self.assertIsNotNone(recording.seed)
+        self.assertEqual([(d, l) for _, d, l in recording.events],
+                         [(SENT, "Forward"), (RECEIVED, "message 1, hi"), (RECEIVED, "ok")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+import sys
+import os
+import socket
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.recorder import SessionRecording
+from core.replay import ReplaySocket, ReplayClient
+from core.protocol import ZappyProtocol
+
+SESSION = """#zappy-session v1\t1000.000000\tlocalhost:4242\tteam1
+0.001000\t<\tWELCOME
+0.002000\t>\tteam1
+0.003000\t<\t3
+0.003000\t<\t10 10
+0.010000\t>\tForward
+0.080000\t<\tok
+0.500000\t>\tInventory
+0.505000\t<\tmessage 2, hi
+0.510000\t<\t[food 10, linemate 1]
+"""
+
+class TestReplay(unittest.TestCase):
+    """Tests unitaires pour ReplaySocket et ReplayClient."""
+
+    def setUp(self):
+        """Écrit une session enregistrée dans un fichier temporaire."""
+        fd, self.path = tempfile.mkstemp(suffix=".session")
+        with os.fdopen(fd, 'w') as f:
+            f.write(SESSION)
+
+    def tearDown(self):
+        """Supprime le fichier temporaire."""
+        os.remove(self.path)
+
+    def test_recv_stops_before_next_command(self):
+        """Test de la livraison des lignes jusqu'à la commande suivante."""
+        transport = ReplaySocket(SessionRecording(self.path))
+        
+        self.assertEqual(transport.recv(4096), b"WELCOME\n")
+        transport.send(b"team1\n")
+        self.assertEqual(transport.recv(4096), b"3\n10 10\n")
+        self.assertAlmostEqual(transport.virtual_time, 0.003)
+
+    def test_non_blocking_recv_without_data(self):
+        """Test d'une lecture non bloquante quand le client doit d'abord envoyer."""
+        transport = ReplaySocket(SessionRecording(self.path))
+        transport.recv(4096)
+        transport.settimeout(0.001)
+        
+        with self.assertRaises(socket.timeout):
+            transport.recv(4096)
+
+    def test_divergence_counted(self):
+        """Test d'une commande différente de celle enregistrée."""
+        transport = ReplaySocket(SessionRecording(self.path))
+        transport.recv(4096)
+        transport.send(b"team1\n")
+        transport.recv(4096)
+        
+        transport.send(b"Left\n")
+        
+        self.assertEqual(transport.divergences, 1)
+        self.assertEqual(transport.recv(4096), b"ok\n")
+
+    def test_idle_advances_virtual_time(self):
+        """Test de l'attente d'un cooldown pendant le rejeu."""
+        transport = ReplaySocket(SessionRecording(self.path))
+        transport.recv(4096)
+        
+        transport.idle()
+        
+        self.assertAlmostEqual(transport.now(), 1000.002)
+
+    def test_client_replays_session(self):
+        """Test d'un ZappyProtocol branché sur le rejeu."""
+        client = ReplayClient(self.path)
+        client.connect()
+        protocol = ZappyProtocol(client)
+        
+        self.assertEqual(client.client_num, 3)
+        self.assertEqual(client.map_size, (10, 10))
+        self.assertTrue(asyncio.run(protocol.forward()))
+        self.assertEqual(asyncio.run(protocol.inventory()), "[food 10, linemate 1]")
+        self.assertEqual(client.check_for_messages(), "message 2, hi")
+        self.assertTrue(client.transport.exhausted())
+        self.assertEqual(client.transport.divergences, 0)
+        self.assertAlmostEqual(client.clock.now(), 1000.51)
+
+    def test_exhausted_session_closes(self):
+        """Test de la fin de session vue comme une fermeture du serveur."""
+        client = ReplayClient(self.path)
+        client.connect()
+        protocol = ZappyProtocol(client)
+        asyncio.run(protocol.forward())
+        asyncio.run(protocol.inventory())
+        
+        with self.assertRaises(ConnectionError):
+            asyncio.run(protocol.look())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import time
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sim.server import StandInServer
+from core.client import ZappyClient
+from core.protocol import ZappyProtocol
+from models.player import Player
+from models.map import Map
+from ai import AI
+from replayer import replay_session
+
+class TestReplaySession(unittest.TestCase):
+    """Tests d'intégration : enregistrement contre le serveur de substitution puis rejeu."""
+
+    def setUp(self):
+        """Démarre un serveur accéléré dont chaque case porte de quoi s'élever au niveau 2."""
+        self.server = StandInServer(6, 6, ["team1"], 1, frequency=500, seed=3)
+        self.port = self.server.start_in_thread()
+        for row in self.server.world.tiles:
+            for tile in row:
+                tile[1] = 3
+        fd, self.path = tempfile.mkstemp(suffix=".session")
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        """Arrête le serveur et supprime l'enregistrement."""
+        self.server.stop_thread()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _record_until_ritual(self) -> bool:
+        """Joue l'IA contre le serveur jusqu'à la fin d'un rituel, en enregistrant.
+
+        Returns:
+            bool: True si un rituel a abouti avant l'échéance
+        """
+        logger = logging.getLogger(__name__)
+        client = ZappyClient("127.0.0.1", self.port, "team1")
+        client.start_recording(self.path, seed=7)
+        client.connect()
+        protocol = ZappyProtocol(client)
+        player = Player(client.client_num, "team1", 3, 3, protocol, logger)
+        client.ai = AI(protocol, player, Map(6, 6), logger)
+        elevated = False
+        deadline = time.monotonic() + 10
+        try:
+            while not elevated and time.monotonic() < deadline:
+                message = client.check_for_messages()
+                if message:
+                    elevated = message.startswith("Current level")
+                    if not client.ai.handle_server_message(message):
+                        break
+                    continue
+                if not client.ai.elevation_in_progress and not client.run():
+                    break
+        finally:
+            client.close()
+        return elevated
+
+    def test_ritual_replayed_without_divergence(self):
+        """Test du rejeu d'un rituel : mêmes commandes, et les 300 ticks gelés sautés."""
+        self.assertTrue(self._record_until_ritual())
+        
+        stats = replay_session(self.path, logging.getLogger(__name__))
+        
+        self.assertEqual(stats["divergences"], 0)
+        self.assertGreater(stats["commands"], 0)
+        self.assertGreater(stats["game_time"], self.server.seconds(300))
+        self.assertLess(stats["wall_time"], stats["game_time"] / 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import logging
@@ -55,7 +56,7 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertTrue(result)
         self.protocol_mock.connect_nbr.assert_called_once()
@@ -65,7 +66,7 @@ class TestReproductionManager(unittest.TestCase):
         """Test de la reproduction sans slots disponibles."""
         self.protocol_mock.connect_nbr.return_value = 0
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result)
         self.protocol_mock.connect_nbr.assert_called_once()
@@ -76,7 +77,7 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = False
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result)
         self.protocol_mock.fork.assert_called_once()
@@ -86,7 +87,7 @@ class TestReproductionManager(unittest.TestCase):
         import time
         self.reproduction_manager.last_fork_time = time.time()
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result)
         self.protocol_mock.connect_nbr.assert_not_called()
@@ -96,7 +97,7 @@ class TestReproductionManager(unittest.TestCase):
         """Test de la reproduction avec exception."""
         self.protocol_mock.connect_nbr.side_effect = Exception("Erreur générale")
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -105,7 +106,7 @@ class TestReproductionManager(unittest.TestCase):
         """Test de la reproduction avec erreur de connexion."""
         self.protocol_mock.connect_nbr.side_effect = ConnectionError("Connexion perdue")
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result)
         self.logger_mock.error.assert_called()
@@ -116,12 +117,12 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
         
-        result1 = self.reproduction_manager.reproduce()
+        result1 = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertTrue(result1)
         
         # Deuxième tentative avec cooldown
-        result2 = self.reproduction_manager.reproduce()
+        result2 = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result2)
 
@@ -131,7 +132,7 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 3
         self.protocol_mock.fork.return_value = True
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertTrue(result)
 
@@ -145,7 +146,7 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
         
-        result = reproduction_manager.reproduce()
+        result = asyncio.run(reproduction_manager.reproduce())
         
         self.assertTrue(result)
         logger_mock.info.assert_called()
@@ -156,7 +157,7 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
         
-        self.reproduction_manager.reproduce()
+        asyncio.run(self.reproduction_manager.reproduce())
         
         self.protocol_mock.connect_nbr.assert_called_once()
         self.protocol_mock.fork.assert_called_once()
@@ -166,12 +167,12 @@ class TestReproductionManager(unittest.TestCase):
         # Test avec True
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         self.assertTrue(result)
         
         # Test avec False
         self.protocol_mock.fork.return_value = False
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         self.assertFalse(result)
 
     def test_reproduce_method_signature(self):
@@ -182,7 +183,7 @@ class TestReproductionManager(unittest.TestCase):
         # Vérifier que la méthode retourne un booléen
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         self.assertIsInstance(result, bool)
 
     def test_reproduction_manager_methods(self):
@@ -200,7 +201,7 @@ class TestReproductionManager(unittest.TestCase):
         self.protocol_mock.connect_nbr.return_value = 5
         self.protocol_mock.fork.return_value = True
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertTrue(result)
 
@@ -209,7 +210,7 @@ class TestReproductionManager(unittest.TestCase):
         # Simuler des conditions défavorables pour la reproduction
         self.protocol_mock.connect_nbr.return_value = 0
         
-        result = self.reproduction_manager.reproduce()
+        result = asyncio.run(self.reproduction_manager.reproduce())
         
         self.assertFalse(result)
 
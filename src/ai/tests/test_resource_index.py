@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.resource_index import ResourceIndex, torus_delta
+
+
+class TestResourceIndex(unittest.TestCase):
+    """Tests unitaires pour l'index spatial des ressources."""
+
+    def setUp(self):
+        """Initialise un index sur une carte 30×20."""
+        self.index = ResourceIndex(30, 20, ["food", "linemate"])
+
+    def test_torus_delta(self):
+        """Test de la distance sur un axe torique."""
+        self.assertEqual(torus_delta(1, 29, 30), 2)
+        self.assertEqual(torus_delta(5, 5, 30), 0)
+
+    def test_add_and_discard(self):
+        """Test de l'ajout et du retrait d'une case."""
+        self.index.add("food", 3, 4)
+        self.index.add("food", 3, 4)
+        self.assertEqual(self.index.count("food"), 1)
+        self.assertTrue(self.index.contains("food", 33, 24))
+
+        self.index.discard("food", 3, 4)
+        self.assertEqual(self.index.count("food"), 0)
+        self.assertEqual(self.index.nearest("food", 0, 0), [])
+
+    def test_unknown_resource(self):
+        """Test d'une ressource non indexée."""
+        self.index.add("thystame", 1, 1)
+        self.assertEqual(self.index.nearest("thystame", 1, 1), [])
+
+    def test_nearest_wraps_around(self):
+        """Test de la recherche à travers le bord du tore."""
+        self.index.add("food", 29, 0)
+        self.index.add("food", 10, 0)
+        self.assertEqual(self.index.nearest("food", 1, 0), [(29, 0)])
+
+    def test_nearest_max_distance(self):
+        """Test de la limite de distance."""
+        self.index.add("food", 10, 10)
+        self.assertEqual(self.index.nearest("food", 0, 0, max_distance=5), [])
+        self.assertEqual(self.index.nearest("food", 8, 9, max_distance=5), [(10, 10)])
+
+    def test_update_replaces_content(self):
+        """Test du remplacement du contenu d'une case."""
+        self.index.update(2, 2, ["food", "linemate"])
+        self.index.update(2, 2, ["linemate"])
+        self.assertFalse(self.index.contains("food", 2, 2))
+        self.assertTrue(self.index.contains("linemate", 2, 2))
+
+    def test_k_nearest_matches_brute_force(self):
+        """Test des k plus proches contre un parcours exhaustif."""
+        rng = random.Random(7)
+        points = set()
+        for _ in range(60):
+            point = (rng.randrange(30), rng.randrange(20))
+            points.add(point)
+            self.index.add("food", *point)
+        for _ in range(50):
+            x, y = rng.randrange(30), rng.randrange(20)
+            expected = sorted(points, key=lambda p: (self.index.distance(x, y, *p), p[1], p[0]))[:4]
+            self.assertEqual(self.index.nearest("food", x, y, k=4), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.map import Map
+from models.route_optimizer import RouteOptimizer
+
+
+class TestRouteOptimizer(unittest.TestCase):
+    """Tests unitaires pour l'optimiseur de tournée de collecte."""
+
+    def setUp(self):
+        """Initialise une carte 20×20 et l'optimiseur."""
+        self.map = Map(20, 20)
+        self.optimizer = RouteOptimizer(self.map)
+
+    def _collected(self, stops):
+        """Total ramassé par ressource sur une tournée."""
+        total = {}
+        for _, _, gain in stops:
+            for resource, count in gain.items():
+                total[resource] = total.get(resource, 0) + count
+        return total
+
+    def test_empty_map(self):
+        """Test d'une carte sans ressource connue."""
+        self.assertEqual(self.optimizer.plan(0, 0, {'linemate': 1}, food=10), [])
+
+    def test_covers_whole_deficit(self):
+        """Test de la collecte de tout le déficit."""
+        self.map.update_tile(2, 0, ['linemate'])
+        self.map.update_tile(4, 0, ['deraumere', 'sibur'])
+        self.map.update_tile(0, 3, ['sibur'])
+        stops = self.optimizer.plan(0, 0, {'linemate': 1, 'deraumere': 1, 'sibur': 1}, food=10)
+
+        collected = self._collected(stops)
+        self.assertEqual(collected['linemate'], 1)
+        self.assertEqual(collected['deraumere'], 1)
+        self.assertEqual(collected['sibur'], 1)
+        self.assertEqual([stop[:2] for stop in stops], [(2, 0), (4, 0)])
+
+    def test_prefers_combined_tile(self):
+        """Test du choix d'une case qui couvre plusieurs besoins."""
+        self.map.update_tile(3, 0, ['linemate'])
+        self.map.update_tile(0, 3, ['deraumere'])
+        self.map.update_tile(4, 4, ['linemate', 'deraumere'])
+        stops = self.optimizer.plan(0, 0, {'linemate': 1, 'deraumere': 1}, food=10)
+        self.assertLessEqual(len(stops), 2)
+        self.assertEqual(self._collected(stops).get('linemate'), 1)
+
+    def test_order_minimises_walking(self):
+        """Test de l'ordre des arrêts le long de la tournée."""
+        for x in (6, 2, 4):
+            self.map.update_tile(x, 0, ['linemate'])
+        stops = self.optimizer.plan(0, 0, {'linemate': 3}, food=10)
+        self.assertEqual([stop[:2] for stop in stops], [(2, 0), (4, 0), (6, 0)])
+
+    def test_food_stop_added_when_budget_short(self):
+        """Test de l'ajout d'un arrêt nourriture quand la réserve ne suffit pas."""
+        self.map.update_tile(9, 0, ['thystame'])
+        self.map.update_tile(5, 1, ['food', 'food', 'food'])
+        stops = self.optimizer.plan(0, 0, {'thystame': 1}, food=2)
+        self.assertIn((5, 1), [stop[:2] for stop in stops])
+        self.assertEqual(self._collected(stops).get('thystame'), 1)
+
+    def test_truncated_to_budget(self):
+        """Test de la troncature quand aucune nourriture n'est connue."""
+        self.map.update_tile(9, 9, ['thystame'])
+        self.assertEqual(self.optimizer.plan(0, 0, {'thystame': 1}, food=2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import Mock, AsyncMock, patch
+import selectors
+import socket
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.client import ZappyClient
+from core.async_protocol import SelectorProtocol
+from runner import MultiAgentRunner, ManagedAgent
+
+class TestMultiAgentRunner(unittest.TestCase):
+    """Tests unitaires pour MultiAgentRunner."""
+
+    def setUp(self):
+        """Crée un runner et un agent relié à une paire de sockets."""
+        self.runner = MultiAgentRunner("localhost", 4242, "team", 1, logger=Mock())
+        self.server_side, client_side = socket.socketpair()
+        self.client = ZappyClient("localhost", 4242, "team")
+        self.client.socket = client_side
+        self.client.client_num = 7
+        self.ai = Mock()
+        self.ai.protocol = SelectorProtocol(self.client)
+        self.ai.elevation_in_progress = False
+        self.ai.state = "NORMAL_OPERATIONS"
+        self.ai.handle_server_message.return_value = True
+        self.agent = ManagedAgent(0, self.client, self.ai)
+        self.runner.agents.append(self.agent)
+        self.runner.selector.register(client_side, selectors.EVENT_READ, self.agent)
+
+    def tearDown(self):
+        """Ferme les sockets et le runner."""
+        self.runner.close()
+        self.server_side.close()
+
+    def test_events_dispatched_between_ticks(self):
+        """Test du traitement des messages asynchrones par le sélecteur."""
+        self.server_side.sendall(b"message 1, team:HELLO:\nCurrent level: 2\n")
+        
+        self.runner._on_readable(self.agent)
+        
+        calls = [c.args[0] for c in self.ai.handle_server_message.call_args_list]
+        self.assertEqual(calls, ["message 1, team:HELLO:", "Current level: 2"])
+        self.assertEqual(self.agent.events, 2)
+        self.assertTrue(self.agent.alive)
+
+    def test_dead_retires_agent(self):
+        """Test du retrait d'un agent mort."""
+        self.ai.handle_server_message.return_value = False
+        self.server_side.sendall(b"dead\n")
+        
+        self.runner._on_readable(self.agent)
+        
+        self.assertFalse(self.agent.alive)
+        self.assertEqual(self.runner.running(), 0)
+
+    def test_tick_accounts_cpu_time(self):
+        """Test du comptage des ticks et du temps CPU par agent."""
+        self.ai.update = AsyncMock(side_effect=lambda: sum(range(20000)) >= 0)
+        self.runner._schedule(self.agent, 0.0)
+        
+        self.runner.run(duration=0.5)
+        
+        stats = self.runner.report()[0]
+        self.assertGreater(stats["ticks"], 0)
+        self.assertGreater(stats["cpu_time"], 0.0)
+        self.assertEqual(stats["client"], 7)
+
+    def test_failed_tick_stops_agent(self):
+        """Test de l'arrêt d'un agent dont le tick échoue."""
+        self.ai.update = AsyncMock(return_value=False)
+        self.runner._schedule(self.agent, 0.0)
+        
+        self.runner.run(duration=1.0)
+        
+        self.assertFalse(self.agent.alive)
+        self.assertEqual(self.agent.ticks, 1)
+
+    def test_elevation_skips_tick(self):
+        """Test du report du tick pendant une élévation."""
+        self.ai.elevation_in_progress = True
+        self.ai.update = AsyncMock(return_value=True)
+        self.runner._schedule(self.agent, 0.0)
+        
+        self.runner.run(duration=0.3)
+        
+        self.ai.update.assert_not_called()
+
+    def test_tick_waits_for_reply_on_readable(self):
+        """Test de la reprise d'un tick à l'arrivée de sa réponse."""
+        async def update():
+            return await self.ai.protocol.forward()
+        self.ai.update = update
+        
+        self.runner._start_tick(self.agent)
+        
+        self.assertTrue(self.agent.busy)
+        self.assertEqual(self.server_side.recv(64), b"Forward\n")
+        self.server_side.sendall(b"message 2, team:HELLO:\nok\n")
+        self.runner._on_readable(self.agent)
+        
+        self.assertFalse(self.agent.busy)
+        self.assertEqual(self.agent.ticks, 1)
+        self.assertTrue(self.agent.alive)
+        self.ai.handle_server_message.assert_called_once_with("message 2, team:HELLO:")
+
+    def test_connection_lost_during_tick(self):
+        """Test du retrait d'un agent dont la connexion tombe pendant un tick."""
+        async def update():
+            return await self.ai.protocol.forward()
+        self.ai.update = update
+        
+        self.runner._start_tick(self.agent)
+        self.server_side.close()
+        self.runner._on_readable(self.agent)
+        
+        self.assertFalse(self.agent.alive)
+        self.assertFalse(self.agent.busy)
+        self.assertEqual(self.runner.running(), 0)
+
+    def test_spawn_continues_after_failed_connect(self):
+        """Test de la poursuite des connexions après un échec."""
+        runner = MultiAgentRunner("localhost", 4242, "team", 3, logger=Mock())
+        peers = []
+        attempts = []
+
+        def connect(client):
+            attempts.append(client)
+            if len(attempts) == 1:
+                raise ConnectionError("refusée")
+            server_side, client.socket = socket.socketpair()
+            peers.append(server_side)
+            client.client_num = len(attempts)
+            client.map_size = (10, 10)
+            return True
+
+        try:
+            with patch.object(ZappyClient, "connect", connect):
+                self.assertEqual(runner.spawn(), 2)
+            self.assertEqual(len(attempts), 3)
+            self.assertEqual(runner.failed_connections, 1)
+            self.assertEqual([agent.index for agent in runner.agents], [0, 1])
+            runner.logger.error.assert_called_once()
+        finally:
+            runner.close()
+            for peer in peers:
+                peer.close()
+
+if __name__ == '__main__':
+    unittest.main()
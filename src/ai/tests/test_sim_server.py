@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sim.server import StandInServer
+from core.client import ZappyClient
+from core.protocol import ZappyProtocol
+
+class TestStandInServer(unittest.TestCase):
+    """Tests d'intégration du client contre le serveur de substitution."""
+
+    def setUp(self):
+        """Démarre un serveur accéléré dans un thread."""
+        self.server = StandInServer(8, 6, ["team1"], 2, frequency=1000, seed=3)
+        self.port = self.server.start_in_thread()
+        self.clients = []
+
+    def tearDown(self):
+        """Ferme les clients et le serveur."""
+        for client in self.clients:
+            client.close()
+        self.server.stop_thread()
+
+    def _connect(self, team: str = "team1") -> ZappyClient:
+        client = ZappyClient("127.0.0.1", self.port, team)
+        client.connect()
+        self.clients.append(client)
+        return client
+
+    def test_handshake(self):
+        """Test de la poignée de main."""
+        client = self._connect()
+        
+        self.assertEqual(client.client_num, 1)
+        self.assertEqual(client.map_size, (8, 6))
+
+    def test_unknown_team_refused(self):
+        """Test du refus d'une équipe inconnue."""
+        with self.assertRaises(Exception):
+            self._connect("nobody")
+
+    def test_commands(self):
+        """Test des commandes de base."""
+        protocol = ZappyProtocol(self._connect())
+        
+        self.assertTrue(asyncio.run(protocol.forward()))
+        self.assertTrue(asyncio.run(protocol.right()))
+        self.assertTrue(asyncio.run(protocol.look()).startswith("[player"))
+        self.assertTrue(asyncio.run(protocol.inventory()).startswith("[food "))
+        self.assertEqual(asyncio.run(protocol.connect_nbr()), 1)
+        self.assertEqual(asyncio.run(protocol.pipeline(["Left", "Forward", "Take nothing"])), [True, True, False])
+
+    def test_frequency_estimated(self):
+        """Test de l'estimation de la fréquence du serveur accéléré."""
+        client = self._connect()
+        protocol = ZappyProtocol(client)
+        
+        asyncio.run(protocol.pipeline(["Forward"] * 5))
+        
+        self.assertGreater(client.clock.frequency, 300)
+
+    def test_broadcast_delivered(self):
+        """Test de la réception d'un broadcast par un autre joueur."""
+        sender = ZappyProtocol(self._connect())
+        receiver = self._connect()
+        
+        self.assertTrue(asyncio.run(sender.broadcast("hello")))
+        message = None
+        deadline = time.monotonic() + 2
+        while message is None and time.monotonic() < deadline:
+            message = receiver.check_for_messages()
+        
+        self.assertRegex(message, r"^message [0-8], hello$")
+
+    def test_food_decay_kills(self):
+        """Test de la mort par manque de nourriture."""
+        self.server.stop_thread()
+        self.server = StandInServer(4, 4, ["team1"], 1, frequency=20000, seed=3)
+        self.port = self.server.start_in_thread()
+        client = self._connect()
+        
+        deadline = time.monotonic() + 3
+        while client.is_connected() and time.monotonic() < deadline:
+            client.poll_socket()
+            time.sleep(0.01)
+        
+        self.assertTrue(client.server_disconnected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sim.world import World, RESOURCES
+
+class TestWorld(unittest.TestCase):
+    """Tests unitaires pour les règles du serveur de substitution."""
+
+    def setUp(self):
+        """Crée un monde vide de ressources avec un joueur au centre."""
+        self.world = World(10, 10, ["team1", "team2"], 3, seed=1)
+        for row in self.world.tiles:
+            for tile in row:
+                tile[:] = [0] * len(RESOURCES)
+        self.world.totals = [0] * len(RESOURCES)
+        self.player = self.world.join("team1")
+        self.world._move(self.player, 5, 5)
+        self.player.orientation = 0
+
+    def test_spawn_density(self):
+        """Test de la réapparition selon la densité."""
+        self.world.spawn_resources()
+        
+        self.assertEqual(self.world.totals[0], 50)
+        self.assertEqual(self.world.totals[6], 5)
+
+    def test_join_consumes_slots(self):
+        """Test des places disponibles par équipe."""
+        self.world.join("team1")
+        self.world.join("team1")
+        
+        self.assertIsNone(self.world.join("team1"))
+        self.assertIsNone(self.world.join("unknown"))
+
+    def test_forward_wraps(self):
+        """Test du déplacement sur le tore."""
+        self.world._move(self.player, 5, 0)
+        
+        self.world.forward(self.player)
+        
+        self.assertEqual((self.player.x, self.player.y), (5, 9))
+
+    def test_look_order(self):
+        """Test de l'ordre des cases vues au niveau 1."""
+        self.world.tiles[4][4][0] = 1
+        self.world.tiles[4][6][1] = 2
+        
+        self.assertEqual(self.world.look(self.player), "[player,food,,linemate linemate]")
+        
+        self.player.orientation = 2
+        self.assertEqual(self.world.look(self.player), "[player,,,]")
+
+    def test_inventory(self):
+        """Test du format de l'inventaire."""
+        self.assertEqual(
+            self.world.inventory(self.player),
+            "[food 10, linemate 0, deraumere 0, sibur 0, mendiane 0, phiras 0, thystame 0]"
+        )
+
+    def test_take_and_set(self):
+        """Test du ramassage et du dépôt d'objets."""
+        self.world.tiles[5][5][1] = 1
+        
+        self.assertTrue(self.world.take(self.player, "linemate"))
+        self.assertFalse(self.world.take(self.player, "linemate"))
+        self.assertTrue(self.world.set(self.player, "linemate"))
+        self.assertFalse(self.world.set(self.player, "thystame"))
+        self.assertFalse(self.world.take(self.player, "gold"))
+
+    def test_sound_direction(self):
+        """Test des secteurs de provenance d'un son."""
+        self.assertEqual(self.world.direction(self.player, 5, 5), 0)
+        self.assertEqual(self.world.direction(self.player, 5, 3), 1)
+        self.assertEqual(self.world.direction(self.player, 3, 5), 3)
+        self.assertEqual(self.world.direction(self.player, 5, 8), 5)
+        self.assertEqual(self.world.direction(self.player, 7, 5), 7)
+        self.assertEqual(self.world.direction(self.player, 4, 4), 2)
+        self.player.orientation = 1
+        self.assertEqual(self.world.direction(self.player, 7, 5), 1)
+
+    def test_sound_uses_shortest_path(self):
+        """Test du plus court chemin à travers le bord du tore."""
+        self.assertEqual(self.world.direction(self.player, 5, 9), 5)
+        self.world._move(self.player, 0, 5)
+        self.assertEqual(self.world.direction(self.player, 9, 5), 3)
+
+    def test_eject(self):
+        """Test de l'éjection des autres joueurs et des œufs."""
+        other = self.world.join("team2")
+        self.world._move(other, 5, 5)
+        other.orientation = 0
+        self.world.fork(other)
+        
+        pushed = self.world.eject(self.player)
+        
+        self.assertEqual(pushed, [(other, 5)])
+        self.assertEqual((other.x, other.y), (5, 4))
+        self.assertEqual(self.world.eggs["team2"], [])
+        self.assertEqual(self.world.slots["team2"], 2)
+
+    def test_ritual(self):
+        """Test d'un rituel de niveau 1."""
+        self.assertIsNone(self.world.ritual_participants(5, 5, 1))
+        self.world.tiles[5][5][1] = 1
+        participants = self.world.ritual_participants(5, 5, 1)
+        
+        self.assertEqual(participants, [self.player])
+        self.assertTrue(self.world.complete_ritual(5, 5, 1, participants))
+        self.assertEqual(self.player.level, 2)
+        self.assertEqual(self.world.tiles[5][5][1], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.vision import Vision, ITEMS
+
+class TestVision(unittest.TestCase):
+    """Tests unitaires pour Vision."""
+
+    def test_parse_counts(self):
+        """Test du parsing en matrice de comptes."""
+        vision = Vision.parse("[player food food,linemate, ,thystame player]")
+        
+        self.assertEqual(len(vision), 4)
+        self.assertEqual(vision.counts.shape, (4, len(ITEMS)))
+        self.assertEqual(vision.count(0, "food"), 2)
+        self.assertEqual(vision.count(0, "player"), 1)
+        self.assertEqual(vision.count(1, "linemate"), 1)
+        self.assertEqual(vision.counts[2].sum(), 0)
+        self.assertTrue(vision.has(3, "thystame"))
+
+    def test_parse_bytes_and_spaces(self):
+        """Test du parsing depuis des octets avec espaces après les virgules."""
+        vision = Vision.parse(b"[player, food sibur, ]\n")
+        
+        self.assertEqual(len(vision), 3)
+        self.assertEqual(vision.count(1, "sibur"), 1)
+
+    def test_unknown_items_ignored(self):
+        """Test des objets inconnus comme les œufs."""
+        vision = Vision.parse("[player egg,egg food]")
+        
+        self.assertEqual(vision.content(0), ["player"])
+        self.assertEqual(vision.content(1), ["food"])
+
+    def test_out_of_range(self):
+        """Test des requêtes hors de la vision."""
+        vision = Vision.parse("[player]")
+        
+        self.assertEqual(vision.count(5, "food"), 0)
+        self.assertEqual(vision.count(0, "gold"), 0)
+        self.assertEqual(vision.content(-1), [])
+        self.assertEqual(vision.stones(3), 0)
+
+    def test_tiles_with(self):
+        """Test de la recherche des cases contenant un objet."""
+        vision = Vision.parse("[player,food,,food linemate]")
+        
+        self.assertEqual(vision.tiles_with("food").tolist(), [1, 3])
+        self.assertEqual(vision.tiles_with("gold").tolist(), [])
+
+    def test_stones(self):
+        """Test du total des pierres d'une case."""
+        vision = Vision.parse("[player player food linemate sibur sibur]")
+        
+        self.assertEqual(vision.stones(0), 3)
+
+    def test_level8_look(self):
+        """Test d'un Look de niveau 8 (81 cases)."""
+        response = "[" + ",".join(["player food linemate"] + ["food"] * 80) + "]"
+        
+        vision = Vision.parse(response)
+        
+        self.assertEqual(len(vision), 81)
+        self.assertEqual(int(vision.column("food").sum()), 81)
+
+    def test_from_tiles_round_trip(self):
+        """Test de la conversion depuis et vers le format liste."""
+        tiles = [["player", "food"], [], ["sibur"]]
+        
+        vision = Vision.from_tiles(tiles)
+        
+        self.assertEqual(vision.to_lists(), tiles)
+        self.assertEqual(vision.count(2, "sibur"), 1)
+
+if __name__ == '__main__':
+    unittest.main()
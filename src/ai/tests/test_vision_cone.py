@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models import vision_cone
+from sim.world import World
+
+
+class TestVisionCone(unittest.TestCase):
+    """Tests unitaires pour les tables du cône de vision."""
+
+    def test_tile_count(self):
+        """Test du nombre de cases par niveau."""
+        self.assertEqual(vision_cone.tile_count(1), 4)
+        self.assertEqual(vision_cone.tile_count(8), 81)
+
+    def test_level_one_north(self):
+        """Test des cases vues au niveau 1 vers le nord."""
+        self.assertEqual(vision_cone.positions(1, 0), ((0, 0), (-1, -1), (0, -1), (1, -1)))
+
+    def test_level_one_west(self):
+        """Test des cases vues au niveau 1 vers l'ouest."""
+        self.assertEqual(vision_cone.positions(1, 3), ((0, 0), (-1, 1), (-1, 0), (-1, -1)))
+
+    def test_inverse_lookup(self):
+        """Test de la cohérence entre index → décalage et décalage → index."""
+        for orientation in range(4):
+            for index, (dx, dy) in enumerate(vision_cone.positions(8, orientation)):
+                self.assertEqual(vision_cone.index_of(dx, dy, 8, orientation), index)
+                self.assertEqual(
+                    vision_cone.INDICES[orientation, dy + vision_cone.MAX_LEVEL, dx + vision_cone.MAX_LEVEL],
+                    index,
+                )
+
+    def test_index_out_of_level(self):
+        """Test d'une case visible au niveau 2 mais pas au niveau 1."""
+        self.assertEqual(vision_cone.index_of(0, -2, 2, 0), 6)
+        self.assertEqual(vision_cone.index_of(0, -2, 1, 0), -1)
+
+    def test_offsets_array(self):
+        """Test de la vue NumPy des décalages."""
+        offsets = vision_cone.offsets(2, 1)
+        self.assertEqual(offsets.shape, (9, 2))
+        self.assertEqual(tuple(offsets[8]), (2, 2))
+        self.assertFalse(offsets.flags.writeable)
+
+    def test_matches_server_look(self):
+        """Test de la concordance avec l'ordre des cases du serveur simulé."""
+        world = World(20, 20, ["team"], 1, seed=3)
+        player = world.join("team")
+        player.level = 3
+        for orientation in range(4):
+            player.orientation = orientation
+            for index in range(vision_cone.tile_count(3)):
+                dx, dy = vision_cone.offset(index, orientation)
+                side = index - int(index ** 0.5) ** 2 - int(index ** 0.5)
+                forward = int(index ** 0.5)
+                self.assertEqual(
+                    world.relative_tile(player, side, forward),
+                    ((player.x + dx) % 20, (player.y + dy) % 20),
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from unittest.mock import Mock
 import sys
 import os
+import numpy as np
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -25,6 +27,7 @@ class TestVisionManager(unittest.TestCase):
         self.map_mock.width = 10
         self.map_mock.height = 10
         self.player_mock.get_position.return_value = (5, 5)
+        self.player_mock.get_direction.return_value = 0
         
         self.vision_manager = VisionManager(
             self.protocol_mock,
@@ -37,13 +40,13 @@ class TestVisionManager(unittest.TestCase):
         """Test de l'initialisation du VisionManager."""
         self.assertIsNotNone(self.vision_manager)
         self.assertEqual(self.vision_manager.level, 1)
-        self.assertEqual(self.vision_manager.vision_cooldown, 7)
+        self.assertIsNone(self.vision_manager.view)
 
     def test_update_vision_success(self):
         """Test de la mise à jour de vision avec succès."""
         self.protocol_mock.look.return_value = "[player, food, linemate]"
         
-        result = self.vision_manager.update_vision()
+        result = asyncio.run(self.vision_manager.update_vision())
         
         self.assertTrue(result)
         self.assertEqual(len(self.vision_manager.vision), 3)
@@ -52,7 +55,7 @@ class TestVisionManager(unittest.TestCase):
         """Test de la mise à jour de vision avec erreur de connexion."""
         self.protocol_mock.look.side_effect = ConnectionError("Connexion perdue")
         
-        result = self.vision_manager.update_vision()
+        result = asyncio.run(self.vision_manager.update_vision())
         
         self.assertFalse(result)
 
@@ -60,7 +63,7 @@ class TestVisionManager(unittest.TestCase):
         """Test de la mise à jour de vision avec réponse invalide."""
         self.protocol_mock.look.return_value = "invalid"
         
-        result = self.vision_manager.update_vision()
+        result = asyncio.run(self.vision_manager.update_vision())
         
         self.assertTrue(result)
 
@@ -68,11 +71,68 @@ class TestVisionManager(unittest.TestCase):
         """Test de la mise à jour forcée de vision avec succès."""
         self.protocol_mock.look.return_value = "[player, food]"
         
-        result = self.vision_manager.force_update_vision()
+        result = asyncio.run(self.vision_manager.force_update_vision())
         
         self.assertTrue(result)
         self.assertEqual(len(self.vision_manager.vision), 2)
 
+    def test_update_vision_skips_useless_look(self):
+        """Test du Look évité quand le joueur n'a pas bougé."""
+        self.protocol_mock.look.return_value = "[player, food]"
+        asyncio.run(self.vision_manager.update_vision())
+        
+        asyncio.run(self.vision_manager.update_vision())
+        asyncio.run(self.vision_manager.force_update_vision("survival"))
+        asyncio.run(self.vision_manager.force_update_vision("elevation"))
+        
+        self.assertEqual(self.protocol_mock.look.call_count, 2)
+
+    def _real_map_manager(self):
+        """VisionManager sur une vraie carte 10x10, joueur en (5, 5) face au nord."""
+        manager = VisionManager(self.protocol_mock, self.player_mock, Map(10, 10), self.logger_mock)
+        self.protocol_mock.look.return_value = "[player food, linemate, sibur, , phiras, food, , thystame, ]"
+        asyncio.run(manager.update_vision())
+        return manager
+
+    def test_shift_forward_keeps_seen_tiles(self):
+        """Test du décalage de la vue après un Forward, sans Look."""
+        manager = self._real_map_manager()
+        manager.map.update_tile(5, 2, ["deraumere"])
+        
+        manager.shift((5, 4, 0))
+        
+        self.protocol_mock.look.assert_called_once()
+        self.assertEqual(manager.view_pose, (5, 4, 0))
+        self.assertEqual(manager.view.content(0), ["player", "sibur"])
+        self.assertEqual(manager.view.content(1), ["food"])
+        self.assertEqual(manager.view.content(3), ["thystame"])
+        self.assertEqual(manager.view.content(6), ["deraumere"])
+        self.assertEqual(manager.origin[3], VisionManager.SEEN)
+        self.assertEqual(manager.origin[6], VisionManager.MEMORY)
+        self.assertEqual(manager.origin[8], VisionManager.UNKNOWN)
+
+    def test_shift_turn_reprojects_cone(self):
+        """Test du décalage de la vue après une rotation."""
+        manager = self._real_map_manager()
+        
+        manager.shift((5, 5, 1))
+        
+        self.assertEqual(manager.view.content(0), ["player", "food"])
+        self.assertEqual(manager.view.content(4), [])
+        self.assertEqual(manager.origin[1], VisionManager.SEEN)
+        self.assertEqual(manager.origin[4], VisionManager.SEEN)
+        self.assertEqual(manager.origin[2], VisionManager.UNKNOWN)
+        self.assertEqual(len(manager.look), 9)
+
+    def test_relocate(self):
+        """Test du rattachement du Look à une pose recalée."""
+        manager = self._real_map_manager()
+        
+        manager.relocate((6, 5, 0))
+        
+        self.assertEqual(manager.look_pose, (6, 5, 0))
+        self.assertEqual(manager.view_pose, (6, 5, 0))
+
     def test_parse_vision_valid(self):
         """Test du parsing de vision valide."""
         response = "[player, food, linemate]"
@@ -128,28 +188,33 @@ class TestVisionManager(unittest.TestCase):
         self.assertEqual(index, 0)
 
     def test_get_vision_index_north(self):
-        """Test du calcul d'index pour la case au nord."""
+        """Test du calcul d'index pour la case devant le joueur orienté au nord."""
         index = self.vision_manager._get_vision_index(0, -1)
         
-        self.assertEqual(index, 7)
+        self.assertEqual(index, 2)
 
     def test_get_vision_index_east(self):
-        """Test du calcul d'index pour la case à l'est."""
+        """Test du calcul d'index pour la case devant le joueur orienté à l'est."""
+        self.player_mock.get_direction.return_value = 1
+        
         index = self.vision_manager._get_vision_index(1, 0)
         
-        self.assertEqual(index, 1)
+        self.assertEqual(index, 2)
 
-    def test_get_vision_index_south(self):
-        """Test du calcul d'index pour la case au sud."""
+    def test_get_vision_index_behind(self):
+        """Test du calcul d'index pour une case hors du cône (derrière le joueur)."""
         index = self.vision_manager._get_vision_index(0, 1)
         
-        self.assertEqual(index, 3)
+        self.assertEqual(index, -1)
 
-    def test_get_vision_index_west(self):
-        """Test du calcul d'index pour la case à l'ouest."""
-        index = self.vision_manager._get_vision_index(-1, 0)
+    def test_get_vision_index_higher_level(self):
+        """Test du calcul d'index au niveau 2 (deuxième ligne du cône)."""
+        self.vision_manager.set_level(2)
+        self.player_mock.get_direction.return_value = 2
+        
+        index = self.vision_manager._get_vision_index(-2, 2)
         
-        self.assertEqual(index, 5)
+        self.assertEqual(index, 8)
 
     def test_find_nearest_object_found(self):
         """Test de la recherche d'objet le plus proche trouvé."""
@@ -157,7 +222,7 @@ class TestVisionManager(unittest.TestCase):
         
         result = self.vision_manager.find_nearest_object('food')
         
-        self.assertEqual(result, (1, 0))
+        self.assertEqual(result, (-1, -1))
 
     def test_find_nearest_object_not_found(self):
         """Test de la recherche d'objet le plus proche non trouvé."""
@@ -171,10 +236,27 @@ class TestVisionManager(unittest.TestCase):
         """Test de la recherche de ressource la plus proche non trouvée."""
         self.vision_manager.vision = [['player'], ['linemate']]
         
-        result = self.vision_manager.find_nearest_resource('food')
+        result = asyncio.run(self.vision_manager.find_nearest_resource('food'))
         
         self.assertIsNone(result)
 
+    def test_find_in_cache_uses_recent_tiles(self):
+        """Test de la recherche hors vision parmi les cases récentes de la carte."""
+        game_map = Map(10, 10)
+        manager = VisionManager(self.protocol_mock, self.player_mock, game_map, self.logger_mock)
+        manager.cache_generations = 2
+        food = np.zeros((1, 7))
+        food[0, 0] = 1
+        game_map.update_tiles([2], [5], food, manager.clock.now())
+        game_map.update_tiles([7], [4], food, manager.clock.now())
+
+        self.assertEqual(manager._find_in_cache('food'), (2, -1))
+        self.assertIsNone(manager._find_in_cache('player'))
+        game_map.update_tiles([0], [0], np.zeros((1, 7)), manager.clock.now())
+        self.assertEqual(manager._find_in_cache('food'), (2, -1))
+        game_map.update_tiles([0], [0], np.zeros((1, 7)), manager.clock.now())
+        self.assertIsNone(manager._find_in_cache('food'))
+
     def test_get_players_in_vision(self):
         """Test de la récupération des joueurs dans la vision."""
         self.vision_manager.vision = [['player'], ['player'], ['food']]
@@ -198,10 +280,29 @@ class TestVisionManager(unittest.TestCase):
         self.assertEqual(result, 1)
 
     def test_can_update_vision(self):
-        """Test de la vérification si la vision peut être mise à jour."""
-        result = self.vision_manager.can_update_vision()
+        """Test de la vérification déléguée au planificateur, sans compter de demande."""
+        self.assertTrue(self.vision_manager.can_update_vision())
+        self.protocol_mock.look.return_value = "[player, food]"
+        asyncio.run(self.vision_manager.update_vision())
+        requests = sum(self.vision_manager.scheduler.requests.values())
         
-        self.assertIsInstance(result, bool)
+        self.assertFalse(self.vision_manager.can_update_vision())
+        self.assertTrue(self.vision_manager.can_update_vision("elevation"))
+        self.assertEqual(sum(self.vision_manager.scheduler.requests.values()), requests)
+
+    def test_look_when_view_not_shifted(self):
+        """Test d'un Look envoyé quand la vue n'a pas suivi la pose, même si le planificateur le juge inutile."""
+        manager = self._real_map_manager()
+        manager.scheduler.should_look = Mock(return_value=False)
+        self.player_mock.get_direction.return_value = 1
+        
+        self.assertTrue(manager.can_update_vision())
+        asyncio.run(manager.force_update_vision("survival"))
+        
+        self.assertEqual(self.protocol_mock.look.call_count, 2)
+        self.assertEqual(manager.view_pose, (5, 5, 1))
+        asyncio.run(manager.update_vision())
+        self.assertEqual(self.protocol_mock.look.call_count, 2)
 
     def test_set_level(self):
         """Test de la définition du niveau."""
@@ -213,13 +314,13 @@ class TestVisionManager(unittest.TestCase):
         """Test de la récupération des ressources dans une portée."""
         self.vision_manager.vision = [['food'], ['linemate'], ['deraumere']]
         
-        result = self.vision_manager.get_resources_in_range(2)
+        result = asyncio.run(self.vision_manager.get_resources_in_range(2))
         
         self.assertIsInstance(result, dict)
 
     def test_is_position_safe(self):
         """Test de la vérification si une position est sûre."""
-        result = self.vision_manager.is_position_safe((5, 5))
+        result = asyncio.run(self.vision_manager.is_position_safe((5, 5)))
         
         self.assertIsInstance(result, bool)
 
@@ -227,7 +328,7 @@ class TestVisionManager(unittest.TestCase):
         """Test de la récupération du meilleur chemin vers une ressource."""
         self.vision_manager.vision = [['player'], ['food'], ['linemate']]
         
-        result = self.vision_manager.get_best_path_to_resource('food')
+        result = asyncio.run(self.vision_manager.get_best_path_to_resource('food'))
         
         self.assertIsInstance(result, list)
 